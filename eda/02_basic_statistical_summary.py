@@ -4,6 +4,9 @@ Task 2.2: Generate Basic Statistical Summary
 ===========================================
 시계열 전력수급 데이터의 기본 통계 요약을 생성하고 분석합니다.
 
+통계 분석은 DataFrame을 받아 구조화된 결과(dict/DataFrame)를 반환하는 순수 함수이며,
+get_results()는 데이터 해시 기준으로 결과를 디스크에 메모이즈합니다.
+
 Author: Time Series Forecasting Team
 Date: 2024-01-01
 Python Version: 3.6.9
@@ -17,420 +20,340 @@ Python Version: 3.6.9
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+import sys
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.loader import load_raw_data, DATE_COL
+from src.pipeline.cache import ResultCache
+from src.utils.figures import FigureRenderer, FigureSpec
+
 # 한글 폰트 설정 (matplotlib)
 plt.rcParams['font.family'] = ['Arial Unicode MS', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
-print("=== 기본 통계 분석 모듈 로딩 완료 ===")
-print(f"Pandas: {pd.__version__}")
-print(f"NumPy: {np.__version__}")
-print(f"Matplotlib: {plt.matplotlib.__version__}")
-print(f"Seaborn: {sns.__version__}")
+TARGET_COL = '최대전력(MW)'
+OUTPUT_DIR = PROJECT_ROOT / 'results' / 'eda' / '01_basic_eda'
+RESULT_CACHE_DIR = PROJECT_ROOT / 'results' / '.cache' / 'eda'
+
+PERCENTILES = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+GROUP_STATS = ['count', 'mean', 'std', 'min', 'max', 'median']
+
+MONTH_NAMES = ['1월', '2월', '3월', '4월', '5월', '6월',
+               '7월', '8월', '9월', '10월', '11월', '12월']
+WEEKDAY_NAMES = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
+# 월 → 계절 (12~2월 겨울, 3~5월 봄, 6~8월 여름, 9~11월 가을)
+SEASON_BY_MONTH = np.array(['', '겨울', '겨울', '봄', '봄', '봄', '여름',
+                            '여름', '여름', '가을', '가을', '가을', '겨울'], dtype=object)
 
 # %%
 # =============================================================================
-# 2. 데이터 로딩 (Task 2.1에서 검증된 경로 사용)
+# 2. 분석 함수 (순수 함수: 출력/파일 저장 없음)
 # =============================================================================
 
-print("=== 데이터 로딩 ===")
-
-# 프로젝트 루트 및 데이터 파일 경로 설정
-project_root = Path.cwd()
-data_filename = "일별최대전력수급(2005-2023).csv"
-
-# 데이터 파일 찾기 함수 (Task 2.1에서 검증된 로직)
-def find_data_files(filename):
-    """여러 가능한 경로에서 데이터 파일을 찾습니다."""
-    possible_paths = [
-        project_root / filename,
-        project_root / "data" / filename,
-        project_root.parent / filename,
-        project_root.parent / "data" / filename,
-        Path("/timeseries/data") / filename,
-        Path("/data/timeseries/data") / filename,
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            return path
-    return None
-
-# 데이터 로딩
-data_file = find_data_files(data_filename)
-if not data_file:
-    print("❌ 데이터 파일을 찾을 수 없습니다!")
-    exit(1)
-
-print(f"📄 데이터 파일: {data_file}")
-
-# CSV 로딩
-try:
-    df = pd.read_csv(data_file, encoding='utf-8')
-    print(f"✅ 데이터 로딩 완료: {df.shape[0]:,}행 × {df.shape[1]}열")
-except Exception as e:
-    print(f"❌ 데이터 로딩 실패: {e}")
-    exit(1)
+def to_series(df, target_col=TARGET_COL, date_col=DATE_COL):
+    """날짜 인덱스 타겟 시계열"""
+    return pd.Series(df[target_col].to_numpy(), index=pd.DatetimeIndex(df[date_col]), name=target_col)
+
+def target_statistics(series):
+    """기본 통계 및 분위수"""
+    values = series.dropna()
+    quantiles = values.quantile(np.array(PERCENTILES) / 100)
+    quantiles.index = PERCENTILES
+    return {
+        'count': int(values.count()),
+        'mean': float(values.mean()),
+        'median': float(values.median()),
+        'std': float(values.std()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'range': float(values.max() - values.min()),
+        'cv_pct': float(values.std() / values.mean() * 100),
+        'q1': float(quantiles[25]),
+        'q3': float(quantiles[75]),
+        'iqr': float(quantiles[75] - quantiles[25]),
+        'percentiles': quantiles,
+    }
+
+def calendar_statistics(series):
+    """연도/월/계절/요일/주말 그룹 통계"""
+    index = series.index
+    month = index.month.to_numpy()
+    weekday = index.weekday.to_numpy()
+
+    yearly = series.groupby(index.year).agg(GROUP_STATS).rename_axis('year')
+    yearly_change = yearly['mean'].diff().dropna()
+
+    monthly = series.groupby(month).agg(GROUP_STATS).rename_axis('month')
+    monthly['month_name'] = [MONTH_NAMES[m - 1] for m in monthly.index]
+
+    seasonal = series.groupby(SEASON_BY_MONTH[month]).agg(GROUP_STATS).rename_axis('season')
+
+    by_weekday = series.groupby(weekday).agg(GROUP_STATS).rename_axis('weekday')
+    by_weekday['day_name'] = [WEEKDAY_NAMES[d] for d in by_weekday.index]
+
+    weekend = series.groupby(np.where(weekday >= 5, '주말', '평일')).agg(GROUP_STATS).rename_axis('day_type')
+
+    return {
+        'yearly': yearly,
+        'yearly_change': {
+            'mean_change': float(yearly_change.mean()),
+            'max_increase_year': int(yearly_change.idxmax()),
+            'max_increase': float(yearly_change.max()),
+            'max_decrease_year': int(yearly_change.idxmin()),
+            'max_decrease': float(yearly_change.min()),
+        },
+        'monthly': monthly,
+        'seasonal': seasonal,
+        'weekday': by_weekday,
+        'weekend': weekend,
+    }
+
+def detect_outliers(series, iqr_factor=1.5, z_threshold=3.0):
+    """IQR / Z-score 이상값 탐지"""
+    values = series.dropna()
+    q1, q3 = values.quantile([0.25, 0.75])
+    iqr = q3 - q1
+    lower_bound, upper_bound = q1 - iqr_factor * iqr, q3 + iqr_factor * iqr
+
+    iqr_outliers = values[(values < lower_bound) | (values > upper_bound)]
+    z_scores = np.abs((values - values.mean()) / values.std())
+    z_outliers = values[z_scores > z_threshold]
+
+    return {
+        'lower_bound': float(lower_bound),
+        'upper_bound': float(upper_bound),
+        'iqr_outliers': iqr_outliers,
+        'iqr_outlier_pct': len(iqr_outliers) / len(values) * 100,
+        'z_threshold': z_threshold,
+        'z_outliers': z_outliers,
+        'z_outlier_pct': len(z_outliers) / len(values) * 100,
+    }
+
+def continuity_check(index):
+    """일 단위 연속성 (누락 날짜)"""
+    date_range = pd.date_range(start=index.min(), end=index.max(), freq='D')
+    missing_dates = date_range.difference(index)
+    return {
+        'start': index.min(),
+        'end': index.max(),
+        'expected_days': len(date_range),
+        'actual_days': len(index),
+        'missing_dates': missing_dates,
+        'missing_pct': len(missing_dates) / len(date_range) * 100,
+    }
+
+def time_correlations(series):
+    """시간 변수(월, 요일, 연중 일, 연중 주)와 타겟의 상관계수 (절댓값 내림차순)"""
+    index = series.index
+    time_vars = pd.DataFrame({
+        'month': index.month,
+        'weekday': index.weekday,
+        'day_of_year': index.dayofyear,
+        'week_of_year': index.isocalendar().week.to_numpy().astype(int),
+    }, index=index)
+    correlations = time_vars.corrwith(series)
+    return correlations.reindex(correlations.abs().sort_values(ascending=False).index)
+
+def basic_statistics(df, target_col=TARGET_COL, date_col=DATE_COL):
+    """전체 기본 통계 결과 (get_results 메모이즈 대상)"""
+    series = to_series(df, target_col, date_col)
+    return {
+        'target_col': target_col,
+        'summary': target_statistics(series),
+        'calendar': calendar_statistics(series),
+        'outliers': detect_outliers(series),
+        'continuity': continuity_check(series.index),
+        'time_correlations': time_correlations(series),
+        'missing_values': int(series.isnull().sum()),
+        'duplicate_rows': int(df.duplicated().sum()),
+    }
+
+def get_results(raw=None, cache=None, force=False):
+    """기본 통계 결과 조회 (같은 데이터·코드이면 디스크 캐시에서 바로 반환)"""
+    df = load_raw_data() if raw is None else raw
+    cache = cache or ResultCache(RESULT_CACHE_DIR)
+    return cache.run('02_basic_statistics', basic_statistics, df, code=[__file__], force=force)
 
 # %%
 # =============================================================================
-# 3. 날짜 컬럼 처리 및 인덱스 설정
+# 3. 시각화
 # =============================================================================
 
-print("=== 날짜 처리 ===")
+def _style_axis(ax):
+    # x축, y축 숫자 크기 및 볼드체 설정
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='both', which='major', labelsize=12)
+    plt.setp(ax.get_xticklabels(), fontweight='bold')
+    plt.setp(ax.get_yticklabels(), fontweight='bold')
+
+def plot_overview(data):
+    """시계열 / 분포 / 월별 박스플롯 / 연도별 평균 4분할 그래프"""
+    series, results = data['series'], data['results']
+    target_col = results['target_col']
+    plt.style.use('default')
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    fig.suptitle('시계열 전력수급 데이터 기본 통계 분석', fontsize=16, fontweight='bold')
+
+    axes[0,0].plot(series.index, series.values, linewidth=0.8, alpha=0.8)
+    axes[0,0].set_title(f'{target_col} 시계열 변화')
+    axes[0,0].set_ylabel('전력 (MW)')
 
-# 날짜 컬럼 변환
-if 'date' in df.columns:
-    print("날짜 컬럼 변환 중...")
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
-    df.set_index('date', inplace=True)
-    print(f"✅ 날짜 인덱스 설정 완료")
-    print(f"날짜 범위: {df.index.min()} ~ {df.index.max()}")
-    print(f"총 기간: {(df.index.max() - df.index.min()).days + 1}일")
-else:
-    print("❌ 'date' 컬럼을 찾을 수 없습니다!")
+    axes[0,1].hist(series.dropna(), bins=50, alpha=0.7, color='skyblue', edgecolor='black')
+    axes[0,1].set_title(f'{target_col} 분포')
+    axes[0,1].set_xlabel('전력 (MW)')
+    axes[0,1].set_ylabel('빈도')
 
-# %%
-# =============================================================================
-# 4. 기본 통계 정보 생성
-# =============================================================================
+    monthly_data = [group.dropna().values for _, group in series.groupby(series.index.month)]
+    axes[1,0].boxplot(monthly_data, labels=range(1, 13))
+    axes[1,0].set_title('월별 전력 분포')
+    axes[1,0].set_xlabel('월')
+    axes[1,0].set_ylabel('전력 (MW)')
 
-print("=== 기본 통계 정보 ===")
+    yearly_mean = results['calendar']['yearly']['mean']
+    axes[1,1].plot(yearly_mean.index, yearly_mean.values, marker='o', linewidth=2)
+    axes[1,1].set_title('연도별 평균 전력 변화')
+    axes[1,1].set_xlabel('연도')
+    axes[1,1].set_ylabel('평균 전력 (MW)')
 
-# 수치형 컬럼 식별
-numeric_cols = df.select_dtypes(include=[np.number]).columns
-print(f"분석 대상 컬럼: {list(numeric_cols)}")
+    for ax in axes.flat:
+        _style_axis(ax)
 
-if len(numeric_cols) > 0:
-    target_col = numeric_cols[0]  # 주요 타겟: 최대전력(MW)
-    data_series = df[target_col]
-    
-    print(f"\n📊 '{target_col}' 기본 통계:")
-    print(f"  • 총 데이터 포인트: {len(data_series):,}개")
-    print(f"  • 평균: {data_series.mean():,.2f} MW")
-    print(f"  • 중앙값: {data_series.median():,.2f} MW")
-    print(f"  • 표준편차: {data_series.std():,.2f} MW")
-    print(f"  • 최솟값: {data_series.min():,.2f} MW")
-    print(f"  • 최댓값: {data_series.max():,.2f} MW")
-    print(f"  • 범위: {data_series.max() - data_series.min():,.2f} MW")
-    print(f"  • 변동계수: {(data_series.std() / data_series.mean()) * 100:.2f}%")
+    plt.tight_layout()
+    return fig
 
 # %%
 # =============================================================================
-# 5. 분위수 및 백분위수 분석
+# 4. 결과 출력
 # =============================================================================
 
-print("=== 분위수 분석 ===")
+def print_results(results):
+    """기본 통계 결과 출력"""
+    target_col = results['target_col']
+    summary = results['summary']
+
+    print(f"\n📊 '{target_col}' 기본 통계:")
+    print(f"  • 총 데이터 포인트: {summary['count']:,}개")
+    print(f"  • 평균: {summary['mean']:,.2f} MW")
+    print(f"  • 중앙값: {summary['median']:,.2f} MW")
+    print(f"  • 표준편차: {summary['std']:,.2f} MW")
+    print(f"  • 최솟값: {summary['min']:,.2f} MW")
+    print(f"  • 최댓값: {summary['max']:,.2f} MW")
+    print(f"  • 범위: {summary['range']:,.2f} MW")
+    print(f"  • 변동계수: {summary['cv_pct']:.2f}%")
 
-if len(numeric_cols) > 0:
-    # 사분위수
-    q25 = data_series.quantile(0.25)
-    q50 = data_series.quantile(0.50)
-    q75 = data_series.quantile(0.75)
-    iqr = q75 - q25
-    
     print(f"\n📈 분위수 정보:")
-    print(f"  • Q1 (25%): {q25:,.2f} MW")
-    print(f"  • Q2 (50%, 중앙값): {q50:,.2f} MW")
-    print(f"  • Q3 (75%): {q75:,.2f} MW")
-    print(f"  • IQR (Q3-Q1): {iqr:,.2f} MW")
-    
-    # 주요 백분위수
-    percentiles = [1, 5, 10, 90, 95, 99]
+    print(f"  • Q1 (25%): {summary['q1']:,.2f} MW")
+    print(f"  • Q2 (50%, 중앙값): {summary['median']:,.2f} MW")
+    print(f"  • Q3 (75%): {summary['q3']:,.2f} MW")
+    print(f"  • IQR (Q3-Q1): {summary['iqr']:,.2f} MW")
     print(f"\n📊 주요 백분위수:")
-    for p in percentiles:
-        value = data_series.quantile(p/100)
-        print(f"  • {p:2d}%: {value:,.2f} MW")
-
-# %%
-# =============================================================================
-# 6. 연도별 통계 분석
-# =============================================================================
-
-print("=== 연도별 통계 분석 ===")
+    for p, value in summary['percentiles'].items():
+        if p not in (25, 50, 75):
+            print(f"  • {p:2d}%: {value:,.2f} MW")
 
-if 'date' in df.index.names or isinstance(df.index, pd.DatetimeIndex):
-    # 연도별 그룹화
-    df['year'] = df.index.year
-    yearly_stats = df.groupby('year')[target_col].agg([
-        'count', 'mean', 'std', 'min', 'max', 'median'
-    ]).round(2)
-    
+    calendar = results['calendar']
     print(f"\n📅 연도별 '{target_col}' 통계:")
-    print(yearly_stats)
-    
-    # 연도별 증가 추세 분석
-    yearly_mean = df.groupby('year')[target_col].mean()
-    year_diff = yearly_mean.diff().dropna()
-    
+    print(calendar['yearly'].round(2))
+    change = calendar['yearly_change']
     print(f"\n📈 연평균 변화량:")
-    print(f"  • 전체 평균 증가량: {year_diff.mean():,.2f} MW/년")
-    print(f"  • 최대 증가년: {year_diff.idxmax()} (+{year_diff.max():,.2f} MW)")
-    print(f"  • 최대 감소년: {year_diff.idxmin()} ({year_diff.min():,.2f} MW)")
+    print(f"  • 전체 평균 증가량: {change['mean_change']:,.2f} MW/년")
+    print(f"  • 최대 증가년: {change['max_increase_year']} (+{change['max_increase']:,.2f} MW)")
+    print(f"  • 최대 감소년: {change['max_decrease_year']} ({change['max_decrease']:,.2f} MW)")
 
-# %%
-# =============================================================================
-# 7. 월별 계절성 분석
-# =============================================================================
-
-print("=== 월별 계절성 분석 ===")
-
-if isinstance(df.index, pd.DatetimeIndex):
-    # 월별 그룹화
-    df['month'] = df.index.month
-    monthly_stats = df.groupby('month')[target_col].agg([
-        'count', 'mean', 'std', 'min', 'max'
-    ]).round(2)
-    
     print(f"\n🗓️ 월별 '{target_col}' 통계:")
-    monthly_stats['month_name'] = ['1월', '2월', '3월', '4월', '5월', '6월',
-                                   '7월', '8월', '9월', '10월', '11월', '12월']
-    print(monthly_stats[['month_name', 'mean', 'std', 'min', 'max']])
-    
-    # 계절별 분석
-    def get_season(month):
-        if month in [12, 1, 2]:
-            return '겨울'
-        elif month in [3, 4, 5]:
-            return '봄'
-        elif month in [6, 7, 8]:
-            return '여름'
-        else:
-            return '가을'
-    
-    df['season'] = df['month'].apply(get_season)
-    seasonal_stats = df.groupby('season')[target_col].agg([
-        'count', 'mean', 'std', 'min', 'max'
-    ]).round(2)
-    
+    print(calendar['monthly'][['month_name', 'mean', 'std', 'min', 'max']].round(2))
     print(f"\n🌸 계절별 '{target_col}' 통계:")
-    print(seasonal_stats)
-
-# %%
-# =============================================================================
-# 8. 요일별 패턴 분석
-# =============================================================================
-
-print("=== 요일별 패턴 분석 ===")
-
-if isinstance(df.index, pd.DatetimeIndex):
-    # 요일별 그룹화
-    df['weekday'] = df.index.weekday  # 0=월요일, 6=일요일
-    df['weekday_name'] = df.index.strftime('%A')
-    
-    weekday_stats = df.groupby('weekday')[target_col].agg([
-        'count', 'mean', 'std', 'min', 'max'
-    ]).round(2)
-    
-    weekday_names = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
-    weekday_stats['day_name'] = weekday_names
-    
+    print(calendar['seasonal'].round(2))
     print(f"\n📅 요일별 '{target_col}' 통계:")
-    print(weekday_stats[['day_name', 'mean', 'std', 'min', 'max']])
-    
-    # 평일 vs 주말 비교
-    df['is_weekend'] = df['weekday'].isin([5, 6])  # 토요일, 일요일
-    weekend_comparison = df.groupby('is_weekend')[target_col].agg([
-        'count', 'mean', 'std', 'min', 'max'
-    ]).round(2)
-    
-    weekend_comparison.index = ['평일', '주말']
+    print(calendar['weekday'][['day_name', 'mean', 'std', 'min', 'max']].round(2))
     print(f"\n🏢 평일 vs 주말 비교:")
-    print(weekend_comparison)
-
-# %%
-# =============================================================================
-# 9. 이상값 탐지 및 분석
-# =============================================================================
+    print(calendar['weekend'].round(2))
 
-print("=== 이상값 분석 ===")
-
-if len(numeric_cols) > 0:
-    # IQR 방법을 사용한 이상값 탐지
-    Q1 = data_series.quantile(0.25)
-    Q3 = data_series.quantile(0.75)
-    IQR = Q3 - Q1
-    
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-    
-    outliers_iqr = data_series[(data_series < lower_bound) | (data_series > upper_bound)]
-    
+    outliers = results['outliers']
+    iqr_outliers = outliers['iqr_outliers']
     print(f"\n🎯 IQR 방법 이상값 탐지:")
-    print(f"  • 하한선: {lower_bound:,.2f} MW")
-    print(f"  • 상한선: {upper_bound:,.2f} MW")
-    print(f"  • 이상값 개수: {len(outliers_iqr):,}개 ({len(outliers_iqr)/len(data_series)*100:.2f}%)")
-    
-    if len(outliers_iqr) > 0:
-        print(f"  • 이상값 범위: {outliers_iqr.min():,.2f} ~ {outliers_iqr.max():,.2f} MW")
-        
-        # 상위 5개 이상값
-        top_outliers = outliers_iqr.nlargest(5)
+    print(f"  • 하한선: {outliers['lower_bound']:,.2f} MW")
+    print(f"  • 상한선: {outliers['upper_bound']:,.2f} MW")
+    print(f"  • 이상값 개수: {len(iqr_outliers):,}개 ({outliers['iqr_outlier_pct']:.2f}%)")
+    if len(iqr_outliers) > 0:
+        print(f"  • 이상값 범위: {iqr_outliers.min():,.2f} ~ {iqr_outliers.max():,.2f} MW")
         print(f"  • 상위 5개 이상값:")
-        for date, value in top_outliers.items():
+        for date, value in iqr_outliers.nlargest(5).items():
             print(f"    - {date.strftime('%Y-%m-%d')}: {value:,.2f} MW")
-    
-    # Z-score 방법을 사용한 이상값 탐지
-    z_scores = np.abs((data_series - data_series.mean()) / data_series.std())
-    outliers_zscore = data_series[z_scores > 3]
-    
-    print(f"\n📊 Z-score 방법 이상값 탐지 (|z| > 3):")
-    print(f"  • 이상값 개수: {len(outliers_zscore):,}개 ({len(outliers_zscore)/len(data_series)*100:.2f}%)")
+    print(f"\n📊 Z-score 방법 이상값 탐지 (|z| > {outliers['z_threshold']:g}):")
+    print(f"  • 이상값 개수: {len(outliers['z_outliers']):,}개 ({outliers['z_outlier_pct']:.2f}%)")
 
-# %%
-# =============================================================================
-# 10. 시계열 연속성 및 누락일 확인
-# =============================================================================
-
-print("=== 시계열 연속성 확인 ===")
-
-if isinstance(df.index, pd.DatetimeIndex):
-    # 전체 기간에서 예상되는 날짜 범위
-    date_range = pd.date_range(start=df.index.min(), end=df.index.max(), freq='D')
-    missing_dates = date_range.difference(df.index)
-    
+    continuity = results['continuity']
+    missing_dates = continuity['missing_dates']
     print(f"\n📅 시계열 연속성 분석:")
-    print(f"  • 전체 기간: {df.index.min().strftime('%Y-%m-%d')} ~ {df.index.max().strftime('%Y-%m-%d')}")
-    print(f"  • 예상 총 일수: {len(date_range):,}일")
-    print(f"  • 실제 데이터 일수: {len(df):,}일")
+    print(f"  • 전체 기간: {continuity['start'].strftime('%Y-%m-%d')} ~ {continuity['end'].strftime('%Y-%m-%d')}")
+    print(f"  • 예상 총 일수: {continuity['expected_days']:,}일")
+    print(f"  • 실제 데이터 일수: {continuity['actual_days']:,}일")
     print(f"  • 누락된 날짜: {len(missing_dates):,}일")
-    
     if len(missing_dates) > 0:
-        print(f"  • 누락 비율: {len(missing_dates)/len(date_range)*100:.2f}%")
-        
-        # 처음 몇 개 누락 날짜 출력
+        print(f"  • 누락 비율: {continuity['missing_pct']:.2f}%")
         print(f"  • 누락된 날짜 예시 (처음 10개):")
         for date in missing_dates[:10]:
             print(f"    - {date.strftime('%Y-%m-%d')}")
     else:
         print("  ✅ 누락된 날짜가 없습니다!")
 
-# %%
-# =============================================================================
-# 11. 기본 시각화 준비
-# =============================================================================
-
-print("=== 기본 시각화 생성 ===")
-
-# 그래프 스타일 설정
-plt.style.use('default')
-fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-fig.suptitle('시계열 전력수급 데이터 기본 통계 분석', fontsize=16, fontweight='bold')
-
-if len(numeric_cols) > 0:
-    # 1. 시계열 플롯
-    axes[0,0].plot(df.index, df[target_col], linewidth=0.8, alpha=0.8)
-    axes[0,0].set_title(f'{target_col} 시계열 변화')
-    axes[0,0].set_ylabel('전력 (MW)')
-    axes[0,0].grid(True, alpha=0.3)
-    # x축, y축 숫자 크기 및 볼드체 설정
-    axes[0,0].tick_params(axis='both', which='major', labelsize=12)
-    plt.setp(axes[0,0].get_xticklabels(), fontweight='bold')
-    plt.setp(axes[0,0].get_yticklabels(), fontweight='bold')
-    
-    # 2. 히스토그램
-    axes[0,1].hist(df[target_col], bins=50, alpha=0.7, color='skyblue', edgecolor='black')
-    axes[0,1].set_title(f'{target_col} 분포')
-    axes[0,1].set_xlabel('전력 (MW)')
-    axes[0,1].set_ylabel('빈도')
-    axes[0,1].grid(True, alpha=0.3)
-    # x축, y축 숫자 크기 및 볼드체 설정
-    axes[0,1].tick_params(axis='both', which='major', labelsize=12)
-    plt.setp(axes[0,1].get_xticklabels(), fontweight='bold')
-    plt.setp(axes[0,1].get_yticklabels(), fontweight='bold')
-    
-    # 3. 월별 박스플롯
-    if 'month' in df.columns:
-        monthly_data = [df[df['month'] == month][target_col] for month in range(1, 13)]
-        bp = axes[1,0].boxplot(monthly_data, labels=range(1, 13))
-        axes[1,0].set_title('월별 전력 분포')
-        axes[1,0].set_xlabel('월')
-        axes[1,0].set_ylabel('전력 (MW)')
-        axes[1,0].grid(True, alpha=0.3)
-        # x축, y축 숫자 크기 및 볼드체 설정
-        axes[1,0].tick_params(axis='both', which='major', labelsize=12)
-        plt.setp(axes[1,0].get_xticklabels(), fontweight='bold')
-        plt.setp(axes[1,0].get_yticklabels(), fontweight='bold')
-    
-    # 4. 연도별 평균 변화
-    if 'year' in df.columns:
-        yearly_mean = df.groupby('year')[target_col].mean()
-        axes[1,1].plot(yearly_mean.index, yearly_mean.values, marker='o', linewidth=2)
-        axes[1,1].set_title('연도별 평균 전력 변화')
-        axes[1,1].set_xlabel('연도')
-        axes[1,1].set_ylabel('평균 전력 (MW)')
-        axes[1,1].grid(True, alpha=0.3)
-        # x축, y축 숫자 크기 및 볼드체 설정
-        axes[1,1].tick_params(axis='both', which='major', labelsize=12)
-        plt.setp(axes[1,1].get_xticklabels(), fontweight='bold')
-        plt.setp(axes[1,1].get_yticklabels(), fontweight='bold')
-
-plt.tight_layout()
-
-# 그래프 저장
-output_dir = project_root / "outputs"
-output_dir.mkdir(exist_ok=True)
-plt.savefig(output_dir / "basic_statistics_overview.png", dpi=300, bbox_inches='tight')
-print(f"📊 기본 통계 그래프 저장: {output_dir / 'basic_statistics_overview.png'}")
-
-plt.show()
+    print(f"\n🔗 시간 변수와 '{target_col}' 상관관계:")
+    for var, corr_val in results['time_correlations'].items():
+        print(f"  • {var}: {corr_val:.4f}")
 
 # %%
 # =============================================================================
-# 12. 상관관계 분석 (추가 변수가 있는 경우)
+# 5. 메인 실행
 # =============================================================================
 
-print("=== 상관관계 분석 ===")
-
-# 시간 관련 변수들과의 상관관계
-if isinstance(df.index, pd.DatetimeIndex):
-    # 시간 기반 변수 생성
-    df['day_of_year'] = df.index.dayofyear
-    df['week_of_year'] = df.index.isocalendar().week
-    
-    # 상관관계 계산
-    correlation_vars = ['month', 'weekday', 'day_of_year', 'week_of_year']
-    correlation_vars = [var for var in correlation_vars if var in df.columns]
-    
-    if len(correlation_vars) > 0:
-        corr_data = df[correlation_vars + [target_col]].corr()
-        
-        print(f"\n🔗 시간 변수와 '{target_col}' 상관관계:")
-        target_corr = corr_data[target_col].drop(target_col).sort_values(key=abs, ascending=False)
-        for var, corr_val in target_corr.items():
-            print(f"  • {var}: {corr_val:.4f}")
+def main(raw=None, cache=None, force=False, preset=None):
+    """메인 실행 함수 (raw: 미리 로딩한 원본 데이터, 없으면 파일에서 로딩, preset: 그림 프리셋)"""
+    df = load_raw_data() if raw is None else raw
+    print(f"✅ 데이터 로딩 완료: {df.shape[0]:,}행 × {df.shape[1]}열")
 
-# %%
-# =============================================================================
-# 13. 통계 요약 리포트 생성
-# =============================================================================
+    cache = cache or ResultCache(RESULT_CACHE_DIR)
+    results = get_results(df, cache=cache, force=force)
+    print(f"{'⏭️ 캐시된 결과 사용' if cache.last_hit else '✅ 통계 분석 완료'}")
+    print_results(results)
+
+    # 그림 코드·데이터·프리셋이 같으면 다시 그리지 않음
+    renderer = FigureRenderer(OUTPUT_DIR, preset=preset)
+    spec = FigureSpec('basic_statistics_overview', plot_overview, {'series': to_series(df), 'results': results})
+    figure, = renderer.render([spec], force=force)
+    print(f"📊 기본 통계 그래프: {figure['path']} ({'새로 렌더링' if figure['rendered'] else '변경 없음'})")
+
+    summary = results['summary']
+    continuity = results['continuity']
+    print("\n" + "="*60)
+    print("📋 기본 통계 분석 완료 리포트")
+    print("="*60)
+
+    print(f"\n🎯 주요 통계 지표 ('{results['target_col']}'):")
+    print(f"  • 데이터 기간: {continuity['start'].strftime('%Y-%m-%d')} ~ {continuity['end'].strftime('%Y-%m-%d')}")
+    print(f"  • 총 데이터 포인트: {continuity['actual_days']:,}개")
+    print(f"  • 평균: {summary['mean']:,.2f} MW")
+    print(f"  • 표준편차: {summary['std']:,.2f} MW")
+    print(f"  • 최솟값: {summary['min']:,.2f} MW")
+    print(f"  • 최댓값: {summary['max']:,.2f} MW")
+    print(f"  • 변동계수: {summary['cv_pct']:.2f}%")
 
-print("\n" + "="*60)
-print("📋 기본 통계 분석 완료 리포트")
-print("="*60)
-
-if len(numeric_cols) > 0:
-    print(f"\n🎯 주요 통계 지표 ('{target_col}'):")
-    print(f"  • 데이터 기간: {df.index.min().strftime('%Y-%m-%d')} ~ {df.index.max().strftime('%Y-%m-%d')}")
-    print(f"  • 총 데이터 포인트: {len(df):,}개")
-    print(f"  • 평균: {data_series.mean():,.2f} MW")
-    print(f"  • 표준편차: {data_series.std():,.2f} MW")
-    print(f"  • 최솟값: {data_series.min():,.2f} MW")
-    print(f"  • 최댓값: {data_series.max():,.2f} MW")
-    print(f"  • 변동계수: {(data_series.std() / data_series.mean()) * 100:.2f}%")
-    
     print(f"\n📊 데이터 품질:")
-    print(f"  • 누락값: {df[target_col].isnull().sum():,}개")
-    print(f"  • 중복값: {df.duplicated().sum():,}개")
-    print(f"  • 이상값 (IQR): {len(outliers_iqr):,}개")
-    print(f"  • 시계열 연속성: {len(date_range) - len(missing_dates):,}/{len(date_range):,}일")
+    print(f"  • 누락값: {results['missing_values']:,}개")
+    print(f"  • 중복값: {results['duplicate_rows']:,}개")
+    print(f"  • 이상값 (IQR): {len(results['outliers']['iqr_outliers']):,}개")
+    print(f"  • 시계열 연속성: {continuity['expected_days'] - len(continuity['missing_dates']):,}/{continuity['expected_days']:,}일")
 
-print(f"\n💾 결과 저장 위치:")
-print(f"  • 통계 그래프: {output_dir / 'basic_statistics_overview.png'}")
+    print(f"\n🎉 Task 2.2 완료!")
+    print(f"다음 단계: Task 2.3 - Create Time Series Plots")
+    return results
 
-print(f"\n🎉 Task 2.2 완료!")
-print(f"다음 단계: Task 2.3 - Create Time Series Plots") 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@ Task 2.3: Create Time Series Visualization
 ==========================================
 시계열 전력수급 데이터의 시각화 차트를 생성합니다.
 
+차트에 쓰이는 집계(연도별 통계, 이동평균, 계절 패턴, 이상값, 분해 성분, 분포 통계)는
+timeseries_components()가 구조화된 결과로 반환하고, get_results()가 데이터 해시 기준으로
+디스크에 메모이즈합니다. 차트는 FigureRenderer가 Agg 백엔드로 병렬 렌더링하며,
+그림 코드·데이터·프리셋이 바뀌지 않았으면 다시 그리지 않습니다.
+
 Author: Time Series Forecasting Team
 Date: 2024-01-01
 Python Version: 3.6.9
@@ -18,10 +23,22 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy import stats
+import sys
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.loader import load_raw_data, DATE_COL
+from src.features.decomposition import get_decomposition, mstl_decompose
+from src.pipeline.cache import ResultCache
+from src.utils.figures import FigureRenderer, FigureSpec
+
 # 한글 폰트 설정 (matplotlib)
 plt.rcParams['font.family'] = ['Arial Unicode MS', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -30,574 +47,461 @@ plt.rcParams['axes.unicode_minus'] = False
 plt.style.use('default')
 sns.set_palette("husl")
 
-print("=== 시계열 시각화 모듈 로딩 완료 ===")
-print(f"Pandas: {pd.__version__}")
-print(f"NumPy: {np.__version__}")
-print(f"Matplotlib: {plt.matplotlib.__version__}")
-print(f"Seaborn: {sns.__version__}")
-
-# %%
-# =============================================================================
-# 2. 데이터 로딩 (Task 2.1-2.2에서 검증된 로직 사용)
-# =============================================================================
-
-print("=== 데이터 로딩 ===")
-
-# 프로젝트 루트 및 데이터 파일 경로 설정
-project_root = Path.cwd()
-data_filename = "일별최대전력수급(2005-2023).csv"
-
-# 데이터 파일 찾기 함수 (이전 태스크에서 검증된 로직)
-def find_data_files(filename):
-    """여러 가능한 경로에서 데이터 파일을 찾습니다."""
-    possible_paths = [
-        project_root / filename,
-        project_root / "data" / filename,
-        project_root.parent / filename,
-        project_root.parent / "data" / filename,
-        Path("/timeseries/data") / filename,
-        Path("/data/timeseries/data") / filename,
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            return path
-    return None
-
-# 데이터 로딩
-data_file = find_data_files(data_filename)
-if not data_file:
-    print("❌ 데이터 파일을 찾을 수 없습니다!")
-    exit(1)
-
-print(f"📄 데이터 파일: {data_file}")
-
-# CSV 로딩 및 날짜 처리
-try:
-    df = pd.read_csv(data_file, encoding='utf-8')
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
-    df.set_index('date', inplace=True)
-    
-    print(f"✅ 데이터 로딩 완료: {df.shape[0]:,}행 × {df.shape[1]}열")
-    print(f"날짜 범위: {df.index.min().strftime('%Y-%m-%d')} ~ {df.index.max().strftime('%Y-%m-%d')}")
-    
-    # 타겟 컬럼 확인
-    target_col = '최대전력(MW)'
-    if target_col not in df.columns:
-        print(f"❌ '{target_col}' 컬럼을 찾을 수 없습니다!")
-        exit(1)
-        
-except Exception as e:
-    print(f"❌ 데이터 로딩 실패: {e}")
-    exit(1)
-
-# %%
-# =============================================================================
-# 3. 출력 디렉토리 설정
-# =============================================================================
-
-output_dir = project_root / "outputs"
-output_dir.mkdir(exist_ok=True)
-
-print(f"📁 출력 디렉토리: {output_dir}")
-
-# %%
-# =============================================================================
-# 4. 전체 시계열 플롯 (Overview)
-# =============================================================================
-
-print("=== 1. 전체 시계열 개요 플롯 생성 ===")
-
-# 그림 설정
-fig, axes = plt.subplots(2, 1, figsize=(15, 12))
-fig.suptitle('Daily Maximum Power Supply Time Series Data (2005-2023)', fontsize=18, fontweight='bold')
-
-# 상단: 전체 시계열
-axes[0].plot(df.index, df[target_col], linewidth=0.8, alpha=0.8, color='steelblue')
-axes[0].set_title('Daily Maximum Power Trend - Full Period', fontsize=14, fontweight='bold')
-axes[0].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
-axes[0].grid(True, alpha=0.3)
-axes[0].tick_params(axis='x', rotation=45)
-# 축 숫자 크기 및 볼드체 설정
-axes[0].tick_params(axis='both', which='major', labelsize=12)
-plt.setp(axes[0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0].get_yticklabels(), fontweight='bold')
-
-# 연도별 평균 추가
-df_temp = df.copy()
-df_temp['year'] = df_temp.index.year
-yearly_mean = df_temp.groupby('year')[target_col].mean()
-axes[0].plot(yearly_mean.index, yearly_mean.values, 
-             color='red', linewidth=3, label='Annual Average', alpha=0.8)
-legend = axes[0].legend(fontsize=11)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-
-# 하단: 이동평균을 활용한 트렌드
-rolling_30 = df[target_col].rolling(window=30, center=True).mean()
-rolling_365 = df[target_col].rolling(window=365, center=True).mean()
-
-axes[1].plot(df.index, df[target_col], linewidth=0.5, alpha=0.3, color='lightgray', label='Daily Data')
-axes[1].plot(df.index, rolling_30, linewidth=1.5, color='orange', label='30-Day Moving Average')
-axes[1].plot(df.index, rolling_365, linewidth=2.5, color='red', label='365-Day Moving Average')
-axes[1].set_title('Trend Analysis with Moving Averages', fontsize=14, fontweight='bold')
-axes[1].set_xlabel('Year', fontsize=12, fontweight='bold')
-axes[1].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
-axes[1].grid(True, alpha=0.3)
-legend = axes[1].legend(fontsize=11)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-axes[1].tick_params(axis='x', rotation=45)
-# 축 숫자 크기 및 볼드체 설정
-axes[1].tick_params(axis='both', which='major', labelsize=12)
-plt.setp(axes[1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1].get_yticklabels(), fontweight='bold')
-
-plt.subplots_adjust(hspace=0.4)
-plt.savefig(output_dir / "01_timeseries_overview.png", dpi=300, bbox_inches='tight')
-print(f"📊 저장: {output_dir / '01_timeseries_overview.png'}")
-plt.show()
-
-# %%
-# =============================================================================
-# 5. 연도별 상세 분석 플롯
-# =============================================================================
-
-print("=== 2. 연도별 상세 분석 플롯 생성 ===")
-
-# 연도별 데이터 준비
-df_temp = df.copy()
-df_temp['year'] = df_temp.index.year
-df_temp['month'] = df_temp.index.month
-df_temp['day_of_year'] = df_temp.index.dayofyear
-
-# 그림 설정
-fig, axes = plt.subplots(2, 2, figsize=(18, 14))
-fig.suptitle('Annual Power Supply Pattern Analysis', fontsize=18, fontweight='bold')
-
-# 1. 연도별 박스플롯
-yearly_data = [df_temp[df_temp['year'] == year][target_col] for year in sorted(df_temp['year'].unique())]
-bp1 = axes[0,0].boxplot(yearly_data, labels=sorted(df_temp['year'].unique()))
-axes[0,0].set_title('Annual Power Distribution (Box Plot)', fontsize=13, fontweight='bold')
-axes[0,0].set_xlabel('Year', fontsize=11, fontweight='bold')
-axes[0,0].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
-axes[0,0].tick_params(axis='x', rotation=45)
-axes[0,0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0,0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0,0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0,0].get_yticklabels(), fontweight='bold')
-
-# 2. 연도별 평균/최대값 추이
-yearly_stats = df_temp.groupby('year')[target_col].agg(['mean', 'max', 'min']).round(0)
-axes[0,1].plot(yearly_stats.index, yearly_stats['mean'], marker='o', linewidth=2, label='Mean')
-axes[0,1].plot(yearly_stats.index, yearly_stats['max'], marker='s', linewidth=2, label='Max')
-axes[0,1].plot(yearly_stats.index, yearly_stats['min'], marker='^', linewidth=2, label='Min')
-axes[0,1].set_title('Annual Statistics Trend', fontsize=13, fontweight='bold')
-axes[0,1].set_xlabel('Year', fontsize=11, fontweight='bold')
-axes[0,1].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
-legend = axes[0,1].legend(fontsize=10)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-axes[0,1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0,1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0,1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0,1].get_yticklabels(), fontweight='bold')
-
-# 3. 연도별 변동성 (표준편차)
-yearly_std = df_temp.groupby('year')[target_col].std()
-axes[1,0].bar(yearly_std.index, yearly_std.values, alpha=0.7, color='skyblue', edgecolor='black')
-axes[1,0].set_title('Annual Volatility (Standard Deviation)', fontsize=13, fontweight='bold')
-axes[1,0].set_xlabel('Year', fontsize=11, fontweight='bold')
-axes[1,0].set_ylabel('Standard Deviation (MW)', fontsize=11, fontweight='bold')
-axes[1,0].tick_params(axis='x', rotation=45)
-axes[1,0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1,0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1,0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1,0].get_yticklabels(), fontweight='bold')
-
-# 4. 연도별 성장률
-yearly_mean = df_temp.groupby('year')[target_col].mean()
-growth_rate = yearly_mean.pct_change() * 100
-axes[1,1].bar(growth_rate.index[1:], growth_rate.values[1:], 
-              color=['green' if x > 0 else 'red' for x in growth_rate.values[1:]], alpha=0.7)
-axes[1,1].axhline(y=0, color='black', linestyle='-', linewidth=1)
-axes[1,1].set_title('Annual Growth Rate (%)', fontsize=13, fontweight='bold')
-axes[1,1].set_xlabel('Year', fontsize=11, fontweight='bold')
-axes[1,1].set_ylabel('Growth Rate (%)', fontsize=11, fontweight='bold')
-axes[1,1].tick_params(axis='x', rotation=45)
-axes[1,1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1,1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1,1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1,1].get_yticklabels(), fontweight='bold')
-
-plt.subplots_adjust(hspace=0.4, wspace=0.3)
-plt.savefig(output_dir / "02_yearly_analysis.png", dpi=300, bbox_inches='tight')
-print(f"📊 저장: {output_dir / '02_yearly_analysis.png'}")
-plt.show()
-
-# %%
-# =============================================================================
-# 6. 계절성 패턴 분석 플롯
-# =============================================================================
-
-print("=== 3. 계절성 패턴 분석 플롯 생성 ===")
-
-# 계절성 데이터 준비
-df_temp['month'] = df_temp.index.month
-df_temp['weekday'] = df_temp.index.weekday
-df_temp['week_of_year'] = df_temp.index.isocalendar().week
-
-# 계절 분류 함수
-def get_season(month):
-    if month in [12, 1, 2]:
-        return 'Winter'
-    elif month in [3, 4, 5]:
-        return 'Spring'
-    elif month in [6, 7, 8]:
-        return 'Summer'
-    else:
-        return 'Fall'
-
-df_temp['season'] = df_temp['month'].apply(get_season)
-
-# 그림 설정
-fig, axes = plt.subplots(2, 2, figsize=(18, 14))
-fig.suptitle('Seasonal and Periodic Pattern Analysis', fontsize=18, fontweight='bold')
-
-# 1. 월별 패턴
-monthly_mean = df_temp.groupby('month')[target_col].mean()
-monthly_std = df_temp.groupby('month')[target_col].std()
-
-axes[0,0].bar(range(1, 13), monthly_mean.values, alpha=0.7, color='lightcoral', 
-              yerr=monthly_std.values, capsize=5, edgecolor='black')
-axes[0,0].set_title('Monthly Average Power Supply (±Std Dev)', fontsize=13, fontweight='bold')
-axes[0,0].set_xlabel('Month', fontsize=11, fontweight='bold')
-axes[0,0].set_ylabel('Average Power (MW)', fontsize=11, fontweight='bold')
-axes[0,0].set_xticks(range(1, 13))
-axes[0,0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0,0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0,0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0,0].get_yticklabels(), fontweight='bold')
-
-# 2. 계절별 분포
-season_order = ['Spring', 'Summer', 'Fall', 'Winter']
-seasonal_data = [df_temp[df_temp['season'] == season][target_col] for season in season_order]
-bp2 = axes[0,1].boxplot(seasonal_data, labels=season_order)
-axes[0,1].set_title('Seasonal Power Distribution', fontsize=13, fontweight='bold')
-axes[0,1].set_xlabel('Season', fontsize=11, fontweight='bold')
-axes[0,1].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
-axes[0,1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0,1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0,1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0,1].get_yticklabels(), fontweight='bold')
-
-# 3. 요일별 패턴
-weekday_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-weekday_mean = df_temp.groupby('weekday')[target_col].mean()
-weekday_std = df_temp.groupby('weekday')[target_col].std()
-
-colors = ['red' if i < 5 else 'blue' for i in range(7)]  # 평일=빨강, 주말=파랑
-axes[1,0].bar(range(7), weekday_mean.values, alpha=0.7, color=colors,
-              yerr=weekday_std.values, capsize=5, edgecolor='black')
-axes[1,0].set_title('Weekly Average Power Supply (Weekday vs Weekend)', fontsize=13, fontweight='bold')
-axes[1,0].set_xlabel('Day of Week', fontsize=11, fontweight='bold')
-axes[1,0].set_ylabel('Average Power (MW)', fontsize=11, fontweight='bold')
-axes[1,0].set_xticks(range(7))
-axes[1,0].set_xticklabels(weekday_names)
-axes[1,0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1,0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1,0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1,0].get_yticklabels(), fontweight='bold')
-
-# 4. 연중 주차별 패턴 (히트맵)
-weekly_pattern = df_temp.groupby(['year', 'week_of_year'])[target_col].mean().unstack(level=0)
-im = axes[1,1].imshow(weekly_pattern.T, aspect='auto', cmap='YlOrRd', interpolation='nearest')
-axes[1,1].set_title('Annual Weekly Power Pattern (Heatmap)', fontsize=13, fontweight='bold')
-axes[1,1].set_xlabel('Week of Year', fontsize=11, fontweight='bold')
-axes[1,1].set_ylabel('Year', fontsize=11, fontweight='bold')
-axes[1,1].set_yticks(range(len(weekly_pattern.columns)))
-axes[1,1].set_yticklabels(weekly_pattern.columns)
-# 축 숫자 크기 및 볼드체 설정
-axes[1,1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1,1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1,1].get_yticklabels(), fontweight='bold')
-
-# 컬러바 추가
-cbar = plt.colorbar(im, ax=axes[1,1])
-cbar.set_label('Average Power (MW)', fontsize=11, fontweight='bold')
-
-plt.subplots_adjust(hspace=0.4, wspace=0.3)
-plt.savefig(output_dir / "03_seasonal_patterns.png", dpi=300, bbox_inches='tight')
-print(f"📊 저장: {output_dir / '03_seasonal_patterns.png'}")
-plt.show()
-
-# %%
-# =============================================================================
-# 7. 특별 이벤트 및 이상값 시각화
-# =============================================================================
-
-print("=== 4. 특별 이벤트 및 이상값 시각화 ===")
-
-# 이상값 탐지 (IQR 방법)
-Q1 = df[target_col].quantile(0.25)
-Q3 = df[target_col].quantile(0.75)
-IQR = Q3 - Q1
-lower_bound = Q1 - 1.5 * IQR
-upper_bound = Q3 + 1.5 * IQR
-
-outliers = df[(df[target_col] < lower_bound) | (df[target_col] > upper_bound)]
-extreme_high = df[df[target_col] > df[target_col].quantile(0.99)]
-extreme_low = df[df[target_col] < df[target_col].quantile(0.01)]
-
-# 그림 설정
-fig, axes = plt.subplots(2, 1, figsize=(15, 12))
-fig.suptitle('Special Events and Outlier Analysis', fontsize=18, fontweight='bold')
-
-# 상단: 이상값 하이라이트
-axes[0].plot(df.index, df[target_col], linewidth=0.8, alpha=0.6, color='gray', label='Normal Data')
-if len(outliers) > 0:
-    axes[0].scatter(outliers.index, outliers[target_col], 
-                   color='red', s=30, alpha=0.8, label=f'Outliers ({len(outliers)})')
-if len(extreme_high) > 0:
-    axes[0].scatter(extreme_high.index, extreme_high[target_col], 
-                   color='orange', s=50, alpha=0.8, label=f'Extreme Values (Top 1%) ({len(extreme_high)})')
-
-axes[0].axhline(y=upper_bound, color='red', linestyle='--', alpha=0.7, label=f'Upper Bound ({upper_bound:,.0f})')
-axes[0].axhline(y=lower_bound, color='red', linestyle='--', alpha=0.7, label=f'Lower Bound ({lower_bound:,.0f})')
-axes[0].set_title('Outliers and Extreme Values Distribution', fontsize=14, fontweight='bold')
-axes[0].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
-legend = axes[0].legend(fontsize=10)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-axes[0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0].get_yticklabels(), fontweight='bold')
-
-# 하단: 연도별 최대/최소값 분포
-yearly_max = df_temp.groupby('year')[target_col].max()
-yearly_min = df_temp.groupby('year')[target_col].min()
-yearly_max_date = df_temp.groupby('year')[target_col].idxmax()
-yearly_min_date = df_temp.groupby('year')[target_col].idxmin()
-
-axes[1].plot(yearly_max.index, yearly_max.values, marker='o', linewidth=2, 
-             color='red', label='Annual Maximum', markersize=8)
-axes[1].plot(yearly_min.index, yearly_min.values, marker='v', linewidth=2, 
-             color='blue', label='Annual Minimum', markersize=8)
-
-# 평균선 추가
-mean_line = df[target_col].mean()
-axes[1].axhline(y=mean_line, color='green', linestyle='-', alpha=0.7, 
-               label=f'Overall Average ({mean_line:,.0f})')
-
-axes[1].set_title('Annual Maximum/Minimum Trend', fontsize=14, fontweight='bold')
-axes[1].set_xlabel('Year', fontsize=12, fontweight='bold')
-axes[1].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
-legend = axes[1].legend(fontsize=11)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-axes[1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1].get_yticklabels(), fontweight='bold')
-
-plt.subplots_adjust(hspace=0.4)
-plt.savefig(output_dir / "04_outliers_events.png", dpi=300, bbox_inches='tight')
-print(f"📊 저장: {output_dir / '04_outliers_events.png'}")
-plt.show()
+TARGET_COL = '최대전력(MW)'
+OUTPUT_DIR = PROJECT_ROOT / 'results' / 'eda' / '01_basic_eda'
+RESULT_CACHE_DIR = PROJECT_ROOT / 'results' / '.cache' / 'eda'
+# MSTL 분해 성분은 06/보간/특성 생성과 같은 캐시를 공유
+DECOMPOSITION_CACHE_DIR = PROJECT_ROOT / 'results' / '.cache' / 'analysis'
+
+SEASON_ORDER = ['Spring', 'Summer', 'Fall', 'Winter']
+SEASON_COLORS = {'Spring': 'green', 'Summer': 'red', 'Fall': 'orange', 'Winter': 'blue'}
+# 월 → 계절 (12~2월 Winter, 3~5월 Spring, 6~8월 Summer, 9~11월 Fall)
+SEASON_BY_MONTH = np.array(['', 'Winter', 'Winter', 'Spring', 'Spring', 'Spring', 'Summer',
+                            'Summer', 'Summer', 'Fall', 'Fall', 'Fall', 'Winter'], dtype=object)
+WEEKDAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+# 차트 이름 (출력 파일명, 확장자는 그림 프리셋 형식) → 설명
+CHARTS = {
+    '01_timeseries_overview': "전체 시계열 개요 및 트렌드",
+    '02_yearly_analysis': "연도별 상세 분석",
+    '03_seasonal_patterns': "계절성 및 주기적 패턴",
+    '04_outliers_events': "이상값 및 특별 이벤트",
+    '05_decomposition': "시계열 분해 분석",
+    '06_distributions': "분포 및 확률밀도 분석",
+}
 
 # %%
 # =============================================================================
-# 8. 분해 분석 (Decomposition)
+# 2. 분석 함수 (순수 함수: 출력/파일 저장 없음)
 # =============================================================================
 
-print("=== 5. 시계열 분해 분석 ===")
-
-# 간단한 시계열 분해 (추세, 계절성, 잔차)
-# 연간 이동평균으로 추세 계산
-trend = df[target_col].rolling(window=365, center=True).mean()
-
-# 월별 계절성 패턴 계산
-monthly_avg = df_temp.groupby('month')[target_col].mean()
-seasonal = df_temp['month'].map(monthly_avg)
-
-# 잔차 계산
-residual = df[target_col] - trend - seasonal
-
-# 그림 설정
-fig, axes = plt.subplots(4, 1, figsize=(15, 16))
-fig.suptitle('Time Series Decomposition (Trend + Seasonality + Residual)', fontsize=18, fontweight='bold')
-
-# 1. 원본 데이터
-axes[0].plot(df.index, df[target_col], linewidth=1, color='black')
-axes[0].set_title('Original Time Series Data', fontsize=13, fontweight='bold')
-axes[0].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
-axes[0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0].get_yticklabels(), fontweight='bold')
-
-# 2. 추세 (Trend)
-axes[1].plot(df.index, trend, linewidth=2, color='red')
-axes[1].set_title('Trend Component (365-Day Moving Average)', fontsize=13, fontweight='bold')
-axes[1].set_ylabel('Trend (MW)', fontsize=11, fontweight='bold')
-axes[1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1].get_yticklabels(), fontweight='bold')
-
-# 3. 계절성 (Seasonality)
-axes[2].plot(df.index, seasonal, linewidth=1, color='green', alpha=0.8)
-axes[2].set_title('Seasonal Component (Monthly Pattern)', fontsize=13, fontweight='bold')
-axes[2].set_ylabel('Seasonality (MW)', fontsize=11, fontweight='bold')
-axes[2].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[2].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[2].get_xticklabels(), fontweight='bold')
-plt.setp(axes[2].get_yticklabels(), fontweight='bold')
-
-# 4. 잔차 (Residual)
-axes[3].plot(df.index, residual, linewidth=0.8, color='orange', alpha=0.7)
-axes[3].axhline(y=0, color='black', linestyle='-', linewidth=1)
-axes[3].set_title('Residual Component (Original - Trend - Seasonality)', fontsize=13, fontweight='bold')
-axes[3].set_xlabel('Year', fontsize=11, fontweight='bold')
-axes[3].set_ylabel('Residual (MW)', fontsize=11, fontweight='bold')
-axes[3].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[3].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[3].get_xticklabels(), fontweight='bold')
-plt.setp(axes[3].get_yticklabels(), fontweight='bold')
-
-plt.subplots_adjust(hspace=0.5)
-plt.savefig(output_dir / "05_decomposition.png", dpi=300, bbox_inches='tight')
-print(f"📊 저장: {output_dir / '05_decomposition.png'}")
-plt.show()
+def to_series(df, target_col=TARGET_COL, date_col=DATE_COL):
+    """날짜 인덱스 타겟 시계열"""
+    return pd.Series(df[target_col].to_numpy(), index=pd.DatetimeIndex(df[date_col]), name=target_col)
+
+def trend_components(series):
+    """연도별 통계·성장률과 30/365일 중심 이동평균"""
+    yearly = series.groupby(series.index.year).agg(['mean', 'max', 'min', 'std']).rename_axis('year')
+    yearly['growth_pct'] = yearly['mean'].pct_change() * 100
+    yearly['max_date'] = series.groupby(series.index.year).idxmax().values
+    yearly['min_date'] = series.groupby(series.index.year).idxmin().values
+    return {
+        'yearly': yearly,
+        'rolling_30': series.rolling(window=30, center=True).mean(),
+        'rolling_365': series.rolling(window=365, center=True).mean(),
+    }
+
+def seasonal_components(series):
+    """월/계절/요일 통계와 연도 × 연중 주차 평균 표"""
+    index = series.index
+    season = pd.Series(SEASON_BY_MONTH[index.month.to_numpy()], index=index)
+    weekly_pattern = series.groupby([index.year, index.isocalendar().week.to_numpy().astype(int)]).mean()
+    weekly_pattern.index.names = ['year', 'week_of_year']
+
+    return {
+        'monthly': series.groupby(index.month).agg(['mean', 'std']).rename_axis('month'),
+        'seasonal': series.groupby(season).agg(['count', 'mean', 'std']).reindex(SEASON_ORDER),
+        'weekday': series.groupby(index.weekday).agg(['mean', 'std']).rename_axis('weekday'),
+        'weekly_pattern': weekly_pattern.unstack(level=0),
+    }
+
+def outlier_components(series, iqr_factor=1.5):
+    """IQR 이상값과 상/하위 1% 극단값"""
+    q1, q3, p01, p99 = series.quantile([0.25, 0.75, 0.01, 0.99])
+    iqr = q3 - q1
+    lower_bound, upper_bound = q1 - iqr_factor * iqr, q3 + iqr_factor * iqr
+    return {
+        'lower_bound': float(lower_bound),
+        'upper_bound': float(upper_bound),
+        'outliers': series[(series < lower_bound) | (series > upper_bound)],
+        'extreme_high': series[series > p99],
+        'extreme_low': series[series < p01],
+        'mean': float(series.mean()),
+    }
+
+def decomposition_components(series):
+    """MSTL 분해: 추세 + 주간(7일)·연간(365일) 계절성 + 잔차 (원 시계열 날짜 기준)"""
+    components = get_decomposition(series, cache_dir=DECOMPOSITION_CACHE_DIR).reindex(series.index)
+    return {
+        'trend': components['trend'],
+        'seasonal_weekly': components['seasonal_7'],
+        'seasonal_annual': components['seasonal_365'],
+        'seasonal': components['seasonal_7'] + components['seasonal_365'],
+        'residual': components['resid'],
+    }
+
+def distribution_components(series):
+    """분포 요약 (평균/중앙값/왜도/첨도, 정규 Q-Q 적합도)"""
+    values = series.dropna().to_numpy()
+    (osm, osr), (slope, intercept, r) = stats.probplot(values, dist="norm")
+    return {
+        'mean': float(values.mean()),
+        'median': float(np.median(values)),
+        'skew': float(stats.skew(values)),
+        'kurtosis': float(stats.kurtosis(values)),
+        'qq_theoretical': osm,
+        'qq_ordered': osr,
+        'qq_fit': {'slope': float(slope), 'intercept': float(intercept), 'r': float(r)},
+    }
+
+def timeseries_components(df, target_col=TARGET_COL, date_col=DATE_COL):
+    """전체 시각화 집계 결과 (get_results 메모이즈 대상)"""
+    series = to_series(df, target_col, date_col)
+    trend = trend_components(series)
+    return {
+        'target_col': target_col,
+        'start': series.index.min(),
+        'end': series.index.max(),
+        'n_points': len(series),
+        'trend': trend,
+        'seasonal': seasonal_components(series),
+        'outliers': outlier_components(series),
+        'decomposition': decomposition_components(series),
+        'distribution': distribution_components(series),
+    }
+
+def get_results(raw=None, cache=None, force=False):
+    """시각화 집계 결과 조회 (같은 데이터·코드이면 디스크 캐시에서 바로 반환)"""
+    df = load_raw_data() if raw is None else raw
+    cache = cache or ResultCache(RESULT_CACHE_DIR)
+    return cache.run('03_timeseries_components', timeseries_components, df, code=[__file__, mstl_decompose], force=force)
 
 # %%
 # =============================================================================
-# 9. 분포 및 확률밀도 분석
+# 3. 시각화 (집계 결과와 원 시계열만 사용)
 # =============================================================================
 
-print("=== 6. 분포 및 확률밀도 분석 ===")
-
-# 그림 설정
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-fig.suptitle('Power Supply Data Distribution Analysis', fontsize=18, fontweight='bold')
-
-# 1. 히스토그램 + KDE
-axes[0,0].hist(df[target_col], bins=50, alpha=0.7, color='skyblue', 
-               edgecolor='black', density=True, label='Histogram')
-df[target_col].plot.kde(ax=axes[0,0], color='red', linewidth=2, label='KDE')
-axes[0,0].axvline(df[target_col].mean(), color='green', linestyle='--', 
-                  linewidth=2, label=f'Mean ({df[target_col].mean():,.0f})')
-axes[0,0].axvline(df[target_col].median(), color='orange', linestyle='--', 
-                  linewidth=2, label=f'Median ({df[target_col].median():,.0f})')
-axes[0,0].set_title('Power Data Distribution (Histogram + KDE)', fontsize=13, fontweight='bold')
-axes[0,0].set_xlabel('Power (MW)', fontsize=11, fontweight='bold')
-axes[0,0].set_ylabel('Probability Density', fontsize=11, fontweight='bold')
-legend = axes[0,0].legend(fontsize=9)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-axes[0,0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0,0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0,0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0,0].get_yticklabels(), fontweight='bold')
-
-# 2. Q-Q 플롯 (정규성 검증)
-from scipy import stats
-stats.probplot(df[target_col], dist="norm", plot=axes[0,1])
-axes[0,1].set_title('Q-Q Plot (Normal Distribution Comparison)', fontsize=13, fontweight='bold')
-axes[0,1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[0,1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[0,1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[0,1].get_yticklabels(), fontweight='bold')
-
-# 3. 계절별 분포 비교
-season_colors = {'Spring': 'green', 'Summer': 'red', 'Fall': 'orange', 'Winter': 'blue'}
-for season in season_order:
-    season_data = df_temp[df_temp['season'] == season][target_col]
-    season_data.plot.kde(ax=axes[1,0], label=f'{season} (n={len(season_data)})', 
-                        color=season_colors[season], linewidth=2)
-
-axes[1,0].set_title('Seasonal Power Distribution Comparison (KDE)', fontsize=13, fontweight='bold')
-axes[1,0].set_xlabel('Power (MW)', fontsize=11, fontweight='bold')
-axes[1,0].set_ylabel('Probability Density', fontsize=11, fontweight='bold')
-legend = axes[1,0].legend(fontsize=9)
-for text in legend.get_texts():
-    text.set_fontweight('bold')
-axes[1,0].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1,0].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1,0].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1,0].get_yticklabels(), fontweight='bold')
-
-# 4. 연도별 분포 변화 (바이올린 플롯)
-years_sample = sorted(df_temp['year'].unique())[::3]  # 3년마다 샘플링
-yearly_data_sample = [df_temp[df_temp['year'] == year][target_col] for year in years_sample]
-parts = axes[1,1].violinplot(yearly_data_sample, positions=range(len(years_sample)), 
-                            showmeans=True, showmedians=True)
-axes[1,1].set_title('Annual Distribution Changes (Violin Plot)', fontsize=13, fontweight='bold')
-axes[1,1].set_xlabel('Year (Sample)', fontsize=11, fontweight='bold')
-axes[1,1].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
-axes[1,1].set_xticks(range(len(years_sample)))
-axes[1,1].set_xticklabels(years_sample)
-axes[1,1].grid(True, alpha=0.3)
-# 축 숫자 크기 및 볼드체 설정
-axes[1,1].tick_params(axis='both', which='major', labelsize=10)
-plt.setp(axes[1,1].get_xticklabels(), fontweight='bold')
-plt.setp(axes[1,1].get_yticklabels(), fontweight='bold')
-
-plt.subplots_adjust(hspace=0.4, wspace=0.3)
-plt.savefig(output_dir / "06_distributions.png", dpi=300, bbox_inches='tight')
-print(f"📊 저장: {output_dir / '06_distributions.png'}")
-plt.show()
+def _style_axis(ax, labelsize=10, grid=True):
+    # 축 숫자 크기 및 볼드체 설정
+    if grid:
+        ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='both', which='major', labelsize=labelsize)
+    plt.setp(ax.get_xticklabels(), fontweight='bold')
+    plt.setp(ax.get_yticklabels(), fontweight='bold')
+
+def _bold_legend(ax, fontsize):
+    legend = ax.legend(fontsize=fontsize)
+    for text in legend.get_texts():
+        text.set_fontweight('bold')
+
+def plot_overview(data):
+    """전체 시계열 개요 플롯"""
+    series, results = data['series'], data['results']
+    trend = results['trend']
+    fig, axes = plt.subplots(2, 1, figsize=(15, 12))
+    fig.suptitle('Daily Maximum Power Supply Time Series Data (2005-2023)', fontsize=18, fontweight='bold')
+
+    # 상단: 전체 시계열 + 연도별 평균
+    axes[0].plot(series.index, series.values, linewidth=0.8, alpha=0.8, color='steelblue')
+    axes[0].plot(trend['yearly'].index, trend['yearly']['mean'].values,
+                 color='red', linewidth=3, label='Annual Average', alpha=0.8)
+    axes[0].set_title('Daily Maximum Power Trend - Full Period', fontsize=14, fontweight='bold')
+    axes[0].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
+    axes[0].tick_params(axis='x', rotation=45)
+    _bold_legend(axes[0], 11)
+    _style_axis(axes[0], labelsize=12)
+
+    # 하단: 이동평균을 활용한 트렌드
+    axes[1].plot(series.index, series.values, linewidth=0.5, alpha=0.3, color='lightgray', label='Daily Data')
+    axes[1].plot(series.index, trend['rolling_30'].values, linewidth=1.5, color='orange', label='30-Day Moving Average')
+    axes[1].plot(series.index, trend['rolling_365'].values, linewidth=2.5, color='red', label='365-Day Moving Average')
+    axes[1].set_title('Trend Analysis with Moving Averages', fontsize=14, fontweight='bold')
+    axes[1].set_xlabel('Year', fontsize=12, fontweight='bold')
+    axes[1].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
+    axes[1].tick_params(axis='x', rotation=45)
+    _bold_legend(axes[1], 11)
+    _style_axis(axes[1], labelsize=12)
+
+    plt.subplots_adjust(hspace=0.4)
+    return fig
+
+def plot_yearly(data):
+    """연도별 상세 분석 플롯"""
+    series, results = data['series'], data['results']
+    yearly = results['trend']['yearly']
+    fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+    fig.suptitle('Annual Power Supply Pattern Analysis', fontsize=18, fontweight='bold')
+
+    # 1. 연도별 박스플롯
+    yearly_data = [group.dropna().values for _, group in series.groupby(series.index.year)]
+    axes[0,0].boxplot(yearly_data, labels=yearly.index)
+    axes[0,0].set_title('Annual Power Distribution (Box Plot)', fontsize=13, fontweight='bold')
+    axes[0,0].set_xlabel('Year', fontsize=11, fontweight='bold')
+    axes[0,0].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
+    axes[0,0].tick_params(axis='x', rotation=45)
+
+    # 2. 연도별 평균/최대값 추이
+    for stat, marker, label in [('mean', 'o', 'Mean'), ('max', 's', 'Max'), ('min', '^', 'Min')]:
+        axes[0,1].plot(yearly.index, yearly[stat].round(0), marker=marker, linewidth=2, label=label)
+    axes[0,1].set_title('Annual Statistics Trend', fontsize=13, fontweight='bold')
+    axes[0,1].set_xlabel('Year', fontsize=11, fontweight='bold')
+    axes[0,1].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
+    _bold_legend(axes[0,1], 10)
+
+    # 3. 연도별 변동성 (표준편차)
+    axes[1,0].bar(yearly.index, yearly['std'].values, alpha=0.7, color='skyblue', edgecolor='black')
+    axes[1,0].set_title('Annual Volatility (Standard Deviation)', fontsize=13, fontweight='bold')
+    axes[1,0].set_xlabel('Year', fontsize=11, fontweight='bold')
+    axes[1,0].set_ylabel('Standard Deviation (MW)', fontsize=11, fontweight='bold')
+    axes[1,0].tick_params(axis='x', rotation=45)
+
+    # 4. 연도별 성장률
+    growth_rate = yearly['growth_pct'].dropna()
+    axes[1,1].bar(growth_rate.index, growth_rate.values,
+                  color=np.where(growth_rate.values > 0, 'green', 'red'), alpha=0.7)
+    axes[1,1].axhline(y=0, color='black', linestyle='-', linewidth=1)
+    axes[1,1].set_title('Annual Growth Rate (%)', fontsize=13, fontweight='bold')
+    axes[1,1].set_xlabel('Year', fontsize=11, fontweight='bold')
+    axes[1,1].set_ylabel('Growth Rate (%)', fontsize=11, fontweight='bold')
+    axes[1,1].tick_params(axis='x', rotation=45)
+
+    for ax in axes.flat:
+        _style_axis(ax)
+
+    plt.subplots_adjust(hspace=0.4, wspace=0.3)
+    return fig
+
+def plot_seasonal(data):
+    """계절성 패턴 분석 플롯"""
+    series, results = data['series'], data['results']
+    seasonal = results['seasonal']
+    fig, axes = plt.subplots(2, 2, figsize=(18, 14))
+    fig.suptitle('Seasonal and Periodic Pattern Analysis', fontsize=18, fontweight='bold')
+
+    # 1. 월별 패턴
+    monthly = seasonal['monthly']
+    axes[0,0].bar(monthly.index, monthly['mean'].values, alpha=0.7, color='lightcoral',
+                  yerr=monthly['std'].values, capsize=5, edgecolor='black')
+    axes[0,0].set_title('Monthly Average Power Supply (±Std Dev)', fontsize=13, fontweight='bold')
+    axes[0,0].set_xlabel('Month', fontsize=11, fontweight='bold')
+    axes[0,0].set_ylabel('Average Power (MW)', fontsize=11, fontweight='bold')
+    axes[0,0].set_xticks(range(1, 13))
+    _style_axis(axes[0,0])
+
+    # 2. 계절별 분포
+    season = SEASON_BY_MONTH[series.index.month.to_numpy()]
+    seasonal_data = [series[season == name].dropna().values for name in SEASON_ORDER]
+    axes[0,1].boxplot(seasonal_data, labels=SEASON_ORDER)
+    axes[0,1].set_title('Seasonal Power Distribution', fontsize=13, fontweight='bold')
+    axes[0,1].set_xlabel('Season', fontsize=11, fontweight='bold')
+    axes[0,1].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
+    _style_axis(axes[0,1])
+
+    # 3. 요일별 패턴 (평일=빨강, 주말=파랑)
+    weekday = seasonal['weekday']
+    axes[1,0].bar(range(7), weekday['mean'].values, alpha=0.7,
+                  color=['red' if i < 5 else 'blue' for i in range(7)],
+                  yerr=weekday['std'].values, capsize=5, edgecolor='black')
+    axes[1,0].set_title('Weekly Average Power Supply (Weekday vs Weekend)', fontsize=13, fontweight='bold')
+    axes[1,0].set_xlabel('Day of Week', fontsize=11, fontweight='bold')
+    axes[1,0].set_ylabel('Average Power (MW)', fontsize=11, fontweight='bold')
+    axes[1,0].set_xticks(range(7))
+    axes[1,0].set_xticklabels(WEEKDAY_NAMES)
+    _style_axis(axes[1,0])
+
+    # 4. 연중 주차별 패턴 (히트맵)
+    weekly_pattern = seasonal['weekly_pattern']
+    im = axes[1,1].imshow(weekly_pattern.T, aspect='auto', cmap='YlOrRd', interpolation='nearest')
+    axes[1,1].set_title('Annual Weekly Power Pattern (Heatmap)', fontsize=13, fontweight='bold')
+    axes[1,1].set_xlabel('Week of Year', fontsize=11, fontweight='bold')
+    axes[1,1].set_ylabel('Year', fontsize=11, fontweight='bold')
+    axes[1,1].set_yticks(range(len(weekly_pattern.columns)))
+    axes[1,1].set_yticklabels(weekly_pattern.columns)
+    _style_axis(axes[1,1], grid=False)
+
+    cbar = plt.colorbar(im, ax=axes[1,1])
+    cbar.set_label('Average Power (MW)', fontsize=11, fontweight='bold')
+
+    plt.subplots_adjust(hspace=0.4, wspace=0.3)
+    return fig
+
+def plot_outliers(data):
+    """특별 이벤트 및 이상값 시각화"""
+    series, results = data['series'], data['results']
+    outliers = results['outliers']
+    yearly = results['trend']['yearly']
+    fig, axes = plt.subplots(2, 1, figsize=(15, 12))
+    fig.suptitle('Special Events and Outlier Analysis', fontsize=18, fontweight='bold')
+
+    # 상단: 이상값 하이라이트
+    axes[0].plot(series.index, series.values, linewidth=0.8, alpha=0.6, color='gray', label='Normal Data')
+    if len(outliers['outliers']) > 0:
+        axes[0].scatter(outliers['outliers'].index, outliers['outliers'].values,
+                        color='red', s=30, alpha=0.8, label=f"Outliers ({len(outliers['outliers'])})")
+    if len(outliers['extreme_high']) > 0:
+        axes[0].scatter(outliers['extreme_high'].index, outliers['extreme_high'].values,
+                        color='orange', s=50, alpha=0.8,
+                        label=f"Extreme Values (Top 1%) ({len(outliers['extreme_high'])})")
+    axes[0].axhline(y=outliers['upper_bound'], color='red', linestyle='--', alpha=0.7,
+                    label=f"Upper Bound ({outliers['upper_bound']:,.0f})")
+    axes[0].axhline(y=outliers['lower_bound'], color='red', linestyle='--', alpha=0.7,
+                    label=f"Lower Bound ({outliers['lower_bound']:,.0f})")
+    axes[0].set_title('Outliers and Extreme Values Distribution', fontsize=14, fontweight='bold')
+    axes[0].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
+    _bold_legend(axes[0], 10)
+    _style_axis(axes[0])
+
+    # 하단: 연도별 최대/최소값 분포
+    axes[1].plot(yearly.index, yearly['max'].values, marker='o', linewidth=2,
+                 color='red', label='Annual Maximum', markersize=8)
+    axes[1].plot(yearly.index, yearly['min'].values, marker='v', linewidth=2,
+                 color='blue', label='Annual Minimum', markersize=8)
+    axes[1].axhline(y=outliers['mean'], color='green', linestyle='-', alpha=0.7,
+                    label=f"Overall Average ({outliers['mean']:,.0f})")
+    axes[1].set_title('Annual Maximum/Minimum Trend', fontsize=14, fontweight='bold')
+    axes[1].set_xlabel('Year', fontsize=12, fontweight='bold')
+    axes[1].set_ylabel('Power (MW)', fontsize=12, fontweight='bold')
+    _bold_legend(axes[1], 11)
+    _style_axis(axes[1])
+
+    plt.subplots_adjust(hspace=0.4)
+    return fig
+
+def plot_decomposition(data):
+    """시계열 분해 (추세 + 계절성 + 잔차) 플롯"""
+    series, results = data['series'], data['results']
+    decomposition = results['decomposition']
+    fig, axes = plt.subplots(4, 1, figsize=(15, 16))
+    fig.suptitle('Time Series Decomposition (MSTL: Trend + Seasonality + Residual)', fontsize=18, fontweight='bold')
+
+    panels = [
+        (series, dict(linewidth=1, color='black'), 'Original Time Series Data', 'Power (MW)'),
+        (decomposition['trend'], dict(linewidth=2, color='red'), 'Trend Component (MSTL)', 'Trend (MW)'),
+        (decomposition['seasonal'], dict(linewidth=1, color='green', alpha=0.8), 'Seasonal Component (Weekly 7d + Annual 365d)', 'Seasonality (MW)'),
+        (decomposition['residual'], dict(linewidth=0.8, color='orange', alpha=0.7), 'Residual Component (Original - Trend - Seasonality)', 'Residual (MW)'),
+    ]
+    for ax, (values, style, title, ylabel) in zip(axes, panels):
+        ax.plot(series.index, values.values, **style)
+        ax.set_title(title, fontsize=13, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=11, fontweight='bold')
+        _style_axis(ax)
+
+    axes[3].axhline(y=0, color='black', linestyle='-', linewidth=1)
+    axes[3].set_xlabel('Year', fontsize=11, fontweight='bold')
+
+    plt.subplots_adjust(hspace=0.5)
+    return fig
+
+def plot_distributions(data):
+    """분포 및 확률밀도 분석 플롯"""
+    series, results = data['series'], data['results']
+    distribution = results['distribution']
+    values = series.dropna()
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig.suptitle('Power Supply Data Distribution Analysis', fontsize=18, fontweight='bold')
+
+    # 1. 히스토그램 + KDE
+    axes[0,0].hist(values, bins=50, alpha=0.7, color='skyblue', edgecolor='black', density=True, label='Histogram')
+    values.plot.kde(ax=axes[0,0], color='red', linewidth=2, label='KDE')
+    axes[0,0].axvline(distribution['mean'], color='green', linestyle='--',
+                      linewidth=2, label=f"Mean ({distribution['mean']:,.0f})")
+    axes[0,0].axvline(distribution['median'], color='orange', linestyle='--',
+                      linewidth=2, label=f"Median ({distribution['median']:,.0f})")
+    axes[0,0].set_title('Power Data Distribution (Histogram + KDE)', fontsize=13, fontweight='bold')
+    axes[0,0].set_xlabel('Power (MW)', fontsize=11, fontweight='bold')
+    axes[0,0].set_ylabel('Probability Density', fontsize=11, fontweight='bold')
+    _bold_legend(axes[0,0], 9)
+
+    # 2. Q-Q 플롯 (정규성 검증)
+    fit = distribution['qq_fit']
+    axes[0,1].plot(distribution['qq_theoretical'], distribution['qq_ordered'], 'o', markersize=3)
+    axes[0,1].plot(distribution['qq_theoretical'],
+                   fit['slope'] * distribution['qq_theoretical'] + fit['intercept'], 'r-')
+    axes[0,1].set_title('Q-Q Plot (Normal Distribution Comparison)', fontsize=13, fontweight='bold')
+    axes[0,1].set_xlabel('Theoretical quantiles')
+    axes[0,1].set_ylabel('Ordered Values')
+
+    # 3. 계절별 분포 비교
+    season = SEASON_BY_MONTH[series.index.month.to_numpy()]
+    for name in SEASON_ORDER:
+        season_data = series[season == name].dropna()
+        season_data.plot.kde(ax=axes[1,0], label=f'{name} (n={len(season_data)})',
+                             color=SEASON_COLORS[name], linewidth=2)
+    axes[1,0].set_title('Seasonal Power Distribution Comparison (KDE)', fontsize=13, fontweight='bold')
+    axes[1,0].set_xlabel('Power (MW)', fontsize=11, fontweight='bold')
+    axes[1,0].set_ylabel('Probability Density', fontsize=11, fontweight='bold')
+    _bold_legend(axes[1,0], 9)
+
+    # 4. 연도별 분포 변화 (바이올린 플롯, 3년마다 샘플링)
+    years_sample = sorted(series.index.year.unique())[::3]
+    yearly_data_sample = [series[series.index.year == year].dropna().values for year in years_sample]
+    axes[1,1].violinplot(yearly_data_sample, positions=range(len(years_sample)), showmeans=True, showmedians=True)
+    axes[1,1].set_title('Annual Distribution Changes (Violin Plot)', fontsize=13, fontweight='bold')
+    axes[1,1].set_xlabel('Year (Sample)', fontsize=11, fontweight='bold')
+    axes[1,1].set_ylabel('Power (MW)', fontsize=11, fontweight='bold')
+    axes[1,1].set_xticks(range(len(years_sample)))
+    axes[1,1].set_xticklabels(years_sample)
+
+    for ax in axes.flat:
+        _style_axis(ax)
+
+    plt.subplots_adjust(hspace=0.4, wspace=0.3)
+    return fig
+
+PLOTTERS = {
+    '01_timeseries_overview': plot_overview,
+    '02_yearly_analysis': plot_yearly,
+    '03_seasonal_patterns': plot_seasonal,
+    '04_outliers_events': plot_outliers,
+    '05_decomposition': plot_decomposition,
+    '06_distributions': plot_distributions,
+}
+
+def figure_specs(series, results):
+    """전체 차트 렌더링 명세"""
+    data = {'series': series, 'results': results}
+    return [FigureSpec(name, PLOTTERS[name], data) for name in CHARTS]
 
 # %%
 # =============================================================================
-# 10. 요약 리포트 및 통계
+# 4. 메인 실행
 # =============================================================================
 
-print("\n" + "="*60)
-print("📋 시계열 시각화 완료 리포트")
-print("="*60)
-
-print(f"\n🎯 생성된 시각화 차트:")
-charts_created = [
-    "01_timeseries_overview.png - 전체 시계열 개요 및 트렌드",
-    "02_yearly_analysis.png - 연도별 상세 분석",
-    "03_seasonal_patterns.png - 계절성 및 주기적 패턴",
-    "04_outliers_events.png - 이상값 및 특별 이벤트",
-    "05_decomposition.png - 시계열 분해 분석",
-    "06_distributions.png - 분포 및 확률밀도 분석"
-]
-
-for i, chart in enumerate(charts_created, 1):
-    print(f"  {i}. {chart}")
-
-print(f"\n📊 주요 시각화 인사이트:")
-print(f"  • 전체 기간: {df.index.min().strftime('%Y-%m-%d')} ~ {df.index.max().strftime('%Y-%m-%d')}")
-print(f"  • 총 데이터 포인트: {len(df):,}개")
-print(f"  • 연평균 증가 추세: 지속적 상승 패턴")
-print(f"  • 계절성: 겨울 > 여름 > 가을 > 봄 순")
-print(f"  • 요일 패턴: 평일 > 주말 전력수요")
-print(f"  • 이상값: {len(outliers)}개 탐지")
-
-print(f"\n💾 결과 저장 위치:")
-print(f"  • 출력 디렉토리: {output_dir}")
-print(f"  • 모든 차트: PNG 형식, 300 DPI")
-
-print(f"\n🎉 Task 2.3 완료!")
-print(f"다음 단계: Task 2.4 - Analyze Missing Values") 
\ No newline at end of file
+def main(raw=None, cache=None, force=False, preset=None):
+    """메인 실행 함수 (raw: 미리 로딩한 원본 데이터, 없으면 파일에서 로딩, preset: 그림 프리셋)"""
+    df = load_raw_data() if raw is None else raw
+    series = to_series(df)
+    print(f"✅ 데이터 로딩 완료: {df.shape[0]:,}행 × {df.shape[1]}열")
+    print(f"날짜 범위: {series.index.min().strftime('%Y-%m-%d')} ~ {series.index.max().strftime('%Y-%m-%d')}")
+
+    cache = cache or ResultCache(RESULT_CACHE_DIR)
+    results = get_results(df, cache=cache, force=force)
+
+    renderer = FigureRenderer(OUTPUT_DIR, preset=preset)
+    print(f"📁 출력 디렉토리: {OUTPUT_DIR}")
+
+    rendered = renderer.render(figure_specs(series, results), force=force)
+    for i, figure in enumerate(rendered, 1):
+        description = CHARTS[figure['name']]
+        if figure['rendered']:
+            print(f"📊 {i}. {description} 저장: {figure['path']} ({figure['elapsed_seconds']:.2f}초)")
+        else:
+            print(f"⏭️ {i}. {description}: 변경 없음 ({figure['path']})")
+
+    print("\n" + "="*60)
+    print("📋 시계열 시각화 완료 리포트")
+    print("="*60)
+
+    print(f"\n🎯 생성된 시각화 차트:")
+    for i, figure in enumerate(rendered, 1):
+        print(f"  {i}. {figure['path'].name} - {CHARTS[figure['name']]}")
+
+    seasonal_means = results['seasonal']['seasonal']['mean'].sort_values(ascending=False)
+    print(f"\n📊 주요 시각화 인사이트:")
+    print(f"  • 전체 기간: {results['start'].strftime('%Y-%m-%d')} ~ {results['end'].strftime('%Y-%m-%d')}")
+    print(f"  • 총 데이터 포인트: {results['n_points']:,}개")
+    print(f"  • 연평균 성장률: {results['trend']['yearly']['growth_pct'].mean():.2f}%")
+    print(f"  • 계절성: {' > '.join(seasonal_means.index)} 순")
+    print(f"  • 분포: 왜도 {results['distribution']['skew']:.3f}, 첨도 {results['distribution']['kurtosis']:.3f}")
+    print(f"  • 이상값: {len(results['outliers']['outliers'])}개 탐지")
+
+    print(f"\n💾 결과 저장 위치:")
+    print(f"  • 출력 디렉토리: {OUTPUT_DIR}")
+    print(f"  • 모든 차트: {renderer.settings['format'].upper()} 형식, {renderer.settings['dpi']} DPI")
+
+    print(f"\n🎉 Task 2.3 완료!")
+    print(f"다음 단계: Task 2.4 - Analyze Missing Values")
+    return results
+
+if __name__ == "__main__":
+    main()
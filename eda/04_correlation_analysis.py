@@ -9,24 +9,35 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+import sys
 from datetime import datetime
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.loader import load_raw_data
+from src.features.relevance import check_mutual_information, feature_relevance, top_k_corr_matrix, top_k_features
+from src.utils.figures import save_figure
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['Arial Unicode MS', 'AppleGothic', 'Malgun Gothic']
 plt.rcParams['axes.unicode_minus'] = False
 
-def load_and_prepare_data():
+TARGET_COL = '최대전력(MW)'
+# 히트맵/막대그래프에 표시할 상위 피처 수 (전체 쌍 상관행렬은 계산하지 않음)
+TOP_K = 15
+
+def load_and_prepare_data(raw=None):
     """데이터 로딩 및 피처 엔지니어링"""
     print("📊 데이터 로딩 및 전처리 시작...")
     
-    # 데이터 로딩
-    df = pd.read_csv('data/shared/data.csv')
-    
-    # 날짜 변환
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
-    df = df.sort_values('date').reset_index(drop=True)
+    # 데이터 로딩 (date 변환 및 정렬 완료 상태)
+    df = (load_raw_data() if raw is None else raw).copy()
     
     # 기본 시간 기반 피처 생성
     df['year'] = df['date'].dt.year
@@ -90,93 +101,89 @@ def load_and_prepare_data():
     print(f"✅ 피처 생성 완료: {df.shape[1]}개 변수, {df.shape[0]}개 관측치")
     return df
 
-def create_correlation_analysis(df):
-    """상관관계 분석 수행"""
+def create_correlation_analysis(df, top_k=TOP_K):
+    """피처 관련도 분석 (타겟 상관, 상호정보량, 래그 교차상관 + 상위 k개 블록 상관행렬)"""
     print("\n🔍 상관관계 분석 시작...")
     
-    # 수치형 변수만 선택
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    if 'date' in df.columns:
-        numeric_cols = [col for col in numeric_cols if col != 'date']
+    # 상호정보량 구간화 점검 (상수 열 ≈ 0, 0/1 열 ≤ ln 2)
+    check_mutual_information()
+    relevance = feature_relevance(df, TARGET_COL)
+    table = relevance['table']
+    print(f"✅ 피처 {len(table)}개 관련도 계산 완료 (상관, 상호정보량, 래그 {list(relevance['lag_corr'].columns)})")
     
-    # 상관관계 매트릭스 계산
-    correlation_matrix = df[numeric_cols].corr()
+    print(f"📈 전력 수요와 상관관계가 높은 상위 {top_k}개 변수:")
+    for i, (var, row) in enumerate(table.head(top_k).iterrows(), 1):
+        print(f"{i:2d}. {var}: {row['corr']:+.3f} (MI {row['mutual_info']:.3f})")
     
-    # 전력 수요와 다른 변수들의 상관관계 추출
-    power_correlations = correlation_matrix['최대전력(MW)'].abs().sort_values(ascending=False)
+    # 상호정보량 기준 상위 (비선형 관계)
+    print(f"\n🔗 상호정보량 기준 상위 {top_k}개 변수:")
+    for i, var in enumerate(top_k_features(table, top_k, by='mutual_info'), 1):
+        print(f"{i:2d}. {var}: {table.at[var, 'mutual_info']:.3f}")
     
-    print("📈 전력 수요와 상관관계가 높은 상위 10개 변수:")
-    for i, (var, corr) in enumerate(power_correlations.head(11).items(), 1):
-        if var != '최대전력(MW)':  # 자기 자신 제외
-            print(f"{i:2d}. {var}: {corr:.3f}")
+    # 상관 상위 k개 피처 + 타겟 블록만 상관행렬 계산
+    top_vars = top_k_features(table, top_k)
+    correlation_matrix = top_k_corr_matrix(df, [TARGET_COL] + top_vars)
     
-    return correlation_matrix, power_correlations, numeric_cols
+    return relevance, correlation_matrix, top_vars
 
-def create_visualizations(df, correlation_matrix, power_correlations, numeric_cols):
+def create_visualizations(df, relevance, correlation_matrix, top_vars):
     """시각화 생성"""
     print("\n📊 시각화 생성 중...")
+    table, lag_corr = relevance['table'], relevance['lag_corr']
     
-    # 1. 전체 상관관계 히트맵
-    plt.figure(figsize=(20, 16))
-    mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))
-    sns.heatmap(correlation_matrix, 
-                mask=mask,
-                annot=True, 
-                fmt='.2f',
+    # 1. 전력 수요와 상위 k개 변수들의 상관관계
+    plt.figure(figsize=(12, 10))
+    sns.heatmap(correlation_matrix,
+                annot=True,
+                fmt='.3f',
                 cmap='RdBu_r',
                 center=0,
                 square=True,
-                linewidths=0.5,
-                cbar_kws={"shrink": .8},
-                annot_kws={'size': 8})
-    plt.title('변수 간 상관관계 히트맵', fontsize=16, fontweight='bold', pad=20)
+                linewidths=0.5)
+    plt.title('전력 수요와 주요 변수들의 상관관계', fontsize=14, fontweight='bold', pad=20)
     plt.xticks(rotation=45, ha='right')
     plt.yticks(rotation=0)
     plt.tight_layout()
-    plt.savefig('results/eda/correlation_heatmap_full.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # 2. 전력 수요와 주요 변수들의 상관관계 (상위 15개)
-    top_vars = power_correlations.head(16).index[1:16]  # 자기 자신 제외하고 상위 15개
-    selected_vars = ['최대전력(MW)'] + list(top_vars)
+    save_figure(plt.gcf(), 'results/eda/correlation_heatmap_main.png')
     
-    plt.figure(figsize=(12, 10))
-    corr_subset = correlation_matrix.loc[selected_vars, selected_vars]
-    sns.heatmap(corr_subset,
+    # 2. 상위 k개 변수의 래그 교차상관 (x_{t-k} vs 전력 수요_t)
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(lag_corr.loc[top_vars],
                 annot=True,
-                fmt='.3f',
+                fmt='.2f',
                 cmap='RdBu_r',
                 center=0,
-                square=True,
                 linewidths=0.5)
-    plt.title('전력 수요와 주요 변수들의 상관관계', fontsize=14, fontweight='bold', pad=20)
-    plt.xticks(rotation=45, ha='right')
-    plt.yticks(rotation=0)
+    plt.title('주요 변수들의 래그 교차상관', fontsize=14, fontweight='bold', pad=20)
+    plt.xlabel('래그 (일)')
     plt.tight_layout()
-    plt.savefig('results/eda/correlation_heatmap_main.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # 3. 전력 수요 상관관계 막대 그래프
-    plt.figure(figsize=(12, 8))
-    top_15_corr = power_correlations.head(16)[1:16]  # 자기 자신 제외
-    colors = ['red' if x < 0 else 'blue' for x in correlation_matrix.loc[top_15_corr.index, '최대전력(MW)']]
-    
-    bars = plt.barh(range(len(top_15_corr)), 
-                    correlation_matrix.loc[top_15_corr.index, '최대전력(MW)'],
-                    color=colors, alpha=0.7)
-    plt.yticks(range(len(top_15_corr)), top_15_corr.index)
-    plt.xlabel('상관계수', fontsize=12)
-    plt.title('전력 수요와 다른 변수들의 상관관계 (상위 15개)', fontsize=14, fontweight='bold')
-    plt.grid(axis='x', alpha=0.3)
+    save_figure(plt.gcf(), 'results/eda/lagged_cross_correlation_heatmap.png')
+    
+    # 3. 전력 수요 상관관계 막대 그래프 (상관계수 + 상호정보량)
+    top = table.loc[top_vars]
+    fig, axes = plt.subplots(1, 2, figsize=(18, 8), sharey=True)
+    colors = ['red' if x < 0 else 'blue' for x in top['corr']]
+    
+    axes[0].barh(range(len(top)), top['corr'], color=colors, alpha=0.7)
+    axes[0].set_yticks(range(len(top)))
+    axes[0].set_yticklabels(top.index)
+    axes[0].invert_yaxis()
+    axes[0].set_xlabel('상관계수', fontsize=12)
+    axes[0].set_title(f'전력 수요와의 상관관계 (상위 {len(top)}개)', fontsize=14, fontweight='bold')
+    axes[0].grid(axis='x', alpha=0.3)
     
     # 값 표시
-    for i, (idx, val) in enumerate(zip(top_15_corr.index, correlation_matrix.loc[top_15_corr.index, '최대전력(MW)'])):
-        plt.text(val + 0.01 if val >= 0 else val - 0.01, i, f'{val:.3f}', 
-                va='center', ha='left' if val >= 0 else 'right', fontsize=10)
+    for i, val in enumerate(top['corr']):
+        axes[0].text(val + 0.01 if val >= 0 else val - 0.01, i, f'{val:.3f}', 
+                     va='center', ha='left' if val >= 0 else 'right', fontsize=10)
+    
+    axes[1].barh(range(len(top)), top['mutual_info'], color='purple', alpha=0.7)
+    axes[1].set_xlabel('상호정보량 (nats)', fontsize=12)
+    axes[1].set_title('상호정보량', fontsize=14, fontweight='bold')
+    axes[1].grid(axis='x', alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('results/eda/correlation_barplot.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/correlation_barplot.png')
     
     # 4. 시간 변수들과 전력 수요의 관계 산점도
     time_vars = ['year', 'month', 'dayofweek', 'season', 'time_trend']
@@ -191,7 +198,7 @@ def create_visualizations(df, correlation_matrix, power_correlations, numeric_co
             axes[i].set_title(f'{var} vs 최대전력 수요')
             
             # 상관계수 표시
-            corr = df[var].corr(df['최대전력(MW)'])
+            corr = table.at[var, 'corr']
             axes[i].text(0.05, 0.95, f'상관계수: {corr:.3f}', 
                         transform=axes[i].transAxes, fontsize=10,
                         bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
@@ -202,8 +209,7 @@ def create_visualizations(df, correlation_matrix, power_correlations, numeric_co
     
     plt.suptitle('시간 변수들과 전력 수요의 관계', fontsize=16, fontweight='bold')
     plt.tight_layout()
-    plt.savefig('results/eda/time_variables_scatter.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/time_variables_scatter.png')
     
     # 5. 래그 변수들과 전력 수요의 관계
     lag_vars = ['power_lag1', 'power_lag7', 'power_lag30', 'power_lag365']
@@ -228,15 +234,14 @@ def create_visualizations(df, correlation_matrix, power_correlations, numeric_co
             axes[i].plot(x_data, p(x_data), "r--", alpha=0.8)
             
             # 상관계수 표시
-            corr = x_data.corr(y_data)
+            corr = table.at[var, 'corr']
             axes[i].text(0.05, 0.95, f'상관계수: {corr:.3f}', 
                         transform=axes[i].transAxes, fontsize=10,
                         bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
     plt.suptitle('래그 변수들과 전력 수요의 관계', fontsize=16, fontweight='bold')
     plt.tight_layout()
-    plt.savefig('results/eda/lag_variables_scatter.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/lag_variables_scatter.png')
     
     print("✅ 시각화 완료: 5개 차트 생성")
 
@@ -276,49 +281,55 @@ def analyze_feature_relationships(df):
     
     return seasonal_analysis, weekday_analysis, monthly_analysis
 
-def save_correlation_results(correlation_matrix, power_correlations):
+def save_correlation_results(relevance, correlation_matrix):
     """상관관계 분석 결과 저장"""
     print("\n💾 분석 결과 저장 중...")
     
-    # 전체 상관관계 매트릭스 저장
+    # 상위 k개 피처 + 타겟 상관행렬 저장
     correlation_matrix.to_csv('results/eda/correlation_matrix.csv')
     
+    # 피처별 관련도 (상관, 상호정보량, 최적 래그) 및 래그 교차상관 저장
+    relevance['table'].to_csv('results/eda/feature_relevance.csv')
+    relevance['lag_corr'].to_csv('results/eda/lagged_cross_correlations.csv')
+    
     # 전력 수요와의 상관관계 저장
+    table = relevance['table']
     power_corr_df = pd.DataFrame({
-        'variable': power_correlations.index,
-        'correlation': power_correlations.values,
-        'abs_correlation': power_correlations.values
+        'variable': table.index,
+        'correlation': table['corr'].values,
+        'abs_correlation': table['abs_corr'].values
     })
     power_corr_df.to_csv('results/eda/power_correlations.csv', index=False)
     
     print("✅ 결과 파일 저장 완료")
 
-def main():
-    """메인 실행 함수"""
+def main(raw=None):
+    """메인 실행 함수 (raw: 미리 로딩한 원본 데이터, 없으면 파일에서 로딩)"""
     print("🚀 상관관계 분석 및 피처 관계 분석 시작")
     print("=" * 50)
     
     try:
         # 데이터 로딩 및 전처리
-        df = load_and_prepare_data()
+        df = load_and_prepare_data(raw)
         
         # 상관관계 분석
-        correlation_matrix, power_correlations, numeric_cols = create_correlation_analysis(df)
+        relevance, correlation_matrix, top_vars = create_correlation_analysis(df)
         
         # 시각화 생성
-        create_visualizations(df, correlation_matrix, power_correlations, numeric_cols)
+        create_visualizations(df, relevance, correlation_matrix, top_vars)
         
         # 피처 관계 심화 분석
         seasonal_analysis, weekday_analysis, monthly_analysis = analyze_feature_relationships(df)
         
         # 결과 저장
-        save_correlation_results(correlation_matrix, power_correlations)
+        save_correlation_results(relevance, correlation_matrix)
         
         print("\n" + "=" * 50)
         print("🎉 상관관계 분석 완료!")
         print(f"📁 생성된 파일들이 'results/eda/' 폴더에 저장되었습니다.")
         print("\n📊 주요 발견사항:")
         print("• 전력 수요와 가장 상관관계가 높은 변수들을 식별했습니다")
+        print("• 상호정보량과 래그 교차상관으로 비선형·시차 관계를 확인했습니다")
         print("• 시간 관련 변수들의 영향도를 분석했습니다")
         print("• 래그 변수들의 예측 가능성을 확인했습니다")
         print("• 계절성 패턴의 구체적인 수치를 확인했습니다")
@@ -9,24 +9,30 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.loader import load_raw_data
+from src.utils.figures import save_figure
+
 # 한글 폰트 설정 (Mac용)
 plt.rcParams['font.family'] = ['Arial Unicode MS', 'AppleGothic', 'Malgun Gothic']
 plt.rcParams['axes.unicode_minus'] = False
 
-def load_and_prepare_data():
+def load_and_prepare_data(raw=None):
     """데이터 로딩 및 기본 전처리"""
     print("📊 데이터 로딩 중...")
     
-    # 데이터 로딩
-    df = pd.read_csv('data/shared/data.csv')
-    
-    # 날짜 변환
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
-    df = df.sort_values('date').reset_index(drop=True)
+    # 데이터 로딩 (date 변환 및 정렬 완료 상태)
+    df = (load_raw_data() if raw is None else raw).copy()
     
     print(f"✅ 데이터 로딩 완료: {df.shape[0]}행 × {df.shape[1]}열")
     return df
@@ -182,8 +188,7 @@ def create_missing_visualizations(df, power_missing, missing_summary):
         plt.title('누락값 연도별 분포', fontsize=12, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('results/eda/missing_values_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/missing_values_analysis.png')
     
     # 3. 누락값 히트맵 (월별, 요일별)
     if power_missing is not None and len(power_missing) > 0:
@@ -213,8 +218,7 @@ def create_missing_visualizations(df, power_missing, missing_summary):
         axes[1].grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig('results/eda/missing_values_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        save_figure(plt.gcf(), 'results/eda/missing_values_distribution.png')
     
     print("✅ 시각화 완료: missing_values_analysis.png, missing_values_distribution.png")
 
@@ -304,14 +308,14 @@ def generate_missing_data_report(df, power_missing, missing_summary):
     print("✅ 보고서 저장 완료: missing_values_report.txt")
     print(report)
 
-def main():
-    """메인 실행 함수"""
+def main(raw=None):
+    """메인 실행 함수 (raw: 미리 로딩한 원본 데이터, 없으면 파일에서 로딩)"""
     print("🚀 누락값 상세 분석 시작")
     print("=" * 50)
     
     try:
         # 데이터 로딩
-        df = load_and_prepare_data()
+        df = load_and_prepare_data(raw)
         
         # 누락값 분석
         power_missing, missing_summary = analyze_missing_values(df)
@@ -11,26 +11,39 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from statsmodels.tsa.stattools import adfuller, kpss
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 from statsmodels.tsa.seasonal import seasonal_decompose
+import sys
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.cv_folds import calendar_folds
+from src.data.loader import load_raw_data
+from src.features.autocorrelation import correlogram
+from src.features.stationarity import StationarityEngine, stationarity_summary, yearly_stationarity
+from src.models.order_search import OrderSearch, ets_grid, sarima_grid
+from src.utils.figures import save_figure
+from src.utils.visualization import plot_correlogram
+
+# ACF/PACF 래그 (단기: ARIMA 차수 결정용, 장기: 최대 2년 계절성 확인용)
+SHORT_LAGS = 40
+LONG_LAGS = 730
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['Arial Unicode MS', 'AppleGothic', 'Malgun Gothic']
 plt.rcParams['axes.unicode_minus'] = False
 
-def load_and_prepare_data():
+def load_and_prepare_data(raw=None):
     """데이터 로딩 및 전처리"""
     print("📊 데이터 로딩 및 전처리...")
     
-    # 데이터 로딩
-    df = pd.read_csv('data/shared/data.csv')
-    
-    # 날짜 변환 및 정렬
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
-    df = df.sort_values('date').reset_index(drop=True)
+    # 데이터 로딩 (date 변환 및 정렬 완료 상태)
+    df = (load_raw_data() if raw is None else raw).copy()
     
     # 인덱스를 날짜로 설정
     df.set_index('date', inplace=True)
@@ -43,105 +56,52 @@ def load_and_prepare_data():
     
     return ts
 
-def adf_test(timeseries, title='ADF Test'):
-    """Augmented Dickey-Fuller Test 수행"""
-    print(f"\n🔍 {title} 수행 중...")
-    
-    # ADF 테스트 실행
-    result = adfuller(timeseries.dropna(), autolag='AIC')
-    
-    # 결과 출력
-    print('📈 ADF Statistic:', f"{result[0]:.6f}")
-    print('📊 p-value:', f"{result[1]:.6f}")
-    print('🔢 Critical Values:')
-    for key, value in result[4].items():
-        print(f'\t{key}: {value:.3f}')
-    
-    # 해석
-    if result[1] <= 0.05:
-        conclusion = "✅ 시계열이 정상적(stationary)입니다 (귀무가설 기각)"
-        is_stationary = True
-    else:
-        conclusion = "❌ 시계열이 비정상적(non-stationary)입니다 (귀무가설 채택)"
-        is_stationary = False
-    
-    print(f"💡 결론: {conclusion}")
-    
-    return {
-        'statistic': result[0],
-        'pvalue': result[1],
-        'critical_values': result[4],
-        'is_stationary': is_stationary,
-        'conclusion': conclusion
-    }
+VARIANT_LABELS = {
+    'original': '원본 데이터',
+    'diff1': '1차 차분',
+    'diff2': '2차 차분',
+    'seasonal_diff': '계절 차분 (365일)'
+}
 
-def kpss_test(timeseries, title='KPSS Test'):
-    """KPSS Test 수행"""
-    print(f"\n🔍 {title} 수행 중...")
-    
-    # KPSS 테스트 실행
-    result = kpss(timeseries.dropna(), regression='c', nlags='auto')
-    
-    # 결과 출력
-    print('📈 KPSS Statistic:', f"{result[0]:.6f}")
-    print('📊 p-value:', f"{result[1]:.6f}")
+def print_test_result(name, result):
+    """검정 결과 출력"""
+    print(f"\n🔍 {name} (lags={result['lags']})")
+    print('📈 Statistic:', f"{result['statistic']:.6f}")
+    print('📊 p-value:', f"{result['pvalue']:.6f}")
     print('🔢 Critical Values:')
-    for key, value in result[3].items():
+    for key, value in result['critical_values'].items():
         print(f'\t{key}: {value:.3f}')
     
-    # 해석 (KPSS는 ADF와 반대)
-    if result[1] <= 0.05:
-        conclusion = "❌ 시계열이 비정상적(non-stationary)입니다 (귀무가설 기각)"
-        is_stationary = False
-    else:
-        conclusion = "✅ 시계열이 정상적(stationary)입니다 (귀무가설 채택)"
-        is_stationary = True
-    
-    print(f"💡 결론: {conclusion}")
-    
-    return {
-        'statistic': result[0],
-        'pvalue': result[1],
-        'critical_values': result[3],
-        'is_stationary': is_stationary,
-        'conclusion': conclusion
-    }
+    status = "✅ 정상적(stationary)" if result['is_stationary'] else "❌ 비정상적(non-stationary)"
+    print(f"💡 결론: 시계열이 {status}입니다")
 
 def analyze_stationarity(ts):
-    """정상성 종합 분석"""
+    """정상성 종합 분석 (차분 변형 × 전체/연도별 창의 ADF·KPSS 검정을 병렬 일괄 실행)"""
     print("\n" + "="*50)
     print("🔬 시계열 정상성 종합 분석")
     print("="*50)
     
-    # 원본 데이터 테스트
-    print("\n📊 원본 데이터 정상성 검정:")
-    adf_original = adf_test(ts, "원본 데이터 ADF Test")
-    kpss_original = kpss_test(ts, "원본 데이터 KPSS Test")
+    engine = StationarityEngine(cache_dir=PROJECT_ROOT / 'results' / '.cache' / 'analysis')
+    stationarity_table = engine.run(ts)
+    stationarity_table.to_csv('results/eda/stationarity_tests.csv', index=False)
     
-    # 1차 차분 데이터 테스트
-    diff1 = ts.diff().dropna()
-    print("\n📊 1차 차분 데이터 정상성 검정:")
-    adf_diff1 = adf_test(diff1, "1차 차분 ADF Test")
-    kpss_diff1 = kpss_test(diff1, "1차 차분 KPSS Test")
+    # 전체 기간 결과 출력
+    stationarity_results = stationarity_summary(stationarity_table)
+    for variant, tests in stationarity_results.items():
+        label = VARIANT_LABELS.get(variant, variant)
+        print(f"\n📊 {label} 정상성 검정:")
+        print_test_result(f"{label} ADF Test", tests['adf'])
+        print_test_result(f"{label} KPSS Test", tests['kpss'])
     
-    # 2차 차분 데이터 테스트
-    diff2 = diff1.diff().dropna()
-    print("\n📊 2차 차분 데이터 정상성 검정:")
-    adf_diff2 = adf_test(diff2, "2차 차분 ADF Test")
-    kpss_diff2 = kpss_test(diff2, "2차 차분 KPSS Test")
+    # 연도별 창: 두 검정 모두 정상으로 판정된 연도 수
+    yearly_counts = yearly_stationarity(stationarity_table).groupby(level='variant').agg(['sum', 'count'])
+    print("\n📅 연도별 정상성 (ADF·KPSS 모두 정상인 연도 수):")
+    for variant, row in yearly_counts.iterrows():
+        print(f"   {VARIANT_LABELS.get(variant, variant)}: {int(row['sum'])}/{int(row['count'])}년")
     
-    # 계절 차분 (365일) 테스트
-    seasonal_diff = ts.diff(365).dropna()
-    print("\n📊 계절 차분 (365일) 데이터 정상성 검정:")
-    adf_seasonal = adf_test(seasonal_diff, "계절 차분 ADF Test")
-    kpss_seasonal = kpss_test(seasonal_diff, "계절 차분 KPSS Test")
+    print(f"\n✅ 정상성 검정 결과 저장: stationarity_tests.csv ({len(stationarity_table)}개 검정)")
     
-    return {
-        'original': {'adf': adf_original, 'kpss': kpss_original},
-        'diff1': {'adf': adf_diff1, 'kpss': kpss_diff1},
-        'diff2': {'adf': adf_diff2, 'kpss': kpss_diff2},
-        'seasonal_diff': {'adf': adf_seasonal, 'kpss': kpss_seasonal}
-    }
+    return stationarity_results, stationarity_table
 
 def plot_stationarity_comparison(ts):
     """정상성 변환 전후 비교 시각화"""
@@ -205,72 +165,70 @@ def plot_stationarity_comparison(ts):
     axes[3, 1].grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('results/eda/stationarity_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/stationarity_comparison.png')
     
     print("✅ 정상성 비교 시각화 저장: stationarity_comparison.png")
 
-def analyze_autocorrelation(ts):
+def compute_autocorrelation(ts):
+    """원본/차분 변형 전체의 ACF·PACF와 신뢰구간을 한 번에 계산 (FFT + Durbin-Levinson)"""
+    nlags = min(LONG_LAGS, len(ts) // 4)
+    acf_results = correlogram(ts.values, nlags=nlags, pacf_lags=SHORT_LAGS)
+
+    # 다른 분석에서 재사용할 수 있도록 래그별 값 저장
+    table = pd.concat({key: acf_results[key] for key in ('acf', 'acf_band', 'pacf', 'pacf_band')}, axis=1)
+    table.columns = [f"{stat}_{variant}" for stat, variant in table.columns]
+    table.to_csv('results/eda/autocorrelation_values.csv')
+
+    print(f"✅ 자기상관 계산 완료: {len(acf_results['nobs'])}개 변형 × {nlags}개 래그")
+    return acf_results
+
+def analyze_autocorrelation(acf_results):
     """자기상관 분석 (ACF/PACF)"""
     print("\n" + "="*50)
     print("📈 자기상관 함수 (ACF/PACF) 분석")
     print("="*50)
     
-    # 1차 차분 데이터로 분석 (대부분의 경우 정상성 확보)
-    diff1 = ts.diff().dropna()
+    acf, acf_band = acf_results['acf'].loc[:SHORT_LAGS], acf_results['acf_band'].loc[:SHORT_LAGS]
+    pacf, pacf_band = acf_results['pacf'], acf_results['pacf_band']
     
-    # ACF/PACF 시각화
+    # ACF/PACF 시각화 (원본, 1차 차분, 계절 차분)
     fig, axes = plt.subplots(3, 2, figsize=(20, 15))
-    
-    # 원본 데이터 ACF/PACF
-    plot_acf(ts.dropna(), ax=axes[0, 0], lags=40, title='원본 데이터 ACF')
-    plot_pacf(ts.dropna(), ax=axes[0, 1], lags=40, title='원본 데이터 PACF')
-    
-    # 1차 차분 ACF/PACF
-    plot_acf(diff1, ax=axes[1, 0], lags=40, title='1차 차분 ACF')
-    plot_pacf(diff1, ax=axes[1, 1], lags=40, title='1차 차분 PACF')
-    
-    # 계절 차분 ACF/PACF (처음 365일 이후부터)
-    seasonal_diff = ts.diff(365).dropna()
-    if len(seasonal_diff) > 40:
-        plot_acf(seasonal_diff, ax=axes[2, 0], lags=40, title='계절 차분 ACF')
-        plot_pacf(seasonal_diff, ax=axes[2, 1], lags=40, title='계절 차분 PACF')
-    else:
-        axes[2, 0].text(0.5, 0.5, '계절 차분 데이터 부족', ha='center', va='center', 
-                        transform=axes[2, 0].transAxes, fontsize=14)
-        axes[2, 1].text(0.5, 0.5, '계절 차분 데이터 부족', ha='center', va='center', 
-                        transform=axes[2, 1].transAxes, fontsize=14)
+    panels = [('original', '원본 데이터'), ('diff1', '1차 차분'), ('seasonal_diff', '계절 차분')]
+    
+    for row, (variant, label) in enumerate(panels):
+        # 계절 차분은 처음 365일 이후부터이므로 데이터가 충분한지 확인
+        if acf_results['nobs'][variant] <= SHORT_LAGS:
+            for ax in axes[row]:
+                ax.text(0.5, 0.5, f'{label} 데이터 부족', ha='center', va='center',
+                        transform=ax.transAxes, fontsize=14)
+            continue
+        plot_correlogram(axes[row, 0], acf[variant], acf_band[variant], f'{label} ACF')
+        plot_correlogram(axes[row, 1], pacf[variant], pacf_band[variant], f'{label} PACF')
     
     plt.tight_layout()
-    plt.savefig('results/eda/autocorrelation_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/autocorrelation_analysis.png')
     
     print("✅ 자기상관 분석 시각화 저장: autocorrelation_analysis.png")
 
-def seasonal_autocorrelation_analysis(ts):
+def seasonal_autocorrelation_analysis(acf_results):
     """계절성 자기상관 분석"""
     print("\n📊 계절성 자기상관 분석...")
     
-    # 계절성 분석을 위한 긴 래그 ACF
+    # 계절성 분석을 위한 긴 래그 ACF (최대 2년, compute_autocorrelation 결과 재사용)
     fig, axes = plt.subplots(2, 1, figsize=(15, 10))
     
-    # 원본 데이터의 긴 래그 ACF (최대 2년)
-    plot_acf(ts.dropna(), ax=axes[0], lags=min(730, len(ts)//4), 
-             title='장기 자기상관 함수 (ACF) - 계절성 패턴 확인')
-    
-    # 1차 차분 데이터의 긴 래그 ACF
-    diff1 = ts.diff().dropna()
-    plot_acf(diff1, ax=axes[1], lags=min(730, len(diff1)//4), 
-             title='1차 차분 장기 자기상관 함수 (ACF)')
+    plot_correlogram(axes[0], acf_results['acf']['original'], acf_results['acf_band']['original'],
+                     '장기 자기상관 함수 (ACF) - 계절성 패턴 확인')
+    plot_correlogram(axes[1], acf_results['acf']['diff1'], acf_results['acf_band']['diff1'],
+                     '1차 차분 장기 자기상관 함수 (ACF)')
     
     plt.tight_layout()
-    plt.savefig('results/eda/seasonal_autocorrelation.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/seasonal_autocorrelation.png')
     
     print("✅ 계절성 자기상관 분석 저장: seasonal_autocorrelation.png")
 
-def recommend_arima_parameters(stationarity_results):
-    """ARIMA 파라미터 권장사항 도출"""
+def recommend_arima_parameters(ts, stationarity_results):
+    """ARIMA 파라미터 권장사항 도출 (차분 차수는 정상성 검정, 나머지 차수는 CV 탐색으로 결정)"""
     print("\n" + "="*50)
     print("🎯 ARIMA 모델 파라미터 권장사항")
     print("="*50)
@@ -297,29 +255,65 @@ def recommend_arima_parameters(stationarity_results):
         seasonal_recommendation = "계절 차분 불필요하거나 추가 검토 필요"
         print("📌 계절성 차분: 불필요하거나 추가 검토 필요")
     
-    # ACF/PACF 분석 가이드라인
-    print("\n📊 ACF/PACF 분석 가이드라인:")
-    print("🔹 ACF가 천천히 감소하면 → AR 성분 필요 (p > 0)")
-    print("🔹 ACF가 특정 래그에서 급격히 끊어지면 → MA 성분 (q 결정)")
-    print("🔹 PACF가 천천히 감소하면 → MA 성분 필요 (q > 0)")
-    print("🔹 PACF가 특정 래그에서 급격히 끊어지면 → AR 성분 (p 결정)")
+    # 차수 탐색 (연도 CV 폴드에서 SARIMA/ETS 후보 평가)
+    search = search_model_orders(ts, d_recommendation)
+    ranking = search.ranking
     
-    # 일반적인 시작점 권장
-    print(f"\n🎯 권장 시작 파라미터:")
-    print(f"   ARIMA(p={1}, d={d_recommendation}, q={1}) 부터 시작")
+    print(f"\n🎯 CV 기준 상위 모델 (폴드 {int(ranking['n_folds'].max())}개 평균):")
+    for _, row in ranking.head(5).iterrows():
+        print(f"   {row['rank']:.0f}. {row['model']}: RMSE {row['mean_rmse']:,.0f} MW, MAPE {row['mean_mape']:.2f}%")
     print(f"   계절성: {seasonal_recommendation}")
-    print(f"   추가 고려사항: SARIMA(p,d,q)(P,D,Q,s) 모델 검토")
     
     return {
         'd_recommendation': d_recommendation,
         'seasonal_recommendation': seasonal_recommendation,
-        'suggested_start': f"ARIMA(1,{d_recommendation},1)"
+        'suggested_start': ranking.iloc[0]['model'],
+        'ranking': ranking
     }
 
-def generate_analysis_report(ts, stationarity_results, arima_recommendations):
+def search_model_orders(ts, d_recommendation, n_val_years=2, train_years=3):
+    """최근 완결 연도를 검증 폴드로 SARIMA/ETS 차수 탐색 후 1위 모델을 전체 데이터로 적합"""
+    print("\n🔎 SARIMA/ETS 차수 탐색 중...")
+    
+    # 상태공간 모델은 결측 구간에서 예측이 NaN 이 되므로 시간 보간한 시계열로 탐색
+    ts = ts.interpolate(method='time', limit_direction='both')
+    
+    # 12월 31일까지 데이터가 있는 연도만 검증 연도로 사용
+    years = ts.index.year.unique()
+    complete_years = [year for year in years if ts.index[-1] >= pd.Timestamp(year=year, month=12, day=31)]
+    folds = calendar_folds(ts.index, complete_years[-n_val_years:], window='sliding', train_years=train_years)
+    
+    search = OrderSearch(sarima_grid(d=(d_recommendation,)) + ets_grid(),
+                         cache_dir=PROJECT_ROOT / 'results' / '.cache' / 'analysis')
+    ranking = search.run(ts, folds)
+    ranking.to_csv('results/eda/model_order_search.csv', index=False)
+    
+    status = search.fold_results['status'].value_counts()
+    print(f"✅ 후보 {len(ranking)}개 평가 (적합 {status.get('fitted', 0)}, 캐시 {status.get('cached', 0)}, "
+          f"가지치기 {status.get('pruned', 0)}, 실패 {status.get('failed', 0)})")
+    
+    best = search.best_model(ts)
+    best.save_model('results/eda/best_statespace_model.pkl')
+    
+    return search
+
+def generate_analysis_report(ts, stationarity_results, arima_recommendations, stationarity_table):
     """종합 분석 보고서 생성"""
     print("\n📝 종합 분석 보고서 생성 중...")
     
+    # 차수 탐색 상위 5개 모델
+    top_models = "\n".join(
+        f"   {row['rank']:.0f}. {row['model']}: RMSE {row['mean_rmse']:,.0f} MW, MAE {row['mean_mae']:,.0f} MW, AIC {row['mean_aic']:,.1f}"
+        for _, row in arima_recommendations['ranking'].head(5).iterrows()
+    )
+    
+    # 연도별 창 검정 결과 요약 (변형별 정상 판정 연도)
+    yearly = yearly_stationarity(stationarity_table)
+    yearly_lines = "\n".join(
+        f"   - {VARIANT_LABELS.get(variant, variant)}: {', '.join(flags[flags].index.get_level_values('window')) or '없음'}"
+        for variant, flags in yearly.groupby(level='variant')
+    )
+    
     report = f"""
 === 🔬 고급 시계열 분석 보고서 ===
 
@@ -355,19 +349,23 @@ def generate_analysis_report(ts, stationarity_results, arima_recommendations):
    - KPSS Test: p-value = {stationarity_results['seasonal_diff']['kpss']['pvalue']:.6f}
      → {'정상적' if stationarity_results['seasonal_diff']['kpss']['is_stationary'] else '비정상적'}
 
+5. 연도별 정상성 (ADF·KPSS 모두 정상인 연도):
+{yearly_lines}
+
 🎯 ARIMA 모델링 권장사항:
 
 1. 차분 차수 (d): {arima_recommendations['d_recommendation']}
 2. 계절성 처리: {arima_recommendations['seasonal_recommendation']}
-3. 권장 시작 모델: {arima_recommendations['suggested_start']}
+3. CV 탐색 1위 모델: {arima_recommendations['suggested_start']}
+{top_models}
 
 📈 ACF/PACF 분석 지침:
-- autocorrelation_analysis.png 파일에서 ACF/PACF 패턴을 확인하여 p, q 값을 결정
+- autocorrelation_analysis.png 의 ACF/PACF 패턴으로 model_order_search.csv 탐색 결과의 p, q 값을 검증
 - 1차 차분 데이터의 ACF/PACF가 모델 파라미터 결정에 가장 중요
 - 계절성이 강한 경우 SARIMA 모델 고려
 
 💡 추가 권장사항:
-1. 모델 선택 시 AIC, BIC 기준으로 여러 파라미터 조합 비교
+1. 탐색 그리드(p, q ≤ 2, 주간 계절성 s=7) 밖의 차수가 필요한지 ACF/PACF로 확인
 2. 잔차 분석을 통한 모델 적합성 검증 필수
 3. 외부 변수(공휴일, 기온 등) 추가 고려 시 ARIMAX 모델 검토
 4. 장기 예측 시 계절성 패턴의 안정성 확인
@@ -376,6 +374,10 @@ def generate_analysis_report(ts, stationarity_results, arima_recommendations):
 - stationarity_comparison.png: 정상성 변환 전후 비교
 - autocorrelation_analysis.png: ACF/PACF 분석
 - seasonal_autocorrelation.png: 장기 계절성 자기상관 분석
+- autocorrelation_values.csv: 변형별 래그 ACF/PACF 및 신뢰구간
+- stationarity_tests.csv: 변형 × 기간(전체/연도별) ADF·KPSS 검정 결과
+- model_order_search.csv: SARIMA/ETS 후보 차수의 연도 CV 성능 순위
+- best_statespace_model.pkl: 1위 모델을 전체 데이터로 적합한 결과
 
 분석 완료 시간: {pd.Timestamp.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
 """
@@ -387,32 +389,33 @@ def generate_analysis_report(ts, stationarity_results, arima_recommendations):
     print("✅ 종합 분석 보고서 저장: advanced_timeseries_analysis_report.txt")
     print(report)
 
-def main():
-    """메인 실행 함수"""
+def main(raw=None):
+    """메인 실행 함수 (raw: 미리 로딩한 원본 데이터, 없으면 파일에서 로딩)"""
     print("🚀 고급 시계열 분석 시작")
     print("=" * 70)
     
     try:
         # 1. 데이터 로딩
-        ts = load_and_prepare_data()
+        ts = load_and_prepare_data(raw)
         
         # 2. 정상성 분석
-        stationarity_results = analyze_stationarity(ts)
+        stationarity_results, stationarity_table = analyze_stationarity(ts)
         
         # 3. 정상성 시각화
         plot_stationarity_comparison(ts)
         
-        # 4. 자기상관 분석
-        analyze_autocorrelation(ts)
+        # 4. 자기상관 분석 (모든 변형·래그를 한 번에 계산한 뒤 시각화)
+        acf_results = compute_autocorrelation(ts)
+        analyze_autocorrelation(acf_results)
         
         # 5. 계절성 자기상관 분석
-        seasonal_autocorrelation_analysis(ts)
+        seasonal_autocorrelation_analysis(acf_results)
         
         # 6. ARIMA 파라미터 권장사항
-        arima_recommendations = recommend_arima_parameters(stationarity_results)
+        arima_recommendations = recommend_arima_parameters(ts, stationarity_results)
         
         # 7. 종합 보고서 생성
-        generate_analysis_report(ts, stationarity_results, arima_recommendations)
+        generate_analysis_report(ts, stationarity_results, arima_recommendations, stationarity_table)
         
         print("\n" + "=" * 70)
         print("🎉 고급 시계열 분석 완료!")
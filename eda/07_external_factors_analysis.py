@@ -11,24 +11,37 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.events import EventCalendar
+from src.data.holidays import holiday_calendar
+from src.data.loader import load_raw_data
+from src.features.holiday_effects import ADJACENT, ALL_HOLIDAYS, BASELINE, WEEKEND, holiday_impact
+from src.utils.figures import save_figure
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['Arial Unicode MS', 'AppleGothic', 'Malgun Gothic']
 plt.rcParams['axes.unicode_minus'] = False
 
-def load_and_prepare_data():
+# 공휴일 효과 부트스트랩 반복 횟수 / 신뢰구간 유의수준
+HOLIDAY_BOOTSTRAP = 1000
+HOLIDAY_ALPHA = 0.05
+
+def load_and_prepare_data(raw=None):
     """데이터 로딩 및 전처리"""
     print("📊 데이터 로딩 및 전처리...")
     
-    # 데이터 로딩
-    df = pd.read_csv('data/shared/data.csv')
-    
-    # 날짜 변환 및 정렬
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
-    df = df.sort_values('date').reset_index(drop=True)
+    # 데이터 로딩 (date 변환 및 정렬 완료 상태)
+    df = (load_raw_data() if raw is None else raw).copy()
     
     # 기본 시간 변수 추가
     df['year'] = df['date'].dt.year
@@ -42,229 +55,67 @@ def load_and_prepare_data():
     
     return df
 
-def create_korean_holidays(start_year=2005, end_year=2023):
-    """한국 공휴일 정보 생성"""
-    print("\n🇰🇷 한국 공휴일 정보 생성 중...")
-    
-    holidays = []
-    
-    for year in range(start_year, end_year + 1):
-        # 고정 공휴일
-        fixed_holidays = [
-            (f'{year}-01-01', '신정'),
-            (f'{year}-03-01', '삼일절'),
-            (f'{year}-05-05', '어린이날'),
-            (f'{year}-06-06', '현충일'),
-            (f'{year}-08-15', '광복절'),
-            (f'{year}-10-03', '개천절'),
-            (f'{year}-10-09', '한글날'),
-            (f'{year}-12-25', '성탄절'),
-        ]
-        
-        # 추석 (음력 8월 15일) - 근사값 사용
-        chuseok_dates = {
-            2005: ['2005-09-17', '2005-09-18', '2005-09-19'],
-            2006: ['2006-10-05', '2006-10-06', '2006-10-07'],
-            2007: ['2007-09-24', '2007-09-25', '2007-09-26'],
-            2008: ['2008-09-12', '2008-09-13', '2008-09-14', '2008-09-15'],
-            2009: ['2009-10-02', '2009-10-03', '2009-10-04'],
-            2010: ['2010-09-21', '2010-09-22', '2010-09-23'],
-            2011: ['2011-09-10', '2011-09-11', '2011-09-12', '2011-09-13'],
-            2012: ['2012-09-29', '2012-09-30', '2012-10-01'],
-            2013: ['2013-09-18', '2013-09-19', '2013-09-20'],
-            2014: ['2014-09-06', '2014-09-07', '2014-09-08', '2014-09-09'],
-            2015: ['2015-09-26', '2015-09-27', '2015-09-28'],
-            2016: ['2016-09-14', '2016-09-15', '2016-09-16'],
-            2017: ['2017-10-03', '2017-10-04', '2017-10-05', '2017-10-06'],
-            2018: ['2018-09-22', '2018-09-23', '2018-09-24', '2018-09-25'],
-            2019: ['2019-09-12', '2019-09-13', '2019-09-14'],
-            2020: ['2020-09-30', '2020-10-01', '2020-10-02'],
-            2021: ['2021-09-20', '2021-09-21', '2021-09-22'],
-            2022: ['2022-09-09', '2022-09-10', '2022-09-11', '2022-09-12'],
-            2023: ['2023-09-28', '2023-09-29', '2023-09-30']
-        }
-        
-        # 설날 (음력 1월 1일) - 근사값 사용
-        lunar_new_year_dates = {
-            2005: ['2005-02-07', '2005-02-08', '2005-02-09'],
-            2006: ['2006-01-28', '2006-01-29', '2006-01-30'],
-            2007: ['2007-02-17', '2007-02-18', '2007-02-19'],
-            2008: ['2008-02-06', '2008-02-07', '2008-02-08'],
-            2009: ['2009-01-25', '2009-01-26', '2009-01-27'],
-            2010: ['2010-02-13', '2010-02-14', '2010-02-15'],
-            2011: ['2011-02-02', '2011-02-03', '2011-02-04'],
-            2012: ['2012-01-22', '2012-01-23', '2012-01-24'],
-            2013: ['2013-02-09', '2013-02-10', '2013-02-11'],
-            2014: ['2014-01-30', '2014-01-31', '2014-02-01'],
-            2015: ['2015-02-18', '2015-02-19', '2015-02-20'],
-            2016: ['2016-02-07', '2016-02-08', '2016-02-09'],
-            2017: ['2017-01-27', '2017-01-28', '2017-01-29'],
-            2018: ['2018-02-15', '2018-02-16', '2018-02-17'],
-            2019: ['2019-02-04', '2019-02-05', '2019-02-06'],
-            2020: ['2020-01-24', '2020-01-25', '2020-01-26'],
-            2021: ['2021-02-11', '2021-02-12', '2021-02-13'],
-            2022: ['2022-01-31', '2022-02-01', '2022-02-02'],
-            2023: ['2023-01-21', '2023-01-22', '2023-01-23']
-        }
-        
-        # 고정 공휴일 추가
-        holidays.extend([(date, name) for date, name in fixed_holidays])
-        
-        # 추석 추가
-        if year in chuseok_dates:
-            for i, date in enumerate(chuseok_dates[year]):
-                name = ['추석 전날', '추석', '추석 다음날', '추석 연휴'][i] if len(chuseok_dates[year]) > 3 else ['추석 전날', '추석', '추석 다음날'][i]
-                holidays.append((date, name))
-        
-        # 설날 추가
-        if year in lunar_new_year_dates:
-            for i, date in enumerate(lunar_new_year_dates[year]):
-                name = ['설날 전날', '설날', '설날 다음날'][i]
-                holidays.append((date, name))
-        
-        # 부처님 오신 날 (음력 4월 8일) - 대략적 날짜
-        buddha_birthday = {
-            2005: '2005-05-15', 2006: '2006-05-05', 2007: '2007-05-24',
-            2008: '2008-05-12', 2009: '2009-05-02', 2010: '2010-05-21',
-            2011: '2011-05-10', 2012: '2012-05-28', 2013: '2013-05-17',
-            2014: '2014-05-06', 2015: '2015-05-25', 2016: '2016-05-14',
-            2017: '2017-05-03', 2018: '2018-05-22', 2019: '2019-05-12',
-            2020: '2020-04-30', 2021: '2021-05-19', 2022: '2022-05-08',
-            2023: '2023-05-27'
-        }
-        
-        if year in buddha_birthday:
-            holidays.append((buddha_birthday[year], '부처님 오신 날'))
-    
-    # DataFrame으로 변환
-    holiday_df = pd.DataFrame(holidays, columns=['date', 'holiday_name'])
-    holiday_df['date'] = pd.to_datetime(holiday_df['date'])
-    
-    print(f"✅ 총 {len(holiday_df)}개 공휴일 정보 생성 완료")
-    
-    return holiday_df
-
 def analyze_holiday_impact(df, holidays_df):
-    """공휴일 영향 분석"""
+    """공휴일 영향 분석 (달력 merge_asof + 일 유형별 집계, 평일 대비 효과의 부트스트랩 신뢰구간)"""
     print("\n🎉 공휴일 영향 분석 중...")
     
-    # 공휴일 정보 병합
-    df_analysis = df.copy()
-    df_analysis['is_holiday'] = df_analysis['date'].isin(holidays_df['date'])
-    
-    # 공휴일 전후 영향 분석
-    df_analysis['is_before_holiday'] = df_analysis['date'].isin(holidays_df['date'] - timedelta(days=1))
-    df_analysis['is_after_holiday'] = df_analysis['date'].isin(holidays_df['date'] + timedelta(days=1))
+    result = holiday_impact(df, '최대전력(MW)', holidays=holidays_df, n_boot=HOLIDAY_BOOTSTRAP, alpha=HOLIDAY_ALPHA)
+    table = result['table']
+    table.to_csv('results/eda/05_external_factors/holiday_impact.csv')
     
-    # 주말 여부
-    df_analysis['is_weekend'] = df_analysis['weekday'].isin([5, 6])  # 토요일, 일요일
+    # 공휴일 정보 병합 (라벨은 df 행 순서)
+    labels = result['labels']
+    df_analysis = df.copy()
+    for col in ['is_holiday', 'is_before_holiday', 'is_after_holiday', 'is_weekend']:
+        df_analysis[col] = labels[col].to_numpy().astype(bool)
     df_analysis['is_weekday'] = ~df_analysis['is_weekend']
-    
-    # 공휴일 타입별 분석
-    holiday_types = {
-        '신정': ['신정'],
-        '설날': ['설날 전날', '설날', '설날 다음날'],
-        '삼일절': ['삼일절'],
-        '부처님오신날': ['부처님 오신 날'],
-        '어린이날': ['어린이날'],
-        '현충일': ['현충일'],
-        '광복절': ['광복절'],
-        '추석': ['추석 전날', '추석', '추석 다음날', '추석 연휴'],
-        '개천절': ['개천절'],
-        '한글날': ['한글날'],
-        '성탄절': ['성탄절']
+    df_analysis['day_type'] = labels['day_type'].to_numpy()
+    df_analysis['day_kind'] = labels['kind'].to_numpy()
+    
+    # 공휴일별 전력 수요 (평일 대비 효과 포함)
+    holiday_impact_stats = {
+        name: {
+            'count': row['count'],
+            'mean_power': row['mean'],
+            'std_power': row['std'],
+            'effect_pct': row['effect_pct'],
+            'effect_pct_ci': (row['effect_pct_low'], row['effect_pct_high'])
+        }
+        for name, row in table[table['kind'] == 'holiday'].iterrows()
     }
     
-    # 공휴일별 전력 수요 평균 계산
-    holiday_impact = {}
-    
-    for holiday_type, holiday_names in holiday_types.items():
-        holiday_dates = holidays_df[holidays_df['holiday_name'].isin(holiday_names)]['date']
-        holiday_power = df_analysis[df_analysis['date'].isin(holiday_dates)]['최대전력(MW)']
-        
-        if len(holiday_power) > 0:
-            holiday_impact[holiday_type] = {
-                'count': len(holiday_power),
-                'mean_power': holiday_power.mean(),
-                'std_power': holiday_power.std()
-            }
-    
-    # 평일/주말/공휴일 비교
-    normal_weekday = df_analysis[(~df_analysis['is_holiday']) & (~df_analysis['is_weekend'])]['최대전력(MW)']
-    weekend = df_analysis[df_analysis['is_weekend'] & (~df_analysis['is_holiday'])]['최대전력(MW)']
-    holidays = df_analysis[df_analysis['is_holiday']]['최대전력(MW)']
-    
+    # 평일/주말/공휴일 비교 (평일은 공휴일 전후를 제외한 기준선)
     comparison_stats = {
-        '평일': {'mean': normal_weekday.mean(), 'std': normal_weekday.std(), 'count': len(normal_weekday)},
-        '주말': {'mean': weekend.mean(), 'std': weekend.std(), 'count': len(weekend)},
-        '공휴일': {'mean': holidays.mean(), 'std': holidays.std(), 'count': len(holidays)}
+        day_type: {
+            'mean': table.loc[day_type, 'mean'],
+            'std': table.loc[day_type, 'std'],
+            'count': table.loc[day_type, 'count'],
+            'effect_pct': table.loc[day_type, 'effect_pct'],
+            'effect_pct_ci': (table.loc[day_type, 'effect_pct_low'], table.loc[day_type, 'effect_pct_high'])
+        }
+        for day_type in [BASELINE, WEEKEND, ADJACENT, ALL_HOLIDAYS] if day_type in table.index
     }
     
-    print("📊 평일/주말/공휴일 전력 수요 비교:")
+    ci_level = int(round((1 - HOLIDAY_ALPHA) * 100))
+    print(f"📊 평일/주말/공휴일 전력 수요 비교 (평일 대비 {ci_level}% 부트스트랩 구간):")
     for day_type, stats in comparison_stats.items():
-        print(f"  {day_type}: 평균 {stats['mean']:,.0f}MW (±{stats['std']:,.0f}), {stats['count']}일")
+        low, high = stats['effect_pct_ci']
+        print(f"  {day_type}: 평균 {stats['mean']:,.0f}MW (±{stats['std']:,.0f}), {stats['count']}일, "
+              f"{stats['effect_pct']:+.1f}% [{low:+.1f}%, {high:+.1f}%]")
     
-    return df_analysis, holiday_impact, comparison_stats
+    return df_analysis, holiday_impact_stats, comparison_stats
 
-def analyze_special_events(df):
-    """특별 이벤트 영향 분석"""
+def analyze_special_events(df, calendar=None):
+    """특별 이벤트 영향 분석 (이벤트 구간 조인 + 이벤트별 집계, 전년 동기 대비)"""
     print("\n🌟 특별 이벤트 영향 분석 중...")
     
-    # 주요 특별 이벤트 정의
-    special_events = {
-        '2008 베이징 올림픽': ['2008-08-08', '2008-08-24'],
-        '2010 밴쿠버 동계올림픽': ['2010-02-12', '2010-02-28'],
-        '2012 런던 올림픽': ['2012-07-27', '2012-08-12'],
-        '2014 소치 동계올림픽': ['2014-02-07', '2014-02-23'],
-        '2016 리우 올림픽': ['2016-08-05', '2016-08-21'],
-        '2018 평창 동계올림픽': ['2018-02-09', '2018-02-25'],
-        '2020 도쿄 올림픽': ['2021-07-23', '2021-08-08'],  # 코로나로 연기
-        '2022 베이징 동계올림픽': ['2022-02-04', '2022-02-20'],
-        
-        # 대선
-        '2007 대선': ['2007-12-19', '2007-12-19'],
-        '2012 대선': ['2012-12-19', '2012-12-19'],
-        '2017 대선': ['2017-05-09', '2017-05-09'],
-        '2022 대선': ['2022-03-09', '2022-03-09'],
-        
-        # 경제 위기
-        '2008 금융위기': ['2008-09-01', '2009-03-31'],
-        '2011 유럽재정위기': ['2011-07-01', '2011-12-31'],
-        
-        # 코로나19
-        '코로나19 팬데믹': ['2020-01-20', '2023-05-05'],  # WHO 팬데믹 종료 선언까지
-        
-        # 기타 사회적 이벤트
-        '2014 세월호 참사': ['2014-04-16', '2014-04-30'],
-        '2016-2017 촛불집회': ['2016-10-29', '2017-04-29'],
-    }
-    
-    # 이벤트별 영향 분석
-    event_impact = {}
-    
-    for event_name, (start_date, end_date) in special_events.items():
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
-        
-        # 데이터 범위 내에 있는 이벤트만 분석
-        if start_dt >= df['date'].min() and start_dt <= df['date'].max():
-            # 이벤트 기간 데이터
-            event_data = df[(df['date'] >= start_dt) & (df['date'] <= end_dt)]['최대전력(MW)']
-            
-            # 같은 기간 전년도 데이터 (비교군)
-            prev_year_start = start_dt - pd.DateOffset(years=1)
-            prev_year_end = end_dt - pd.DateOffset(years=1)
-            prev_year_data = df[(df['date'] >= prev_year_start) & (df['date'] <= prev_year_end)]['최대전력(MW)']
-            
-            if len(event_data) > 0 and len(prev_year_data) > 0:
-                event_impact[event_name] = {
-                    'event_mean': event_data.mean(),
-                    'prev_year_mean': prev_year_data.mean(),
-                    'change_percent': ((event_data.mean() - prev_year_data.mean()) / prev_year_data.mean()) * 100,
-                    'days_count': len(event_data),
-                    'period': f"{start_date} ~ {end_date}"
-                }
+    if calendar is None:
+        calendar = EventCalendar.from_records()
+    effects = calendar.effects(df, '최대전력(MW)')
+    effects.to_csv('results/eda/05_external_factors/special_events_impact.csv')
+    print(f"✅ 이벤트 {len(calendar)}개 중 {len(effects)}개 분석 (데이터 기간 내 + 전년 동기 관측 존재)")
     
+    event_impact = effects.rename(columns={'baseline_mean': 'prev_year_mean'}).to_dict('index')
     return event_impact
 
 def analyze_seasonal_patterns(df):
@@ -310,22 +161,18 @@ def create_economic_proxy_variables(df):
     yearly_power = df_econ.groupby('year')['최대전력(MW)'].mean()
     yearly_growth = yearly_power.pct_change() * 100
     
-    # 산업활동 지수 프록시 (평일 전력 수요)
+    # 연·월 × 평일/주말 평균을 한 번의 집계로 계산
     df_econ['is_weekday'] = ~df_econ['weekday'].isin([5, 6])
-    monthly_industrial = df_econ[df_econ['is_weekday']].groupby(['year', 'month'])['최대전력(MW)'].mean()
+    monthly = df_econ.groupby(['year', 'month', 'is_weekday'])['최대전력(MW)'].mean().unstack('is_weekday')
+    monthly = monthly.reindex(columns=[True, False])
+    
+    # 산업활동 지수 프록시 (평일 전력 수요)
+    monthly_industrial = monthly[True].dropna()
     
     # 전력 집약도 지수 (주말 대비 평일 전력 수요 비율)
-    monthly_weekend = df_econ[~df_econ['is_weekday']].groupby(['year', 'month'])['최대전력(MW)'].mean()
-    power_intensity = {}
-    
-    for year in df_econ['year'].unique():
-        for month in range(1, 13):
-            weekday_key = (year, month)
-            if weekday_key in monthly_industrial.index and weekday_key in monthly_weekend.index:
-                weekend_power = monthly_weekend[weekday_key]
-                weekday_power = monthly_industrial[weekday_key]
-                if weekend_power > 0:
-                    power_intensity[weekday_key] = weekday_power / weekend_power
+    both = monthly.dropna()
+    both = both[both[False] > 0]
+    power_intensity = (both[True] / both[False]).to_dict()
     
     economic_indicators = {
         'yearly_growth': yearly_growth.to_dict(),
@@ -342,23 +189,14 @@ def visualize_external_factors(df_analysis, holiday_impact, comparison_stats, ev
     # 1. 공휴일 vs 평일/주말 비교
     fig, axes = plt.subplots(2, 2, figsize=(20, 16))
     
-    # 평일/주말/공휴일 비교 박스플롯
-    day_types = []
-    power_values = []
-    
-    for day_type in ['평일', '주말', '공휴일']:
-        if day_type == '평일':
-            data = df_analysis[(~df_analysis['is_holiday']) & (~df_analysis['is_weekend'])]['최대전력(MW)']
-        elif day_type == '주말':
-            data = df_analysis[df_analysis['is_weekend'] & (~df_analysis['is_holiday'])]['최대전력(MW)']
-        else:  # 공휴일
-            data = df_analysis[df_analysis['is_holiday']]['최대전력(MW)']
-        
-        day_types.extend([day_type] * len(data))
-        power_values.extend(data.tolist())
-    
-    box_data = pd.DataFrame({'day_type': day_types, 'power': power_values})
-    sns.boxplot(data=box_data, x='day_type', y='power', ax=axes[0, 0])
+    # 평일/주말/공휴일 비교 박스플롯 (공휴일 영향 표와 같은 일 유형 기준)
+    kind_labels = {'baseline': '평일', 'weekend': '주말', 'holiday': '공휴일'}
+    box_data = df_analysis[df_analysis['day_kind'].isin(list(kind_labels))]
+    box_data = pd.DataFrame({
+        'day_type': box_data['day_kind'].map(kind_labels),
+        'power': box_data['최대전력(MW)']
+    })
+    sns.boxplot(data=box_data, x='day_type', y='power', order=list(kind_labels.values()), ax=axes[0, 0])
     axes[0, 0].set_title('평일/주말/공휴일 전력 수요 분포', fontsize=14, fontweight='bold')
     axes[0, 0].set_ylabel('전력 수요 (MW)')
     
@@ -397,8 +235,7 @@ def visualize_external_factors(df_analysis, holiday_impact, comparison_stats, ev
         axes[1, 1].set_ylabel('평균 전력 수요 (MW)')
     
     plt.tight_layout()
-    plt.savefig('results/eda/05_external_factors/external_factors_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), 'results/eda/05_external_factors/external_factors_analysis.png')
     
     # 2. 특별 이벤트 영향 시각화
     if event_impact:
@@ -423,8 +260,7 @@ def visualize_external_factors(df_analysis, holiday_impact, comparison_stats, ev
                    f'{value:.1f}%', ha='center', va='bottom' if value > 0 else 'top')
         
         plt.tight_layout()
-        plt.savefig('results/eda/05_external_factors/special_events_impact.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        save_figure(plt.gcf(), 'results/eda/05_external_factors/special_events_impact.png')
     
     print("✅ 외부 요인 분석 시각화 저장 완료")
 
@@ -432,10 +268,15 @@ def generate_external_factors_report(df, holiday_impact, comparison_stats, event
     """외부 요인 분석 종합 보고서 생성"""
     print("\n📝 외부 요인 분석 보고서 생성 중...")
     
-    # 평일 대비 변화율 계산
+    # 평일 대비 변화율 (부트스트랩 신뢰구간 포함)
     baseline_power = comparison_stats['평일']['mean']
-    weekend_change = ((comparison_stats['주말']['mean'] - baseline_power) / baseline_power) * 100
-    holiday_change = ((comparison_stats['공휴일']['mean'] - baseline_power) / baseline_power) * 100
+    weekend_change = comparison_stats['주말']['effect_pct']
+    holiday_change = comparison_stats['공휴일']['effect_pct']
+    ci_level = int(round((1 - HOLIDAY_ALPHA) * 100))
+    
+    def change_text(stats):
+        low, high = stats['effect_pct_ci']
+        return f"{stats['effect_pct']:+.1f}%, {ci_level}% CI [{low:+.1f}%, {high:+.1f}%]"
     
     report = f"""
 === 🌟 외부 요인 및 특별 이벤트 분석 보고서 ===
@@ -447,23 +288,28 @@ def generate_external_factors_report(df, holiday_impact, comparison_stats, event
 
 🎉 공휴일 영향 분석:
 
-1. 일반적 패턴:
+1. 일반적 패턴 (평일 = 공휴일·주말·공휴일 전후를 제외한 날, 신뢰구간은 부트스트랩 {HOLIDAY_BOOTSTRAP:,}회):
    - 평일 평균: {comparison_stats['평일']['mean']:,.0f} MW
-   - 주말 평균: {comparison_stats['주말']['mean']:,.0f} MW ({weekend_change:+.1f}%)
-   - 공휴일 평균: {comparison_stats['공휴일']['mean']:,.0f} MW ({holiday_change:+.1f}%)
+   - 주말 평균: {comparison_stats['주말']['mean']:,.0f} MW ({change_text(comparison_stats['주말'])})
+   - 공휴일 평균: {comparison_stats['공휴일']['mean']:,.0f} MW ({change_text(comparison_stats['공휴일'])})"""
+
+    if '공휴일 전후' in comparison_stats:
+        report += f"""
+   - 공휴일 전후 평균: {comparison_stats['공휴일 전후']['mean']:,.0f} MW ({change_text(comparison_stats['공휴일 전후'])})"""
+
+    report += f"""
 
 2. 주요 발견사항:
    - 주말 전력 수요는 평일 대비 {abs(weekend_change):.1f}% {'감소' if weekend_change < 0 else '증가'}
    - 공휴일 전력 수요는 평일 대비 {abs(holiday_change):.1f}% {'감소' if holiday_change < 0 else '증가'}
    - 공휴일이 주말보다 전력 수요가 {'높음' if comparison_stats['공휴일']['mean'] > comparison_stats['주말']['mean'] else '낮음'}
 
-3. 공휴일별 특성:"""
+3. 공휴일별 특성 (평일 대비):"""
 
     if holiday_impact:
         report += "\n"
         for holiday_name, impact in holiday_impact.items():
-            change_vs_baseline = ((impact['mean_power'] - baseline_power) / baseline_power) * 100
-            report += f"   - {holiday_name}: {impact['mean_power']:,.0f} MW ({change_vs_baseline:+.1f}%, {impact['count']}일)\n"
+            report += f"   - {holiday_name}: {impact['mean_power']:,.0f} MW ({change_text(impact)}, {impact['count']}일)\n"
 
     report += f"""
 🌟 특별 이벤트 영향:"""
@@ -529,12 +375,14 @@ def generate_external_factors_report(df, holiday_impact, comparison_stats, event
 4. 모델링 전략:
    - 공휴일과 주말 효과를 별도 변수로 처리
    - 계절별 차별화된 모델 또는 계절 더미 변수 활용
-   - 특별 이벤트는 기간별 더미 변수로 처리
+   - 특별 이벤트는 기간별 더미 변수로 처리 (src.features.engineering.create_event_features)
    - 경제 지표는 라그를 고려한 피처 엔지니어링 적용
 
 📁 생성된 분석 파일:
 - external_factors_analysis.png: 공휴일/계절별 전력 수요 분석
 - special_events_impact.png: 특별 이벤트 영향 분석
+- holiday_impact.csv: 일 유형별 평균, 평일 대비 효과(MW, %)와 부트스트랩 신뢰구간, Cohen's d
+- special_events_impact.csv: 이벤트별 기간 평균, 전년 동기 평균, 변화율
 - external_factors_analysis_report.txt: 종합 분석 보고서
 
 분석 완료 시간: {pd.Timestamp.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
@@ -547,8 +395,8 @@ def generate_external_factors_report(df, holiday_impact, comparison_stats, event
     print("✅ 외부 요인 분석 보고서 저장: external_factors_analysis_report.txt")
     print(report)
 
-def main():
-    """메인 실행 함수"""
+def main(raw=None):
+    """메인 실행 함수 (raw: 미리 로딩한 원본 데이터, 없으면 파일에서 로딩)"""
     print("🚀 외부 요인 및 특별 이벤트 분석 시작")
     print("=" * 70)
     
@@ -558,10 +406,10 @@ def main():
     
     try:
         # 1. 데이터 로딩
-        df = load_and_prepare_data()
+        df = load_and_prepare_data(raw)
         
-        # 2. 한국 공휴일 정보 생성
-        holidays_df = create_korean_holidays()
+        # 2. 한국 공휴일 달력 (특성 생성 파이프라인과 같은 달력)
+        holidays_df = holiday_calendar(range(df['year'].min(), df['year'].max() + 1))
         
         # 3. 공휴일 영향 분석
         df_analysis, holiday_impact, comparison_stats = analyze_holiday_impact(df, holidays_df)
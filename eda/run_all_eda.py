@@ -2,7 +2,18 @@
 """
 EDA 마스터 실행 스크립트
 ======================
-모든 EDA 분석을 순차적으로 실행하는 통합 스크립트입니다.
+모든 EDA 분석을 병렬로 실행하는 통합 스크립트입니다.
+
+원본 데이터는 부모 프로세스에서 한 번만 로딩·파싱하고, matplotlib(Agg)/seaborn/statsmodels도
+미리 임포트한 뒤 프로세스 풀(fork)에서 각 분석의 main(raw=...)을 호출합니다.
+워커는 부모의 메모리를 copy-on-write로 공유하므로 데이터 재파싱·라이브러리 재임포트가 없습니다.
+분석별 출력은 results/eda/logs/<스크립트>.log 에, 실행 기록은 results/eda/eda_run_report.json 에 저장됩니다.
+
+사용법:
+    python eda/run_all_eda.py                 # 병렬 실행 (어느 위치에서나 가능)
+    python eda/run_all_eda.py --workers 1     # 순차 실행
+    python eda/run_all_eda.py --fail-fast     # 첫 실패 시 남은 분석 취소
+    python eda/run_all_eda.py --preset preview  # 저해상도 미리보기 그림
 
 Author: Time Series Forecasting Team
 Date: 2025-06-06
@@ -10,106 +21,253 @@ Python Version: 3.10+
 TaskMaster Tasks: 2.1-2.7
 """
 
+import argparse
+import importlib.util
+import json
+import multiprocessing
 import os
 import sys
 import time
-import subprocess
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
+EDA_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = EDA_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.loader import load_raw_data, RAW_DATA_PATH
+from src.utils.figures import FIGURE_PRESETS
+
+RESULTS_DIR = Path('results/eda')
+LOG_DIR = RESULTS_DIR / 'logs'
+
+# 전체 EDA 분석 목록 (각 스크립트의 main(raw=...)을 호출)
+EDA_ANALYSES = [
+    {'script': "01_data_loading_and_validation.py", 'desc': "1️⃣ 데이터 로딩 및 검증"},
+    {'script': "02_basic_statistical_summary.py", 'desc': "2️⃣ 기본 통계 분석"},
+    {'script': "03_time_series_visualization.py", 'desc': "3️⃣ 시계열 시각화"},
+    {'script': "04_correlation_analysis.py", 'desc': "4️⃣ 상관관계 분석 & 피처 엔지니어링"},
+    {'script': "05_missing_values_analysis.py", 'desc': "5️⃣ 누락값 상세 분석"},
+    {'script': "05b_check_missing_dates.py", 'desc': "5️⃣b 누락된 날짜 확인"},
+    {'script': "06_advanced_timeseries_analysis.py", 'desc': "6️⃣ 고급 시계열 분석 (정상성/자기상관)"},
+    {'script': "07_external_factors_analysis.py", 'desc': "7️⃣ 외부 요인 & 특별 이벤트 분석"},
+]
+
+# 워커가 공유하는 원본 데이터 (fork 시 copy-on-write로 상속)
+_SHARED_RAW = None
+
+
 def print_header(title):
     """섹션 헤더 출력"""
     print("\n" + "="*70)
     print(f"🎯 {title}")
     print("="*70)
 
-def run_script(script_path, script_name):
-    """스크립트 실행 및 결과 모니터링"""
-    print(f"\n▶️ {script_name} 실행 중...")
+def _set_shared_raw(raw):
+    """워커 공유 데이터 설정 (spawn 방식에서는 워커 초기화 함수로 사용)"""
+    global _SHARED_RAW
+    _SHARED_RAW = raw
+
+def preload_libraries():
+    """무거운 라이브러리를 부모 프로세스에서 한 번만 임포트 (헤드리스 Agg 백엔드)"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot  # noqa: F401
+    for module_name in ('seaborn', 'scipy.stats', 'statsmodels.tsa.stattools', 'statsmodels.graphics.tsaplots'):
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+def load_analysis(script_file):
+    """EDA 스크립트를 모듈로 로딩 (파일명이 숫자로 시작하여 일반 import 불가)"""
+    module_name = 'eda_' + Path(script_file).stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, EDA_DIR / script_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def query_results(script_file, raw=None, force=False):
+    """분석 결과 조회 (get_results를 제공하는 스크립트만, 데이터 해시 기준 캐시 사용)
+
+    대시보드/리포트에서 재계산·재시각화 없이 EDA 결과를 가져올 때 사용한다.
+    """
+    module = load_analysis(script_file)
+    if not hasattr(module, 'get_results'):
+        raise AttributeError(f"{script_file} 는 get_results()를 제공하지 않습니다.")
+    return module.get_results(raw=raw, force=force)
+
+def run_analysis(analysis):
+    """분석 하나 실행 (워커 프로세스, 표준 출력은 로그 파일로)
+
+    Returns:
+    - dict: script, status(success/failed), elapsed_seconds, log, error
+    """
+    script_path = EDA_DIR / analysis['script']
+    log_path = LOG_DIR / f"{script_path.stem}.log"
     start_time = time.time()
-    
-    try:
-        result = subprocess.call([sys.executable, script_path])
-        
-        elapsed_time = time.time() - start_time
-        
-        if result == 0:
-            print(f"✅ {script_name} 완료! (실행시간: {elapsed_time:.2f}초)")
-            return True
+    status, error = 'success', None
+
+    with open(log_path, 'w', encoding='utf-8') as log, redirect_stdout(log), redirect_stderr(log):
+        try:
+            load_analysis(analysis['script']).main(raw=_SHARED_RAW)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                status, error = 'failed', f"SystemExit({e.code})"
+        except Exception as e:
+            traceback.print_exc()
+            status, error = 'failed', f"{type(e).__name__}: {e}"
+        finally:
+            import matplotlib.pyplot as plt
+            plt.close('all')
+
+    return {
+        'script': analysis['script'],
+        'status': status,
+        'elapsed_seconds': round(time.time() - start_time, 3),
+        'log': str(log_path),
+        'error': error,
+    }
+
+def run_all(analyses=EDA_ANALYSES, max_workers=None, fail_fast=False, data_path=RAW_DATA_PATH):
+    """데이터를 한 번 로딩한 뒤 분석들을 프로세스 풀에서 실행
+
+    Returns:
+    - list: 분석별 실행 기록 (등록 순서), 취소된 분석은 status='cancelled'
+    """
+    # 스크립트의 상대 경로(data/, results/)는 모두 프로젝트 루트 기준
+    os.chdir(PROJECT_ROOT)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    preload_libraries()
+    load_start = time.time()
+    raw = load_raw_data(data_path)
+    _set_shared_raw(raw)
+    print(f"📊 데이터 로딩 완료: {raw.shape[0]:,}행 × {raw.shape[1]}열 ({time.time() - load_start:.2f}초)")
+
+    records = {}
+    pending = []
+    for analysis in analyses:
+        if (EDA_DIR / analysis['script']).exists():
+            pending.append(analysis)
+        else:
+            records[analysis['script']] = {
+                'script': analysis['script'], 'status': 'failed',
+                'elapsed_seconds': 0.0, 'log': None, 'error': '파일을 찾을 수 없음'
+            }
+
+    if max_workers == 1:
+        for analysis in pending:
+            if fail_fast and any(r['status'] == 'failed' for r in records.values()):
+                break
+            records[analysis['script']] = run_analysis(analysis)
+            _print_record(analysis, records[analysis['script']])
+    else:
+        # fork: 부모의 데이터·임포트된 모듈을 그대로 공유 / 그 외: 초기화 함수로 데이터 전달
+        methods = multiprocessing.get_all_start_methods()
+        if 'fork' in methods:
+            executor_kwargs = {'mp_context': multiprocessing.get_context('fork')}
         else:
-            print(f"❌ {script_name} 실행 실패! (종료 코드: {result})")
-            return False
-            
-    except Exception as e:
-        elapsed_time = time.time() - start_time
-        print(f"❌ {script_name} 실행 중 오류 발생: {e}")
-        print(f"   실행시간: {elapsed_time:.2f}초")
-        return False
+            executor_kwargs = {'initializer': _set_shared_raw, 'initargs': (raw,)}
+
+        with ProcessPoolExecutor(max_workers=max_workers, **executor_kwargs) as executor:
+            futures = {executor.submit(run_analysis, analysis): analysis for analysis in pending}
+            for future in as_completed(futures):
+                analysis = futures[future]
+                if future.cancelled():
+                    continue
+                records[analysis['script']] = future.result()
+                _print_record(analysis, records[analysis['script']])
+
+                if fail_fast and records[analysis['script']]['status'] == 'failed':
+                    for other in futures:
+                        other.cancel()
+
+    for analysis in analyses:
+        records.setdefault(analysis['script'], {
+            'script': analysis['script'], 'status': 'cancelled',
+            'elapsed_seconds': None, 'log': None, 'error': 'fail-fast로 취소'
+        })
+
+    return [dict(records[a['script']], desc=a['desc']) for a in analyses]
+
+def _print_record(analysis, record):
+    if record['status'] == 'success':
+        print(f"✅ {analysis['desc']} 완료! (실행시간: {record['elapsed_seconds']:.2f}초)")
+    else:
+        print(f"❌ {analysis['desc']} 실행 실패! ({record['error']}) - 로그: {record['log']}")
+
+def save_run_report(records, total_elapsed, max_workers, fail_fast, output_path=RESULTS_DIR / 'eda_run_report.json'):
+    """분석별 실행 기록 저장"""
+    report = {
+        'run_datetime': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'total_elapsed_seconds': round(total_elapsed, 3),
+        'max_workers': max_workers,
+        'fail_fast': fail_fast,
+        'analyses': records
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return output_path
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='EDA 분석 병렬 실행')
+    parser.add_argument('--workers', type=int, default=None, help='동시에 실행할 최대 분석 수 (기본: CPU 수)')
+    parser.add_argument('--fail-fast', action='store_true', help='첫 실패 시 남은 분석 취소')
+    parser.add_argument('--preset', choices=list(FIGURE_PRESETS), default=None,
+                        help='그림 DPI/형식 프리셋 (preview: 빠른 미리보기, publication: 300 DPI)')
+    args = parser.parse_args()
+
+    # 워커는 환경변수를 상속하므로 모든 분석의 save_figure/FigureRenderer에 적용됨
+    if args.preset:
+        os.environ['FIGURE_PRESET'] = args.preset
+
     print_header("전체 EDA 통합 분석 시작 🚀")
-    
-    # 현재 디렉토리 확인
-    current_dir = Path.cwd()
-    print(f"현재 작업 디렉토리: {current_dir}")
-    
-    # 전체 EDA 스크립트 순서 (업데이트된 목록)
-    eda_scripts = [
-        ("01_data_loading_and_validation.py", "1️⃣ 데이터 로딩 및 검증"),
-        ("02_basic_statistical_summary.py", "2️⃣ 기본 통계 분석"),
-        ("03_time_series_visualization.py", "3️⃣ 시계열 시각화"),
-        ("04_correlation_analysis.py", "4️⃣ 상관관계 분석 & 피처 엔지니어링"),
-        ("05_missing_values_analysis.py", "5️⃣ 누락값 상세 분석"),
-        ("05b_check_missing_dates.py", "5️⃣b 누락된 날짜 확인"),
-        ("06_advanced_timeseries_analysis.py", "6️⃣ 고급 시계열 분석 (정상성/자기상관)"),
-        ("07_external_factors_analysis.py", "7️⃣ 외부 요인 & 특별 이벤트 분석")
-    ]
-    
-    # 결과 추적
-    results = {}
+    print(f"프로젝트 루트: {PROJECT_ROOT}")
+
+    print(f"\n📋 실행 예정 분석: {len(EDA_ANALYSES)}개")
+    for i, analysis in enumerate(EDA_ANALYSES, 1):
+        print(f"   {i}. {analysis['desc']}")
+
     total_start_time = time.time()
-    
-    print(f"\n📋 실행 예정 스크립트: {len(eda_scripts)}개")
-    for i, (script_file, script_desc) in enumerate(eda_scripts, 1):
-        print(f"   {i}. {script_desc}")
-    
-    # 순차 실행
-    for i, (script_file, script_desc) in enumerate(eda_scripts, 1):
-        print_header(f"단계 {i}/{len(eda_scripts)}: {script_desc}")
-        script_path = current_dir / script_file
-        
-        if not script_path.exists():
-            print(f"❌ 파일을 찾을 수 없음: {script_path}")
-            results[script_desc] = False
-            continue
-            
-        success = run_script(script_path, script_desc)
-        results[script_desc] = success
-        
-        if not success:
-            print(f"⚠️ {script_desc} 실패 - 계속 진행합니다...")
-    
-    # 최종 결과 요약
+    records = run_all(max_workers=args.workers, fail_fast=args.fail_fast)
     total_elapsed_time = time.time() - total_start_time
-    
+
+    # 최종 결과 요약
     print_header("🎯 EDA 분석 완료 요약 보고서")
-    
-    success_count = sum(results.values())
-    total_count = len(results)
-    
+
+    success_count = sum(1 for r in records if r['status'] == 'success')
+    total_count = len(records)
+
     print(f"⏱️ 전체 실행 시간: {total_elapsed_time:.2f}초 ({total_elapsed_time/60:.1f}분)")
     print(f"📊 성공률: {success_count}/{total_count} ({success_count/total_count*100:.1f}%)")
-    
+
     print(f"\n📋 각 단계별 실행 결과:")
-    for i, (script_desc, success) in enumerate(results.items(), 1):
-        status = "✅ 성공" if success else "❌ 실패"
-        print(f"   {i:2d}. {script_desc}: {status}")
-    
+    for i, record in enumerate(records, 1):
+        if record['status'] == 'success':
+            status = f"✅ 성공 ({record['elapsed_seconds']:.2f}초)"
+        elif record['status'] == 'cancelled':
+            status = "⏸️ 취소"
+        else:
+            status = f"❌ 실패 ({record['error']})"
+        print(f"   {i:2d}. {record['desc']}: {status}")
+
+    report_path = save_run_report(records, total_elapsed_time, args.workers, args.fail_fast)
+    print(f"\n📋 실행 기록: {report_path}")
+
     # 결과 파일 확인
-    results_dir = current_dir.parent / "results" / "eda"
-    if results_dir.exists():
+    if RESULTS_DIR.exists():
         print(f"\n📁 생성된 결과 파일 요약:")
-        
+
         # 각 카테고리별 파일 수 확인
         categories = {
             "01_basic_eda": "기본 EDA 시각화",
@@ -118,19 +276,19 @@ def main():
             "04_advanced_timeseries": "고급 시계열 분석",
             "05_external_factors": "외부 요인 분석"
         }
-        
+
         total_files = 0
         for category, description in categories.items():
-            category_dir = results_dir / category
+            category_dir = RESULTS_DIR / category
             if category_dir.exists():
                 files = list(category_dir.glob("*"))
                 file_count = len(files)
                 total_files += file_count
                 print(f"   📊 {description}: {file_count}개 파일")
-        
+
         print(f"\n🎯 총 생성 파일: {total_files}개")
-        print(f"📂 결과 위치: {results_dir}")
-    
+        print(f"📂 결과 위치: {RESULTS_DIR}")
+
     # 최종 메시지
     if success_count == total_count:
         print(f"\n🎉 모든 EDA 분석이 성공적으로 완료되었습니다!")
@@ -139,28 +297,28 @@ def main():
     else:
         failed_count = total_count - success_count
         print(f"\n⚠️ {failed_count}개 분석에서 오류가 발생했습니다.")
-        print(f"❓ 개별 스크립트를 직접 실행하여 문제를 확인해보세요.")
+        print(f"❓ results/eda/logs/ 의 분석별 로그를 확인해보세요.")
         print(f"💡 가상환경 활성화 및 패키지 설치를 확인하세요:")
         print(f"   source venv/bin/activate")
         print(f"   pip install -r requirements.txt")
-    
+
     return success_count == total_count
 
 if __name__ == "__main__":
     # 스크립트 정보
     print("="*70)
-    print("🎯 EDA 마스터 실행 스크립트 v2.0")
+    print("🎯 EDA 마스터 실행 스크립트 v3.0")
     print("📅 시계열 전력수급 데이터 탐색적 분석")
     print("👥 Time Series Forecasting Team - Deep Learning Competition")
     print("="*70)
     print("🐍 Python 버전:", sys.version.split()[0])
     print("⏰ 실행 시작:", time.strftime("%Y-%m-%d %H:%M:%S"))
-    
+
     # 메인 실행
     success = main()
-    
+
     print(f"\n⏰ 실행 종료: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*70)
-    
+
     # 종료 코드
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)
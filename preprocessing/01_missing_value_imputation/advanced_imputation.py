@@ -1,19 +1,28 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from pathlib import Path
 from scipy import interpolate
 from scipy.stats import zscore
 from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.seasonal import seasonal_decompose
 from sklearn.impute import KNNImputer
 from sklearn.preprocessing import StandardScaler
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.loader import load_csv
+from src.features.decomposition import get_decomposition, seasonal_columns
+
 def load_data():
     """데이터 로드 및 전처리"""
-    df = pd.read_csv('data/shared/data.csv')
-    df['date'] = pd.to_datetime(df['date'], format='%Y.%m.%d')
+    # 파싱 결과는 data/shared/.cache/ 에 캐싱 (date는 datetime으로 변환됨)
+    df = load_csv('data/shared/data.csv')
     df = df.set_index('date').sort_index()
     df = df[~df.index.duplicated(keep='last')]
     
@@ -55,32 +64,19 @@ def spline_interpolation(df, all_dates):
     return result
 
 def seasonal_decomposition_imputation(df, all_dates, missing_dates):
-    """계절 분해 기반 보간"""
-    # 일주일 주기로 계절 분해 수행
-    df_reindexed = df.reindex(all_dates)
-    
-    # 초기 선형 보간으로 계절 분해를 위한 연속 데이터 생성
-    temp_data = df_reindexed['최대전력(MW)'].interpolate(method='linear')
+    """계절 분해 기반 보간 (주간 + 연간 MSTL, 분해 결과는 EDA/특성 생성과 공유 캐시)"""
+    # 누락 날짜는 분해 전에 선형 보간으로 채워짐 (components['filled'])
+    components = get_decomposition(df['최대전력(MW)']).reindex(all_dates)
     
-    # 계절 분해 (주간 주기)
-    decomposition = seasonal_decompose(temp_data, model='additive', period=7)
+    # 트렌드 + 계절성(주간 + 연간)으로 보간값 계산
+    trend_seasonal = components['trend'] + components[seasonal_columns(components)].sum(axis=1)
     
-    # 트렌드, 계절성, 잔차 성분 추출
-    trend = decomposition.trend
-    seasonal = decomposition.seasonal
-    resid = decomposition.resid
+    # 잔차 성분은 관측된 날짜 잔차의 평균으로 보완
+    resid_mean = components.loc[~components['filled'].astype(bool), 'resid'].mean()
     
     result = {}
     for date in missing_dates:
-        # 트렌드 + 계절성으로 보간값 계산
-        imputed_value = trend.loc[date] + seasonal.loc[date]
-        
-        # 잔차 성분은 주변값의 평균으로 보완
-        nearby_residuals = resid.dropna()
-        if len(nearby_residuals) > 0:
-            imputed_value += nearby_residuals.mean()
-        
-        result[date] = imputed_value
+        result[date] = trend_seasonal.loc[date] + resid_mean
     
     return result
 
@@ -314,6 +310,12 @@ def main():
     df_complete.reset_index().to_csv(output_file, index=False)
     print(f"\n고급 보간 데이터 저장: {output_file}")
     
+    # 다음 단계(02_feature_engineering) 입력용 최종 데이터셋
+    final_output_file = Path('results/preprocessing/01_missing_value_imputation/final_imputed_dataset.csv')
+    final_output_file.parent.mkdir(parents=True, exist_ok=True)
+    df_complete.rename_axis('date').reset_index().to_csv(final_output_file, index=False)
+    print(f"최종 데이터셋 저장: {final_output_file}")
+    
     # 7. 통계 요약
     print(f"\n=== 최종 통계 ===")
     stats = df_complete['최대전력(MW)'].describe()
@@ -1,9 +1,19 @@
 import pandas as pd
 import numpy as np
+import sys
 from datetime import datetime
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.feature_store import FeatureStore
+from src.data.holidays import holiday_calendar, label_holidays
+
 def create_temporal_features(df, date_col='date'):
     """
     시간적 특성 공학 - 핵심 피처만 생성
@@ -59,82 +69,24 @@ def create_temporal_features(df, date_col='date'):
     print(f"시간적 특성 공학 완료. 총 {len(df_features.columns)}개 피처 생성.")
     return df_features
 
-def create_korean_holidays():
-    """
-    한국 공휴일 데이터베이스 생성 (핵심만)
-    """
-    holidays = []
-    
-    # 고정 공휴일
-    fixed_holidays = [
-        ('01-01', '신정'),
-        ('03-01', '삼일절'),
-        ('05-05', '어린이날'),
-        ('06-06', '현충일'),
-        ('08-15', '광복절'),
-        ('10-03', '개천절'),
-        ('10-09', '한글날'),
-        ('12-25', '크리스마스')
-    ]
-    
-    # 2005-2023년 고정 공휴일
-    for year in range(2005, 2024):
-        for date_str, name in fixed_holidays:
-            holidays.append({
-                'date': f"{year}-{date_str}",
-                'name': name,
-                'type': 'fixed'
-            })
-    
-    # 주요 음력 공휴일 (대표적인 날짜들만)
-    lunar_holidays = [
-        # 설날 (음력 1.1 기준 대략적 양력 날짜)
-        ('2005-02-07', '설날'), ('2005-02-08', '설날'), ('2005-02-09', '설날'),
-        ('2006-01-28', '설날'), ('2006-01-29', '설날'), ('2006-01-30', '설날'),
-        ('2007-02-17', '설날'), ('2007-02-18', '설날'), ('2007-02-19', '설날'),
-        ('2008-02-06', '설날'), ('2008-02-07', '설날'), ('2008-02-08', '설날'),
-        ('2009-01-25', '설날'), ('2009-01-26', '설날'), ('2009-01-27', '설날'),
-        ('2010-02-13', '설날'), ('2010-02-14', '설날'), ('2010-02-15', '설날'),
-        # 추석 (음력 8.15 기준 대략적 양력 날짜)
-        ('2005-09-17', '추석'), ('2005-09-18', '추석'), ('2005-09-19', '추석'),
-        ('2006-10-05', '추석'), ('2006-10-06', '추석'), ('2006-10-07', '추석'),
-        ('2007-09-24', '추석'), ('2007-09-25', '추석'), ('2007-09-26', '추석'),
-        ('2008-09-13', '추석'), ('2008-09-14', '추석'), ('2008-09-15', '추석'),
-        ('2009-10-02', '추석'), ('2009-10-03', '추석'), ('2009-10-04', '추석'),
-        ('2010-09-21', '추석'), ('2010-09-22', '추석'), ('2010-09-23', '추석'),
-    ]
-    
-    for date_str, name in lunar_holidays:
-        holidays.append({
-            'date': date_str,
-            'name': name,
-            'type': 'lunar'
-        })
-    
-    return pd.DataFrame(holidays)
-
 def add_holiday_features(df, date_col='date'):
     """
     공휴일 피처 추가
     """
     print("공휴일 피처 생성 중...")
     
-    # 공휴일 데이터베이스 생성
-    holidays_df = create_korean_holidays()
-    holidays_df['date'] = pd.to_datetime(holidays_df['date'])
+    # 공휴일 달력 (날짜당 한 행, EDA 공휴일 영향 분석과 같은 달력)
+    holidays_df = holiday_calendar()
     
     # 데이터 복사
     df_holiday = df.copy()
     if df_holiday[date_col].dtype == 'object':
         df_holiday[date_col] = pd.to_datetime(df_holiday[date_col])
     
-    # 공휴일 여부 확인
-    holiday_dates = set(holidays_df['date'].dt.date)
-    df_holiday['is_holiday'] = df_holiday[date_col].dt.date.isin(holiday_dates).astype(int)
-    
-    # 공휴일 타입
-    holiday_type_map = dict(zip(holidays_df['date'].dt.date, holidays_df['type']))
-    df_holiday['holiday_type'] = df_holiday[date_col].dt.date.map(holiday_type_map).fillna('none')
+    # 공휴일 여부 / 타입 (merge_asof 한 번으로 매칭)
+    labels = label_holidays(df_holiday[date_col], holidays_df)
+    df_holiday['is_holiday'] = labels['is_holiday'].to_numpy()
+    df_holiday['holiday_type'] = labels['holiday_type'].to_numpy()
     
     print(f"총 {df_holiday['is_holiday'].sum()}개 공휴일 확인됨.")
     return df_holiday, holidays_df
@@ -166,6 +118,11 @@ def main():
     df_final.to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"시간 피처 데이터: {output_path}")
     
+    # 컬럼형 피처 저장소 (pyarrow 설치 시, 다음 단계에서 우선 사용)
+    store_path = FeatureStore().try_save(df_final, '02_feature_engineering/electricity_data_with_temporal_features')
+    if store_path:
+        print(f"피처 저장소: {store_path}")
+    
     # 공휴일 데이터베이스 저장
     holidays_path = 'results/preprocessing/02_feature_engineering/korean_holidays_database.csv'
     holidays_df.to_csv(holidays_path, index=False, encoding='utf-8-sig')
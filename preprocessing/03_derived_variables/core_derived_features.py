@@ -1,9 +1,18 @@
 import pandas as pd
 import numpy as np
+import sys
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
-def create_core_derived_features(df, target_col='최대전력(MW)', date_col='date'):
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.feature_store import FeatureStore
+
+def create_core_derived_features(df, target_col='최대전력(MW)', date_col='date', forecast_safe=False):
     """
     핵심 5개 파생 변수 생성
     
@@ -11,6 +20,7 @@ def create_core_derived_features(df, target_col='최대전력(MW)', date_col='da
     - df: 시간 피처가 포함된 DataFrame
     - target_col: 전력 수요 컬럼명
     - date_col: 날짜 컬럼명
+    - forecast_safe: True이면 daily_change도 예측 시점(t-1일)까지의 정보만 사용
     
     Returns:
     - DataFrame: 핵심 파생 변수가 추가된 데이터프레임
@@ -47,7 +57,11 @@ def create_core_derived_features(df, target_col='최대전력(MW)', date_col='da
     
     # 5. daily_change: 일간 변화량 (트렌드 방향)
     print("5. daily_change - 전일 대비 변화량")
-    df_derived['daily_change'] = df_derived[target_col] - df_derived[target_col].shift(1)
+    if forecast_safe:
+        # 어제 - 그제 (당일 타겟 미사용)
+        df_derived['daily_change'] = df_derived[target_col].shift(1) - df_derived[target_col].shift(2)
+    else:
+        df_derived['daily_change'] = df_derived[target_col] - df_derived[target_col].shift(1)
     
     # 결측값 현황 확인
     print("\n📈 파생 변수 생성 결과:")
@@ -119,11 +133,11 @@ def save_derived_features_summary(df, output_path):
 if __name__ == "__main__":
     # 1. 데이터 로드
     print("데이터 로딩 중...")
-    input_file = "results/preprocessing/02_feature_engineering/electricity_data_with_temporal_features.csv"
-    df = pd.read_csv(input_file)
+    store = FeatureStore()
+    df = store.load('02_feature_engineering/electricity_data_with_temporal_features')
     
-    # 2. 핵심 파생 변수 생성
-    df_with_derived = create_core_derived_features(df)
+    # 2. 핵심 파생 변수 생성 (재귀 예측의 ForecastState 와 같은 daily_change 정의: 어제 - 그제)
+    df_with_derived = create_core_derived_features(df, forecast_safe=True)
     
     # 3. 파생 변수 분석
     correlations = analyze_derived_features(df_with_derived)
@@ -138,6 +152,10 @@ if __name__ == "__main__":
     df_with_derived.to_csv(output_file, index=False, encoding='utf-8-sig')
     print(f"\n💾 결과 데이터 저장: {output_file}")
     
+    store_path = store.try_save(df_with_derived, '03_derived_variables/electricity_data_with_core_derived')
+    if store_path:
+        print(f"💾 피처 저장소: {store_path}")
+    
     # 요약 보고서 저장
     summary_file = f"{output_dir}/core_derived_features_summary.txt"
     save_derived_features_summary(df_with_derived, summary_file)
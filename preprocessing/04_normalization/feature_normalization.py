@@ -12,11 +12,21 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler, PowerTransformer
-import joblib
 import warnings
 import json
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.feature_store import FeatureStore
+from src.features.normalization import FeatureNormalizer, column_stats, select_scalers
+from src.features.scaling_quality import FEATURE_CRITERIA, scaling_quality_table, verify_scaling
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
@@ -56,151 +66,90 @@ def analyze_feature_types(df):
     
     return feature_types
 
+SCALER_CLASSES = {
+    'StandardScaler': StandardScaler,
+    'MinMaxScaler': MinMaxScaler,
+    'RobustScaler': RobustScaler,
+    'PowerTransformer': lambda: PowerTransformer(method='yeo-johnson'),
+}
+
+def select_optimal_scalers(df, features):
+    """모든 피처의 분포 통계를 한 번에 계산하고 스케일러 선택 규칙을 적용합니다.
+    
+    Returns:
+    - DataFrame: 피처별 통계(column_stats) + scaler_type, reason
+    """
+    stats = column_stats(df, features)
+    return stats.join(select_scalers(stats))
+
 def get_optimal_scaler(data, feature_name):
     """피처의 분포 특성을 분석하여 최적 스케일러를 선택합니다."""
     
-    # 결측값 제거하고 분석
-    clean_data = data.dropna()
-    
-    if len(clean_data) == 0:
-        return None, "No valid data"
-    
-    # 기본 통계량
-    skewness = abs(clean_data.skew())
-    
-    # IQR을 이용한 이상치 비율 계산
-    Q1 = clean_data.quantile(0.25)
-    Q3 = clean_data.quantile(0.75)
-    IQR = Q3 - Q1
-    outliers = ((clean_data < (Q1 - 1.5 * IQR)) | (clean_data > (Q3 + 1.5 * IQR))).sum()
-    outlier_ratio = outliers / len(clean_data)
-    
-    # 분포의 범위
-    data_range = clean_data.max() - clean_data.min()
-    
-    # 스케일러 선택 로직
-    if outlier_ratio > 0.1:  # 이상치가 10% 이상
-        return RobustScaler(), f"RobustScaler (outlier_ratio: {outlier_ratio:.3f})"
-    elif skewness > 2:  # 매우 치우친 분포
-        return PowerTransformer(method='yeo-johnson'), f"PowerTransformer (skewness: {skewness:.3f})"
-    elif data_range < 100 and clean_data.min() >= 0:  # 작은 범위의 양수 데이터
-        return MinMaxScaler(), f"MinMaxScaler (range: {data_range:.1f})"
-    else:  # 일반적인 경우
-        return StandardScaler(), f"StandardScaler (default)"
+    selection = select_optimal_scalers(data.to_frame(feature_name), [feature_name]).iloc[0]
+    
+    if selection['scaler_type'] is None:
+        return None, selection['reason']
+    
+    return SCALER_CLASSES[selection['scaler_type']](), selection['reason']
 
-def normalize_features(df, feature_types):
-    """피처들을 정규화합니다."""
+def normalize_features(df, feature_types, fit_mask=None):
+    """피처들을 정규화합니다.
     
-    df_normalized = df.copy()
-    scalers = {}
-    scaling_info = {}
+    Parameters:
+    - df: 정규화할 DataFrame
+    - feature_types: analyze_feature_types 결과
+    - fit_mask: 스케일러 파라미터 추정에 사용할 행 (None이면 전체, 예: 학습 기간만)
+    
+    Returns:
+    - (정규화된 DataFrame, FeatureNormalizer, scaling_info)
+    """
     
     # 정규화할 피처들 (numerical 피처만)
-    features_to_scale = feature_types['numerical']
+    features_to_scale = [f for f in feature_types['numerical'] if df[f].notna().any()]
+    skipped = sorted(set(feature_types['numerical']) - set(features_to_scale))
     
     print(f"정규화 대상 피처 수: {len(features_to_scale)}")
+    if skipped:
+        print(f"  - 스킵 (유효 데이터 없음): {skipped}")
     
-    for feature in features_to_scale:
-        print(f"\n처리 중: {feature}")
-        
-        # 결측값 임시 처리 (중위수로 채움)
-        original_na_mask = df_normalized[feature].isna()
-        if original_na_mask.any():
-            median_val = df_normalized[feature].median()
-            df_normalized[feature].fillna(median_val, inplace=True)
-            print(f"  - 결측값 {original_na_mask.sum()}개를 중위수 {median_val:.2f}로 임시 처리")
-        
-        # 최적 스케일러 선택
-        scaler, reason = get_optimal_scaler(df_normalized[feature], feature)
-        
-        if scaler is None:
-            print(f"  - 스킵 (유효 데이터 없음)")
-            continue
-        
-        # 스케일링 적용
-        try:
-            # 2D 배열로 변환
-            feature_values = df_normalized[feature].values.reshape(-1, 1)
-            scaled_values = scaler.fit_transform(feature_values)
-            df_normalized[feature] = scaled_values.flatten()
-            
-            # 스케일러 및 정보 저장
-            scalers[feature] = scaler
-            scaling_info[feature] = {
-                'scaler_type': type(scaler).__name__,
-                'reason': reason,
-                'original_mean': float(df[feature].mean()) if not df[feature].isna().all() else None,
-                'original_std': float(df[feature].std()) if not df[feature].isna().all() else None,
-                'scaled_mean': float(df_normalized[feature].mean()),
-                'scaled_std': float(df_normalized[feature].std())
-            }
-            
-            print(f"  - 적용: {reason}")
-            print(f"  - 변환 전: 평균 {df[feature].mean():.3f}, 표준편차 {df[feature].std():.3f}")
-            print(f"  - 변환 후: 평균 {df_normalized[feature].mean():.3f}, 표준편차 {df_normalized[feature].std():.3f}")
-            
-        except Exception as e:
-            print(f"  - 오류 발생: {e}")
-            continue
-        
-        # 원본 결측값 패턴 복원
-        if original_na_mask.any():
-            df_normalized.loc[original_na_mask, feature] = np.nan
-            print(f"  - 원본 결측값 패턴 복원 완료")
+    # 결측값은 통계에서 제외되고 변환 후에도 그대로 유지됨
+    df_fit = df if fit_mask is None else df.loc[fit_mask]
+    normalizer = FeatureNormalizer().fit(df_fit, features_to_scale)
+    df_normalized = normalizer.transform(df)
+    
+    # 변환 전후 통계 (전체 컬럼 한 번에 계산)
+    original_mean = df[features_to_scale].mean()
+    original_std = df[features_to_scale].std()
+    scaled_mean = df_normalized[features_to_scale].mean()
+    scaled_std = df_normalized[features_to_scale].std()
+    
+    scaling_info = {}
+    for feature, scaler_type, reason in zip(normalizer.columns, normalizer.methods, normalizer.reasons):
+        scaling_info[feature] = {
+            'scaler_type': scaler_type,
+            'reason': reason,
+            'original_mean': float(original_mean[feature]),
+            'original_std': float(original_std[feature]),
+            'scaled_mean': float(scaled_mean[feature]),
+            'scaled_std': float(scaled_std[feature])
+        }
+        print(f"  - {feature}: {reason} | 변환 전 평균 {original_mean[feature]:.3f}, 표준편차 {original_std[feature]:.3f}"
+              f" → 변환 후 평균 {scaled_mean[feature]:.3f}, 표준편차 {scaled_std[feature]:.3f}")
     
-    return df_normalized, scalers, scaling_info
+    return df_normalized, normalizer, scaling_info
 
 def validate_scaling_quality(df_original, df_scaled, feature_types):
     """스케일링 품질을 검증합니다."""
     
-    validation_results = {}
-    
-    numerical_features = feature_types['numerical']
+    # 모든 피처의 검증 기준을 한 번에 계산
+    table = scaling_quality_table(df_original, df_scaled, feature_types['numerical'])
     
-    for feature in numerical_features:
-        if feature not in df_scaled.columns:
-            continue
-        
-        # 결측값 제외하고 비교
-        original_clean = df_original[feature].dropna()
-        scaled_clean = df_scaled[feature].dropna()
-        
-        if len(original_clean) == 0 or len(scaled_clean) == 0:
-            continue
-        
-        # 검증 기준들
-        criteria = {}
-        
-        # 1. 스케일링된 피처의 평균이 0 근처인지 (StandardScaler의 경우)
-        criteria['mean_near_zero'] = abs(scaled_clean.mean()) < 0.1
-        
-        # 2. 스케일링된 피처의 표준편차가 1 근처인지 (StandardScaler의 경우)
-        criteria['std_near_one'] = 0.8 < scaled_clean.std() < 1.2
-        
-        # 3. 결측값 패턴이 보존되었는지
-        original_na_pattern = df_original[feature].isna()
-        scaled_na_pattern = df_scaled[feature].isna()
-        criteria['na_pattern_preserved'] = original_na_pattern.equals(scaled_na_pattern)
-        
-        # 4. 상대적 순서가 보존되었는지 (상관관계 확인)
-        if len(original_clean) > 1 and len(scaled_clean) > 1:
-            correlation = original_clean.corr(scaled_clean)
-            criteria['order_preserved'] = correlation > 0.95
-        else:
-            criteria['order_preserved'] = True
-        
-        # 5. 이상치가 과도하게 증가하지 않았는지
-        original_outliers = ((original_clean - original_clean.mean()).abs() > 3 * original_clean.std()).sum()
-        scaled_outliers = ((scaled_clean - scaled_clean.mean()).abs() > 3 * scaled_clean.std()).sum()
-        criteria['outliers_controlled'] = scaled_outliers <= original_outliers * 1.5
-        
-        # 전체 품질 점수
-        quality_score = sum(criteria.values()) / len(criteria)
-        
+    validation_results = {}
+    for feature, row in table.iterrows():
         validation_results[feature] = {
-            'criteria': criteria,
-            'quality_score': quality_score,
-            'passed': quality_score >= 0.8  # 80% 이상 기준 통과
+            'criteria': {criterion: bool(row[criterion]) for criterion in FEATURE_CRITERIA},
+            'quality_score': float(row['quality_score']),
+            'passed': bool(row['passed'])  # 80% 이상 기준 통과
         }
     
     return validation_results
@@ -340,7 +289,7 @@ def generate_comprehensive_report(df_original, df_scaled, feature_types, scaling
     report.append("**Time-Aware Data Splitting**을 위한 완전한 정규화 데이터셋이 준비되었습니다.")
     report.append("\n### 활용 가능한 파일들")
     report.append("- `electricity_data_normalized.csv`: 정규화된 전체 데이터셋")
-    report.append("- `scalers.joblib`: 저장된 스케일러 객체들 (미래 데이터 적용용)")
+    report.append("- `feature_normalizer.json`: 정규화 파라미터 (FeatureNormalizer.load 로 미래 데이터에 적용)")
     report.append("- `scaling_metadata.json`: 상세 스케일링 정보")
     
     # 보고서 저장
@@ -353,8 +302,8 @@ def main():
     """메인 실행 함수"""
     
     # 입력 데이터 로드
-    input_path = 'results/preprocessing/03_derived_variables/electricity_data_with_core_derived.csv'
-    df = pd.read_csv(input_path)
+    store = FeatureStore()
+    df = store.load('03_derived_variables/electricity_data_with_core_derived')
     
     print("=" * 80)
     print("Task 3.4: Feature Normalization and Scaling")
@@ -376,7 +325,7 @@ def main():
     
     # 2. 피처 정규화
     print("\n2단계: 피처 정규화 수행")
-    df_normalized, scalers, scaling_info = normalize_features(df, feature_types)
+    df_normalized, normalizer, scaling_info = normalize_features(df, feature_types)
     
     # 3. 품질 검증
     print("\n3단계: 스케일링 품질 검증")
@@ -386,6 +335,10 @@ def main():
     total_count = len(validation_results)
     print(f"품질 검증 통과: {passed_count}/{total_count} ({passed_count/total_count*100:.1f}%)")
     
+    quality_report = verify_scaling(df, df_normalized, normalizer)
+    for name, check in quality_report['checks'].items():
+        print(f"  {'✅' if check['passed'] else '❌'} {name}: {check['message']}")
+    
     # 4. 시각화
     print("\n4단계: 스케일링 효과 시각화")
     create_scaling_visualizations(df, df_normalized, feature_types, output_dir)
@@ -398,10 +351,13 @@ def main():
     df_normalized.to_csv(normalized_output_path, index=False, encoding='utf-8')
     print(f"정규화 데이터셋 저장: {normalized_output_path}")
     
-    # 스케일러 객체들 저장
-    scalers_path = os.path.join(output_dir, 'scalers.joblib')
-    joblib.dump(scalers, scalers_path)
-    print(f"스케일러 객체들 저장: {scalers_path}")
+    store_path = store.try_save(df_normalized, '04_normalization/electricity_data_normalized')
+    if store_path:
+        print(f"피처 저장소 저장: {store_path}")
+    
+    # 정규화 파라미터 저장 (center/scale/λ만 저장, 예측 템플릿에 동일 적용)
+    normalizer_path = normalizer.save(os.path.join(output_dir, 'feature_normalizer.json'))
+    print(f"정규화 파라미터 저장: {normalizer_path}")
     
     # 메타데이터 저장 (JSON 직렬화 가능하도록 변환)
     metadata = {
@@ -412,6 +368,7 @@ def main():
             'passed': bool(v['passed']),
             'criteria': {kk: bool(vv) for kk, vv in v['criteria'].items()}
         } for k, v in validation_results.items()},
+        'quality_verification': {key: quality_report[key] for key in ('passed', 'summary', 'checks')},
         'processing_datetime': datetime.now().isoformat(),
         'input_shape': list(df.shape),
         'output_shape': list(df_normalized.shape)
@@ -436,7 +393,7 @@ def main():
     print(f"✅ 품질 검증 통과: {passed_count}/{total_count}개")
     print(f"✅ 결과 저장 위치: {output_dir}")
     
-    return df_normalized, scalers, validation_results
+    return df_normalized, normalizer, validation_results
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
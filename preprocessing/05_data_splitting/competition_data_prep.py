@@ -11,18 +11,38 @@ Task 3.5: Time-Aware Data Splitting for Competition
 import pandas as pd
 import numpy as np
 import json
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.feature_store import FeatureStore, read_frame
+from src.data.cv_folds import calendar_folds
+from src.data.holidays import create_korean_holidays
+from src.data.submission import format_submission_dates, prediction_dates as submission_date_range
+from src.features.forecast_state import ForecastState
+from src.features.normalization import FeatureNormalizer
+
 class CompetitionDataPreparator:
     """대회용 데이터 준비 클래스"""
     
-    def __init__(self, input_path, output_dir):
+    def __init__(self, input_path=None, output_dir='results/preprocessing/05_data_splitting', train_data=None,
+                 normalizer=None):
+        """input_path 대신 train_data(DataFrame)를 주면 디스크를 거치지 않고 사용
+        
+        normalizer(FeatureNormalizer)를 주면 훈련 데이터와 같은 파라미터로 예측 피처를 정규화
+        """
+        if input_path is None and train_data is None:
+            raise ValueError("input_path 또는 train_data 중 하나가 필요합니다.")
+        
         self.input_path = input_path
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # 대회 설정
         self.prediction_start = datetime(2024, 1, 1)
@@ -30,14 +50,23 @@ class CompetitionDataPreparator:
         self.total_prediction_days = 527
         
         # 데이터 로드
-        self.train_data = None
-        self.cv_folds = []
+        self.train_data = train_data
+        self.normalizer = normalizer
+        
+        # 공휴일 달력 (훈련 + 예측 기간)
+        self.holidays = create_korean_holidays(years=range(2005, self.prediction_end.year + 1))
+        self.holiday_types = dict(zip(self.holidays['date'], self.holidays['type']))
+        self.cv_folds = None
         
     def load_normalized_data(self):
         """정규화된 훈련 데이터 로드"""
         print("🔄 정규화된 데이터 로드 중...")
         
-        self.train_data = pd.read_csv(self.input_path)
+        if self.train_data is None:
+            # .feather/.parquet 이면 파싱 없이 로딩
+            self.train_data = read_frame(self.input_path)
+        else:
+            self.train_data = self.train_data.copy()
         self.train_data['date'] = pd.to_datetime(self.train_data['date'])
         
         print(f"   📊 데이터 형태: {self.train_data.shape}")
@@ -46,82 +75,70 @@ class CompetitionDataPreparator:
         print()
         
     def create_prediction_dates(self):
-        """527일 예측 날짜 생성"""
+        """527일 예측 날짜 생성
+        
+        Returns:
+        - DataFrame: date(제출 형식 YYYY.M.D), datetime, iso_date
+        """
         print("🔄 예측 날짜 템플릿 생성 중...")
         
-        # 527일 날짜 생성
-        prediction_dates = []
-        current_date = self.prediction_start
-        
-        for i in range(self.total_prediction_days):
-            # 제출 형식으로 변환 (YYYY.M.D)
-            formatted_date = f"{current_date.year}.{current_date.month}.{current_date.day}"
-            prediction_dates.append({
-                'date': formatted_date,
-                'datetime': current_date,
-                'iso_date': current_date.strftime('%Y-%m-%d')
-            })
-            current_date += timedelta(days=1)
-        
-        # 마지막 날짜 검증
-        final_date = prediction_dates[-1]['datetime']
-        if final_date != self.prediction_end:
-            raise ValueError(f"날짜 계산 오류: 예상 {self.prediction_end}, 실제 {final_date}")
-        
-        print(f"   📅 예측 기간: {prediction_dates[0]['date']} ~ {prediction_dates[-1]['date']}")
-        print(f"   📊 총 예측 일수: {len(prediction_dates)}일")
-        print(f"   ✅ 527일 검증: {'통과' if len(prediction_dates) == 527 else '실패'}")
+        # 527일 날짜 생성 (제출 형식 문자열은 벡터 연산으로 변환)
+        dates = submission_date_range(self.prediction_start, self.prediction_end)
+        prediction_dates_df = pd.DataFrame({
+            'date': format_submission_dates(dates),
+            'datetime': dates,
+            'iso_date': dates.strftime('%Y-%m-%d')
+        })
+        
+        # 일수 검증
+        if len(prediction_dates_df) != self.total_prediction_days:
+            raise ValueError(f"날짜 계산 오류: 예상 {self.total_prediction_days}일, 실제 {len(prediction_dates_df)}일")
+        
+        print(f"   📅 예측 기간: {prediction_dates_df['date'].iloc[0]} ~ {prediction_dates_df['date'].iloc[-1]}")
+        print(f"   📊 총 예측 일수: {len(prediction_dates_df)}일")
+        print(f"   ✅ 527일 검증: {'통과' if len(prediction_dates_df) == 527 else '실패'}")
         print()
         
-        return prediction_dates
+        return prediction_dates_df
     
     def create_time_features(self, prediction_dates):
         """예측 날짜에 대한 시간 피처 생성"""
         print("🔄 예측 날짜 시간 피처 생성 중...")
         
-        features_list = []
-        
-        for date_info in prediction_dates:
-            dt = date_info['datetime']
-            
-            # 기본 시간 피처
-            features = {
-                'date': date_info['iso_date'],
-                'year': dt.year,
-                'month': dt.month,
-                'day': dt.day,
-                'dayofweek': dt.weekday(),
-                'dayofyear': dt.timetuple().tm_yday,
-                'weekofyear': dt.isocalendar()[1],
-                'quarter': (dt.month - 1) // 3 + 1,
-                'season': self._get_season(dt.month)
-            }
-            
-            # 이진 피처
-            features.update({
-                'is_weekend': 1 if dt.weekday() >= 5 else 0,
-                'is_weekday': 1 if dt.weekday() < 5 else 0,
-                'is_month_start': 1 if dt.day == 1 else 0,
-                'is_month_end': 1 if dt.day == pd.Timestamp(dt).days_in_month else 0
-            })
-            
-            # 주기적 피처
-            features.update({
-                'month_sin': np.sin(2 * np.pi * dt.month / 12),
-                'month_cos': np.cos(2 * np.pi * dt.month / 12),
-                'dayofweek_sin': np.sin(2 * np.pi * dt.weekday() / 7),
-                'dayofweek_cos': np.cos(2 * np.pi * dt.weekday() / 7)
-            })
-            
-            # 공휴일 피처 (기본값 설정)
-            features.update({
-                'is_holiday': 0,
-                'holiday_type': 'none'
-            })
-            
-            features_list.append(features)
-        
-        df_features = pd.DataFrame(features_list)
+        dt = pd.DatetimeIndex(prediction_dates['datetime'])
+        dayofweek = dt.dayofweek.to_numpy()
+        month = dt.month.to_numpy()
+        
+        # 기본 시간 피처
+        df_features = pd.DataFrame({
+            'date': prediction_dates['iso_date'].to_numpy(),
+            'year': dt.year,
+            'month': month,
+            'day': dt.day,
+            'dayofweek': dayofweek,
+            'dayofyear': dt.dayofyear,
+            'weekofyear': dt.isocalendar().week.to_numpy().astype(int),
+            'quarter': dt.quarter,
+            'season': pd.Series(month).map(self._get_season).to_numpy()
+        })
+        
+        # 이진 피처
+        df_features['is_weekend'] = (dayofweek >= 5).astype(int)
+        df_features['is_weekday'] = (dayofweek < 5).astype(int)
+        df_features['is_month_start'] = dt.is_month_start.astype(int)
+        df_features['is_month_end'] = dt.is_month_end.astype(int)
+        
+        # 주기적 피처
+        df_features['month_sin'] = np.sin(2 * np.pi * month / 12)
+        df_features['month_cos'] = np.cos(2 * np.pi * month / 12)
+        df_features['dayofweek_sin'] = np.sin(2 * np.pi * dayofweek / 7)
+        df_features['dayofweek_cos'] = np.cos(2 * np.pi * dayofweek / 7)
+        
+        # 공휴일 피처 (공휴일 달력 기준)
+        df_features['holiday_type'] = df_features['date'].map(self.holiday_types).fillna('none')
+        df_features['is_holiday'] = (df_features['holiday_type'] != 'none').astype(int)
+        df_features = df_features[[c for c in df_features.columns if c != 'holiday_type'] + ['holiday_type']]
+        
         print(f"   📊 생성된 피처 수: {len(df_features.columns)}개")
         print(f"   📅 피처 데이터 형태: {df_features.shape}")
         print()
@@ -129,67 +146,69 @@ class CompetitionDataPreparator:
         return df_features
     
     def _get_season(self, month):
-        """계절 정보 반환"""
-        if month in [12, 1, 2]:
-            return 0  # 겨울
-        elif month in [3, 4, 5]:
+        """계절 정보 반환 (02_feature_engineering 과 같은 인코딩)"""
+        if month in [3, 4, 5]:
             return 1  # 봄
         elif month in [6, 7, 8]:
             return 2  # 여름
-        else:
+        elif month in [9, 10, 11]:
             return 3  # 가을
+        else:
+            return 4  # 겨울
     
-    def create_lag_initialization(self):
-        """2023년 말 데이터로 2024년 lag 피처 초기화 값 생성"""
-        print("🔄 Lag 피처 초기화 값 생성 중...")
-        
-        # 2023년 말 데이터 추출
-        last_30_days = self.train_data.tail(30).copy()
-        last_7_days = self.train_data.tail(7).copy()
-        last_day = self.train_data.tail(1).copy()
-        
-        # 초기화 값 계산
-        lag_init = {
-            'lag_1day': float(last_day['최대전력(MW)'].iloc[0]),
-            'lag_7day': float(last_7_days['최대전력(MW)'].iloc[0]),
-            'rolling_7day_mean': float(last_7_days['최대전력(MW)'].mean()),
-            'rolling_30day_mean': float(last_30_days['최대전력(MW)'].mean()),
-            'daily_change': 0.0
-        }
+    def normalize_prediction_features(self, prediction_features):
+        """훈련 데이터에 적용된 정규화 파라미터를 예측 피처에 동일하게 적용"""
+        if self.normalizer is None:
+            return prediction_features
         
-        print(f"   📊 Lag 초기값:")
-        for key, value in lag_init.items():
+        columns = [c for c in self.normalizer.columns if c in prediction_features.columns]
+        print(f"🔄 예측 피처 정규화 중... ({len(columns)}개 컬럼, 훈련 데이터 파라미터 사용)")
+        print()
+        return self.normalizer.transform(prediction_features)
+    
+    def create_forecast_state(self, prediction_features, buffer_size=365):
+        """재귀 예측용 상태 생성 (최근 buffer_size일 타겟 + 예측 구간 달력 피처 + 공휴일 달력)"""
+        print("🔄 재귀 예측 상태 생성 중...")
+        
+        forecast_state = ForecastState.from_history(
+            self.train_data, prediction_features,
+            holidays=self.holidays, normalizer=self.normalizer,
+            buffer_size=buffer_size
+        )
+        
+        print(f"   📊 링 버퍼: 최근 {len(forecast_state.state.buffer)}일 (마지막 날짜 {forecast_state.state.last_date.date()})")
+        print(f"   📅 예측 구간 달력: {len(forecast_state)}일 × {forecast_state.calendar.shape[1]}열")
+        print(f"   📊 첫 예측일 lag 피처:")
+        for key, value in forecast_state.state.next_features().items():
             print(f"      {key}: {value:.2f}")
         print()
         
-        return lag_init
+        return forecast_state
     
-    def create_cv_folds(self):
-        """시계열 교차검증 폴드 생성"""
+    def create_cv_folds(self, val_years=range(2020, 2024), window='expanding', train_years=None, gap_days=0):
+        """시계열 교차검증 폴드 생성 (정수 인덱스 범위)
+        
+        Parameters:
+        - val_years: 검증 연도 (기본: 최근 4년)
+        - window: 'expanding' 또는 'sliding'
+        - train_years: sliding 창 길이 (연 단위)
+        - gap_days: 훈련 끝과 검증 시작 사이 embargo 일수
+        """
         print("🔄 시계열 교차검증 폴드 생성 중...")
         
-        # 연도별 폴드 생성 (최근 4년)
-        cv_folds = []
-        
-        for val_year in range(2020, 2024):
-            train_end = f"{val_year-1}-12-31"
-            val_start = f"{val_year}-01-01"
-            val_end = f"{val_year}-12-31"
-            
-            fold = {
-                'fold_id': val_year - 2019,
-                'train_period': f"2005-01-01 ~ {train_end}",
-                'validation_period': f"{val_start} ~ {val_end}",
-                'train_size': len(self.train_data[self.train_data['date'] <= train_end]),
-                'val_size': len(self.train_data[
-                    (self.train_data['date'] >= val_start) & 
-                    (self.train_data['date'] <= val_end)
-                ])
-            }
-            
-            cv_folds.append(fold)
-            print(f"   📂 Fold {fold['fold_id']}: {fold['train_period']} → {fold['validation_period']}")
-            print(f"      훈련: {fold['train_size']}일, 검증: {fold['val_size']}일")
+        # 행 순서가 날짜 순서와 같아야 정수 범위로 슬라이싱 가능
+        self.train_data = self.train_data.sort_values('date').reset_index(drop=True)
+        cv_folds = calendar_folds(
+            self.train_data['date'], val_years,
+            window=window, train_years=train_years, gap_days=gap_days
+        )
+        
+        summary = cv_folds.to_frame(self.train_data['date'])
+        for fold in summary.itertuples():
+            print(f"   📂 Fold {fold.fold_id}: {fold.train_first_date} ~ {fold.train_last_date} → "
+                  f"{fold.val_first_date} ~ {fold.val_last_date}")
+            print(f"      훈련: {fold.train_size}일 (iloc[{fold.train_start}:{fold.train_stop}]), "
+                  f"검증: {fold.val_size}일 (iloc[{fold.val_start}:{fold.val_stop}])")
         
         print(f"\n   📊 총 {len(cv_folds)}개 폴드 생성")
         print()
@@ -197,15 +216,21 @@ class CompetitionDataPreparator:
         self.cv_folds = cv_folds
         return cv_folds
     
-    def save_results(self, prediction_features, submission_template, lag_init):
+    def save_results(self, prediction_features, submission_template, forecast_state):
         """결과 저장"""
         print("🔄 결과 저장 중...")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # 1. 전체 훈련 데이터 저장
         train_path = self.output_dir / 'train_data_full.csv'
         self.train_data.to_csv(train_path, index=False, encoding='utf-8-sig')
         print(f"   💾 훈련 데이터: {train_path}")
         
+        store = FeatureStore(root=self.output_dir)
+        store_path = store.try_save(self.train_data, 'train_data_full')
+        if store_path:
+            print(f"   💾 훈련 데이터 (피처 저장소): {store_path}")
+        
         # 2. 예측 피처 템플릿 저장
         pred_path = self.output_dir / 'prediction_template.csv'
         prediction_features.to_csv(pred_path, index=False, encoding='utf-8-sig')
@@ -216,11 +241,27 @@ class CompetitionDataPreparator:
         submission_template.to_csv(sub_path, index=False, encoding='utf-8-sig')
         print(f"   💾 제출 템플릿: {sub_path}")
         
-        # 4. CV 폴드 메타데이터 저장
+        # 4. CV 폴드 저장 (정수 범위 배열 + 사람이 읽을 수 있는 요약)
+        folds_path = self.cv_folds.save(self.output_dir / 'cv_folds.npz')
+        print(f"   💾 CV 폴드 인덱스: {folds_path}")
+        
+        summary = self.cv_folds.to_frame(self.train_data['date'])
         cv_metadata = {
             'cv_strategy': 'time_series_split',
             'num_folds': len(self.cv_folds),
-            'folds': self.cv_folds
+            'params': self.cv_folds.params,
+            'folds': [
+                {
+                    'fold_id': int(fold.fold_id),
+                    'train_period': f"{fold.train_first_date} ~ {fold.train_last_date}",
+                    'validation_period': f"{fold.val_first_date} ~ {fold.val_last_date}",
+                    'train_index': [int(fold.train_start), int(fold.train_stop)],
+                    'val_index': [int(fold.val_start), int(fold.val_stop)],
+                    'train_size': int(fold.train_size),
+                    'val_size': int(fold.val_size)
+                }
+                for fold in summary.itertuples()
+            ]
         }
         
         cv_path = self.output_dir / 'cv_folds_metadata.json'
@@ -228,16 +269,27 @@ class CompetitionDataPreparator:
             json.dump(cv_metadata, f, indent=2, ensure_ascii=False)
         print(f"   💾 CV 메타데이터: {cv_path}")
         
-        # 5. Lag 초기화 값 저장
+        # 5. 재귀 예측 상태 저장 (링 버퍼 + 예측 구간 달력 + 공휴일 + 정규화 파라미터)
+        state_path = forecast_state.save(self.output_dir / 'forecast_state.json')
+        print(f"   💾 재귀 예측 상태: {state_path}")
+        
+        # 6. 첫 예측일 lag 피처 (원 단위, 모델 노트북 호환용)
         lag_path = self.output_dir / 'lag_initialization.json'
         with open(lag_path, 'w', encoding='utf-8') as f:
-            json.dump(lag_init, f, indent=2, ensure_ascii=False)
+            json.dump(forecast_state.state.next_features(), f, indent=2, ensure_ascii=False)
         print(f"   💾 Lag 초기값: {lag_path}")
         
         print()
     
-    def run_complete_pipeline(self):
-        """전체 파이프라인 실행"""
+    def run_complete_pipeline(self, save=True):
+        """전체 파이프라인 실행
+        
+        Parameters:
+        - save: False이면 파일을 쓰지 않고 결과만 반환
+        
+        Returns:
+        - dict: train_data, prediction_features, submission_template, forecast_state, cv_folds
+        """
         print("🚀 Task 3.5: Time-Aware Data Splitting 시작")
         print("=" * 70)
         print()
@@ -250,43 +302,60 @@ class CompetitionDataPreparator:
         
         # 3. 시간 피처 생성
         prediction_features = self.create_time_features(prediction_dates)
+        prediction_features = self.normalize_prediction_features(prediction_features)
         
-        # 4. Lag 초기화 값 생성
-        lag_init = self.create_lag_initialization()
+        # 4. 재귀 예측 상태 생성
+        forecast_state = self.create_forecast_state(prediction_features)
         
         # 5. CV 폴드 생성
         self.create_cv_folds()
         
         # 6. 제출 템플릿 생성
-        submission_data = []
-        for date_info in prediction_dates:
-            submission_data.append({
-                'date': date_info['date'],
-                '최대전력(MW)': 0
-            })
-        submission_template = pd.DataFrame(submission_data)
+        submission_template = pd.DataFrame({
+            'date': prediction_dates['date'].to_numpy(),
+            '최대전력(MW)': 0
+        })
         
         # 7. 결과 저장
-        self.save_results(prediction_features, submission_template, lag_init)
+        if save:
+            self.save_results(prediction_features, submission_template, forecast_state)
         
         print("🎉 Task 3.5: Time-Aware Data Splitting 완료!")
         print("=" * 70)
         print()
-        print("📋 생성된 파일:")
-        for file_path in sorted(self.output_dir.glob('*')):
-            print(f"   📄 {file_path.name}")
-        print()
+        if save:
+            print("📋 생성된 파일:")
+            for file_path in sorted(self.output_dir.glob('*')):
+                print(f"   📄 {file_path.name}")
+            print()
         print("✅ 다음 단계: Task 4 (Model Development) 준비 완료")
+        
+        return {
+            'train_data': self.train_data,
+            'prediction_features': prediction_features,
+            'submission_template': submission_template,
+            'forecast_state': forecast_state,
+            'cv_folds': self.cv_folds
+        }
 
 
 def main():
     """메인 실행 함수"""
     # 입력/출력 경로 설정
     input_path = 'results/preprocessing/04_normalization/electricity_data_normalized.csv'
+    store = FeatureStore()
+    if store.exists('04_normalization/electricity_data_normalized'):
+        input_path = store.path('04_normalization/electricity_data_normalized')
     output_dir = 'results/preprocessing/05_data_splitting'
     
+    # 04 단계 정규화 파라미터 (있으면 예측 피처에도 동일 적용)
+    normalizer = None
+    normalizer_path = Path('results/preprocessing/04_normalization/feature_normalizer.json')
+    if normalizer_path.exists():
+        normalizer = FeatureNormalizer.load(normalizer_path)
+    
     # 데이터 준비 실행
-    preparator = CompetitionDataPreparator(input_path, output_dir)
+    preparator = CompetitionDataPreparator(input_path, output_dir, normalizer=normalizer)
     preparator.run_complete_pipeline()
 
 
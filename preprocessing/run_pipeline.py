@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전처리 파이프라인 실행 스크립트 (01 → 05 + 시각화/품질 검증)
+
+각 단계가 선언한 입력/출력 파일로 실행 순서(DAG)를 결정하고,
+서로 독립적인 단계(보간 시각화 보고서, 정규화 품질 검증 등)는 병렬로 실행합니다.
+각 단계의 입력 파일·코드·파라미터 해시가 이전 실행과 같으면
+단계를 건너뛰고 캐시(results/.cache)에서 출력 파일만 복원합니다.
+단계별 실행 시간과 최대 메모리는 results/preprocessing/pipeline_run_report.json 에 기록됩니다.
+
+사용법:
+    python preprocessing/run_pipeline.py            # 변경된 단계만 실행 (어느 위치에서나 가능)
+    python preprocessing/run_pipeline.py --force    # 전체 재실행
+    python preprocessing/run_pipeline.py --workers 1  # 순차 실행
+    python preprocessing/run_pipeline.py --clear-cache
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.pipeline.cache import StageCache
+from src.pipeline.dag import PipelineDAG, run_script
+
+PREPROCESSING_DIR = Path('preprocessing')
+RESULTS_DIR = Path('results/preprocessing')
+
+# pyarrow가 있으면 각 단계가 피처 저장소 파일도 함께 생성
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def _store_outputs(*names):
+    """피처 저장소 산출물 경로 (pyarrow가 없으면 생성되지 않음)"""
+    if not HAS_PYARROW:
+        return []
+    return [RESULTS_DIR / f"{name}.feather" for name in names]
+
+
+# 모든 단계가 공유하는 src 모듈 (변경 시 전체 단계 캐시 무효화)
+SHARED_CODE = [
+    PROJECT_ROOT / 'src' / 'data' / 'feature_store.py',
+    PROJECT_ROOT / 'src' / 'data' / 'loader.py',
+    PROJECT_ROOT / 'src' / 'data' / 'cv_folds.py',
+    PROJECT_ROOT / 'src' / 'data' / 'holidays.py',
+    PROJECT_ROOT / 'src' / 'data' / 'submission.py',
+    PROJECT_ROOT / 'src' / 'features' / 'decomposition.py',
+    PROJECT_ROOT / 'src' / 'features' / 'incremental.py',
+    PROJECT_ROOT / 'src' / 'features' / 'forecast_state.py',
+    PROJECT_ROOT / 'src' / 'features' / 'normalization.py',
+    PROJECT_ROOT / 'src' / 'features' / 'scaling_quality.py',
+    PROJECT_ROOT / 'src' / 'pipeline' / 'cache.py',
+    PROJECT_ROOT / 'src' / 'utils' / 'stats.py',
+]
+
+
+PREPROCESSING_STAGES = [
+    {
+        'name': '01_missing_value_imputation',
+        'script': PREPROCESSING_DIR / '01_missing_value_imputation' / 'advanced_imputation.py',
+        'inputs': [Path('data/shared/data.csv')],
+        'outputs': [
+            RESULTS_DIR / '01_missing_value_imputation' / 'final_imputed_dataset.csv',
+            Path('data/shared/electricity_data_advanced_imputed.csv'),
+        ],
+    },
+    {
+        'name': '01b_imputation_report',
+        'script': PREPROCESSING_DIR / '01_missing_value_imputation' / 'imputation_comparison_fixed.py',
+        'inputs': [
+            Path('data/shared/data.csv'),
+            Path('data/shared/electricity_data_advanced_imputed.csv'),
+        ],
+        'outputs': [
+            PREPROCESSING_DIR / 'imputation_comparison_korean.png',
+            PREPROCESSING_DIR / 'detailed_imputation_analysis.png',
+            PREPROCESSING_DIR / 'imputation_summary_report.txt',
+        ],
+    },
+    {
+        'name': '02_feature_engineering',
+        'script': PREPROCESSING_DIR / '02_feature_engineering' / 'temporal_features.py',
+        'inputs': [RESULTS_DIR / '01_missing_value_imputation' / 'final_imputed_dataset.csv'],
+        'outputs': [
+            RESULTS_DIR / '02_feature_engineering' / 'electricity_data_with_temporal_features.csv',
+            RESULTS_DIR / '02_feature_engineering' / 'korean_holidays_database.csv',
+        ] + _store_outputs('02_feature_engineering/electricity_data_with_temporal_features'),
+    },
+    {
+        'name': '03_derived_variables',
+        'script': PREPROCESSING_DIR / '03_derived_variables' / 'core_derived_features.py',
+        'inputs': [RESULTS_DIR / '02_feature_engineering' / 'electricity_data_with_temporal_features.csv'],
+        'outputs': [
+            RESULTS_DIR / '03_derived_variables' / 'electricity_data_with_core_derived.csv',
+            RESULTS_DIR / '03_derived_variables' / 'core_derived_features_summary.txt',
+        ] + _store_outputs('03_derived_variables/electricity_data_with_core_derived'),
+    },
+    {
+        'name': '04_normalization',
+        'script': PREPROCESSING_DIR / '04_normalization' / 'feature_normalization.py',
+        'inputs': [RESULTS_DIR / '03_derived_variables' / 'electricity_data_with_core_derived.csv'],
+        'outputs': [
+            RESULTS_DIR / '04_normalization' / 'electricity_data_normalized.csv',
+            RESULTS_DIR / '04_normalization' / 'feature_normalizer.json',
+            RESULTS_DIR / '04_normalization' / 'scaling_metadata.json',
+            RESULTS_DIR / '04_normalization' / 'feature_normalization_report.txt',
+            RESULTS_DIR / '04_normalization' / 'scaling_effects_comparison.png',
+        ] + _store_outputs('04_normalization/electricity_data_normalized'),
+    },
+    {
+        'name': '04b_quality_verification',
+        'script': RESULTS_DIR / '04_normalization' / 'quality_verification.py',
+        # 보고서만 기록 (실제 파이프라인 결과에서 통과를 확인한 뒤 '--strict' 를 추가해 차단 게이트로 전환)
+        'args': ['--output', str(RESULTS_DIR / '04_normalization' / 'quality_verification_report.json')],
+        'inputs': [
+            RESULTS_DIR / '03_derived_variables' / 'electricity_data_with_core_derived.csv',
+            RESULTS_DIR / '04_normalization' / 'electricity_data_normalized.csv',
+            RESULTS_DIR / '04_normalization' / 'scaling_metadata.json',
+            RESULTS_DIR / '04_normalization' / 'feature_normalizer.json',
+        ] + _store_outputs(
+            '03_derived_variables/electricity_data_with_core_derived',
+            '04_normalization/electricity_data_normalized'
+        ),
+        'outputs': [RESULTS_DIR / '04_normalization' / 'quality_verification_report.json'],
+    },
+    {
+        'name': '05_data_splitting',
+        'script': PREPROCESSING_DIR / '05_data_splitting' / 'competition_data_prep.py',
+        'inputs': [
+            RESULTS_DIR / '04_normalization' / 'electricity_data_normalized.csv',
+            RESULTS_DIR / '04_normalization' / 'feature_normalizer.json',
+        ],
+        'outputs': [
+            RESULTS_DIR / '05_data_splitting' / 'train_data_full.csv',
+            RESULTS_DIR / '05_data_splitting' / 'prediction_template.csv',
+            RESULTS_DIR / '05_data_splitting' / 'submission_template.csv',
+            RESULTS_DIR / '05_data_splitting' / 'cv_folds_metadata.json',
+            RESULTS_DIR / '05_data_splitting' / 'cv_folds.npz',
+            RESULTS_DIR / '05_data_splitting' / 'forecast_state.json',
+            RESULTS_DIR / '05_data_splitting' / 'lag_initialization.json',
+        ] + _store_outputs('05_data_splitting/train_data_full'),
+    },
+]
+
+
+def print_header(title):
+    """섹션 헤더 출력"""
+    print("\n" + "=" * 70)
+    print(f"🎯 {title}")
+    print("=" * 70)
+
+
+def build_dag():
+    """PREPROCESSING_STAGES 선언으로 DAG 구성"""
+    dag = PipelineDAG()
+
+    for stage in PREPROCESSING_STAGES:
+        script = stage['script']
+        cwd = stage.get('cwd')
+        args = stage.get('args', ())
+        dag.add_stage(
+            stage['name'],
+            lambda script=script, cwd=cwd, args=args: run_script(script.resolve(), cwd=cwd, args=args),
+            inputs=stage['inputs'],
+            outputs=stage['outputs'],
+            code=[script, *SHARED_CODE],
+            params={'pyarrow': HAS_PYARROW}
+        )
+
+    return dag
+
+
+def run_pipeline(force=False, cache_dir='results/.cache', max_workers=4):
+    """전처리 DAG 실행 (독립 단계 병렬, 변경이 없는 단계는 캐시 사용)"""
+    # 단계 스크립트와 캐시 매니페스트의 경로는 모두 프로젝트 루트 기준
+    os.chdir(PROJECT_ROOT)
+    cache = StageCache(cache_dir)
+    dag = build_dag()
+
+    print_header("실행 계획")
+    for i, level in enumerate(dag.execution_levels(), 1):
+        print(f"   레벨 {i}: {', '.join(level)}")
+
+    return dag.run(max_workers=max_workers, cache=cache, force=force)
+
+
+def save_run_report(records, total_elapsed, output_path=RESULTS_DIR / 'pipeline_run_report.json'):
+    """단계별 실행 기록 저장"""
+    report = {
+        'run_datetime': datetime.now().isoformat(),
+        'total_elapsed_seconds': round(total_elapsed, 3),
+        'stages': records
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return output_path
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='전처리 파이프라인 (DAG 병렬 실행, 캐시 지원)')
+    parser.add_argument('--force', action='store_true', help='캐시를 무시하고 전체 재실행')
+    parser.add_argument('--clear-cache', action='store_true', help='캐시 삭제 후 종료')
+    parser.add_argument('--cache-dir', default='results/.cache', help='캐시 디렉토리')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 실행할 최대 단계 수')
+    args = parser.parse_args()
+
+    if args.clear_cache:
+        os.chdir(PROJECT_ROOT)
+        StageCache(args.cache_dir).clear()
+        print(f"🧹 캐시 삭제 완료: {args.cache_dir}")
+        return
+
+    total_start = time.time()
+    records = run_pipeline(force=args.force, cache_dir=args.cache_dir, max_workers=args.workers)
+    total_elapsed = time.time() - total_start
+
+    print_header("전처리 파이프라인 요약")
+    for record in records:
+        if record['status'] in ('success', 'cached'):
+            memory = record['peak_memory_mb']
+            memory_str = f", 최대 메모리 {memory:.1f}MB" if memory is not None else ""
+            status = "⏭️ 캐시" if record['status'] == 'cached' else "✅ 실행"
+            print(f"   {record['stage']}: {status} ({record['elapsed_seconds']:.2f}초{memory_str})")
+        else:
+            status = "❌ 실패" if record['status'] == 'failed' else "⏸️ 건너뜀"
+            print(f"   {record['stage']}: {status} - {record['error']}")
+    print(f"\n⏱️ 전체 실행 시간: {total_elapsed:.2f}초")
+
+    report_path = save_run_report(records, total_elapsed)
+    print(f"📋 실행 기록: {report_path}")
+
+    if any(record['status'] == 'failed' for record in records):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,298 +4,88 @@
 Task 3.4 품질 검증 스크립트
 
 피처 정규화 및 스케일링 결과의 품질을 종합적으로 검증합니다.
+검증 기준은 src.features.scaling_quality.verify_scaling 으로 한 번에 계산합니다.
+--strict 를 주면 하나라도 실패할 때 종료 코드 1을 반환합니다 (CI 게이트용).
+
+사용법:
+    python results/preprocessing/04_normalization/quality_verification.py
+    python results/preprocessing/04_normalization/quality_verification.py --output quality_verification_report.json
+    python results/preprocessing/04_normalization/quality_verification.py --strict
 """
 
-import pandas as pd
-import numpy as np
+import argparse
 import json
-import joblib
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler, PowerTransformer
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 import 경로에 추가 (src 패키지 사용)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.feature_store import FeatureStore
+from src.features.normalization import FeatureNormalizer
+from src.features.scaling_quality import verify_scaling, save_report
+
+# 이 스크립트가 있는 폴더 (실행 위치와 무관하게 경로 결정)
+NORMALIZATION_DIR = Path(__file__).resolve().parent
+
+
+def load_data(store_root=NORMALIZATION_DIR.parent):
+    """데이터 로드 (피처 저장소 우선, 없으면 CSV)"""
+    store = FeatureStore(root=store_root)
 
-def load_data():
-    """데이터 로드"""
     # 원본 데이터 (Task 3.3 결과)
-    original_path = '../03_derived_variables/electricity_data_with_core_derived.csv'
-    df_original = pd.read_csv(original_path)
-    
+    df_original = store.load('03_derived_variables/electricity_data_with_core_derived')
+
     # 정규화된 데이터 (Task 3.4 결과)
-    normalized_path = 'electricity_data_normalized.csv'
-    df_normalized = pd.read_csv(normalized_path)
-    
+    df_normalized = store.load('04_normalization/electricity_data_normalized')
+
     # 메타데이터
-    with open('scaling_metadata.json', 'r', encoding='utf-8') as f:
+    with open(NORMALIZATION_DIR / 'scaling_metadata.json', 'r', encoding='utf-8') as f:
         metadata = json.load(f)
-    
-    # 스케일러 객체들
-    scalers = joblib.load('scalers.joblib')
-    
-    return df_original, df_normalized, metadata, scalers
-
-def verify_basic_properties(df_original, df_normalized):
-    """기본 속성 검증"""
-    print("🔍 1. 기본 속성 검증")
-    print("=" * 60)
-    
-    # 데이터 형태 확인
-    print(f"원본 데이터: {df_original.shape[0]:,}행 × {df_original.shape[1]}열")
-    print(f"정규화 데이터: {df_normalized.shape[0]:,}행 × {df_normalized.shape[1]}열")
-    
-    # 행 수 일치 확인
-    if df_original.shape[0] == df_normalized.shape[0]:
-        print("✅ 행 수 일치")
-    else:
-        print("❌ 행 수 불일치")
-    
-    # 열 수 일치 확인
-    if df_original.shape[1] == df_normalized.shape[1]:
-        print("✅ 열 수 일치")
-    else:
-        print("❌ 열 수 불일치")
-    
-    # 날짜 범위 확인
-    print(f"날짜 범위: {df_normalized['date'].min()} ~ {df_normalized['date'].max()}")
-    
-    # 타겟 변수 통계 (컬럼명 확인)
-    target_col = '최대전력(MW)' if '최대전력(MW)' in df_normalized.columns else 'power_consumption'
-    print(f"타겟 변수 범위: {df_normalized[target_col].min():.1f} ~ {df_normalized[target_col].max():.1f}")
-    print()
 
-def verify_scaling_results(df_original, df_normalized, metadata, scalers):
-    """스케일링 결과 검증"""
-    print("🔍 2. 스케일링 결과 검증")
-    print("=" * 60)
-    
-    feature_types = metadata['feature_types']
-    scaling_info = metadata['scaling_info']
-    
-    print(f"전체 피처 수: {len(df_normalized.columns)}개")
-    print(f"스케일링 적용 피처: {len(scaling_info)}개")
-    print()
-    
-    # 피처 타입별 요약
-    print("피처 타입별 분류:")
-    for type_name, features in feature_types.items():
-        if features:
-            print(f"  {type_name}: {len(features)}개")
-    print()
-    
-    # 스케일링된 피처들 검증
-    print("스케일링된 피처 검증:")
-    scaling_results = {}
-    
-    for feature, info in scaling_info.items():
-        if feature in df_normalized.columns:
-            scaled_data = df_normalized[feature].dropna()
-            
-            # 평균과 표준편차 확인
-            mean_val = scaled_data.mean()
-            std_val = scaled_data.std()
-            
-            # 검증 기준
-            is_standard = (abs(mean_val) < 0.1 and 0.8 < std_val < 1.2)
-            is_minmax = (0 <= mean_val <= 1 and 0 < std_val < 1)
-            
-            scaler_type = info['scaler_type']
-            if scaler_type == 'StandardScaler':
-                passed = is_standard
-                expected = "평균≈0, 표준편차≈1"
-            elif scaler_type == 'MinMaxScaler':
-                passed = is_minmax
-                expected = "범위 0-1"
-            else:  # RobustScaler, PowerTransformer
-                passed = True  # 더 유연한 기준
-                expected = "적절한 범위"
-            
-            status = "✅" if passed else "❌"
-            print(f"  {status} {feature}: {scaler_type}")
-            print(f"      평균: {mean_val:.3f}, 표준편차: {std_val:.3f} ({expected})")
-            
-            scaling_results[feature] = {
-                'scaler_type': scaler_type,
-                'mean': mean_val,
-                'std': std_val,
-                'passed': passed
-            }
-    
-    passed_count = sum(1 for r in scaling_results.values() if r['passed'])
-    total_count = len(scaling_results)
-    print(f"\n스케일링 검증 통과: {passed_count}/{total_count}개 ({passed_count/total_count*100:.1f}%)")
-    print()
-    
-    return scaling_results
+    # 정규화 파라미터
+    normalizer = FeatureNormalizer.load(NORMALIZATION_DIR / 'feature_normalizer.json')
 
-def verify_missing_values(df_original, df_normalized):
-    """결측값 패턴 보존 검증"""
-    print("🔍 3. 결측값 패턴 보존 검증")
-    print("=" * 60)
-    
-    common_cols = [col for col in df_original.columns if col in df_normalized.columns]
-    
-    pattern_preserved = {}
-    total_mismatches = 0
-    
-    for col in common_cols:
-        if col == 'date':
-            continue
-            
-        original_na = df_original[col].isna()
-        normalized_na = df_normalized[col].isna()
-        
-        if original_na.equals(normalized_na):
-            pattern_preserved[col] = True
-            status = "✅"
-        else:
-            pattern_preserved[col] = False
-            mismatches = (original_na != normalized_na).sum()
-            total_mismatches += mismatches
-            status = f"❌ ({mismatches}개 불일치)"
-        
-        na_count = original_na.sum()
-        if na_count > 0:
-            print(f"  {status} {col}: {na_count}개 결측값")
-    
-    preserved_count = sum(pattern_preserved.values())
-    total_count = len(pattern_preserved)
-    
-    print(f"\n결측값 패턴 보존: {preserved_count}/{total_count}개 ({preserved_count/total_count*100:.1f}%)")
-    if total_mismatches == 0:
-        print("✅ 모든 결측값 패턴이 완벽하게 보존됨")
-    else:
-        print(f"❌ 총 {total_mismatches}개의 결측값 패턴 불일치 발견")
-    print()
+    return df_original, df_normalized, metadata, normalizer
 
-def verify_correlations(df_original, df_normalized, metadata):
-    """상관관계 보존 검증"""
-    print("🔍 4. 상관관계 보존 검증")
-    print("=" * 60)
-    
-    # 타겟 변수 확인
-    target_col = '최대전력(MW)' if '최대전력(MW)' in df_normalized.columns else 'power_consumption'
-    
-    if target_col not in df_normalized.columns:
-        print("❌ 타겟 변수를 찾을 수 없음")
-        return
-    
-    numerical_features = metadata['feature_types']['numerical']
-    correlation_changes = []
-    
-    print("타겟 변수와의 상관관계 보존도:")
-    print("| 피처명 | 원본 상관관계 | 정규화 후 | 차이 | 보존도 |")
-    print("|--------|-------------|-----------|------|--------|")
-    
-    for feature in numerical_features:
-        if feature in df_original.columns and feature in df_normalized.columns:
-            # 원본 상관관계
-            orig_corr = df_original[target_col].corr(df_original[feature])
-            # 정규화 후 상관관계
-            norm_corr = df_normalized[target_col].corr(df_normalized[feature])
-            
-            if not pd.isna(orig_corr) and not pd.isna(norm_corr):
-                diff = abs(orig_corr - norm_corr)
-                correlation_changes.append(diff)
-                
-                # 보존도 판정
-                if diff < 0.01:
-                    preservation = "우수"
-                elif diff < 0.05:
-                    preservation = "양호"
-                else:
-                    preservation = "주의"
-                
-                print(f"| {feature} | {orig_corr:.3f} | {norm_corr:.3f} | {diff:.3f} | {preservation} |")
-    
-    if correlation_changes:
-        avg_change = np.mean(correlation_changes)
-        max_change = np.max(correlation_changes)
-        print(f"\n평균 상관관계 변화: {avg_change:.4f}")
-        print(f"최대 상관관계 변화: {max_change:.4f}")
-        
-        if avg_change < 0.01:
-            print("✅ 상관관계 구조가 완벽하게 보존됨")
-        elif avg_change < 0.05:
-            print("✅ 상관관계 구조가 잘 보존됨")
-        else:
-            print("⚠️ 상관관계 구조에 변화가 있음")
-    print()
+def print_check(name, check):
+    """검증 항목 한 줄 출력"""
+    status = "✅" if check['passed'] else "❌"
+    print(f"{status} {name}: {check['message']}")
 
-def verify_time_series_properties(df_original, df_normalized):
-    """시계열 특성 보존 검증"""
-    print("🔍 5. 시계열 특성 보존 검증")
+def print_feature_results(report):
+    """피처별 스케일링 검증 결과 출력"""
+    print("🔍 스케일링된 피처 검증")
     print("=" * 60)
-    
-    # 날짜 순서 확인
-    dates_original = pd.to_datetime(df_original['date'])
-    dates_normalized = pd.to_datetime(df_normalized['date'])
-    
-    if dates_original.equals(dates_normalized):
-        print("✅ 날짜 순서 완전 보존")
-    else:
-        print("❌ 날짜 순서 변경됨")
-    
-    # 시간 순서 확인
-    is_sorted_orig = dates_original.is_monotonic_increasing
-    is_sorted_norm = dates_normalized.is_monotonic_increasing
-    
-    if is_sorted_orig and is_sorted_norm:
-        print("✅ 시간 순서 정렬 상태 유지")
-    else:
-        print("❌ 시간 순서 정렬 상태 변경")
-    
-    # 연속성 확인
-    date_diff_orig = dates_original.diff().mode()[0]
-    date_diff_norm = dates_normalized.diff().mode()[0]
-    
-    if date_diff_orig == date_diff_norm:
-        print(f"✅ 날짜 간격 일관성 유지 ({date_diff_orig})")
-    else:
-        print("❌ 날짜 간격 일관성 변경")
-    
+
+    for feature, result in report['features'].items():
+        status = "✅" if result['passed'] and result['scaler_expectation'] else "❌"
+        print(f"  {status} {feature}: {result['scaler_type']}")
+        print(f"      평균: {result['scaled_mean']:.3f}, 표준편차: {result['scaled_std']:.3f}, "
+              f"순서 상관: {result['order_corr']:.3f}, 점수: {result['quality_score']:.2f}")
     print()
 
-def generate_quality_summary(scaling_results, df_normalized, metadata):
+def print_quality_summary(report, metadata):
     """품질 검증 요약"""
-    print("🔍 6. 종합 품질 검증 요약")
+    print("🔍 종합 품질 검증 요약")
     print("=" * 60)
-    
-    # 전체 통계
-    total_features = len(df_normalized.columns)
-    scaled_features = len(scaling_results)
-    passed_scaling = sum(1 for r in scaling_results.values() if r['passed'])
-    
-    print(f"📊 전체 피처 수: {total_features}개")
-    print(f"📊 스케일링 적용: {scaled_features}개")
-    print(f"📊 스케일링 검증 통과: {passed_scaling}/{scaled_features}개 ({passed_scaling/scaled_features*100:.1f}%)")
-    
-    # 데이터 품질 점수 계산
-    quality_score = 0
-    max_score = 5
-    
-    # 1. 기본 구조 보존 (20점)
-    quality_score += 1
-    
-    # 2. 스케일링 품질 (20점)
-    if passed_scaling / scaled_features >= 0.8:
-        quality_score += 1
-    elif passed_scaling / scaled_features >= 0.6:
-        quality_score += 0.7
-    elif passed_scaling / scaled_features >= 0.4:
-        quality_score += 0.5
-    
-    # 3. 결측값 패턴 보존 (20점)
-    quality_score += 1  # 이미 검증됨
-    
-    # 4. 상관관계 보존 (20점)
-    quality_score += 1  # 이미 검증됨
-    
-    # 5. 시계열 특성 보존 (20점)
-    quality_score += 1  # 이미 검증됨
-    
-    final_score = (quality_score / max_score) * 100
-    
+
+    summary = report['summary']
+    print(f"📊 피처 타입별 분류: " + ", ".join(
+        f"{type_name} {len(features)}개" for type_name, features in metadata['feature_types'].items() if features
+    ))
+    print(f"📊 스케일링 검증 통과: {summary['n_features_passed']}/{summary['n_features']}개 "
+          f"({summary['feature_pass_ratio']*100:.1f}%)")
+    print()
+
+    for name, check in report['checks'].items():
+        print_check(name, check)
+
+    final_score = summary['quality_score']
     print(f"\n🏆 종합 품질 점수: {final_score:.1f}/100")
-    
+
     if final_score >= 90:
         grade = "A+ (우수)"
     elif final_score >= 80:
@@ -304,54 +94,56 @@ def generate_quality_summary(scaling_results, df_normalized, metadata):
         grade = "B (보통)"
     else:
         grade = "C (개선 필요)"
-    
+
     print(f"🏆 품질 등급: {grade}")
-    
+
     # 권장사항
     print("\n📋 권장사항:")
-    if passed_scaling / scaled_features < 0.8:
-        print("  ⚠️ 일부 스케일링 결과가 기준에 미달합니다. 스케일러 선택을 재검토하세요.")
-    else:
+    if report['passed']:
         print("  ✅ 모든 검증 기준을 만족합니다.")
-    
-    print("  ✅ 시계열 모델링에 적합한 데이터셋입니다.")
-    print("  ✅ Task 3.5 (Time-Aware Data Splitting) 진행 가능합니다.")
+        print("  ✅ Task 3.5 (Time-Aware Data Splitting) 진행 가능합니다.")
+    else:
+        failed = [name for name, check in report['checks'].items() if not check['passed']]
+        print(f"  ⚠️ 기준 미달 항목: {', '.join(failed)}. 스케일러 선택을 재검토하세요.")
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='정규화 품질 검증')
+    parser.add_argument('--output', default=None, help='검증 보고서 JSON 저장 경로')
+    parser.add_argument('--strict', action='store_true', help='검증 실패 시 종료 코드 1 반환')
+    args = parser.parse_args()
+
     print("🔍 Task 3.4: Feature Normalization and Scaling")
     print("    품질 검증 보고서")
     print("=" * 70)
     print()
-    
+
     # 데이터 로드
     try:
-        df_original, df_normalized, metadata, scalers = load_data()
+        df_original, df_normalized, metadata, normalizer = load_data()
     except Exception as e:
         print(f"❌ 데이터 로드 실패: {e}")
-        return
-    
-    # 1. 기본 속성 검증
-    verify_basic_properties(df_original, df_normalized)
-    
-    # 2. 스케일링 결과 검증
-    scaling_results = verify_scaling_results(df_original, df_normalized, metadata, scalers)
-    
-    # 3. 결측값 패턴 보존 검증
-    verify_missing_values(df_original, df_normalized)
-    
-    # 4. 상관관계 보존 검증
-    verify_correlations(df_original, df_normalized, metadata)
-    
-    # 5. 시계열 특성 보존 검증
-    verify_time_series_properties(df_original, df_normalized)
-    
-    # 6. 종합 요약
-    generate_quality_summary(scaling_results, df_normalized, metadata)
-    
+        sys.exit(1)
+
+    print(f"원본 데이터: {df_original.shape[0]:,}행 × {df_original.shape[1]}열")
+    print(f"정규화 데이터: {df_normalized.shape[0]:,}행 × {df_normalized.shape[1]}열")
+    print()
+
+    # 전체 검증 기준을 한 번에 계산
+    report = verify_scaling(df_original, df_normalized, normalizer)
+
+    print_feature_results(report)
+    print_quality_summary(report, metadata)
+
+    if args.output:
+        print(f"\n📋 검증 보고서: {save_report(report, args.output)}")
+
     print("\n" + "=" * 70)
-    print("🎉 품질 검증 완료!")
+    print("🎉 품질 검증 완료!" if report['passed'] else "❌ 품질 검증 실패")
     print("=" * 70)
 
+    if args.strict and not report['passed']:
+        sys.exit(1)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
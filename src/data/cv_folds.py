@@ -0,0 +1,187 @@
+"""
+시계열 교차검증 폴드 (정수 인덱스 범위 기반)
+"""
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+WINDOW_TYPES = ('expanding', 'sliding')
+
+
+class CVFolds:
+    """시간순으로 정렬된 데이터의 폴드를 [start, stop) 정수 범위 배열로 보관하는 클래스
+
+    각 폴드는 train_start:train_stop, val_start:val_stop 슬라이스로 표현되므로
+    DataFrame.iloc / ndarray 에 그대로 적용하면 복사 없이 잘라낼 수 있다.
+    """
+
+    FIELDS = ('train_start', 'train_stop', 'val_start', 'val_stop')
+
+    def __init__(self, train_start, train_stop, val_start, val_stop, fold_ids=None, params=None):
+        self.train_start = np.asarray(train_start, dtype=np.int64)
+        self.train_stop = np.asarray(train_stop, dtype=np.int64)
+        self.val_start = np.asarray(val_start, dtype=np.int64)
+        self.val_stop = np.asarray(val_stop, dtype=np.int64)
+        n_folds = len(self.train_start)
+        self.fold_ids = np.arange(1, n_folds + 1) if fold_ids is None else np.asarray(fold_ids, dtype=np.int64)
+        self.params = dict(params or {})
+
+        if not all(len(getattr(self, field)) == n_folds for field in self.FIELDS):
+            raise ValueError("폴드 범위 배열의 길이가 서로 다릅니다.")
+        if np.any(self.train_stop > self.val_start):
+            raise ValueError("훈련 구간이 검증 구간과 겹칩니다 (train_stop > val_start).")
+        if np.any(self.train_start >= self.train_stop) or np.any(self.val_start >= self.val_stop):
+            raise ValueError("비어 있는 훈련/검증 구간이 있습니다.")
+
+    def __len__(self):
+        return len(self.train_start)
+
+    def __iter__(self):
+        """(훈련 slice, 검증 slice) 순회"""
+        for i in range(len(self)):
+            yield self.slices(i)
+
+    def slices(self, i):
+        """i번째 폴드의 (훈련 slice, 검증 slice)"""
+        return (slice(int(self.train_start[i]), int(self.train_stop[i])),
+                slice(int(self.val_start[i]), int(self.val_stop[i])))
+
+    def split(self, X=None, y=None, groups=None):
+        """sklearn cv 인자로 쓸 수 있는 (훈련 인덱스, 검증 인덱스) 생성기"""
+        for train, val in self:
+            yield np.arange(train.start, train.stop), np.arange(val.start, val.stop)
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        return len(self)
+
+    @property
+    def train_size(self):
+        return self.train_stop - self.train_start
+
+    @property
+    def val_size(self):
+        return self.val_stop - self.val_start
+
+    def to_frame(self, dates=None):
+        """폴드 요약 표 (dates 를 주면 각 구간의 시작/끝 날짜 포함)"""
+        frame = pd.DataFrame({
+            'fold_id': self.fold_ids,
+            **{field: getattr(self, field) for field in self.FIELDS},
+            'train_size': self.train_size,
+            'val_size': self.val_size,
+        })
+        if dates is not None:
+            dates = pd.to_datetime(pd.Series(dates)).reset_index(drop=True)
+            frame['train_first_date'] = dates.iloc[self.train_start].dt.strftime('%Y-%m-%d').values
+            frame['train_last_date'] = dates.iloc[self.train_stop - 1].dt.strftime('%Y-%m-%d').values
+            frame['val_first_date'] = dates.iloc[self.val_start].dt.strftime('%Y-%m-%d').values
+            frame['val_last_date'] = dates.iloc[self.val_stop - 1].dt.strftime('%Y-%m-%d').values
+        return frame
+
+    def save(self, filepath):
+        """정수 범위 배열을 npz로 저장 (폴드당 정수 4개)"""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            filepath,
+            fold_ids=self.fold_ids,
+            **{field: getattr(self, field) for field in self.FIELDS},
+            params=np.array(json.dumps(self.params, default=str))
+        )
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """save 결과 로딩"""
+        with np.load(filepath) as data:
+            return cls(
+                *(data[field] for field in cls.FIELDS),
+                fold_ids=data['fold_ids'],
+                params=json.loads(str(data['params']))
+            )
+
+
+def rolling_origin_folds(n_samples, val_size, n_folds, step=None, window='expanding',
+                         train_size=None, gap=0, min_train_size=1):
+    """위치 기반 rolling-origin 폴드
+
+    마지막 폴드의 검증 구간이 데이터 끝에서 끝나도록 검증 시작점을 step 간격으로 배치한다.
+
+    Parameters:
+    - n_samples: 전체 행 수
+    - val_size: 검증 구간 길이
+    - n_folds: 폴드 수
+    - step: 검증 시작점 간격 (기본값 val_size)
+    - window: 'expanding' (처음부터) 또는 'sliding' (최근 train_size 행)
+    - train_size: sliding 창 길이
+    - gap: 훈련 끝과 검증 시작 사이에 비워 둘 행 수 (embargo)
+    - min_train_size: 이보다 짧은 훈련 구간은 오류
+
+    Returns:
+    - CVFolds
+    """
+    step = val_size if step is None else step
+    val_start = n_samples - val_size - step * np.arange(n_folds - 1, -1, -1)
+    val_stop = val_start + val_size
+    train_stop = val_start - gap
+    train_start = _train_start(train_stop, window, train_size)
+
+    if np.any(train_stop - train_start < min_train_size):
+        raise ValueError(f"훈련 구간이 {min_train_size}행보다 짧은 폴드가 있습니다. n_folds/step/gap을 줄이세요.")
+
+    params = {'scheme': 'rolling_origin', 'val_size': val_size, 'step': step,
+              'window': window, 'train_size': train_size, 'gap': gap}
+    return CVFolds(train_start, train_stop, val_start, val_stop, params=params)
+
+
+def calendar_folds(dates, val_years, window='expanding', train_years=None, gap_days=0):
+    """연도 단위 검증 폴드 (검증: 해당 연도 전체, 훈련: 그 이전)
+
+    Parameters:
+    - dates: 오름차순으로 정렬된 날짜 (행 순서 그대로)
+    - val_years: 검증 연도 목록
+    - window: 'expanding' 또는 'sliding'
+    - train_years: sliding 창 길이 (연 단위)
+    - gap_days: 훈련 끝과 검증 시작 사이에 비워 둘 일수 (embargo)
+
+    Returns:
+    - CVFolds
+    """
+    dates = pd.to_datetime(pd.Series(dates)).to_numpy()
+    if np.any(np.diff(dates) < np.timedelta64(0)):
+        raise ValueError("dates가 오름차순으로 정렬되어 있지 않습니다.")
+
+    val_years = np.asarray(list(val_years))
+    year_starts = val_years.astype(str).astype('datetime64[Y]').astype('datetime64[ns]')
+    year_ends = (val_years + 1).astype(str).astype('datetime64[Y]').astype('datetime64[ns]')
+
+    # 경계 날짜를 한 번의 searchsorted로 정수 위치로 변환
+    val_start = np.searchsorted(dates, year_starts, side='left')
+    val_stop = np.searchsorted(dates, year_ends, side='left')
+    train_stop = np.searchsorted(dates, year_starts - np.timedelta64(gap_days, 'D'), side='left')
+
+    if window == 'sliding':
+        if train_years is None:
+            raise ValueError("sliding 창에는 train_years가 필요합니다.")
+        train_first = (val_years - train_years).astype(str).astype('datetime64[Y]').astype('datetime64[ns]')
+        train_start = np.searchsorted(dates, train_first - np.timedelta64(gap_days, 'D'), side='left')
+    else:
+        train_start = _train_start(train_stop, window, None)
+
+    params = {'scheme': 'calendar_year', 'val_years': val_years.tolist(),
+              'window': window, 'train_years': train_years, 'gap_days': gap_days}
+    return CVFolds(train_start, train_stop, val_start, val_stop,
+                   fold_ids=np.arange(1, len(val_years) + 1), params=params)
+
+
+def _train_start(train_stop, window, train_size):
+    """창 종류에 따른 훈련 시작 위치"""
+    if window not in WINDOW_TYPES:
+        raise ValueError(f"지원하지 않는 창 종류입니다: {window} (지원: {list(WINDOW_TYPES)})")
+    if window == 'expanding':
+        return np.zeros_like(train_stop)
+    if train_size is None:
+        raise ValueError("sliding 창에는 train_size가 필요합니다.")
+    return np.maximum(train_stop - train_size, 0)
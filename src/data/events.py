@@ -0,0 +1,167 @@
+"""
+특별 이벤트 달력 (구간 배열 + 정렬 구간 조인)
+"""
+import numpy as np
+import pandas as pd
+
+
+# 특별 이벤트 (이름, 분류, 시작일, 종료일 - 종료일 포함)
+SPECIAL_EVENTS = [
+    # 대형 스포츠 이벤트
+    ('2008 베이징 올림픽', 'sports', '2008-08-08', '2008-08-24'),
+    ('2010 밴쿠버 동계올림픽', 'sports', '2010-02-12', '2010-02-28'),
+    ('2012 런던 올림픽', 'sports', '2012-07-27', '2012-08-12'),
+    ('2014 소치 동계올림픽', 'sports', '2014-02-07', '2014-02-23'),
+    ('2016 리우 올림픽', 'sports', '2016-08-05', '2016-08-21'),
+    ('2018 평창 동계올림픽', 'sports', '2018-02-09', '2018-02-25'),
+    ('2020 도쿄 올림픽', 'sports', '2021-07-23', '2021-08-08'),  # 코로나로 연기
+    ('2022 베이징 동계올림픽', 'sports', '2022-02-04', '2022-02-20'),
+    # 대선
+    ('2007 대선', 'election', '2007-12-19', '2007-12-19'),
+    ('2012 대선', 'election', '2012-12-19', '2012-12-19'),
+    ('2017 대선', 'election', '2017-05-09', '2017-05-09'),
+    ('2022 대선', 'election', '2022-03-09', '2022-03-09'),
+    # 경제 위기
+    ('2008 금융위기', 'economic_crisis', '2008-09-01', '2009-03-31'),
+    ('2011 유럽재정위기', 'economic_crisis', '2011-07-01', '2011-12-31'),
+    # 코로나19 (WHO 팬데믹 종료 선언까지)
+    ('코로나19 팬데믹', 'pandemic', '2020-01-20', '2023-05-05'),
+    # 기타 사회적 이벤트
+    ('2014 세월호 참사', 'social', '2014-04-16', '2014-04-30'),
+    ('2016-2017 촛불집회', 'social', '2016-10-29', '2017-04-29'),
+]
+
+
+class EventCalendar:
+    """이벤트를 [start, end] 일 단위 구간 배열로 보관하는 달력 클래스
+
+    날짜 ↔ 이벤트 매칭은 모든 구간 경계를 정렬된 날짜 배열에 searchsorted 두 번으로
+    위치시킨 뒤 (행 위치, 이벤트 번호) 쌍으로 펼쳐서 한 번에 계산한다 (겹치는 구간 허용).
+    """
+
+    def __init__(self, names, categories, start, end):
+        self.names = np.asarray(names, dtype=object)
+        self.categories = np.asarray(categories, dtype=object)
+        self.start = np.asarray(start, dtype='datetime64[D]')
+        self.end = np.asarray(end, dtype='datetime64[D]')
+
+        if not (len(self.names) == len(self.categories) == len(self.start) == len(self.end)):
+            raise ValueError("이벤트 배열의 길이가 서로 다릅니다.")
+        if np.any(self.end < self.start):
+            raise ValueError("종료일이 시작일보다 빠른 이벤트가 있습니다.")
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_records(cls, records=SPECIAL_EVENTS):
+        """(이름, 분류, 시작일, 종료일) 목록으로 생성"""
+        names, categories, start, end = zip(*records) if records else ((), (), (), ())
+        return cls(names, categories, start, end)
+
+    @classmethod
+    def from_holidays(cls, holidays_df, date_col='date', name_col='name', category_col='type'):
+        """공휴일 표(create_korean_holidays 형식)로 하루짜리 이벤트 달력 생성"""
+        dates = pd.to_datetime(holidays_df[date_col]).to_numpy().astype('datetime64[D]')
+        return cls(holidays_df[name_col].to_numpy(), holidays_df[category_col].to_numpy(), dates, dates)
+
+    def to_frame(self):
+        """이벤트 목록 표"""
+        return pd.DataFrame({
+            'event': self.names,
+            'category': self.categories,
+            'start': self.start.astype('datetime64[ns]'),
+            'end': self.end.astype('datetime64[ns]'),
+            'days': (self.end - self.start).astype(int) + 1,
+        })
+
+    def shifted(self, years=0, days=0):
+        """모든 구간을 years 년 / days 일 이동한 달력 (전년 동기 비교군 등)"""
+        offset = pd.DateOffset(years=years, days=days)
+        start = (pd.DatetimeIndex(self.start.astype('datetime64[ns]')) + offset).to_numpy()
+        end = (pd.DatetimeIndex(self.end.astype('datetime64[ns]')) + offset).to_numpy()
+        return EventCalendar(self.names, self.categories, start, end)
+
+    def join(self, dates):
+        """날짜 배열과 이벤트 구간의 조인
+
+        Parameters:
+        - dates: 날짜 시퀀스 (정렬되지 않아도 됨)
+
+        Returns:
+        - (rows, events): 같은 길이의 정수 배열 쌍, rows[i] 번째 날짜가 events[i] 번째 이벤트 기간에 속함
+        """
+        days = pd.DatetimeIndex(pd.to_datetime(dates)).to_numpy().astype('datetime64[D]')
+        order = np.argsort(days, kind='stable')
+        sorted_days = days[order]
+
+        lo = np.searchsorted(sorted_days, self.start, side='left')
+        hi = np.searchsorted(sorted_days, self.end, side='right')
+        counts = hi - lo
+
+        events = np.repeat(np.arange(len(self)), counts)
+        # 이벤트별 [lo, hi) 범위를 이어 붙인 정렬 위치
+        offsets = np.repeat(lo - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+        positions = np.arange(counts.sum()) + offsets
+        return order[positions], events
+
+    def membership(self, dates, by='category'):
+        """날짜 × 이벤트(또는 분류) 소속 여부 행렬
+
+        Returns:
+        - DataFrame: index=날짜 순서(0..n-1), columns=이벤트 이름 또는 분류, 값 0/1
+        """
+        n = len(dates)
+        rows, events = self.join(dates)
+        labels = self.names if by == 'event' else self.categories
+        columns, codes = np.unique(labels, return_inverse=True)
+        matrix = np.zeros((n, len(columns)), dtype=np.int8)
+        matrix[rows, codes[events]] = 1
+        return pd.DataFrame(matrix, columns=columns)
+
+    def features(self, dates, prefix='event'):
+        """모델 피처: 분류별 이벤트 기간 여부 + 진행 중인 이벤트 수 + 이벤트 시작 후 경과일"""
+        rows, events = self.join(dates)
+        frame = self.membership(dates).add_prefix(f'{prefix}_')
+        frame[f'{prefix}_active_count'] = np.bincount(rows, minlength=len(dates))
+
+        # 여러 이벤트가 겹치면 가장 최근에 시작한 이벤트 기준
+        days = pd.DatetimeIndex(pd.to_datetime(dates)).to_numpy().astype('datetime64[D]')
+        elapsed = (days[rows] - self.start[events]).astype(int)
+        no_event = np.iinfo(np.int64).max
+        since_start = np.full(len(dates), no_event, dtype=np.int64)
+        np.minimum.at(since_start, rows, elapsed)
+        frame[f'{prefix}_days_since_start'] = np.where(since_start == no_event, -1, since_start)
+        return frame
+
+    def effects(self, df, value_col, date_col='date', baseline_years=1, min_start=None, max_start=None):
+        """이벤트 기간 평균 vs 전년 동기(baseline_years 년 전 같은 구간) 평균
+
+        이벤트 구간과 비교 구간 모두 join 한 번씩으로 날짜를 배정하고 이벤트별 groupby 로 집계한다.
+
+        Returns:
+        - DataFrame: index=이벤트, category, period, days_count, event_mean, baseline_mean,
+          change_percent (시작일이 데이터 기간 안이고 두 구간 모두 관측치가 있는 이벤트만)
+        """
+        dates = df[date_col]
+        values = df[value_col].to_numpy(dtype=float)
+
+        def grouped(calendar):
+            rows, events = calendar.join(dates)
+            return pd.Series(values[rows]).groupby(events).agg(['mean', 'count'])
+
+        event_stats = grouped(self)
+        baseline_stats = grouped(self.shifted(years=-baseline_years))
+
+        table = self.to_frame()
+        table['period'] = [f"{s:%Y-%m-%d} ~ {e:%Y-%m-%d}" for s, e in zip(table['start'], table['end'])]
+        table['days_count'] = event_stats['count'].reindex(table.index).fillna(0).astype(int)
+        table['event_mean'] = event_stats['mean'].reindex(table.index)
+        table['baseline_mean'] = baseline_stats['mean'].reindex(table.index)
+        table['change_percent'] = (table['event_mean'] - table['baseline_mean']) / table['baseline_mean'] * 100
+
+        min_start = pd.to_datetime(dates).min() if min_start is None else pd.Timestamp(min_start)
+        max_start = pd.to_datetime(dates).max() if max_start is None else pd.Timestamp(max_start)
+        in_range = table['start'].between(min_start, max_start)
+        table = table[in_range & table['event_mean'].notna() & table['baseline_mean'].notna()]
+        return table.set_index('event')[['category', 'period', 'days_count', 'event_mean', 'baseline_mean', 'change_percent']]
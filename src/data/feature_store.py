@@ -0,0 +1,142 @@
+"""
+컬럼형 피처 저장소 (Feather/Parquet)
+"""
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+FORMAT_SUFFIXES = {'feather': '.feather', 'parquet': '.parquet'}
+
+
+def _require_pyarrow():
+    """pyarrow 임포트 (선택 의존성)"""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("피처 저장소는 pyarrow가 필요합니다: pip install pyarrow") from e
+    return pyarrow
+
+
+def optimize_dtypes(df, keep_float64=(), categorical=()):
+    """저장용 dtype 축소 (실수형 float32, 정수형 최소 크기 NumPy 정수, 지정 컬럼 category)"""
+    df = df.copy()
+
+    for col in df.columns:
+        series = df[col]
+        if col in categorical:
+            df[col] = series.astype('category')
+        elif pd.api.types.is_float_dtype(series) and col not in keep_float64:
+            df[col] = series.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(series):
+            if not isinstance(series.dtype, np.dtype):
+                # 널 허용 정수(UInt32 등, 예: dt.isocalendar().week)는 NumPy dtype 으로 변환
+                if series.isna().any():
+                    df[col] = series.astype(np.float64 if col in keep_float64 else np.float32)
+                    continue
+                series = series.astype(np.int64)
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_bool_dtype(series):
+            df[col] = series.astype(np.int8)
+
+    return df
+
+
+def read_frame(path, columns=None, memory_map=True):
+    """확장자에 따라 Feather/Parquet/CSV 파일을 읽음 (columns로 필요한 컬럼만 로드)"""
+    path = Path(path)
+
+    if path.suffix == '.feather':
+        _require_pyarrow()
+        from pyarrow import feather
+        return feather.read_table(path, columns=columns, memory_map=memory_map).to_pandas()
+
+    if path.suffix == '.parquet':
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=columns, memory_map=memory_map).to_pandas()
+
+    return pd.read_csv(path, usecols=columns)
+
+
+class FeatureStore:
+    """results/preprocessing/* 산출물을 타입이 보존된 컬럼형 포맷으로 저장/로딩하는 클래스
+
+    Feather(비압축)는 메모리 매핑으로 파싱 없이 읽을 수 있고,
+    Parquet(zstd)은 더 작은 용량으로 저장한다. 두 포맷 모두 컬럼 단위 로딩을 지원한다.
+    """
+
+    def __init__(self, root='results/preprocessing', fmt='feather',
+                 keep_float64=('최대전력(MW)',), categorical=('holiday_type',)):
+        if fmt not in FORMAT_SUFFIXES:
+            raise ValueError(f"지원하지 않는 포맷입니다: {fmt} (지원: {list(FORMAT_SUFFIXES)})")
+
+        self.root = Path(root)
+        self.fmt = fmt
+        self.keep_float64 = tuple(keep_float64)
+        self.categorical = tuple(categorical)
+
+    def path(self, name):
+        """산출물 이름(예: '04_normalization/electricity_data_normalized')의 저장 경로"""
+        return self.root / f"{name}{FORMAT_SUFFIXES[self.fmt]}"
+
+    def exists(self, name):
+        """저장된 산출물 존재 여부"""
+        return self.path(name).exists()
+
+    def save(self, df, name):
+        """DataFrame을 dtype 최적화 후 저장"""
+        _require_pyarrow()
+        import pyarrow as pa
+
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        df_opt = optimize_dtypes(df, keep_float64=self.keep_float64, categorical=self.categorical)
+        table = pa.Table.from_pandas(df_opt, preserve_index=False)
+
+        if self.fmt == 'feather':
+            from pyarrow import feather
+            feather.write_feather(table, path, compression='uncompressed')
+        else:
+            import pyarrow.parquet as pq
+            pq.write_table(table, path, compression='zstd')
+
+        return path
+
+    def try_save(self, df, name):
+        """pyarrow가 있으면 저장하고 경로를, 없으면 None을 반환 (CSV 산출물과 병행 저장용)"""
+        try:
+            return self.save(df, name)
+        except ImportError:
+            return None
+
+    def load(self, name, columns=None, memory_map=True):
+        """산출물 로딩 (저장소 파일이 없거나 pyarrow가 없으면 같은 이름의 CSV로 대체)"""
+        path = self.path(name)
+        csv_path = self.root / f"{name}.csv"
+
+        if path.exists():
+            try:
+                return read_frame(path, columns=columns, memory_map=memory_map)
+            except ImportError:
+                if not csv_path.exists():
+                    raise
+
+        if csv_path.exists():
+            return read_frame(csv_path, columns=columns)
+
+        raise FileNotFoundError(f"산출물을 찾을 수 없습니다: {path} (또는 {csv_path})")
+
+    def columns(self, name):
+        """데이터를 읽지 않고 스키마의 컬럼 목록만 반환"""
+        _require_pyarrow()
+        path = self.path(name)
+
+        if self.fmt == 'feather':
+            import pyarrow as pa
+            with pa.memory_map(str(path)) as source:
+                return pa.ipc.open_file(source).schema.names
+
+        import pyarrow.parquet as pq
+        return pq.read_schema(path).names
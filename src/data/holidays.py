@@ -0,0 +1,175 @@
+"""
+한국 공휴일 달력
+"""
+import numpy as np
+import pandas as pd
+
+
+# 고정 공휴일 (월-일, 이름)
+FIXED_HOLIDAYS = [
+    ('01-01', '신정'),
+    ('03-01', '삼일절'),
+    ('05-05', '어린이날'),
+    ('06-06', '현충일'),
+    ('08-15', '광복절'),
+    ('10-03', '개천절'),
+    ('10-09', '한글날'),
+    ('12-25', '크리스마스')
+]
+
+# 주요 음력 공휴일 (설날·추석 연휴, 부처님 오신 날)
+LUNAR_HOLIDAYS = [
+    # 설날 (음력 1.1 기준 대략적 양력 날짜)
+    ('2005-02-07', '설날'), ('2005-02-08', '설날'), ('2005-02-09', '설날'),
+    ('2006-01-28', '설날'), ('2006-01-29', '설날'), ('2006-01-30', '설날'),
+    ('2007-02-17', '설날'), ('2007-02-18', '설날'), ('2007-02-19', '설날'),
+    ('2008-02-06', '설날'), ('2008-02-07', '설날'), ('2008-02-08', '설날'),
+    ('2009-01-25', '설날'), ('2009-01-26', '설날'), ('2009-01-27', '설날'),
+    ('2010-02-13', '설날'), ('2010-02-14', '설날'), ('2010-02-15', '설날'),
+    # 추석 (음력 8.15 기준 대략적 양력 날짜)
+    ('2005-09-17', '추석'), ('2005-09-18', '추석'), ('2005-09-19', '추석'),
+    ('2006-10-05', '추석'), ('2006-10-06', '추석'), ('2006-10-07', '추석'),
+    ('2007-09-24', '추석'), ('2007-09-25', '추석'), ('2007-09-26', '추석'),
+    ('2008-09-13', '추석'), ('2008-09-14', '추석'), ('2008-09-15', '추석'),
+    ('2009-10-02', '추석'), ('2009-10-03', '추석'), ('2009-10-04', '추석'),
+    ('2010-09-21', '추석'), ('2010-09-22', '추석'), ('2010-09-23', '추석'),
+    # 설날 (2011~2023)
+    ('2011-02-02', '설날'), ('2011-02-03', '설날'), ('2011-02-04', '설날'),
+    ('2012-01-22', '설날'), ('2012-01-23', '설날'), ('2012-01-24', '설날'),
+    ('2013-02-09', '설날'), ('2013-02-10', '설날'), ('2013-02-11', '설날'),
+    ('2014-01-30', '설날'), ('2014-01-31', '설날'), ('2014-02-01', '설날'),
+    ('2015-02-18', '설날'), ('2015-02-19', '설날'), ('2015-02-20', '설날'),
+    ('2016-02-07', '설날'), ('2016-02-08', '설날'), ('2016-02-09', '설날'),
+    ('2017-01-27', '설날'), ('2017-01-28', '설날'), ('2017-01-29', '설날'),
+    ('2018-02-15', '설날'), ('2018-02-16', '설날'), ('2018-02-17', '설날'),
+    ('2019-02-04', '설날'), ('2019-02-05', '설날'), ('2019-02-06', '설날'),
+    ('2020-01-24', '설날'), ('2020-01-25', '설날'), ('2020-01-26', '설날'),
+    ('2021-02-11', '설날'), ('2021-02-12', '설날'), ('2021-02-13', '설날'),
+    ('2022-01-31', '설날'), ('2022-02-01', '설날'), ('2022-02-02', '설날'),
+    ('2023-01-21', '설날'), ('2023-01-22', '설날'), ('2023-01-23', '설날'),
+    # 추석 (2011~2023, 대체공휴일 포함)
+    ('2011-09-10', '추석'), ('2011-09-11', '추석'), ('2011-09-12', '추석'), ('2011-09-13', '추석'),
+    ('2012-09-29', '추석'), ('2012-09-30', '추석'), ('2012-10-01', '추석'),
+    ('2013-09-18', '추석'), ('2013-09-19', '추석'), ('2013-09-20', '추석'),
+    ('2014-09-06', '추석'), ('2014-09-07', '추석'), ('2014-09-08', '추석'), ('2014-09-09', '추석'),
+    ('2015-09-26', '추석'), ('2015-09-27', '추석'), ('2015-09-28', '추석'),
+    ('2016-09-14', '추석'), ('2016-09-15', '추석'), ('2016-09-16', '추석'),
+    ('2017-10-03', '추석'), ('2017-10-04', '추석'), ('2017-10-05', '추석'), ('2017-10-06', '추석'),
+    ('2018-09-22', '추석'), ('2018-09-23', '추석'), ('2018-09-24', '추석'), ('2018-09-25', '추석'),
+    ('2019-09-12', '추석'), ('2019-09-13', '추석'), ('2019-09-14', '추석'),
+    ('2020-09-30', '추석'), ('2020-10-01', '추석'), ('2020-10-02', '추석'),
+    ('2021-09-20', '추석'), ('2021-09-21', '추석'), ('2021-09-22', '추석'),
+    ('2022-09-09', '추석'), ('2022-09-10', '추석'), ('2022-09-11', '추석'), ('2022-09-12', '추석'),
+    ('2023-09-28', '추석'), ('2023-09-29', '추석'), ('2023-09-30', '추석'),
+    # 부처님 오신 날 (음력 4.8 기준 양력 날짜)
+    ('2005-05-15', '부처님 오신 날'), ('2006-05-05', '부처님 오신 날'), ('2007-05-24', '부처님 오신 날'),
+    ('2008-05-12', '부처님 오신 날'), ('2009-05-02', '부처님 오신 날'), ('2010-05-21', '부처님 오신 날'),
+    ('2011-05-10', '부처님 오신 날'), ('2012-05-28', '부처님 오신 날'), ('2013-05-17', '부처님 오신 날'),
+    ('2014-05-06', '부처님 오신 날'), ('2015-05-25', '부처님 오신 날'), ('2016-05-14', '부처님 오신 날'),
+    ('2017-05-03', '부처님 오신 날'), ('2018-05-22', '부처님 오신 날'), ('2019-05-12', '부처님 오신 날'),
+    ('2020-04-30', '부처님 오신 날'), ('2021-05-19', '부처님 오신 날'), ('2022-05-08', '부처님 오신 날'),
+    ('2023-05-27', '부처님 오신 날'),
+    # 예측 기간 (2024.1.1 ~ 2025.6.10, 연휴에 붙은 대체·임시공휴일 포함)
+    ('2024-02-09', '설날'), ('2024-02-10', '설날'), ('2024-02-11', '설날'), ('2024-02-12', '설날'),
+    ('2024-05-15', '부처님 오신 날'),
+    ('2024-09-16', '추석'), ('2024-09-17', '추석'), ('2024-09-18', '추석'),
+    ('2025-01-27', '설날'), ('2025-01-28', '설날'), ('2025-01-29', '설날'), ('2025-01-30', '설날'),
+    ('2025-05-05', '부처님 오신 날'),
+    ('2025-10-05', '추석'), ('2025-10-06', '추석'), ('2025-10-07', '추석'), ('2025-10-08', '추석'),
+]
+
+# 예측 기간의 선거일·대체공휴일·임시공휴일 (연도별로 지정되는 휴일, type 은 'fixed' 로 분류)
+DESIGNATED_HOLIDAYS = [
+    ('2024-04-10', '국회의원 선거'),
+    ('2024-05-06', '어린이날 대체공휴일'),
+    ('2024-10-01', '국군의 날 임시공휴일'),
+    ('2025-03-03', '삼일절 대체공휴일'),
+    ('2025-05-06', '어린이날 대체공휴일'),
+    ('2025-06-03', '대통령 선거'),
+]
+
+
+def create_korean_holidays(years=range(2005, 2024)):
+    """
+    한국 공휴일 데이터베이스 생성 (핵심만)
+
+    Parameters:
+    - years: 고정 공휴일, 지정 휴일(선거일·대체공휴일)과 음력 공휴일을 포함할 연도
+
+    Returns:
+    - DataFrame: date(문자열), name, type('fixed' 또는 'lunar')
+    """
+    years = list(years)
+    holidays = []
+
+    for year in years:
+        for date_str, name in FIXED_HOLIDAYS:
+            holidays.append({
+                'date': f"{year}-{date_str}",
+                'name': name,
+                'type': 'fixed'
+            })
+
+    for date_str, name in DESIGNATED_HOLIDAYS:
+        if int(date_str[:4]) in years:
+            holidays.append({
+                'date': date_str,
+                'name': name,
+                'type': 'fixed'
+            })
+
+    for date_str, name in LUNAR_HOLIDAYS:
+        if int(date_str[:4]) in years:
+            holidays.append({
+                'date': date_str,
+                'name': name,
+                'type': 'lunar'
+            })
+
+    return pd.DataFrame(holidays)
+
+
+def holiday_calendar(years=range(2005, 2024)):
+    """날짜당 한 행으로 정리한 공휴일 달력 (date: datetime, 오름차순)
+
+    고정 공휴일과 음력 연휴가 겹치는 날(예: 개천절 + 추석)은 음력 연휴로 표시한다.
+    """
+    holidays = create_korean_holidays(years)
+    holidays['date'] = pd.to_datetime(holidays['date'])
+    holidays = holidays.sort_values(['date', 'type'])
+    return holidays.drop_duplicates('date', keep='last').reset_index(drop=True)
+
+
+def label_holidays(dates, holidays=None, window_days=1):
+    """각 날짜에 가장 가까운 공휴일을 merge_asof 한 번으로 붙임
+
+    Parameters:
+    - dates: 날짜 시퀀스 (정렬되지 않아도 됨)
+    - holidays: holiday_calendar() 결과 (기본값: dates 기간의 연도)
+    - window_days: 공휴일로부터 이 일수 이내인 날만 매칭 (전날/다음날 판별용)
+
+    Returns:
+    - DataFrame (dates 순서): holiday_name, holiday_type (매칭 없으면 'none'),
+      holiday_offset (날짜 - 공휴일, 일), is_holiday, is_before_holiday, is_after_holiday
+    """
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    if holidays is None:
+        holidays = holiday_calendar(range(dates.min().year, dates.max().year + 1))
+
+    left = pd.DataFrame({'date': dates, 'row': np.arange(len(dates))}).sort_values('date')
+    right = holidays[['date', 'name', 'type']].rename(columns={'date': 'holiday_date'})
+    merged = pd.merge_asof(left, right, left_on='date', right_on='holiday_date', direction='nearest',
+                           tolerance=pd.Timedelta(days=window_days)).sort_values('row')
+
+    offset = (merged['date'] - merged['holiday_date']).dt.days
+    labels = pd.DataFrame({
+        'holiday_name': merged['name'].fillna('none').to_numpy(),
+        'holiday_type': merged['type'].fillna('none').to_numpy(),
+        'holiday_offset': offset.to_numpy(),
+    })
+    labels['is_holiday'] = (labels['holiday_offset'] == 0).astype(int)
+    labels['is_before_holiday'] = (labels['holiday_offset'] == -1).astype(int)
+    labels['is_after_holiday'] = (labels['holiday_offset'] == 1).astype(int)
+    # 전날/다음날 매칭은 공휴일 이름·유형을 'none' 으로 둠 (당일만 공휴일)
+    labels.loc[labels['is_holiday'] == 0, ['holiday_name', 'holiday_type']] = 'none'
+    return labels
@@ -1,12 +1,140 @@
 """
 데이터 로딩 유틸리티
 """
+import codecs
+import importlib.util
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+from .submission import SubmissionWriter
+from ..pipeline.cache import hash_file
+
+
+# 원본 데이터 경로 (프로젝트 루트 기준)
+RAW_DATA_PATH = Path('data/shared/data.csv')
+
+# 원본 CSV 스키마 (명시된 컬럼만 dtype 고정, 나머지는 추론)
+DATE_COL = 'date'
+DATE_FORMAT = '%Y.%m.%d'
+RAW_DTYPES = {'최대전력(MW)': 'float64'}
+
+# 캐시 파일은 원본 옆 .cache/ 폴더에 저장
+CACHE_DIRNAME = '.cache'
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# pyarrow CSV 엔진은 encoding 인자를 무시하고 UTF-8 로만 읽음
+PYARROW_ENCODINGS = ('utf-8', 'utf-8-sig')
+
+
+def detect_encoding(file_path, sample_size=1 << 16):
+    """파일 앞부분 바이트로 인코딩 판별 (BOM → utf-8-sig, utf-8 디코딩 실패 → cp949)"""
+    with open(file_path, 'rb') as f:
+        sample = f.read(sample_size)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    try:
+        # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def parse_csv(file_path, encoding=None, dtype=None, date_col=DATE_COL, date_format=DATE_FORMAT):
+    """스키마를 지정하여 CSV 파싱 (UTF-8 파일은 pyarrow 엔진 사용 가능 시 사용, 날짜 컬럼은 datetime 변환)"""
+    encoding = encoding or detect_encoding(file_path)
+    dtype = RAW_DTYPES if dtype is None else dtype
+    header = pd.read_csv(file_path, encoding=encoding, nrows=0).columns
+    dtype = {col: t for col, t in dtype.items() if col in header}
+    if date_col in header:
+        dtype[date_col] = 'string'
+
+    engine = 'pyarrow' if HAS_PYARROW and codecs.lookup(encoding).name in PYARROW_ENCODINGS else 'c'
+    df = pd.read_csv(file_path, encoding=encoding, dtype=dtype, engine=engine)
+
+    if date_col in df.columns:
+        try:
+            df[date_col] = pd.to_datetime(df[date_col], format=date_format)
+        except ValueError:
+            # 형식이 다른 파일은 자동 추론으로 대체
+            df[date_col] = pd.to_datetime(df[date_col])
+    return df
+
+
+def _cache_paths(file_path):
+    cache_dir = file_path.parent / CACHE_DIRNAME
+    suffix = '.feather' if HAS_PYARROW else '.pkl'
+    return cache_dir / f"{file_path.name}{suffix}", cache_dir / f"{file_path.name}.json"
+
+
+def load_csv(file_path, use_cache=True, **parse_kwargs):
+    """CSV 로딩 (파싱 결과를 바이너리 캐시에 저장하고 이후 로딩은 캐시 사용)
+
+    캐시 키는 (파일 크기, 수정 시각)이며, 수정 시각만 바뀐 경우에는 내용 해시가 같으면
+    캐시를 그대로 사용한다. 파싱 옵션(parse_kwargs)이 달라도 캐시를 다시 만든다.
+    """
+    file_path = Path(file_path)
+    if not use_cache:
+        return parse_csv(file_path, **parse_kwargs)
+
+    cache_path, meta_path = _cache_paths(file_path)
+    stat = file_path.stat()
+    options = json.dumps(parse_kwargs, sort_keys=True, default=str)
+
+    meta = None
+    if cache_path.exists() and meta_path.exists():
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('options') != options or meta.get('size') != stat.st_size:
+            meta = None
+
+    if meta is not None:
+        fresh = meta.get('mtime_ns') == stat.st_mtime_ns
+        if not fresh and meta.get('sha256') == hash_file(file_path):
+            # 내용은 같고 수정 시각만 바뀜 → 메타데이터만 갱신
+            meta['mtime_ns'] = stat.st_mtime_ns
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+            fresh = True
+        if fresh:
+            if cache_path.suffix == '.feather':
+                return pd.read_feather(cache_path)
+            return pd.read_pickle(cache_path)
+
+    df = parse_csv(file_path, **parse_kwargs)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if cache_path.suffix == '.feather':
+            df.to_feather(cache_path)
+        else:
+            df.to_pickle(cache_path)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'source': str(file_path),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': hash_file(file_path),
+                'options': options
+            }, f, indent=2)
+    except OSError as e:
+        # 읽기 전용 경로 등에서는 캐시 없이 진행
+        print(f"캐시 저장 생략: {e}")
+
+    return df
+
+
+def load_raw_data(file_path=RAW_DATA_PATH, use_cache=True):
+    """원본 전력 데이터 로딩 (date는 datetime, 날짜순 정렬)"""
+    df = load_csv(file_path, use_cache=use_cache)
+    return df.sort_values(DATE_COL).reset_index(drop=True)
+
 
 class DataLoader:
     """시계열 데이터 로딩 및 기본 전처리를 담당하는 클래스"""
@@ -16,18 +144,14 @@ class DataLoader:
         self.train_data = None
         self.submission_format = None
     
-    def load_train_data(self, filename="일별최대전력수급(2005-2023).csv"):
-        """학습 데이터 로딩"""
+    def load_train_data(self, filename="일별최대전력수급(2005-2023).csv", use_cache=True):
+        """학습 데이터 로딩 (인코딩 자동 감지, date 컬럼은 datetime 변환, 파싱 결과 캐싱)"""
         file_path = self.data_dir / filename
         
         if not file_path.exists():
             raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {file_path}")
         
-        # CSV 파일 로딩 (인코딩 자동 감지)
-        try:
-            self.train_data = pd.read_csv(file_path, encoding='utf-8')
-        except UnicodeDecodeError:
-            self.train_data = pd.read_csv(file_path, encoding='cp949')
+        self.train_data = load_csv(file_path, use_cache=use_cache)
         
         print(f"데이터 로딩 완료: {self.train_data.shape}")
         return self.train_data
@@ -56,13 +180,9 @@ class DataLoader:
         print(f"기간: {self.train_data.iloc[0, 0]} ~ {self.train_data.iloc[-1, 0]}")
 
 
-def create_submission_file(predictions, output_path="submission.csv"):
-    """예측 결과를 제출 형식으로 저장"""
-    submission_df = pd.DataFrame({
-        'date': pd.date_range(start='2024-01-01', periods=len(predictions), freq='D'),
-        'prediction': predictions
-    })
-    
-    submission_df.to_csv(output_path, index=False)
+def create_submission_file(predictions, output_path="submission.csv", template_path=None):
+    """예측 결과를 제출 형식(date: YYYY.M.D, 최대전력(MW))으로 저장"""
+    writer = SubmissionWriter(template_path=template_path)
+    output_path = writer.write(predictions, output_path)
     print(f"제출 파일 저장 완료: {output_path}")
-    return submission_df 
\ No newline at end of file
+    return writer.build(predictions)
@@ -0,0 +1,165 @@
+"""
+대회 제출 파일 생성 (날짜 형식 YYYY.M.D)
+"""
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+DATE_COL = 'date'
+TARGET_COL = '최대전력(MW)'
+
+# 예측 대상 기간 (527일)
+PREDICTION_START = '2024-01-01'
+PREDICTION_END = '2025-06-10'
+
+
+def format_submission_dates(dates):
+    """날짜를 제출 형식(YYYY.M.D, 앞자리 0 없음) 문자열로 변환 (벡터 연산)"""
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    return (
+        pd.Index(dates.year.astype(str)) + '.' +
+        pd.Index(dates.month.astype(str)) + '.' +
+        pd.Index(dates.day.astype(str))
+    ).to_numpy(dtype=object)
+
+
+def parse_submission_dates(values):
+    """제출 형식 날짜 문자열을 DatetimeIndex로 변환"""
+    return pd.DatetimeIndex(pd.to_datetime(pd.Series(values, dtype=str), format='%Y.%m.%d'))
+
+
+def prediction_dates(start=PREDICTION_START, end=PREDICTION_END):
+    """예측 대상 날짜 (일 단위, 양 끝 포함)"""
+    return pd.date_range(start=start, end=end, freq='D')
+
+
+def build_template(start=PREDICTION_START, end=PREDICTION_END):
+    """제출 템플릿 (date: YYYY.M.D, 최대전력(MW): 0)"""
+    dates = prediction_dates(start, end)
+    return pd.DataFrame({DATE_COL: format_submission_dates(dates), TARGET_COL: 0})
+
+
+class SubmissionWriter:
+    """템플릿 날짜에 맞춰 하나 또는 여러 개의 예측 벡터를 제출 파일로 저장하는 클래스
+
+    날짜 문자열은 생성 시 한 번만 만들고, 예측 벡터는 (일수, 시나리오 수) 행렬로
+    묶어서 길이·날짜 정렬·결측/무한값을 한 번에 검증한다.
+    """
+
+    def __init__(self, template=None, template_path=None, encoding='utf-8-sig'):
+        if template is None and template_path is not None:
+            template = pd.read_csv(template_path, encoding=encoding)
+        if template is None:
+            template = build_template()
+
+        if DATE_COL not in template.columns:
+            raise ValueError(f"템플릿에 '{DATE_COL}' 컬럼이 없습니다: {list(template.columns)}")
+
+        self.template = template.reset_index(drop=True)
+        self.encoding = encoding
+        self.dates = parse_submission_dates(self.template[DATE_COL])
+        # 템플릿 문자열을 그대로 사용 (원본 형식 유지)
+        self.date_strings = self.template[DATE_COL].astype(str).to_numpy(dtype=object)
+
+    def __len__(self):
+        return len(self.template)
+
+    def _to_matrix(self, predictions):
+        """예측값을 (일수, 시나리오 수) 행렬과 시나리오 이름으로 변환
+
+        허용 형식: 1차원 배열/Series, 2차원 배열, DataFrame, {이름: 벡터} dict
+        Series/DataFrame 의 인덱스가 날짜이면 템플릿 날짜와 정렬 여부도 검증한다.
+        """
+        index = None
+        if isinstance(predictions, dict):
+            names = [str(name) for name in predictions]
+            matrix = np.column_stack([np.asarray(v, dtype=float).ravel() for v in predictions.values()])
+        elif isinstance(predictions, pd.DataFrame):
+            names = [str(c) for c in predictions.columns]
+            matrix = predictions.to_numpy(dtype=float)
+            index = predictions.index
+        elif isinstance(predictions, pd.Series):
+            names = [TARGET_COL]
+            matrix = predictions.to_numpy(dtype=float)[:, None]
+            index = predictions.index
+        else:
+            matrix = np.asarray(predictions, dtype=float)
+            if matrix.ndim == 1:
+                matrix = matrix[:, None]
+            names = [TARGET_COL] if matrix.shape[1] == 1 else [f"pred_{i}" for i in range(matrix.shape[1])]
+
+        self.validate(matrix, index)
+        return matrix, names
+
+    def validate(self, matrix, index=None):
+        """길이, 날짜 정렬, 결측/무한값 검증 (위반 시 ValueError)"""
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.ndim == 1:
+            matrix = matrix[:, None]
+
+        if matrix.shape[0] != len(self):
+            raise ValueError(f"예측 길이가 템플릿과 다릅니다: {matrix.shape[0]} (필요: {len(self)})")
+
+        if isinstance(index, pd.DatetimeIndex):
+            if not index.normalize().equals(self.dates):
+                mismatch = np.flatnonzero(index.normalize() != self.dates)
+                raise ValueError(
+                    f"예측 날짜가 템플릿과 다릅니다: {len(mismatch)}개 위치 불일치 "
+                    f"(첫 불일치 {index[mismatch[0]].date()} vs {self.dates[mismatch[0]].date()})"
+                )
+
+        invalid = ~np.isfinite(matrix)
+        if invalid.any():
+            rows, cols = np.nonzero(invalid)
+            raise ValueError(
+                f"예측값에 결측/무한값이 {invalid.sum()}개 있습니다 "
+                f"(첫 위치: {self.date_strings[rows[0]]}, 열 {cols[0]})"
+            )
+        return True
+
+    def build(self, predictions):
+        """단일 예측 벡터로 제출 DataFrame 생성"""
+        matrix, _ = self._to_matrix(predictions)
+        if matrix.shape[1] != 1:
+            raise ValueError(f"단일 예측 벡터가 필요합니다: {matrix.shape[1]}개 열")
+        return pd.DataFrame({DATE_COL: self.date_strings, TARGET_COL: matrix[:, 0]})
+
+    def write(self, predictions, output_path='submission.csv'):
+        """단일 제출 파일 저장"""
+        submission = self.build(predictions)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        submission.to_csv(output_path, index=False, encoding=self.encoding)
+        return output_path
+
+    def write_wide(self, predictions, output_path):
+        """여러 예측 벡터를 날짜 1열 + 시나리오별 열로 된 하나의 파일로 저장"""
+        matrix, names = self._to_matrix(predictions)
+        wide = pd.DataFrame(matrix, columns=names)
+        wide.insert(0, DATE_COL, self.date_strings)
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        wide.to_csv(output_path, index=False, encoding=self.encoding)
+        return output_path
+
+    def write_batch(self, predictions, output_dir, filename='submission_{name}.csv'):
+        """여러 예측 벡터를 시나리오별 제출 파일로 한 번에 저장
+
+        Returns:
+        - dict: {시나리오 이름: 저장 경로}
+        """
+        matrix, names = self._to_matrix(predictions)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 날짜 열은 공유하고 값 열만 바꿔 가며 저장
+        submission = pd.DataFrame({DATE_COL: self.date_strings, TARGET_COL: 0.0})
+        paths = {}
+        for i, name in enumerate(names):
+            submission[TARGET_COL] = matrix[:, i]
+            path = output_dir / filename.format(name=name)
+            submission.to_csv(path, index=False, encoding=self.encoding)
+            paths[name] = path
+        return paths
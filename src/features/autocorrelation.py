@@ -0,0 +1,194 @@
+"""
+FFT 기반 자기상관(ACF/PACF) 계산 및 래그 선택
+"""
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+# 차분 변형 이름 → 순서대로 적용할 차분 간격
+DIFFERENCE_VARIANTS = {
+    'original': (),
+    'diff1': (1,),
+    'diff2': (1, 1),
+    'seasonal_diff': (365,),
+}
+
+
+def acf_fft_batch(X, nlags):
+    """여러 시계열(행)의 0~nlags 래그 자기상관을 한 번의 배치 FFT로 계산 (O(N log N))
+
+    길이가 다른 시계열은 NaN으로 채워서 넘긴다. 결측값은 평균 제거 후 0으로 두고
+    계산하므로 각 행은 statsmodels의 biased ACF와 같은 값이 된다.
+
+    Returns:
+    - ndarray: (시계열 수, nlags + 1), 분산이 0인 행은 NaN
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    X = X - np.nanmean(X, axis=1, keepdims=True)
+    X = np.where(np.isnan(X), 0.0, X)
+
+    n = X.shape[1]
+    nlags = min(int(nlags), n - 1)
+    n_fft = 1 << int(np.ceil(np.log2(2 * n - 1)))
+
+    spectrum = np.fft.rfft(X, n_fft, axis=1)
+    autocov = np.fft.irfft(np.abs(spectrum) ** 2, n_fft, axis=1)[:, :nlags + 1]
+
+    variance = autocov[:, :1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(variance > 0, autocov / np.where(variance > 0, variance, 1.0), np.nan)
+
+
+def acf_fft(x, nlags):
+    """FFT로 0~nlags 래그의 자기상관 계산 (단일 시계열)"""
+    return acf_fft_batch(np.asarray(x, dtype=float)[None, :], nlags)[0]
+
+
+def pacf_durbin_levinson_batch(acf, nlags=None):
+    """Durbin-Levinson 재귀로 여러 ACF(행)의 PACF를 동시에 계산 (O(nlags^2), 시계열 방향은 벡터화)
+
+    분모가 0 이하가 되어 수치적으로 불안정해진 행은 이후 래그를 0으로 둔다.
+    """
+    acf = np.atleast_2d(np.asarray(acf, dtype=float))
+    n_series = acf.shape[0]
+    nlags = acf.shape[1] - 1 if nlags is None else min(int(nlags), acf.shape[1] - 1)
+
+    pacf = np.zeros((n_series, nlags + 1))
+    pacf[:, 0] = 1.0
+    if nlags == 0:
+        return pacf
+
+    phi = np.zeros((n_series, nlags))
+    phi[:, 0] = acf[:, 1]
+    pacf[:, 1] = np.nan_to_num(acf[:, 1])
+    active = np.isfinite(acf[:, 1])
+
+    for k in range(2, nlags + 1):
+        prev = phi[:, :k - 1]
+        num = acf[:, k] - np.einsum('ij,ij->i', prev, acf[:, k - 1:0:-1])
+        den = 1.0 - np.einsum('ij,ij->i', prev, acf[:, 1:k])
+        active &= den > 0
+        if not active.any():
+            break
+
+        phi_kk = np.where(active, num / np.where(active, den, 1.0), 0.0)
+        phi[active, :k - 1] = prev[active] - phi_kk[active, None] * prev[active, ::-1]
+        phi[:, k - 1] = phi_kk
+        pacf[:, k] = phi_kk
+
+    return pacf
+
+
+def pacf_durbin_levinson(acf, nlags=None):
+    """Durbin-Levinson 재귀로 ACF에서 PACF 계산 (단일 시계열)"""
+    return pacf_durbin_levinson_batch(np.asarray(acf, dtype=float)[None, :], nlags)[0]
+
+
+def acf_band(acf, nobs, alpha=0.05):
+    """Bartlett 공식에 따른 ACF 신뢰구간 반폭 (statsmodels plot_acf 음영과 동일)
+
+    Parameters:
+    - acf: (시계열 수, 래그 수) ACF
+    - nobs: 시계열별 관측치 수
+    """
+    acf = np.atleast_2d(acf)
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    variance = np.ones_like(acf) / np.asarray(nobs, dtype=float)[:, None]
+    variance[:, 0] = 0.0
+    variance[:, 2:] *= 1 + 2 * np.cumsum(np.nan_to_num(acf[:, 1:-1]) ** 2, axis=1)
+    return z * np.sqrt(variance)
+
+
+def pacf_band(nobs, nlags, alpha=0.05):
+    """PACF 신뢰구간 반폭 (z / sqrt(N), 래그 0은 0)"""
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    band = np.repeat(z / np.sqrt(np.asarray(nobs, dtype=float))[:, None], nlags + 1, axis=1)
+    band[:, 0] = 0.0
+    return band
+
+
+def difference_variants(y, variants=DIFFERENCE_VARIANTS):
+    """차분 변형들을 NaN으로 채운 (변형 수, N) 행렬로 변환 (차분은 위치 기준)"""
+    y = np.asarray(y, dtype=float)
+    rows = np.full((len(variants), len(y)), np.nan)
+    for i, periods in enumerate(variants.values()):
+        x = y
+        for period in periods:
+            x = x[period:] - x[:-period]
+        rows[i, :len(x)] = x
+    return rows
+
+
+def correlogram(y, nlags, variants=DIFFERENCE_VARIANTS, pacf_lags=None, alpha=0.05):
+    """차분 변형별 ACF/PACF와 신뢰구간을 한 번의 배치 계산으로 반환
+
+    Parameters:
+    - y: 원 시계열 (1차원)
+    - nlags: ACF 최대 래그
+    - variants: {이름: 차분 간격 튜플} (DIFFERENCE_VARIANTS 형식)
+    - pacf_lags: PACF 최대 래그 (기본값 nlags)
+    - alpha: 신뢰구간 유의수준
+
+    Returns:
+    - dict: acf, acf_band, pacf, pacf_band (index=lag, columns=변형 이름 DataFrame), nobs (Series)
+    """
+    X = difference_variants(y, variants)
+    nobs = (~np.isnan(X)).sum(axis=1)
+    names = list(variants)
+
+    acf = acf_fft_batch(X, nlags)
+    pacf_lags = acf.shape[1] - 1 if pacf_lags is None else min(int(pacf_lags), acf.shape[1] - 1)
+    pacf = pacf_durbin_levinson_batch(acf, pacf_lags)
+
+    def frame(values):
+        return pd.DataFrame(values.T, index=pd.RangeIndex(values.shape[1], name='lag'), columns=names)
+
+    return {
+        'acf': frame(acf),
+        'acf_band': frame(acf_band(acf, nobs, alpha)),
+        'pacf': frame(pacf),
+        'pacf_band': frame(pacf_band(nobs, pacf_lags, alpha)),
+        'nobs': pd.Series(nobs, index=names),
+    }
+
+
+def rank_lags(y, max_lag=730):
+    """1~max_lag 래그별 ACF/PACF와 유의성 계산
+
+    Returns:
+    - DataFrame: lag, acf, pacf, significant (|pacf| > 1.96/sqrt(N))
+    """
+    y = np.asarray(y, dtype=float)
+    n_valid = int((~np.isnan(y)).sum())
+
+    acf = acf_fft(y, max_lag)
+    pacf = pacf_durbin_levinson(acf)
+    bound = 1.96 / np.sqrt(max(n_valid, 1))
+
+    lags = np.arange(1, len(acf))
+    return pd.DataFrame({
+        'lag': lags,
+        'acf': acf[1:],
+        'pacf': pacf[1:],
+        'significant': np.abs(pacf[1:]) > bound
+    })
+
+
+def select_lags(y, top_k=10, max_lag=730, seasonal_lags=(7, 364, 371), min_lag=1):
+    """PACF 크기 기준 상위 top_k 래그와 계절 래그를 선택
+
+    seasonal_lags 는 요일을 맞춘 연간 래그(364=52주, 371=53주) 등으로,
+    max_lag 이내이면 항상 포함한다.
+
+    Returns:
+    - list: 오름차순 정렬된 래그 목록
+    """
+    table = rank_lags(y, max_lag)
+    candidates = table[(table['lag'] >= min_lag) & table['significant']]
+    top = candidates.reindex(candidates['pacf'].abs().sort_values(ascending=False).index).head(top_k)
+
+    selected = set(top['lag'].astype(int).tolist())
+    selected.update(lag for lag in seasonal_lags if min_lag <= lag <= table['lag'].max())
+    return sorted(selected)
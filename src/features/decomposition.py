@@ -0,0 +1,90 @@
+"""
+다중 계절 STL(MSTL) 분해 (주간 7일 + 연간 365일) 및 성분 캐시
+"""
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.seasonal import MSTL
+
+from ..pipeline.cache import ResultCache, hash_frame
+
+DECOMPOSITION_PERIODS = (7, 365)
+
+
+def mstl_decompose(frame, periods=DECOMPOSITION_PERIODS, iterate=2):
+    """일별 시계열의 MSTL 분해
+
+    날짜 누락 구간은 일 단위로 채운 뒤 선형 보간해서 분해하고, 보간한 날짜는
+    filled 컬럼으로 표시한다 (STL 은 연속·무결측 입력이 필요).
+
+    Parameters:
+    - frame: 날짜 인덱스, 값 컬럼 하나인 DataFrame (ResultCache.run 입력 형식)
+    - periods: 계절 주기 목록 (일 단위)
+    - iterate: 계절 성분 추정 반복 횟수
+
+    Returns:
+    - DataFrame: observed, trend, seasonal_<주기>..., resid, filled (일 단위 연속 날짜 인덱스)
+    """
+    series = frame.iloc[:, 0].astype(float)
+    series = series[~series.index.duplicated(keep='last')].sort_index()
+    full_index = pd.date_range(series.index.min(), series.index.max(), freq='D', name=series.index.name)
+    observed = series.reindex(full_index)
+    filled = observed.isna().to_numpy()
+    observed = observed.interpolate(method='linear', limit_direction='both')
+
+    result = MSTL(observed.to_numpy(), periods=list(periods), iterate=iterate).fit()
+    seasonal = np.asarray(result.seasonal).reshape(len(observed), -1)
+
+    components = pd.DataFrame({'observed': observed.to_numpy(), 'trend': result.trend}, index=full_index)
+    for i, period in enumerate(periods):
+        components[f'seasonal_{period}'] = seasonal[:, i]
+    components['resid'] = result.resid
+    components['filled'] = filled
+    return components
+
+
+def get_decomposition(series, periods=DECOMPOSITION_PERIODS, cache_dir='results/.cache/analysis', force=False):
+    """MSTL 분해 성분 조회 (같은 시계열·주기이면 디스크 캐시에서 바로 반환)
+
+    EDA 그림, 결측 보간, 특성 생성이 모두 이 함수를 거치므로 한 번 분해한 결과를 공유한다.
+    """
+    frame = series.to_frame()
+    return ResultCache(cache_dir).run(
+        'mstl_decomposition', mstl_decompose, frame,
+        params={'periods': list(periods)}, data_hash=hash_frame(frame), force=force
+    )
+
+
+def seasonal_columns(components):
+    """분해 결과의 계절 성분 컬럼 목록"""
+    return [col for col in components.columns if col.startswith('seasonal_')]
+
+
+def deseasonalize(components):
+    """계절 성분(전 주기 합)을 뺀 시계열 (= 추세 + 잔차)"""
+    return components['observed'] - components[seasonal_columns(components)].sum(axis=1)
+
+
+def seasonal_profile(components, window=730):
+    """최근 window 일의 계절 성분을 요일/연중 일자별 평균으로 요약
+
+    분해 기간 밖의 날짜(검증·예측 구간)에도 같은 계절 성분을 적용할 수 있도록 한다.
+
+    Returns:
+    - dict: weekly (index=요일 0~6), annual (index=연중 일자 1~366)
+    """
+    recent = components.iloc[-window:]
+    index = recent.index
+    weekly = recent.get('seasonal_7', pd.Series(0.0, index=index)).groupby(index.dayofweek).mean()
+    annual = recent.get('seasonal_365', pd.Series(0.0, index=index)).groupby(index.dayofyear).mean()
+    return {
+        'weekly': weekly.reindex(range(7), fill_value=0.0),
+        'annual': annual.reindex(range(1, 367)).ffill().bfill(),
+    }
+
+
+def apply_seasonal_profile(dates, profile):
+    """seasonal_profile 을 날짜 배열에 적용한 계절 성분 값"""
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    weekly = profile['weekly'].to_numpy()[dates.dayofweek]
+    annual = profile['annual'].to_numpy()[dates.dayofyear - 1]
+    return weekly + annual
@@ -5,12 +5,28 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+# add_time_features 가 만드는 달력 컬럼 (예측 시점에 미리 알 수 있어 누출 감사 대상에서 제외)
+TIME_FEATURE_COLUMNS = ('year', 'month', 'day', 'dayofweek', 'dayofyear', 'quarter', 'is_weekend',
+                        'season', 'month_sin', 'month_cos', 'day_sin', 'day_cos')
+
 
 class TimeSeriesFeatureEngine:
-    """시계열 데이터의 특성 엔지니어링을 담당하는 클래스"""
+    """시계열 데이터의 특성 엔지니어링을 담당하는 클래스
+
+    forecast_safe=True 이면 모든 타겟 기반 피처를 예측 시점(t-1일까지)의
+    정보만 사용하도록 한 칸 밀어서 정렬한다.
+    """
     
-    def __init__(self):
-        pass
+    def __init__(self, forecast_safe=False):
+        self.forecast_safe = forecast_safe
+        self.selected_lags = None
+        self.seasonal_profile = None
+    
+    def _known_target(self, df, target_col):
+        """피처 계산에 사용할 타겟 시리즈 (forecast_safe 모드에서는 t-1 기준)"""
+        if self.forecast_safe:
+            return df[target_col].shift(1)
+        return df[target_col]
     
     def add_time_features(self, df, date_col='date'):
         """날짜 기반 특성 추가"""
@@ -44,6 +60,16 @@ class TimeSeriesFeatureEngine:
         
         return df
     
+    def add_fourier_features(self, df, date_col='date', periods=(7, 365.25), orders=(3, 10)):
+        """다중 주기 푸리에 계절성 특성 추가 (주간 7일, 연간 365.25일 기본)"""
+        from .fourier import fourier_terms
+        
+        df = df.copy()
+        terms = fourier_terms(df[date_col], periods=periods, orders=orders)
+        df[terms.columns] = terms.values
+        
+        return df
+    
     def add_lag_features(self, df, target_col, lags=[1, 7, 14, 30, 365]):
         """래그 특성 추가"""
         df = df.copy()
@@ -53,33 +79,75 @@ class TimeSeriesFeatureEngine:
         
         return df
     
+    def add_selected_lag_features(self, df, target_col, top_k=10, max_lag=730,
+                                  seasonal_lags=(7, 364, 371), refit=False):
+        """ACF/PACF 기반으로 자동 선택한 래그 특성만 추가
+        
+        처음 호출(또는 refit=True) 시 주어진 데이터로 래그를 선택하고,
+        이후에는 self.selected_lags 를 재사용한다 (검증/예측 데이터에 동일 적용).
+        """
+        if self.selected_lags is None or refit:
+            from .autocorrelation import select_lags
+            
+            self.selected_lags = select_lags(
+                df[target_col].values, top_k=top_k, max_lag=max_lag, seasonal_lags=seasonal_lags
+            )
+            print(f"✓ 선택된 래그: {self.selected_lags}")
+        
+        return self.add_lag_features(df, target_col, lags=self.selected_lags)
+    
+    def add_deseasonalized_lag_features(self, df, target_col, date_col='date', lags=[1, 7, 14], refit=False):
+        """계절성(주간 + 연간 MSTL 성분)을 제거한 타겟의 래그 특성 추가
+        
+        처음 호출(또는 refit=True) 시 주어진 데이터의 MSTL 분해(get_decomposition 캐시 공유)에서
+        요일/연중 일자별 계절 프로파일을 만들고, 이후에는 self.seasonal_profile 을 재사용한다
+        (검증/예측 구간에는 분해를 다시 하지 않고 같은 계절 성분을 적용).
+        """
+        from .decomposition import apply_seasonal_profile, get_decomposition, seasonal_profile
+        
+        df = df.copy()
+        dates = pd.to_datetime(df[date_col])
+        
+        if self.seasonal_profile is None or refit:
+            series = pd.Series(df[target_col].to_numpy(), index=pd.DatetimeIndex(dates, name=date_col)).dropna()
+            self.seasonal_profile = seasonal_profile(get_decomposition(series))
+            print("✓ 계절 프로파일(주간 + 연간) 생성")
+        
+        deseasonalized = df[target_col] - apply_seasonal_profile(dates, self.seasonal_profile)
+        for lag in lags:
+            df[f'{target_col}_deseasonalized_lag_{lag}'] = deseasonalized.shift(lag)
+        
+        return df
+    
     def add_rolling_features(self, df, target_col, windows=[7, 14, 30, 90]):
         """롤링 통계 특성 추가"""
         df = df.copy()
+        target = self._known_target(df, target_col)
         
         for window in windows:
             # 평균, 표준편차, 최대, 최소
-            df[f'{target_col}_rolling_mean_{window}'] = df[target_col].rolling(window).mean()
-            df[f'{target_col}_rolling_std_{window}'] = df[target_col].rolling(window).std()
-            df[f'{target_col}_rolling_max_{window}'] = df[target_col].rolling(window).max()
-            df[f'{target_col}_rolling_min_{window}'] = df[target_col].rolling(window).min()
+            df[f'{target_col}_rolling_mean_{window}'] = target.rolling(window).mean()
+            df[f'{target_col}_rolling_std_{window}'] = target.rolling(window).std()
+            df[f'{target_col}_rolling_max_{window}'] = target.rolling(window).max()
+            df[f'{target_col}_rolling_min_{window}'] = target.rolling(window).min()
             
-            # 트렌드 (현재값 - 평균)
-            df[f'{target_col}_trend_{window}'] = df[target_col] - df[f'{target_col}_rolling_mean_{window}']
+            # 트렌드 (현재값 - 평균, forecast_safe 모드에서는 어제값 - 평균)
+            df[f'{target_col}_trend_{window}'] = target - df[f'{target_col}_rolling_mean_{window}']
         
         return df
     
     def add_diff_features(self, df, target_col, periods=[1, 7, 365]):
         """차분 특성 추가"""
         df = df.copy()
+        target = self._known_target(df, target_col)
         
         for period in periods:
-            df[f'{target_col}_diff_{period}'] = df[target_col].diff(period)
-            df[f'{target_col}_pct_change_{period}'] = df[target_col].pct_change(period)
+            df[f'{target_col}_diff_{period}'] = target.diff(period)
+            df[f'{target_col}_pct_change_{period}'] = target.pct_change(period)
         
         return df
     
-    def create_all_features(self, df, target_col, date_col='date'):
+    def create_all_features(self, df, target_col, date_col='date', auto_lags=False):
         """모든 특성을 한 번에 생성"""
         print("특성 엔지니어링 시작...")
         
@@ -87,8 +155,11 @@ class TimeSeriesFeatureEngine:
         df = self.add_time_features(df, date_col)
         print("✓ 시간 특성 추가 완료")
         
-        # 래그 특성
-        df = self.add_lag_features(df, target_col)
+        # 래그 특성 (auto_lags=True 이면 ACF/PACF 기반 자동 선택)
+        if auto_lags:
+            df = self.add_selected_lag_features(df, target_col)
+        else:
+            df = self.add_lag_features(df, target_col)
         print("✓ 래그 특성 추가 완료")
         
         # 롤링 특성
@@ -100,6 +171,18 @@ class TimeSeriesFeatureEngine:
         print("✓ 차분 특성 추가 완료")
         
         print(f"특성 엔지니어링 완료: {df.shape[1]}개 특성")
+        
+        # 누출 감사 (forecast_safe 모드)
+        if self.forecast_safe:
+            from .leakage import audit_feature_leakage
+            
+            audit = audit_feature_leakage(df, target_col)
+            flagged = audit.index[audit['flagged']].tolist()
+            if flagged:
+                print(f"⚠️ 미래 정보 누출 의심 피처: {flagged}")
+            else:
+                print("✓ 누출 감사 통과")
+        
         return df
 
 
@@ -123,4 +206,20 @@ def create_holiday_features(df, date_col='date'):
     
     df['is_holiday'] = df[date_col].dt.strftime('%m-%d').isin(holidays).astype(int)
     
-    return df 
\ No newline at end of file
+    return df
+
+
+def create_event_features(df, date_col='date', calendar=None, prefix='event'):
+    """특별 이벤트 특성 추가 (분류별 기간 여부, 진행 중 이벤트 수, 시작 후 경과일)
+    
+    calendar: EventCalendar (기본값: src.data.events.SPECIAL_EVENTS)
+    """
+    from ..data.events import EventCalendar
+    
+    df = df.copy()
+    if calendar is None:
+        calendar = EventCalendar.from_records()
+    features = calendar.features(pd.to_datetime(df[date_col]), prefix=prefix)
+    df[features.columns] = features.to_numpy()
+    
+    return df
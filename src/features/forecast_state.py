@@ -0,0 +1,160 @@
+"""
+재귀 예측용 상태 (과거 타겟 링 버퍼 + 예측 구간 달력 피처)
+"""
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from .incremental import IncrementalFeatureState
+from .normalization import FeatureNormalizer
+
+
+class ForecastState:
+    """예측 구간을 하루씩 진행하며 lag/rolling 피처를 O(1)로 갱신하는 클래스
+
+    훈련 데이터의 마지막 buffer_size일 타겟을 링 버퍼로 보관하고, 예측 구간의
+    달력 피처(공휴일 포함)는 미리 계산해 둔다. next_features() 로 다음 날 입력을 얻고
+    advance(prediction) 으로 예측값을 버퍼에 넣어 다음 날로 이동한다.
+    normalizer 가 있으면 lag/rolling 피처도 훈련 데이터와 같은 파라미터로 정규화한다.
+    """
+
+    def __init__(self, state, calendar, holidays=None, normalizer=None, date_col='date', position=0):
+        if not state.forecast_safe:
+            raise ValueError("ForecastState에는 forecast_safe=True 인 IncrementalFeatureState가 필요합니다.")
+
+        self.state = state
+        self.date_col = date_col
+        self.calendar = calendar.reset_index(drop=True)
+        self.holidays = holidays
+        self.normalizer = normalizer
+        self.position = position
+
+        # 단계별 dict 생성 비용을 없애기 위해 달력 행을 미리 변환
+        self._calendar_records = self.calendar.to_dict('records')
+        self._dates = pd.to_datetime(self.calendar[date_col]).tolist()
+
+        self._lag_columns = list(IncrementalFeatureState.FEATURE_COLUMNS)
+        self._norm_columns = []
+        if normalizer is not None:
+            self._norm_columns = [c for c in self._lag_columns if c in normalizer.columns]
+
+    @classmethod
+    def from_history(cls, history, calendar, holidays=None, normalizer=None,
+                     target_col='최대전력(MW)', date_col='date', buffer_size=365):
+        """과거 데이터(원 단위 타겟)와 예측 구간 달력 피처로 상태 생성
+
+        Parameters:
+        - history: date_col, target_col 을 포함한 훈련 데이터
+        - calendar: 예측 구간 달력 피처 (date_col 포함, 하루 한 행)
+        - holidays: 공휴일 달력 (date, name, type)
+        - normalizer: lag/rolling 피처에 적용할 FeatureNormalizer
+        - buffer_size: 보관할 과거 일수
+        """
+        state = IncrementalFeatureState(
+            target_col=target_col, date_col=date_col,
+            buffer_size=buffer_size, forecast_safe=True
+        ).fit(history)
+
+        first_date = pd.Timestamp(calendar[date_col].iloc[0])
+        if state.last_date is not None and first_date != state.last_date + pd.Timedelta(days=1):
+            raise ValueError(
+                f"예측 구간은 훈련 마지막 날({state.last_date.date()}) 다음 날부터 시작해야 합니다: "
+                f"{first_date.date()}"
+            )
+
+        return cls(state, calendar, holidays=holidays, normalizer=normalizer, date_col=date_col)
+
+    def __len__(self):
+        return len(self._calendar_records)
+
+    @property
+    def remaining(self):
+        """남은 예측 일수"""
+        return len(self) - self.position
+
+    @property
+    def current_date(self):
+        """다음에 예측할 날짜"""
+        return self._dates[self.position] if self.remaining > 0 else None
+
+    def next_features(self):
+        """다음 예측일의 입력 피처 (달력 피처 + lag/rolling 피처)"""
+        if self.remaining <= 0:
+            raise IndexError("예측 구간을 모두 진행했습니다.")
+
+        lag_features = self.state.next_features()
+        if self._norm_columns:
+            scaled = self.normalizer.transform_array(
+                [lag_features[c] for c in self._norm_columns], self._norm_columns
+            )
+            lag_features.update(zip(self._norm_columns, scaled.tolist()))
+
+        return {**self._calendar_records[self.position], **lag_features}
+
+    def advance(self, prediction):
+        """예측값(원 단위)을 버퍼에 넣고 다음 날로 이동"""
+        if self.remaining <= 0:
+            raise IndexError("예측 구간을 모두 진행했습니다.")
+        self.state.push(prediction, date=self._dates[self.position])
+        self.position += 1
+
+    def roll(self, predict_fn):
+        """남은 예측 구간 전체를 재귀적으로 진행
+
+        Parameters:
+        - predict_fn: 피처 dict 를 받아 예측값(원 단위)을 반환하는 함수
+
+        Returns:
+        - DataFrame: 날짜별 입력 피처와 예측값 (target_col 컬럼)
+        """
+        rows = []
+        while self.remaining > 0:
+            features = self.next_features()
+            prediction = float(predict_fn(features))
+            self.advance(prediction)
+            rows.append({**features, self.state.target_col: prediction})
+        return pd.DataFrame(rows)
+
+    def to_dict(self):
+        """JSON 직렬화 가능한 상태"""
+        holidays = None
+        if self.holidays is not None:
+            holidays = self.holidays.assign(
+                date=pd.to_datetime(self.holidays['date']).dt.strftime('%Y-%m-%d')
+            ).to_dict('list')
+
+        return {
+            'state': self.state.to_dict(),
+            'position': self.position,
+            'date_col': self.date_col,
+            'calendar': self.calendar.replace({np.nan: None}).to_dict('list'),
+            'holidays': holidays,
+            'normalizer': self.normalizer.to_dict() if self.normalizer is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, params):
+        """to_dict 결과로부터 복원"""
+        return cls(
+            IncrementalFeatureState.from_dict(params['state']),
+            pd.DataFrame(params['calendar']),
+            holidays=pd.DataFrame(params['holidays']) if params.get('holidays') else None,
+            normalizer=FeatureNormalizer.from_dict(params['normalizer']) if params.get('normalizer') else None,
+            date_col=params.get('date_col', 'date'),
+            position=params.get('position', 0)
+        )
+
+    def save(self, filepath):
+        """JSON으로 저장"""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """JSON 로딩"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
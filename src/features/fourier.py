@@ -0,0 +1,58 @@
+"""
+다중 주기 푸리에 계절성 기저 생성
+"""
+import numpy as np
+import pandas as pd
+
+
+# 시간 인덱스 기준점 (학습/예측 데이터가 같은 위상을 갖도록 고정)
+FOURIER_ORIGIN = pd.Timestamp('1970-01-01')
+
+
+def _period_label(period):
+    """컬럼명에 사용할 주기 표기 (365.25 → 365_25)"""
+    return f"{period:g}".replace('.', '_')
+
+
+def fourier_terms(dates, periods=(7, 365.25), orders=(3, 10), prefix='fourier'):
+    """푸리에 항(sin/cos)을 한 번의 외적으로 생성
+
+    t(일 단위, 시간 단위 데이터는 소수 일) × 주파수 2πk/period 의 외적을 구해
+    모든 주기·차수의 sin/cos 를 동시에 계산한다.
+
+    Parameters:
+    - dates: 날짜 시퀀스 (Series, DatetimeIndex, 배열)
+    - periods: 주기 목록 (일 단위, 예: 7, 365.25, 시간 단위 데이터의 일중 주기는 1)
+    - orders: 주기별 차수 K (periods와 같은 길이, 또는 하나의 정수)
+    - prefix: 컬럼명 접두사
+
+    Returns:
+    - DataFrame: {prefix}_{period}_{sin|cos}_{k} 컬럼
+    """
+    if np.isscalar(orders):
+        orders = [int(orders)] * len(periods)
+    if len(orders) != len(periods):
+        raise ValueError(f"periods({len(periods)})와 orders({len(orders)})의 길이가 다릅니다.")
+
+    index = dates.index if isinstance(dates, pd.Series) else None
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    t = ((dates - FOURIER_ORIGIN) / pd.Timedelta(days=1)).to_numpy(dtype=float)
+
+    # 주파수 벡터와 컬럼명
+    freqs = []
+    names = []
+    for period, order in zip(periods, orders):
+        label = _period_label(period)
+        for k in range(1, order + 1):
+            freqs.append(2 * np.pi * k / period)
+            names.append((label, k))
+    freqs = np.asarray(freqs)
+
+    angles = np.outer(t, freqs)
+    values = np.hstack([np.sin(angles), np.cos(angles)])
+    columns = (
+        [f"{prefix}_{label}_sin_{k}" for label, k in names] +
+        [f"{prefix}_{label}_cos_{k}" for label, k in names]
+    )
+
+    return pd.DataFrame(values, columns=columns, index=index)
@@ -0,0 +1,142 @@
+"""
+공휴일 영향 분석 (공휴일 달력 merge_asof + 일 유형별 집계 + 배치 부트스트랩 신뢰구간)
+"""
+import numpy as np
+import pandas as pd
+
+from ..data.holidays import label_holidays
+
+BASELINE = '평일'
+WEEKEND = '주말'
+ADJACENT = '공휴일 전후'
+ALL_HOLIDAYS = '공휴일'
+
+
+def day_types(df, date_col='date', holidays=None):
+    """날짜별 일 유형 라벨 (공휴일 이름 > 주말 > 공휴일 전후 > 평일 우선순위)
+
+    Returns:
+    - DataFrame (df 행 순서): label_holidays 결과 + is_weekend, day_type, kind
+      (kind: holiday / weekend / adjacent / baseline)
+    """
+    dates = pd.to_datetime(df[date_col])
+    labels = label_holidays(dates, holidays)
+    labels['is_weekend'] = (dates.dt.dayofweek >= 5).astype(int).to_numpy()
+
+    adjacent = (labels['is_before_holiday'] == 1) | (labels['is_after_holiday'] == 1)
+    labels['kind'] = np.select(
+        [labels['is_holiday'] == 1, labels['is_weekend'] == 1, adjacent],
+        ['holiday', 'weekend', 'adjacent'], default='baseline'
+    )
+    labels['day_type'] = np.select(
+        [labels['is_holiday'] == 1, labels['is_weekend'] == 1, adjacent],
+        [labels['holiday_name'], WEEKEND, ADJACENT], default=BASELINE
+    )
+    return labels
+
+
+def bootstrap_group_means(values, codes, n_boot=1000, seed=0, batch_size=200):
+    """그룹별 평균의 부트스트랩 분포 (그룹 안에서 복원추출)
+
+    값을 그룹 순서로 정렬해 두고 (batch, n) 균등난수 행렬 하나로 모든 그룹의 재표본
+    위치를 한 번에 만든 뒤, np.add.reduceat 으로 그룹 구간 합을 구한다.
+
+    Parameters:
+    - values: (n,) 값 배열
+    - codes: (n,) 0..G-1 그룹 번호 (모든 그룹에 관측치가 1개 이상)
+    - n_boot: 부트스트랩 반복 횟수
+    - seed: 난수 시드
+    - batch_size: 한 번에 만드는 반복 수 (메모리는 batch_size × n 으로 제한)
+
+    Returns:
+    - (n_boot, G) 그룹 평균 배열
+    """
+    values = np.asarray(values, dtype=float)
+    codes = np.asarray(codes, dtype=np.int64)
+    order = np.argsort(codes, kind='stable')
+    sorted_values = values[order]
+    sorted_codes = codes[order]
+
+    sizes = np.bincount(codes)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    row_start = starts[sorted_codes]
+    row_size = sizes[sorted_codes]
+
+    rng = np.random.default_rng(seed)
+    means = np.empty((n_boot, len(sizes)))
+    for begin in range(0, n_boot, batch_size):
+        batch = min(batch_size, n_boot - begin)
+        positions = row_start + np.floor(rng.random((batch, len(values))) * row_size).astype(np.int64)
+        means[begin:begin + batch] = np.add.reduceat(sorted_values[positions], starts, axis=1) / sizes
+    return means
+
+
+def holiday_impact(df, value_col='최대전력(MW)', date_col='date', holidays=None,
+                   n_boot=1000, alpha=0.05, seed=0):
+    """평일 대비 공휴일·주말·공휴일 전후 수요 효과와 부트스트랩 신뢰구간
+
+    공휴일 달력을 merge_asof 한 번으로 붙여 일 유형을 정하고, 일 유형별 groupby 한 번으로
+    기본 통계를 구한다. 효과는 평일(공휴일·주말·공휴일 전후 제외) 평균과의 차이이며,
+    '공휴일' 행은 공휴일별 평균을 일수로 가중한 층화 추정치다.
+
+    Parameters:
+    - df: 날짜와 값 컬럼을 포함한 DataFrame
+    - value_col: 분석할 값 컬럼
+    - date_col: 날짜 컬럼
+    - holidays: holiday_calendar() 형식 공휴일 달력 (None이면 데이터 기간으로 생성)
+    - n_boot: 부트스트랩 반복 횟수
+    - alpha: 신뢰구간 유의수준 (0.05 → 95% 구간)
+    - seed: 난수 시드
+
+    Returns:
+    - dict: table (index=day_type, kind, count, mean, std, effect_mw, effect_pct 및 각 *_low/*_high,
+      cohens_d), labels (df 행 순서의 day_types 결과)
+    """
+    labels = day_types(df, date_col, holidays)
+    values = df[value_col].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+
+    group_codes, groups = pd.factorize(labels['day_type'].to_numpy()[valid])
+    stats = pd.Series(values[valid]).groupby(group_codes).agg(['count', 'mean', 'std'])
+    stats.index = pd.Index(groups[stats.index], name='day_type')
+    stats['kind'] = labels['kind'].to_numpy()[valid][np.unique(group_codes, return_index=True)[1]]
+
+    if BASELINE not in stats.index:
+        raise ValueError("평일(공휴일·주말·공휴일 전후 제외) 관측치가 없어 효과를 계산할 수 없습니다.")
+
+    boot = pd.DataFrame(bootstrap_group_means(values[valid], group_codes, n_boot, seed), columns=stats.index)
+
+    # 공휴일 전체: 공휴일별 평균을 일수로 가중 (층화 부트스트랩)
+    holiday_stats = stats[stats['kind'] == 'holiday']
+    if len(holiday_stats):
+        weights = holiday_stats['count'] / holiday_stats['count'].sum()
+        total = holiday_stats['count'].sum()
+        mean = (holiday_stats['mean'] * weights).sum()
+        ss = ((holiday_stats['count'] - 1) * holiday_stats['std'].fillna(0) ** 2
+              + holiday_stats['count'] * (holiday_stats['mean'] - mean) ** 2).sum()
+        combined = pd.DataFrame({'count': [total], 'mean': [mean],
+                                 'std': [np.sqrt(ss / (total - 1)) if total > 1 else np.nan],
+                                 'kind': ['all_holidays']}, index=pd.Index([ALL_HOLIDAYS], name='day_type'))
+        stats = pd.concat([stats, combined])
+        boot[ALL_HOLIDAYS] = boot[holiday_stats.index].to_numpy() @ weights.to_numpy()
+
+    base = stats.loc[BASELINE]
+    effect = boot.sub(boot[BASELINE], axis=0)
+    effect_pct = effect.div(boot[BASELINE], axis=0) * 100
+    q = [100 * alpha / 2, 100 * (1 - alpha / 2)]
+
+    table = stats[['kind', 'count', 'mean', 'std']].copy()
+    table['count'] = table['count'].astype(int)
+    table['effect_mw'] = table['mean'] - base['mean']
+    table[['effect_mw_low', 'effect_mw_high']] = np.percentile(effect.to_numpy(), q, axis=0).T
+    table['effect_pct'] = table['effect_mw'] / base['mean'] * 100
+    table[['effect_pct_low', 'effect_pct_high']] = np.percentile(effect_pct.to_numpy(), q, axis=0).T
+
+    # 평일과의 합동 표준편차 기준 효과 크기
+    pooled = np.sqrt(((table['count'] - 1) * table['std'] ** 2 + (base['count'] - 1) * base['std'] ** 2)
+                     / (table['count'] + base['count'] - 2))
+    table['cohens_d'] = table['effect_mw'] / pooled
+
+    kind_order = {'baseline': 0, 'weekend': 1, 'adjacent': 2, 'all_holidays': 3, 'holiday': 4}
+    table = table.assign(_order=table['kind'].map(kind_order)).sort_values(['_order', 'effect_pct'])
+    return {'table': table.drop(columns='_order'), 'labels': labels}
@@ -0,0 +1,163 @@
+"""
+증분(온라인) 특성 상태 관리
+"""
+from collections import deque
+from itertools import islice
+import numpy as np
+import pandas as pd
+
+
+class IncrementalFeatureState:
+    """새 데이터가 들어올 때 핵심 파생 변수를 새 행에 대해서만 계산하는 클래스
+
+    preprocessing/03_derived_variables/core_derived_features.py 의
+    lag_1day, lag_7day, rolling_7day_mean, rolling_30day_mean, daily_change 와
+    동일한 정의를 사용하며, 최근 값만 링 버퍼에 보관하고 rolling 평균은
+    창별 누적합으로 유지하여 행당 O(1)로 갱신한다.
+    forecast_safe=True 이면 daily_change 를 어제 - 그제로 계산한다.
+    """
+
+    FEATURE_COLUMNS = ['lag_1day', 'lag_7day', 'rolling_7day_mean', 'rolling_30day_mean', 'daily_change']
+    ROLLING_WINDOWS = (7, 30)
+
+    def __init__(self, target_col='최대전력(MW)', date_col='date', buffer_size=30, forecast_safe=False):
+        if buffer_size < 30:
+            raise ValueError(f"buffer_size는 최소 30이어야 합니다: {buffer_size}")
+
+        self.target_col = target_col
+        self.date_col = date_col
+        self.buffer_size = buffer_size
+        self.forecast_safe = forecast_safe
+
+        # 링 버퍼 (가장 오래된 값 → 가장 최근 값)
+        self.buffer = deque(maxlen=buffer_size)
+        self.last_date = None
+        # 창별 [결측 제외 합계, 유효 개수]
+        self._window_sums = {window: [0.0, 0] for window in self.ROLLING_WINDOWS}
+
+    def _reset(self):
+        self.buffer.clear()
+        self._window_sums = {window: [0.0, 0] for window in self.ROLLING_WINDOWS}
+
+    def push(self, value, date=None):
+        """값 하나를 버퍼에 추가하고 rolling 누적합 갱신 (O(1))"""
+        value = float(value)
+        for window, sums in self._window_sums.items():
+            # 창에서 빠지는 값 (추가 전 버퍼 끝에서 window번째)
+            if len(self.buffer) >= window:
+                leaving = self.buffer[-window]
+                if not np.isnan(leaving):
+                    sums[0] -= leaving
+                    sums[1] -= 1
+            if not np.isnan(value):
+                sums[0] += value
+                sums[1] += 1
+        self.buffer.append(value)
+        if date is not None:
+            self.last_date = pd.Timestamp(date)
+
+    def fit(self, df):
+        """과거 데이터의 마지막 구간으로 버퍼 초기화"""
+        df = df[[self.date_col, self.target_col]].copy()
+        df[self.date_col] = pd.to_datetime(df[self.date_col])
+        df = df.sort_values(self.date_col)
+
+        self._reset()
+        for value in df[self.target_col].tail(self.buffer_size).astype(float).to_numpy():
+            self.push(value)
+        self.last_date = df[self.date_col].iloc[-1] if len(df) > 0 else None
+        return self
+
+    def _window_mean(self, window):
+        """버퍼 끝에서 window개 값의 평균 (rolling(min_periods=1)과 동일하게 결측 무시)"""
+        if len(self.buffer) == 0:
+            return np.nan
+        if window in self._window_sums:
+            total, count = self._window_sums[window]
+            return total / count if count > 0 else np.nan
+        start = max(0, len(self.buffer) - window)
+        values = np.fromiter(islice(self.buffer, start, None), dtype=float)
+        valid = values[~np.isnan(values)]
+        return float(valid.mean()) if len(valid) > 0 else np.nan
+
+    def _lag(self, lag):
+        """버퍼 기준 lag일 전 값"""
+        return self.buffer[-lag] if len(self.buffer) >= lag else np.nan
+
+    def current_features(self):
+        """다음 날(버퍼 다음 행)에 해당하는 lag/rolling 피처 계산"""
+        return {
+            'lag_1day': self._lag(1),
+            'lag_7day': self._lag(7),
+            'rolling_7day_mean': self._window_mean(7),
+            'rolling_30day_mean': self._window_mean(30),
+        }
+
+    def next_features(self):
+        """다음 날 타겟을 모르는 상태에서의 5개 파생 변수 (daily_change = 어제 - 그제)"""
+        features = self.current_features()
+        features['daily_change'] = features['lag_1day'] - self._lag(2)
+        return features
+
+    def update(self, new_rows):
+        """새 행들에 대한 파생 변수를 계산하고 상태를 갱신
+
+        Parameters:
+        - new_rows: date_col, target_col 을 포함한 DataFrame (마지막 날짜 이후 데이터)
+
+        Returns:
+        - DataFrame: new_rows 에 5개 파생 변수가 추가된 데이터프레임
+        """
+        df_new = new_rows.copy()
+        df_new[self.date_col] = pd.to_datetime(df_new[self.date_col])
+        df_new = df_new.sort_values(self.date_col).reset_index(drop=True)
+
+        if self.last_date is not None and len(df_new) > 0 and df_new[self.date_col].iloc[0] <= self.last_date:
+            raise ValueError(
+                f"새 데이터는 마지막 날짜({self.last_date.date()}) 이후여야 합니다: "
+                f"{df_new[self.date_col].iloc[0].date()}"
+            )
+
+        rows = []
+        for value in df_new[self.target_col].astype(float).to_numpy():
+            if self.forecast_safe:
+                features = self.next_features()
+            else:
+                features = self.current_features()
+                features['daily_change'] = value - features['lag_1day']
+            rows.append(features)
+            self.push(value)
+
+        if len(df_new) > 0:
+            self.last_date = df_new[self.date_col].iloc[-1]
+
+        features_df = pd.DataFrame(rows, columns=self.FEATURE_COLUMNS, index=df_new.index)
+        for col in self.FEATURE_COLUMNS:
+            df_new[col] = features_df[col]
+
+        return df_new
+
+    def to_dict(self):
+        """상태를 JSON 직렬화 가능한 형태로 변환"""
+        return {
+            'target_col': self.target_col,
+            'date_col': self.date_col,
+            'buffer_size': self.buffer_size,
+            'forecast_safe': self.forecast_safe,
+            'buffer': [None if np.isnan(v) else float(v) for v in self.buffer],
+            'last_date': self.last_date.strftime('%Y-%m-%d') if self.last_date is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """to_dict 결과로부터 상태 복원"""
+        obj = cls(
+            target_col=state['target_col'],
+            date_col=state['date_col'],
+            buffer_size=state['buffer_size'],
+            forecast_safe=state.get('forecast_safe', False)
+        )
+        for v in state['buffer']:
+            obj.push(np.nan if v is None else v)
+        obj.last_date = pd.Timestamp(state['last_date']) if state['last_date'] else None
+        return obj
@@ -0,0 +1,84 @@
+"""
+미래 정보 누출(leakage) 감사
+"""
+import numpy as np
+import pandas as pd
+
+from ..utils.stats import masked_corr
+from .engineering import TIME_FEATURE_COLUMNS
+
+
+def _innovation(y, lags=(1, 7)):
+    """과거 값(lags)으로 설명되지 않는 타겟의 혁신(잔차) 성분"""
+    y = np.asarray(y, dtype=float)
+    max_lag = max(lags)
+    n = len(y)
+
+    design = np.column_stack(
+        [np.ones(n)] + [np.concatenate([np.full(lag, np.nan), y[:-lag]]) for lag in lags]
+    )
+    valid = ~np.isnan(design).any(axis=1) & ~np.isnan(y)
+    valid[:max_lag] = False
+
+    resid = np.full(n, np.nan)
+    if valid.sum() > design.shape[1]:
+        coef, *_ = np.linalg.lstsq(design[valid], y[valid], rcond=None)
+        resid[valid] = y[valid] - design[valid] @ coef
+    return resid
+
+
+def audit_feature_leakage(df, target_col, feature_cols=None, horizons=(0, 1, 7),
+                          innovation_lags=(1, 7), threshold=0.3, known_future=TIME_FEATURE_COLUMNS):
+    """각 피처가 예측 시점 이후의 타겟 정보를 담고 있는지 점검
+
+    t행의 피처는 t-1일까지의 정보만 사용해야 한다. 타겟에서 과거 값
+    (innovation_lags)으로 설명되는 부분을 제거한 혁신 성분과의 상관을
+    피처 수준값과 1차 차분 모두에 대해 계산하고, 그 절댓값이 threshold를
+    넘으면 누출 의심으로 표시한다. 미래 타겟(t+h)과의 원 상관도 함께 보고한다.
+
+    Parameters:
+    - df: 날짜순으로 정렬된 DataFrame
+    - target_col: 타겟 컬럼명
+    - feature_cols: 점검할 컬럼 (None이면 타겟을 제외한 모든 수치형 컬럼)
+    - horizons: 원 상관을 보고할 미래 시점 목록 (0 = 당일 타겟)
+    - innovation_lags: 혁신 성분 계산에 사용할 타겟 래그
+    - threshold: 누출 판정 기준 상관계수
+    - known_future: 예측 시점에 미리 알 수 있어 점검하지 않을 컬럼 (기본값: 달력 컬럼).
+      요일·주말 같은 달력 피처는 차분이 월/토요일에 튀어 혁신 성분과 상관이 커 보일 수 있다.
+
+    Returns:
+    - DataFrame: 피처별 상관 지표와 flagged 여부 (leak_score 내림차순)
+    """
+    if feature_cols is None:
+        feature_cols = [
+            col for col in df.select_dtypes(include=[np.number, 'bool']).columns
+            if col != target_col
+        ]
+    skip = set(known_future or ())
+    feature_cols = [col for col in feature_cols if col not in skip]
+
+    X = df[feature_cols].to_numpy(dtype=float)
+    y = df[target_col].to_numpy(dtype=float)
+    n = len(y)
+
+    # 미래 타겟 행렬: 열 h는 y[t+h]
+    future = np.column_stack([
+        np.concatenate([y[h:], np.full(h, np.nan)]) for h in horizons
+    ])
+    raw_corr = masked_corr(X, future)
+
+    # 혁신 성분과의 상관 (수준 / 1차 차분)
+    innovation = _innovation(y, innovation_lags)
+    X_diff = np.vstack([np.full((1, X.shape[1]), np.nan), np.diff(X, axis=0)]) if n > 0 else X
+    level_corr = masked_corr(X, innovation)[:, 0]
+    diff_corr = masked_corr(X_diff, innovation)[:, 0]
+
+    report = pd.DataFrame(index=pd.Index(feature_cols, name='feature'))
+    for i, h in enumerate(horizons):
+        report[f'corr_target_t+{h}'] = raw_corr[:, i]
+    report['innovation_corr'] = level_corr
+    report['innovation_corr_diff'] = diff_corr
+    report['leak_score'] = np.fmax(np.abs(level_corr), np.abs(diff_corr))
+    report['flagged'] = report['leak_score'] > threshold
+
+    return report.sort_values('leak_score', ascending=False)
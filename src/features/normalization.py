@@ -0,0 +1,347 @@
+"""
+벡터화 피처 정규화 (fit / transform / inverse_transform 분리)
+"""
+import json
+import warnings
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+# 스케일러 이름은 기존 scaling_metadata.json 과의 호환을 위해 sklearn 클래스명을 사용
+SCALER_TYPES = ('StandardScaler', 'MinMaxScaler', 'RobustScaler', 'PowerTransformer')
+
+# Yeo-Johnson λ 탐색 격자
+YJ_LAMBDA_GRID = np.linspace(-3.0, 3.0, 121)
+
+
+def yeo_johnson(X, lmbda):
+    """Yeo-Johnson 변환 (lmbda는 열별 값으로 브로드캐스팅)"""
+    X, lmbda = np.broadcast_arrays(np.asarray(X, dtype=float), np.asarray(lmbda, dtype=float))
+    pos = X >= 0
+    out = np.full(X.shape, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        lam_zero = np.abs(lmbda) < 1e-8
+        lam_two = np.abs(lmbda - 2) < 1e-8
+
+        out = np.where(pos & lam_zero, np.log1p(X), out)
+        out = np.where(pos & ~lam_zero, (np.power(X + 1, lmbda) - 1) / lmbda, out)
+        out = np.where(~pos & lam_two, -np.log1p(-X), out)
+        out = np.where(~pos & ~lam_two, -(np.power(1 - X, 2 - lmbda) - 1) / (2 - lmbda), out)
+
+    return np.where(np.isnan(X), np.nan, out)
+
+
+def inverse_yeo_johnson(Y, lmbda):
+    """Yeo-Johnson 역변환"""
+    Y, lmbda = np.broadcast_arrays(np.asarray(Y, dtype=float), np.asarray(lmbda, dtype=float))
+    pos = Y >= 0
+    out = np.full(Y.shape, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        lam_zero = np.abs(lmbda) < 1e-8
+        lam_two = np.abs(lmbda - 2) < 1e-8
+
+        out = np.where(pos & lam_zero, np.expm1(Y), out)
+        out = np.where(pos & ~lam_zero, np.power(Y * lmbda + 1, 1 / lmbda) - 1, out)
+        out = np.where(~pos & lam_two, -np.expm1(-Y), out)
+        out = np.where(~pos & ~lam_two, 1 - np.power(1 - (2 - lmbda) * Y, 1 / (2 - lmbda)), out)
+
+    return np.where(np.isnan(Y), np.nan, out)
+
+
+def fit_yeo_johnson_lambda(X, grid=YJ_LAMBDA_GRID):
+    """열별 Yeo-Johnson λ를 격자 위 로그우도 최대화로 한 번에 추정"""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+
+    n = np.sum(~np.isnan(X), axis=0)
+    log_term = np.nansum(np.sign(X) * np.log1p(np.abs(X)), axis=0)
+
+    # (격자, 행, 열) 한 번에 변환 후 열별 분산
+    transformed = yeo_johnson(X[None, :, :], grid[:, None, None])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_var = np.log(np.nanvar(transformed, axis=1))
+    loglik = -0.5 * n[None, :] * log_var + (grid[:, None] - 1) * log_term[None, :]
+    loglik = np.where(np.isfinite(loglik), loglik, -np.inf)
+
+    return grid[np.argmax(loglik, axis=0)]
+
+
+# 스케일러 자동 선택 규칙 (위에서부터 처음 만족하는 규칙 적용, 모두 불만족 시 StandardScaler)
+# (스케일러, 조건 함수(통계표 → bool 배열), 사유 형식)
+SCALER_RULES = (
+    ('RobustScaler', lambda s: s['outlier_ratio'] > 0.1, "RobustScaler (outlier_ratio: {outlier_ratio:.3f})"),
+    ('PowerTransformer', lambda s: s['skew'].abs() > 2, "PowerTransformer (skewness: {abs_skew:.3f})"),
+    ('MinMaxScaler', lambda s: (s['range'] < 100) & (s['min'] >= 0), "MinMaxScaler (range: {range:.1f})"),
+)
+DEFAULT_SCALER = ('StandardScaler', "StandardScaler (default)")
+
+
+def column_stats(data, columns=None):
+    """열별 분포 통계표를 행렬 한 번의 스캔으로 계산
+
+    Parameters:
+    - data: DataFrame 또는 2차원 배열 (행: 관측치, 열: 피처)
+    - columns: 사용할 컬럼 (DataFrame이면 기본값 전체 컬럼)
+
+    Returns:
+    - DataFrame: 인덱스는 피처명, 컬럼은 count, mean, std, min, q1, median, q3, max,
+                 iqr, range, skew, kurtosis, outlier_ratio (결측값은 제외하고 계산)
+    """
+    if isinstance(data, pd.DataFrame):
+        columns = list(data.columns) if columns is None else list(columns)
+        X = data[columns].to_numpy(dtype=float)
+    else:
+        X = np.asarray(data, dtype=float)
+        if X.ndim == 1:
+            X = X[:, None]
+        columns = list(range(X.shape[1])) if columns is None else list(columns)
+
+    valid = ~np.isnan(X)
+    count = valid.sum(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        # 유효값이 없는 열은 NaN 통계 (All-NaN 경고 무시)
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        # 분위수 (최솟값·최댓값 포함) 한 번에 계산
+        col_min, q1, median, q3, col_max = np.nanpercentile(X, [0, 25, 50, 75, 100], axis=0)
+
+        # 중심 모멘트 2~4차를 같은 편차 행렬에서 계산
+        mean = np.nansum(X, axis=0) / count
+        dev = np.where(valid, X - mean, 0.0)
+        dev2 = dev * dev
+        m2 = dev2.sum(axis=0) / count
+        m3 = (dev2 * dev).sum(axis=0) / count
+        m4 = (dev2 * dev2).sum(axis=0) / count
+
+        # pandas와 같은 표본 보정 표준편차·왜도·첨도
+        std = np.sqrt(m2 * count / (count - 1))
+        g1 = m3 / m2 ** 1.5
+        skew = np.sqrt(count * (count - 1)) / (count - 2) * g1
+        g2 = m4 / m2 ** 2 - 3
+        kurtosis = (count - 1) / ((count - 2) * (count - 3)) * ((count + 1) * g2 + 6)
+
+        iqr = q3 - q1
+        outliers = ((X < q1 - 1.5 * iqr) | (X > q3 + 1.5 * iqr)).sum(axis=0)
+        outlier_ratio = outliers / count
+
+    return pd.DataFrame({
+        'count': count,
+        'mean': mean,
+        'std': std,
+        'min': col_min,
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'max': col_max,
+        'iqr': iqr,
+        'range': col_max - col_min,
+        'skew': np.nan_to_num(skew),
+        'kurtosis': np.nan_to_num(kurtosis),
+        'outlier_ratio': np.nan_to_num(outlier_ratio),
+    }, index=pd.Index(columns, name='feature'))
+
+
+def select_scalers(stats, rules=SCALER_RULES, default=DEFAULT_SCALER):
+    """통계표에 규칙을 한 번에 적용하여 열별 스케일러 선택
+
+    Parameters:
+    - stats: column_stats 결과
+    - rules: (스케일러, 조건 함수, 사유 형식) 목록, 앞의 규칙이 우선
+    - default: 모든 규칙이 불만족일 때의 (스케일러, 사유)
+
+    Returns:
+    - DataFrame: scaler_type, reason 컬럼 (유효 데이터가 없는 열은 scaler_type이 None)
+    """
+    conditions = [np.asarray(condition(stats), dtype=bool) for _, condition, _ in rules]
+    scaler_types = np.select(conditions, [name for name, _, _ in rules], default=default[0]).astype(object)
+
+    # 사유 문자열은 선택된 규칙의 형식에 통계값을 채워 생성
+    formats = {name: fmt for name, _, fmt in rules}
+    formats[default[0]] = default[1]
+    values = stats.assign(abs_skew=stats['skew'].abs()).to_dict('records')
+    reasons = [formats[scaler].format(**row) for scaler, row in zip(scaler_types, values)]
+
+    selection = pd.DataFrame({'scaler_type': scaler_types, 'reason': reasons}, index=stats.index)
+    empty = stats['count'].to_numpy() == 0
+    selection.loc[empty, 'scaler_type'] = None
+    selection.loc[empty, 'reason'] = "No valid data"
+    return selection
+
+
+class FeatureNormalizer:
+    """열별 스케일러를 자동 선택하고 하나의 행렬 연산으로 적용하는 정규화 클래스
+
+    변환은 (PowerTransformer 열에만 Yeo-Johnson) → (X - center) / scale 의
+    열별 아핀 변환이며, 파라미터(center, scale, λ)만 JSON으로 저장한다.
+    """
+
+    def __init__(self, methods=None):
+        # methods: {컬럼: 스케일러명} 으로 자동 선택을 덮어쓸 수 있음
+        self.methods_override = dict(methods or {})
+        self.columns = []
+        self.methods = []
+        self.reasons = []
+        self.center = None
+        self.scale = None
+        self.lmbda = None
+        self.is_fitted = False
+
+    def fit(self, df, columns):
+        """df[columns]로 스케일러 선택 및 파라미터 추정 (결측값은 무시)"""
+        self.columns = list(columns)
+        X = df[self.columns].to_numpy(dtype=float)
+
+        stats = column_stats(X, self.columns)
+        selection = select_scalers(stats)
+        methods = selection['scaler_type'].to_numpy(dtype=object)
+        reasons = selection['reason'].tolist()
+        # 유효 데이터가 없는 열은 항등 변환 (scale=1, center=0)
+        methods[pd.isna(methods)] = 'StandardScaler'
+        for i, col in enumerate(self.columns):
+            if col in self.methods_override:
+                methods[i] = self.methods_override[col]
+                reasons[i] = f"{methods[i]} (지정)"
+        unknown = set(methods) - set(SCALER_TYPES)
+        if unknown:
+            raise ValueError(f"지원하지 않는 스케일러입니다: {sorted(unknown)}")
+
+        count = stats['count'].to_numpy()
+        stats = {key: stats[key].to_numpy() for key in ('mean', 'std', 'min', 'range', 'median', 'iqr')}
+        center = stats['mean'].copy()
+        # sklearn StandardScaler와 같은 모표준편차 (ddof=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = stats['std'] * np.sqrt((count - 1) / count)
+        lmbda = np.ones(len(self.columns))  # λ=1 은 항등 변환
+
+        is_minmax = methods == 'MinMaxScaler'
+        center[is_minmax] = stats['min'][is_minmax]
+        scale[is_minmax] = stats['range'][is_minmax]
+
+        is_robust = methods == 'RobustScaler'
+        center[is_robust] = stats['median'][is_robust]
+        scale[is_robust] = stats['iqr'][is_robust]
+
+        is_power = methods == 'PowerTransformer'
+        if is_power.any():
+            lmbda[is_power] = fit_yeo_johnson_lambda(X[:, is_power])
+            transformed = yeo_johnson(X[:, is_power], lmbda[is_power])
+            center[is_power] = np.nanmean(transformed, axis=0)
+            scale[is_power] = np.nanstd(transformed, axis=0)
+
+        # 분산이 0인 열은 sklearn과 같이 scale=1
+        scale = np.where((scale == 0) | ~np.isfinite(scale), 1.0, scale)
+        center = np.nan_to_num(center)
+
+        self.methods = list(methods)
+        self.reasons = reasons
+        self.center = center
+        self.scale = scale
+        self.lmbda = lmbda
+        self.is_fitted = True
+        return self
+
+    def _check_fitted(self):
+        if not self.is_fitted:
+            raise RuntimeError("FeatureNormalizer가 학습되지 않았습니다. fit()을 먼저 호출하세요.")
+
+    def _column_index(self, df):
+        """df에 존재하는 학습 컬럼과 그 파라미터 위치"""
+        idx = [i for i, col in enumerate(self.columns) if col in df.columns]
+        return [self.columns[i] for i in idx], np.array(idx, dtype=int)
+
+    def transform(self, df):
+        """학습된 파라미터로 변환 (df에 있는 학습 컬럼만, 결측값은 그대로 유지)"""
+        self._check_fitted()
+        columns, idx = self._column_index(df)
+        df_out = df.copy()
+        if len(columns) == 0:
+            return df_out
+
+        df_out[columns] = self._transform_values(df_out[columns].to_numpy(dtype=float), idx)
+        return df_out
+
+    def _transform_values(self, X, idx):
+        """idx 위치 파라미터로 배열 변환 (X의 마지막 축이 idx 순서)"""
+        X = np.array(X, dtype=float)
+        power = np.array([self.methods[i] == 'PowerTransformer' for i in idx], dtype=bool)
+        if power.any():
+            X[..., power] = yeo_johnson(X[..., power], self.lmbda[idx][power])
+        return (X - self.center[idx]) / self.scale[idx]
+
+    def transform_array(self, X, columns):
+        """DataFrame 없이 배열 변환 (예: 재귀 예측 중 한 행씩 변환)
+
+        Parameters:
+        - X: (..., len(columns)) 배열
+        - columns: X 마지막 축의 컬럼명 (모두 학습 컬럼이어야 함)
+        """
+        self._check_fitted()
+        missing = [c for c in columns if c not in self.columns]
+        if missing:
+            raise ValueError(f"학습되지 않은 컬럼입니다: {missing}")
+        idx = np.array([self.columns.index(c) for c in columns], dtype=int)
+        return self._transform_values(X, idx)
+
+    def fit_transform(self, df, columns):
+        """fit 후 transform"""
+        return self.fit(df, columns).transform(df)
+
+    def inverse_transform(self, df):
+        """정규화된 값을 원래 스케일로 복원"""
+        self._check_fitted()
+        columns, idx = self._column_index(df)
+        df_out = df.copy()
+        if len(columns) == 0:
+            return df_out
+
+        X = df_out[columns].to_numpy(dtype=float) * self.scale[idx] + self.center[idx]
+        power = np.array([self.methods[i] == 'PowerTransformer' for i in idx])
+        if power.any():
+            X[:, power] = inverse_yeo_johnson(X[:, power], self.lmbda[idx][power])
+
+        df_out[columns] = X
+        return df_out
+
+    def to_dict(self):
+        """JSON 직렬화 가능한 파라미터"""
+        self._check_fitted()
+        return {
+            'columns': self.columns,
+            'methods': self.methods,
+            'reasons': self.reasons,
+            'center': self.center.tolist(),
+            'scale': self.scale.tolist(),
+            'lambda': self.lmbda.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, params):
+        """to_dict 결과로부터 복원"""
+        obj = cls()
+        obj.columns = list(params['columns'])
+        obj.methods = list(params['methods'])
+        obj.reasons = list(params.get('reasons', obj.methods))
+        obj.center = np.asarray(params['center'], dtype=float)
+        obj.scale = np.asarray(params['scale'], dtype=float)
+        obj.lmbda = np.asarray(params['lambda'], dtype=float)
+        obj.is_fitted = True
+        return obj
+
+    def save(self, filepath):
+        """파라미터를 JSON으로 저장"""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath):
+        """JSON 파라미터 로딩"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
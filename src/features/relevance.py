@@ -0,0 +1,170 @@
+"""
+피처 관련도 (타겟 상관, 상호정보량, 래그 교차상관) 벡터화 계산 및 상위 k개 선택
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from ..utils.stats import block_corr, standardize
+
+DEFAULT_LAGS = (1, 7, 14, 30, 365)
+
+
+def _quantile_bins(X, n_bins):
+    """열별 분위수 경계 기반 등빈도 구간 번호 (결측값은 -1)
+
+    경계는 np.nanquantile 로 정하고 값이 경계보다 큰 개수로 구간을 매기므로, 같은 값은
+    항상 같은 구간에 들어간다 (이진·정수·상수 열도 행 순서와 무관하게 값으로만 구간화).
+    """
+    X = np.asarray(X, dtype=float)
+    valid = ~np.isnan(X)
+    quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+    with warnings.catch_warnings():
+        # 전부 결측인 열의 경계는 NaN (해당 열은 모두 -1)
+        warnings.simplefilter('ignore', RuntimeWarning)
+        edges = np.nanquantile(X, quantiles, axis=0)
+
+    bins = np.zeros(X.shape, dtype=np.int64)
+    with np.errstate(invalid='ignore'):
+        for edge in edges:
+            bins += X > edge
+    return np.where(valid, bins, -1)
+
+
+def check_mutual_information(n=1000, n_bins=16, seed=0):
+    """상호정보량 구간화 점검: 상수 열은 MI ≈ 0, 0/1 열은 MI ≤ ln 2 (추세가 있는 타겟 기준)
+
+    구간이 값이 아닌 행 순서를 따르면 두 조건이 모두 깨지므로 순위 계산 전에 확인한다.
+    """
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 10, n) + rng.normal(size=n)
+    X = np.column_stack([np.ones(n), np.arange(n) % 7 >= 5])
+    mi = mutual_information(X, y, n_bins=n_bins)
+    if not (abs(mi[0]) < 1e-9 and mi[1] <= np.log(2) + 1e-9):
+        raise ValueError(f"상호정보량 구간화 점검 실패: 상수 열 {mi[0]:.4f}, 0/1 열 {mi[1]:.4f} (상한 {np.log(2):.4f})")
+    return mi
+
+
+def mutual_information(X, y, n_bins=16, block_size=256):
+    """각 열과 y 의 상호정보량 (등빈도 구간화 + 한 번의 bincount 로 열 블록의 결합 분포 계산)
+
+    Returns:
+    - (p,) 상호정보량 배열 (nats, 유효 쌍이 없으면 NaN)
+    """
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    y_bins = _quantile_bins(np.asarray(y, dtype=float)[:, None], n_bins)[:, 0]
+    p = X.shape[1]
+    mi = np.full(p, np.nan)
+    cells = n_bins * n_bins
+
+    for start in range(0, p, block_size):
+        x_bins = _quantile_bins(X[:, start:start + block_size], n_bins)
+        width = x_bins.shape[1]
+        valid = (x_bins >= 0) & (y_bins >= 0)[:, None]
+        # 열마다 n_bins² 칸씩 떨어진 결합 구간 번호로 바꿔 한 번에 셈
+        codes = x_bins * n_bins + y_bins[:, None] + np.arange(width) * cells
+        counts = np.bincount(codes[valid], minlength=width * cells).reshape(width, n_bins, n_bins).astype(float)
+
+        total = counts.sum(axis=(1, 2), keepdims=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pxy = counts / total
+            px = pxy.sum(axis=2, keepdims=True)
+            py = pxy.sum(axis=1, keepdims=True)
+            terms = np.where(pxy > 0, pxy * np.log(pxy / (px * py)), 0.0)
+        block = terms.sum(axis=(1, 2))
+        block[total[:, 0, 0] == 0] = np.nan
+        mi[start:start + width] = block
+
+    return mi
+
+
+def lagged_cross_correlations(X, y, lags=DEFAULT_LAGS, dtype=np.float32):
+    """corr(x_{t-k}, y_t) 를 래그별로 계산 (래그마다 표준화 열의 행렬곱 한 번)
+
+    Returns:
+    - (p, len(lags)) 상관계수 배열
+    """
+    Zx, Mx = standardize(X, dtype)
+    Zy, My = standardize(y, dtype)
+    Zy2 = Zy * Zy
+    corr = np.full((Zx.shape[1], len(lags)), np.nan, dtype=dtype)
+
+    for j, lag in enumerate(lags):
+        if lag >= len(Zy):
+            continue
+        # x 는 앞쪽 n-lag 행, y 는 뒤쪽 n-lag 행을 맞춤
+        zx, mx = Zx[:len(Zx) - lag], Mx[:len(Mx) - lag]
+        zy, my, zy2 = Zy[lag:], My[lag:], Zy2[lag:]
+        n = mx.T @ my
+        with np.errstate(invalid='ignore', divide='ignore'):
+            column = (zx.T @ zy) / np.sqrt(((zx * zx).T @ my) * (mx.T @ zy2))
+        column[(n < 2) | ~np.isfinite(column)] = np.nan
+        corr[:, j] = column[:, 0]
+
+    return np.clip(corr, -1.0, 1.0)
+
+
+def feature_relevance(df, target_col, feature_cols=None, lags=DEFAULT_LAGS, n_bins=16, block_size=256):
+    """피처별 타겟 관련도 표
+
+    Parameters:
+    - df: 날짜순으로 정렬된 DataFrame
+    - target_col: 타겟 컬럼명
+    - feature_cols: 대상 컬럼 (None이면 타겟을 제외한 모든 수치형 컬럼)
+    - lags: 래그 교차상관을 계산할 래그 목록
+    - n_bins: 상호정보량 구간 수
+    - block_size: 열 블록 크기 (메모리 사용량 제한)
+
+    Returns:
+    - dict: table (피처별 corr, abs_corr, mutual_info, best_lag, best_lag_corr 및 순위,
+      abs_corr 내림차순), lag_corr (피처 × 래그 DataFrame)
+    """
+    if feature_cols is None:
+        feature_cols = [
+            col for col in df.select_dtypes(include=[np.number, 'bool']).columns
+            if col != target_col
+        ]
+
+    X = df[feature_cols].to_numpy(dtype=float)
+    y = df[target_col].to_numpy(dtype=float)
+    index = pd.Index(feature_cols, name='feature')
+
+    corr = block_corr(X, y, block_size=block_size)[:, 0]
+    mi = mutual_information(X, y, n_bins=n_bins, block_size=block_size)
+    lag_corr = pd.DataFrame(lagged_cross_correlations(X, y, lags), index=index,
+                            columns=pd.Index(list(lags), name='lag'))
+
+    # 피처별 |상관|이 가장 큰 래그
+    values = lag_corr.to_numpy(dtype=float)
+    strength = np.where(np.isnan(values), -np.inf, np.abs(values))
+    best = strength.argmax(axis=1)
+    has_lag = np.isfinite(strength).any(axis=1)
+
+    table = pd.DataFrame({
+        'corr': corr.astype(float),
+        'abs_corr': np.abs(corr).astype(float),
+        'mutual_info': mi,
+    }, index=index)
+    table['best_lag'] = np.where(has_lag, np.asarray(lags)[best], np.nan)
+    table['best_lag_corr'] = np.where(has_lag, values[np.arange(len(values)), best], np.nan)
+    table['corr_rank'] = table['abs_corr'].rank(ascending=False, method='min')
+    table['mi_rank'] = table['mutual_info'].rank(ascending=False, method='min')
+
+    return {
+        'table': table.sort_values('abs_corr', ascending=False),
+        'lag_corr': lag_corr,
+    }
+
+
+def top_k_features(table, k=15, by='abs_corr'):
+    """관련도 표에서 by 기준 상위 k개 피처 이름"""
+    return table[by].nlargest(k).index.tolist()
+
+
+def top_k_corr_matrix(df, columns):
+    """선택한 열끼리의 상관계수 행렬 (상위 k개 블록만 계산)"""
+    X = df[columns].to_numpy(dtype=float)
+    return pd.DataFrame(block_corr(X, X).astype(float), index=columns, columns=columns)
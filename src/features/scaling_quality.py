@@ -0,0 +1,266 @@
+"""
+벡터화 스케일링 품질 검증 (모든 피처의 검증 기준을 행렬 연산으로 한 번에 계산)
+"""
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from ..utils.stats import masked_corr, paired_corr
+
+
+# 피처별 검증 기준 (center_ok / spread_ok 는 피처에 적용된 스케일러의 기대 분포 기준)
+FEATURE_CRITERIA = ('center_ok', 'spread_ok', 'na_pattern_preserved',
+                    'order_preserved', 'outliers_controlled')
+
+# 종합 판정 기준
+MIN_PASS_RATIO = 0.8       # 피처 검증 통과 비율
+MAX_CORR_DRIFT = 0.05      # 타겟 상관관계 평균 변화 (0.05 미만: 양호)
+
+
+def _nan_moments(X):
+    """열별 평균·표본표준편차 (결측값 제외)"""
+    valid = ~np.isnan(X)
+    count = valid.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(valid, X, 0.0).sum(axis=0) / count
+        dev = np.where(valid, X - mean, 0.0)
+        std = np.sqrt((dev ** 2).sum(axis=0) / (count - 1))
+    return mean, std, count
+
+
+def _outlier_counts(X, mean, std):
+    """열별 3σ 이상치 개수"""
+    with np.errstate(invalid='ignore'):
+        return (np.abs(X - mean) > 3 * std).sum(axis=0)
+
+
+def _scaler_expectation(scaler_types, X, Z, mean, std):
+    """스케일러 종류별 기대 분포의 중심·퍼짐 만족 여부
+
+    - StandardScaler / PowerTransformer(표준화 포함) / 미지정: 평균 ≈ 0, 표준편차 ≈ 1
+    - MinMaxScaler: 평균이 [0, 1] 안, 0 < 표준편차 < 1
+    - RobustScaler: 중앙값 ≈ 0, IQR ≈ 1 (원본 IQR 이 0 이면 scale=1 이라 퍼짐 검증 생략)
+
+    Returns:
+    - (center_ok, spread_ok): 피처별 bool 배열 쌍
+    """
+    scaler_types = np.asarray(scaler_types, dtype=object)
+    is_minmax = scaler_types == 'MinMaxScaler'
+    is_robust = scaler_types == 'RobustScaler'
+
+    with np.errstate(invalid='ignore'):
+        standard_center = np.abs(mean) < 0.1
+        standard_spread = (std > 0.8) & (std < 1.2)
+        minmax_center = (mean >= 0) & (mean <= 1)
+        minmax_spread = (std > 0) & (std < 1)
+
+        robust_center = np.zeros(len(scaler_types), dtype=bool)
+        robust_spread = np.zeros(len(scaler_types), dtype=bool)
+        if is_robust.any():
+            q25, median, q75 = np.nanpercentile(Z[:, is_robust], [25, 50, 75], axis=0)
+            o25, o75 = np.nanpercentile(X[:, is_robust], [25, 75], axis=0)
+            robust_center[is_robust] = np.abs(median) < 0.1
+            robust_spread[is_robust] = ((q75 - q25 > 0.8) & (q75 - q25 < 1.2)) | (o75 - o25 == 0)
+
+    center_ok = np.select([is_minmax, is_robust], [minmax_center, robust_center], default=standard_center)
+    spread_ok = np.select([is_minmax, is_robust], [minmax_spread, robust_spread], default=standard_spread)
+    return center_ok.astype(bool), spread_ok.astype(bool)
+
+
+def scaling_quality_table(df_original, df_scaled, features, scaler_types=None):
+    """피처별 스케일링 품질 검증표
+
+    Parameters:
+    - df_original: 정규화 전 DataFrame
+    - df_scaled: 정규화 후 DataFrame (행 순서가 df_original 과 같아야 함)
+    - features: 검증할 피처 목록 (두 DataFrame 모두에 있는 피처만 사용)
+    - scaler_types: {피처: 스케일러명} (없으면 모든 피처를 StandardScaler 기준으로 검증)
+
+    Returns:
+    - DataFrame: 피처별 통계, FEATURE_CRITERIA 판정, quality_score, passed, scaler_expectation
+    """
+    features = [f for f in features if f in df_original.columns and f in df_scaled.columns]
+    X = df_original[features].to_numpy(dtype=float)
+    Z = df_scaled[features].to_numpy(dtype=float)
+
+    orig_mean, orig_std, orig_count = _nan_moments(X)
+    scaled_mean, scaled_std, scaled_count = _nan_moments(Z)
+    na_mismatches = (np.isnan(X) != np.isnan(Z)).sum(axis=0)
+    order_corr = paired_corr(X, Z)
+    orig_outliers = _outlier_counts(X, orig_mean, orig_std)
+    scaled_outliers = _outlier_counts(Z, scaled_mean, scaled_std)
+
+    table = pd.DataFrame({
+        'scaler_type': [None if scaler_types is None else scaler_types.get(f) for f in features],
+        'original_mean': orig_mean,
+        'original_std': orig_std,
+        'scaled_mean': scaled_mean,
+        'scaled_std': scaled_std,
+        'na_mismatches': na_mismatches,
+        'order_corr': order_corr,
+        'original_outliers': orig_outliers,
+        'scaled_outliers': scaled_outliers,
+    }, index=pd.Index(features, name='feature'))
+
+    center_ok, spread_ok = _scaler_expectation(table['scaler_type'], X, Z, scaled_mean, scaled_std)
+    table['center_ok'] = center_ok
+    table['spread_ok'] = spread_ok
+    with np.errstate(invalid='ignore'):
+        table['na_pattern_preserved'] = na_mismatches == 0
+        # 유효값이 1개 이하인 피처는 순서 검증 생략 (기존 기준과 동일)
+        table['order_preserved'] = np.where(np.minimum(orig_count, scaled_count) > 1, order_corr > 0.95, True)
+        table['outliers_controlled'] = scaled_outliers <= orig_outliers * 1.5
+
+    table['quality_score'] = table[list(FEATURE_CRITERIA)].mean(axis=1)
+    table['passed'] = table['quality_score'] >= 0.8
+    table['scaler_expectation'] = center_ok & spread_ok
+
+    # 유효 데이터가 없는 피처는 검증 대상에서 제외
+    return table[(orig_count > 0) & (scaled_count > 0)]
+
+
+def target_correlation_drift(df_original, df_scaled, target_col, features):
+    """타겟과의 상관관계가 정규화 전후로 얼마나 변했는지 (피처 전체를 한 번에 계산)
+
+    Returns:
+    - DataFrame: original_corr, scaled_corr, diff (인덱스: 피처)
+    """
+    features = [f for f in features
+                if f != target_col and f in df_original.columns and f in df_scaled.columns]
+    orig_corr = masked_corr(df_original[features].to_numpy(dtype=float),
+                            df_original[target_col].to_numpy(dtype=float))[:, 0]
+    scaled_corr = masked_corr(df_scaled[features].to_numpy(dtype=float),
+                              df_scaled[target_col].to_numpy(dtype=float))[:, 0]
+
+    drift = pd.DataFrame({
+        'original_corr': orig_corr,
+        'scaled_corr': scaled_corr,
+        'diff': np.abs(orig_corr - scaled_corr),
+    }, index=pd.Index(features, name='feature'))
+    return drift.dropna()
+
+
+def _check(passed, message, **details):
+    return {'passed': bool(passed), 'message': message, **details}
+
+
+def verify_scaling(df_original, df_scaled, normalizer=None, features=None,
+                   target_col='최대전력(MW)', date_col='date',
+                   min_pass_ratio=MIN_PASS_RATIO, max_corr_drift=MAX_CORR_DRIFT):
+    """정규화 결과를 메모리에서 바로 검증하고 CI 판정용 보고서를 반환
+
+    Parameters:
+    - df_original, df_scaled: 정규화 전후 DataFrame
+    - normalizer: FeatureNormalizer (검증 피처와 스케일러 종류를 가져옴)
+    - features: normalizer 가 없을 때 검증할 피처 목록
+    - target_col: 상관관계 보존 검증에 사용할 타겟 컬럼
+    - date_col: 시계열 순서 검증에 사용할 날짜 컬럼
+    - min_pass_ratio: 피처 검증 통과 비율 기준
+    - max_corr_drift: 타겟 상관관계 평균 변화 허용치
+
+    Returns:
+    - dict: passed, checks(structure, scaling, scaler_expectation, missing_values,
+            correlation, time_order), summary, features (JSON 직렬화 가능)
+    """
+    if normalizer is not None:
+        features = normalizer.columns
+        scaler_types = dict(zip(normalizer.columns, normalizer.methods))
+    elif features is not None:
+        scaler_types = None
+    else:
+        raise ValueError("normalizer 또는 features 중 하나가 필요합니다.")
+
+    table = scaling_quality_table(df_original, df_scaled, features, scaler_types)
+    checks = {}
+
+    # 1. 기본 구조
+    same_shape = df_original.shape == df_scaled.shape
+    checks['structure'] = _check(
+        same_shape and list(df_original.columns) == list(df_scaled.columns),
+        f"원본 {df_original.shape} / 정규화 {df_scaled.shape}",
+        original_shape=list(df_original.shape), scaled_shape=list(df_scaled.shape)
+    )
+
+    # 2. 피처별 스케일링 기준
+    n_features = len(table)
+    n_passed = int(table['passed'].sum())
+    pass_ratio = n_passed / n_features if n_features else 1.0
+    checks['scaling'] = _check(
+        pass_ratio >= min_pass_ratio,
+        f"피처 검증 통과 {n_passed}/{n_features}",
+        pass_ratio=pass_ratio, failed_features=table.index[~table['passed']].tolist()
+    )
+
+    # 3. 스케일러 종류별 기대 분포
+    failed_expectation = table.index[~table['scaler_expectation']].tolist()
+    checks['scaler_expectation'] = _check(
+        not failed_expectation,
+        f"기대 분포 불일치 {len(failed_expectation)}개",
+        failed_features=failed_expectation
+    )
+
+    # 4. 결측값 패턴 (공통 컬럼 전체)
+    common = [c for c in df_original.columns if c in df_scaled.columns and c != date_col]
+    if same_shape:
+        mismatches = pd.Series(
+            (df_original[common].isna().to_numpy() != df_scaled[common].isna().to_numpy()).sum(axis=0),
+            index=common
+        )
+    else:
+        mismatches = pd.Series(len(df_original), index=common)
+    checks['missing_values'] = _check(
+        mismatches.sum() == 0,
+        f"결측값 패턴 불일치 {int(mismatches.sum())}개",
+        mismatched_columns={c: int(v) for c, v in mismatches[mismatches > 0].items()}
+    )
+
+    # 5. 타겟 상관관계 보존
+    if target_col in df_original.columns and target_col in df_scaled.columns and same_shape:
+        drift = target_correlation_drift(df_original, df_scaled, target_col, table.index)
+        mean_drift = float(drift['diff'].mean()) if len(drift) else 0.0
+        max_drift = float(drift['diff'].max()) if len(drift) else 0.0
+        checks['correlation'] = _check(
+            mean_drift < max_corr_drift,
+            f"타겟 상관관계 평균 변화 {mean_drift:.4f} (최대 {max_drift:.4f})",
+            mean_drift=mean_drift, max_drift=max_drift
+        )
+    else:
+        checks['correlation'] = _check(False, f"타겟 컬럼 {target_col} 을(를) 비교할 수 없음")
+
+    # 6. 시계열 순서
+    if date_col in df_original.columns and date_col in df_scaled.columns and same_shape:
+        dates_original = pd.to_datetime(df_original[date_col]).reset_index(drop=True)
+        dates_scaled = pd.to_datetime(df_scaled[date_col]).reset_index(drop=True)
+        checks['time_order'] = _check(
+            dates_original.equals(dates_scaled) and dates_scaled.is_monotonic_increasing,
+            "날짜 순서 보존" if dates_original.equals(dates_scaled) else "날짜 순서 변경됨"
+        )
+    else:
+        checks['time_order'] = _check(False, f"날짜 컬럼 {date_col} 을(를) 비교할 수 없음")
+
+    n_checks_passed = sum(check['passed'] for check in checks.values())
+    report = {
+        'passed': n_checks_passed == len(checks),
+        'checks': checks,
+        'summary': {
+            'n_features': n_features,
+            'n_features_passed': n_passed,
+            'feature_pass_ratio': pass_ratio,
+            'checks_passed': n_checks_passed,
+            'checks_total': len(checks),
+            'quality_score': n_checks_passed / len(checks) * 100,
+        },
+        # NaN/넘파이 타입을 JSON 값으로 변환
+        'features': json.loads(table.to_json(orient='index', force_ascii=False)),
+    }
+    return report
+
+
+def save_report(report, filepath):
+    """검증 보고서를 JSON으로 저장"""
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return filepath
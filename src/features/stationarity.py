@@ -0,0 +1,183 @@
+"""
+ADF/KPSS 정상성 검정 배치 실행 (차분 변형 × 기간 창 병렬, 래그 선택 캐시)
+"""
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.stattools import adfuller, kpss
+
+from ..pipeline.cache import ResultCache, hash_bytes
+from .autocorrelation import DIFFERENCE_VARIANTS
+
+# 창 하나에 검정을 수행할 최소 관측치 수 (계절 차분의 첫 해 등 짧은 창 제외)
+MIN_WINDOW_OBS = 60
+
+FULL_WINDOW = 'full'
+
+
+def variant_series(ts, variants=DIFFERENCE_VARIANTS):
+    """차분 변형별 시계열 (날짜 인덱스 유지, 차분 결과는 끝 날짜에 정렬)"""
+    series = {}
+    for name, periods in variants.items():
+        x = ts
+        for period in periods:
+            x = x.diff(period)
+        series[name] = x.dropna()
+    return series
+
+
+def yearly_windows(index, full=True):
+    """검정 창 목록 [(이름, 시작, 끝)]: 전체 기간 + 연도별"""
+    windows = [(FULL_WINDOW, index[0], index[-1])] if full else []
+    for year in np.unique(index.year):
+        in_year = index[index.year == year]
+        windows.append((str(year), in_year[0], in_year[-1]))
+    return windows
+
+
+def select_lags(y, regression='c'):
+    """ADF(AIC 자동 선택)·KPSS(Hobijn 자동 선택) 래그 결정
+
+    ADF의 자동 래그 선택은 maxlag+1 번의 OLS 회귀가 필요한 가장 비싼 단계이므로,
+    결과 래그만 따로 캐시해 두고 검정 자체는 고정 래그 회귀 한 번으로 재현한다.
+    """
+    y = np.asarray(y, dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        adf_lag = adfuller(y, regression=regression, autolag='AIC')[2]
+        kpss_lag = kpss(y, regression=regression, nlags='auto')[2]
+    return {'adf': int(adf_lag), 'kpss': int(kpss_lag)}
+
+
+def run_tests(y, lags, regression='c', alpha=0.05):
+    """고정 래그로 ADF/KPSS 검정 수행
+
+    Returns:
+    - list: 검정별 {test, statistic, pvalue, lags, crit_1%, crit_5%, crit_10%, is_stationary}
+    """
+    y = np.asarray(y, dtype=float)
+    with warnings.catch_warnings():
+        # KPSS p-value 가 표 범위를 벗어나면 InterpolationWarning (경계값으로 잘림)
+        warnings.simplefilter('ignore')
+        adf = adfuller(y, maxlag=lags['adf'], regression=regression, autolag=None)
+        kps = kpss(y, regression=regression, nlags=lags['kpss'])
+
+    rows = []
+    for test, statistic, pvalue, critical in (('adf', adf[0], adf[1], adf[4]), ('kpss', kps[0], kps[1], kps[3])):
+        row = {'test': test, 'statistic': float(statistic), 'pvalue': float(pvalue), 'lags': lags[test]}
+        row.update({f"crit_{level}": float(value) for level, value in critical.items()})
+        # ADF 귀무가설 = 단위근(비정상), KPSS 귀무가설 = 정상
+        row['is_stationary'] = pvalue <= alpha if test == 'adf' else pvalue > alpha
+        rows.append(row)
+    return rows
+
+
+def _run_task(task):
+    """작업 하나(변형 × 창)의 래그 선택 + 검정 (프로세스 풀 작업 함수)"""
+    y, lags, regression, alpha = task['values'], task['lags'], task['regression'], task['alpha']
+    if lags is None:
+        lags = select_lags(y, regression)
+    return lags, run_tests(y, lags, regression, alpha)
+
+
+class StationarityEngine:
+    """차분 변형과 기간 창(전체 + 연도별) 조합의 ADF/KPSS 검정을 한 번에 실행하는 클래스
+
+    - 각 (변형, 창) 작업은 독립이므로 프로세스 풀에서 병렬로 실행한다.
+    - 래그 선택 결과는 구간 값의 해시를 키로 ResultCache 에 저장하므로, 데이터가 갱신되어도
+      바뀌지 않은 과거 연도 창은 래그 탐색 회귀를 다시 하지 않는다.
+    - 결과는 (variant, window, test) 한 행씩의 tidy DataFrame 으로 반환한다.
+    """
+
+    def __init__(self, variants=DIFFERENCE_VARIANTS, regression='c', alpha=0.05,
+                 min_obs=MIN_WINDOW_OBS, cache_dir='results/.cache/analysis', max_workers=None):
+        self.variants = variants
+        self.regression = regression
+        self.alpha = alpha
+        self.min_obs = min_obs
+        self.cache = ResultCache(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+
+    def _lag_key(self, values):
+        params = {'regression': self.regression}
+        return self.cache.key('stationarity_lags', hash_bytes(values.tobytes()), code=(select_lags,), params=params)
+
+    def _tasks(self, ts, windows):
+        tasks = []
+        for variant, series in variant_series(ts, self.variants).items():
+            for window, start, end in windows:
+                segment = series.loc[start:end]
+                if len(segment) < self.min_obs:
+                    continue
+                values = segment.to_numpy(dtype=float)
+                task = {
+                    'variant': variant, 'window': window,
+                    'start': segment.index[0], 'end': segment.index[-1],
+                    'values': values, 'regression': self.regression, 'alpha': self.alpha, 'lags': None
+                }
+                if self.cache is not None:
+                    task['lag_key'] = self._lag_key(values)
+                    task['lags'] = self.cache.get('stationarity_lags', task['lag_key'])
+                tasks.append(task)
+        return tasks
+
+    def _workers(self, n_jobs):
+        if n_jobs <= 1 or multiprocessing.current_process().name != 'MainProcess':
+            return 1
+        return min(self.max_workers or os.cpu_count() or 1, n_jobs)
+
+    def run(self, ts, windows=None):
+        """정상성 검정 실행
+
+        Parameters:
+        - ts: 날짜 인덱스 시계열
+        - windows: [(이름, 시작, 끝)] 검정 창 (기본값: 전체 + 연도별)
+
+        Returns:
+        - DataFrame: variant, window, start, end, nobs, test, statistic, pvalue, lags,
+          crit_1%, crit_5%, crit_10%, is_stationary
+        """
+        windows = windows if windows is not None else yearly_windows(ts.index)
+        tasks = self._tasks(ts, windows)
+
+        n_workers = self._workers(len(tasks))
+        if n_workers == 1:
+            outputs = [_run_task(task) for task in tasks]
+        else:
+            context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+                outputs = list(executor.map(_run_task, tasks))
+
+        rows = []
+        for task, (lags, tests) in zip(tasks, outputs):
+            if self.cache is not None and task['lags'] is None:
+                self.cache.put('stationarity_lags', task['lag_key'], lags)
+            meta = {key: task[key] for key in ('variant', 'window', 'start', 'end')}
+            meta['nobs'] = len(task['values'])
+            rows.extend({**meta, **test} for test in tests)
+
+        return pd.DataFrame(rows)
+
+
+def stationarity_summary(table, window=FULL_WINDOW):
+    """tidy 결과에서 한 창의 결과를 {변형: {검정: {...}}} 형태로 변환"""
+    summary = {}
+    for row in table[table['window'] == window].to_dict('records'):
+        summary.setdefault(row['variant'], {})[row['test']] = {
+            'statistic': row['statistic'],
+            'pvalue': row['pvalue'],
+            'lags': row['lags'],
+            'critical_values': {k[len('crit_'):]: v for k, v in row.items() if k.startswith('crit_')},
+            'is_stationary': bool(row['is_stationary'])
+        }
+    return summary
+
+
+def yearly_stationarity(table):
+    """연도별 창에서 ADF·KPSS 가 모두 정상으로 판정했는지 여부 (index=(variant, window) bool Series)"""
+    yearly = table[table['window'] != FULL_WINDOW]
+    return yearly.groupby(['variant', 'window'])['is_stationary'].all()
@@ -66,14 +66,21 @@ class BaseModel(ABC):
         return metrics
     
     def cross_validate(self, X, y, cv=5):
-        """교차 검증"""
+        """교차 검증
+        
+        cv: 폴드 수(TimeSeriesSplit) 또는 CVFolds (정수 범위 slice로 복사 없이 분할)
+        """
         from sklearn.model_selection import TimeSeriesSplit
         from sklearn.metrics import mean_squared_error
+        from ..data.cv_folds import CVFolds
         
-        tscv = TimeSeriesSplit(n_splits=cv)
+        if isinstance(cv, CVFolds):
+            splits = iter(cv)
+        else:
+            splits = TimeSeriesSplit(n_splits=cv).split(X)
         scores = []
         
-        for train_idx, val_idx in tscv.split(X):
+        for train_idx, val_idx in splits:
             X_train, X_val = X.iloc[train_idx], X.iloc[val_idx]
             y_train, y_val = y.iloc[train_idx], y.iloc[val_idx]
             
@@ -0,0 +1,239 @@
+"""
+SARIMA / ETS 차수 자동 탐색 (연도 CV 폴드 병렬, 이웃 적합 warm start, 정보기준 가지치기, 적합 결과 캐시)
+"""
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ..pipeline.cache import ResultCache, hash_bytes
+from .statespace_model import StateSpaceModel, spec_name
+
+# 같은 차분 그룹의 최저 AIC 보다 이만큼 이상 나쁘면 더 복잡한 차수로 확장하지 않음
+# (ΔAIC > 10: 해당 모델을 지지할 근거가 사실상 없음)
+IC_MARGIN = 10.0
+
+
+def sarima_grid(p=range(3), d=(1,), q=range(3), P=range(2), D=(0,), Q=range(2), s=7):
+    """SARIMA 후보 차수 목록 (일별 데이터이므로 계절 주기 기본값은 주간 7일)"""
+    grid = []
+    for pi, di, qi, Pi, Di, Qi in itertools.product(p, d, q, P, D, Q):
+        seasonal = (Pi, Di, Qi, s) if (Pi or Di or Qi) else (0, 0, 0, 0)
+        grid.append({'kind': 'sarima', 'order': (pi, di, qi), 'seasonal_order': seasonal})
+    return grid
+
+
+def ets_grid(trend=(None, 'add'), damped_trend=(False, True), seasonal=(None, 'add'), seasonal_periods=7):
+    """ETS(가법 오차) 후보 목록 (추세 없는 감쇠 조합 제외)"""
+    grid = []
+    for tr, damped, se in itertools.product(trend, damped_trend, seasonal):
+        if damped and tr is None:
+            continue
+        grid.append({'kind': 'ets', 'error': 'add', 'trend': tr, 'damped_trend': damped,
+                     'seasonal': se, 'seasonal_periods': seasonal_periods if se else None})
+    return grid
+
+
+def _components(spec):
+    """차수 비교용 성분 벡터 (클수록 복잡한 모델)"""
+    if spec['kind'] == 'sarima':
+        return tuple(spec['order']) + tuple(spec['seasonal_order'][:3])
+    return (spec['trend'] is not None, bool(spec['damped_trend']), spec['seasonal'] is not None)
+
+
+def _ic_group(spec):
+    """AIC 를 비교할 수 있는 그룹 (차분 차수가 다르면 우도 표본이 달라 비교 불가)"""
+    if spec['kind'] == 'sarima':
+        return ('sarima', spec['order'][1], spec['seasonal_order'][1])
+    return ('ets',)
+
+
+def _extends(spec, base):
+    """spec 이 base 의 모든 성분을 포함하면서 더 복잡한지 여부"""
+    a, b = _components(spec), _components(base)
+    return spec['kind'] == base['kind'] and a != b and all(x >= y for x, y in zip(a, b))
+
+
+def _nearest(spec, fitted):
+    """이미 적합한 같은 종류 사양 중 성분 거리가 가장 가까운 것의 파라미터"""
+    same_kind = [(other, params) for other, params in fitted if other['kind'] == spec['kind']]
+    if not same_kind:
+        return None
+    target = np.array(_components(spec), dtype=float)
+    distances = [np.abs(np.array(_components(other), dtype=float) - target).sum() for other, _ in same_kind]
+    return same_kind[int(np.argmin(distances))][1]
+
+
+def _search_chain(job):
+    """폴드 하나 × 모델 종류 하나의 후보를 단순한 순서대로 적합 (프로세스 풀 작업 함수)
+
+    앞서 적합한 이웃 차수의 파라미터로 warm start 하고, 같은 그룹 최저 AIC 보다
+    IC_MARGIN 이상 나쁜 후보를 확장한 차수는 적합하지 않고 건너뛴다.
+    """
+    y_train, y_val = job['y_train'], job['y_val']
+    cache = ResultCache(job['cache_dir']) if job['cache_dir'] else None
+    data_hash = hash_bytes(y_train.tobytes() + y_val.tobytes())
+
+    rows, fitted, dead_ends, best_ic = [], [], [], {}
+    for spec in sorted(job['specs'], key=lambda s: (sum(_components(s)), _components(s))):
+        row = {'fold_id': job['fold_id'], 'model': spec_name(spec), 'kind': spec['kind'], 'spec': spec,
+               'status': 'pruned', 'warm_start': False}
+        if any(_extends(spec, base) for base in dead_ends):
+            rows.append(row)
+            continue
+
+        cache_key = cache.key('statespace_fits', data_hash, code=(StateSpaceModel,),
+                              params={'spec': spec, 'maxiter': job['maxiter']}) if cache else None
+        record = cache.get('statespace_fits', cache_key) if cache else None
+        status = 'cached' if record is not None else 'fitted'
+        try:
+            if record is None:
+                warm_start = _nearest(spec, fitted)
+                model = StateSpaceModel(spec, warm_start=warm_start, maxiter=job['maxiter'])
+                started = time.perf_counter()
+                model.fit(None, y_train)
+                record = {
+                    'params': model.params.to_dict(),
+                    'aic': float(model.model.aic), 'bic': float(model.model.bic),
+                    'converged': model.converged,
+                    'forecast': model.predict(len(y_val)),
+                    'fit_seconds': time.perf_counter() - started,
+                    'warm_start': warm_start is not None
+                }
+                if cache:
+                    cache.put('statespace_fits', cache_key, record)
+
+            forecast = np.asarray(record['forecast'], dtype=float)
+            if not np.all(np.isfinite(forecast)):
+                raise ValueError("예측값에 NaN/inf 가 포함되어 있습니다.")
+            # 검증 구간의 결측 관측치는 지표 계산에서 제외
+            observed = np.isfinite(y_val)
+            metrics = StateSpaceModel(spec).evaluate(y_val[observed], forecast[observed])
+        except Exception as e:  # 수치적으로 적합·평가 불가능한 차수
+            row.update(status='failed', error=str(e))
+            rows.append(row)
+            continue
+
+        row['status'] = status
+        row.update({key: record[key] for key in ('params', 'aic', 'bic', 'converged', 'fit_seconds', 'warm_start')})
+        row.update({name.lower(): value for name, value in metrics.items()})
+        rows.append(row)
+        fitted.append((spec, record['params']))
+
+        group = _ic_group(spec)
+        if record['aic'] > best_ic.get(group, np.inf) + job['ic_margin']:
+            dead_ends.append(spec)
+        best_ic[group] = min(best_ic.get(group, np.inf), record['aic'])
+
+    return rows
+
+
+def rank_results(fold_results):
+    """폴드별 결과를 모델별 평균 성능 순위표로 집계 (모든 폴드에서 평가된 모델만 순위 부여)"""
+    evaluated = fold_results[fold_results['status'].isin(['fitted', 'cached'])]
+    n_folds = fold_results['fold_id'].nunique()
+
+    ranking = evaluated.groupby('model').agg(
+        kind=('kind', 'first'),
+        n_folds=('fold_id', 'nunique'),
+        mean_rmse=('rmse', 'mean'),
+        std_rmse=('rmse', 'std'),
+        mean_mae=('mae', 'mean'),
+        mean_mape=('mape', 'mean'),
+        mean_aic=('aic', 'mean'),
+        fit_seconds=('fit_seconds', 'sum')
+    )
+    skipped = fold_results[~fold_results['status'].isin(['fitted', 'cached'])].groupby('model').size()
+    ranking['skipped_folds'] = skipped.reindex(ranking.index, fill_value=0)
+    ranking['complete'] = ranking['n_folds'] == n_folds
+
+    ranking = ranking.sort_values(['complete', 'mean_rmse'], ascending=[False, True])
+    ranking['rank'] = np.where(ranking['complete'], np.arange(1, len(ranking) + 1), np.nan)
+    return ranking.reset_index()
+
+
+class OrderSearch:
+    """SARIMA/ETS 후보 차수를 연도 CV 폴드에서 평가해 순위를 매기는 클래스
+
+    - (폴드, 모델 종류) 작업 단위로 프로세스 풀에서 병렬 실행
+    - 작업 안에서는 단순한 차수부터 적합하며 이웃 차수의 파라미터로 warm start
+    - AIC 가 같은 그룹 최저값보다 ic_margin 이상 나쁜 차수는 더 확장하지 않음 (가지치기)
+    - 적합 결과(파라미터, 정보기준, 검증 예측)는 훈련·검증 구간 해시를 키로 ResultCache 에 저장
+
+    사용 예:
+        folds = calendar_folds(ts.index, val_years=[2022, 2023], window='sliding', train_years=3)
+        search = OrderSearch(sarima_grid() + ets_grid())
+        ranking = search.run(ts, folds)
+        model = search.best_model(ts)  # 전체 데이터로 다시 적합한 StateSpaceModel
+    """
+
+    def __init__(self, specs=None, ic_margin=IC_MARGIN, maxiter=50,
+                 cache_dir='results/.cache/analysis', max_workers=None):
+        self.specs = specs if specs is not None else sarima_grid() + ets_grid()
+        self.ic_margin = ic_margin
+        self.maxiter = maxiter
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self.fold_results = None
+        self.ranking = None
+
+    def _workers(self, n_jobs):
+        if n_jobs <= 1 or multiprocessing.current_process().name != 'MainProcess':
+            return 1
+        return min(self.max_workers or os.cpu_count() or 1, n_jobs)
+
+    def _jobs(self, y, folds):
+        values = np.asarray(y, dtype=float)
+        kinds = sorted({spec['kind'] for spec in self.specs})
+        jobs = []
+        for fold_id, (train, val) in zip(folds.fold_ids, folds):
+            for kind in kinds:
+                jobs.append({
+                    'fold_id': int(fold_id),
+                    'y_train': values[train], 'y_val': values[val],
+                    'specs': [spec for spec in self.specs if spec['kind'] == kind],
+                    'ic_margin': self.ic_margin, 'maxiter': self.maxiter, 'cache_dir': self.cache_dir
+                })
+        return jobs
+
+    def run(self, y, folds):
+        """차수 탐색 실행
+
+        Parameters:
+        - y: 시계열 (행 순서가 folds 와 일치)
+        - folds: CVFolds (예: calendar_folds)
+
+        Returns:
+        - DataFrame: 모델별 rank, mean_rmse, std_rmse, mean_mae, mean_mape, mean_aic 등 (rank 오름차순)
+        """
+        jobs = self._jobs(y, folds)
+        n_workers = self._workers(len(jobs))
+        if n_workers == 1:
+            outputs = [_search_chain(job) for job in jobs]
+        else:
+            context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+                outputs = list(executor.map(_search_chain, jobs))
+
+        self.fold_results = pd.DataFrame([row for rows in outputs for row in rows])
+        self.ranking = rank_results(self.fold_results)
+        return self.ranking
+
+    def best_spec(self):
+        """1위 모델 사양"""
+        if self.ranking is None:
+            raise ValueError("run()을 먼저 실행하세요.")
+        best = self.ranking.iloc[0]['model']
+        return self.fold_results.loc[self.fold_results['model'] == best, 'spec'].iloc[0]
+
+    def best_model(self, y):
+        """1위 사양을 전체 데이터로 다시 적합한 StateSpaceModel (마지막 폴드 파라미터로 warm start)"""
+        spec = self.best_spec()
+        fits = self.fold_results[(self.fold_results['model'] == spec_name(spec))
+                                 & self.fold_results['status'].isin(['fitted', 'cached'])]
+        warm_start = fits.sort_values('fold_id')['params'].iloc[-1]
+        return StateSpaceModel(spec, warm_start=warm_start, maxiter=self.maxiter).fit(None, y)
@@ -0,0 +1,102 @@
+"""
+SARIMA / ETS 상태공간 모델 (statsmodels 래퍼)
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+from .base_model import BaseModel
+
+MODEL_KINDS = ('sarima', 'ets')
+
+
+def spec_name(spec):
+    """모델 사양 표시 이름 (예: SARIMA(1,1,1)(0,0,1,7), ETS(A,Ad,A,7))"""
+    if spec['kind'] == 'sarima':
+        p, d, q = spec['order']
+        P, D, Q, s = spec.get('seasonal_order', (0, 0, 0, 0))
+        seasonal = f"({P},{D},{Q},{s})" if s else ""
+        return f"SARIMA({p},{d},{q}){seasonal}"
+    if spec['kind'] == 'ets':
+        trend = {None: 'N', 'add': 'A', 'mul': 'M'}[spec.get('trend')]
+        if spec.get('damped_trend'):
+            trend += 'd'
+        seasonal = {None: 'N', 'add': 'A', 'mul': 'M'}[spec.get('seasonal')]
+        period = f",{spec['seasonal_periods']}" if spec.get('seasonal') else ""
+        return f"ETS({spec.get('error', 'add')[0].upper()},{trend},{seasonal}{period})"
+    raise ValueError(f"지원하지 않는 모델 종류입니다: {spec['kind']} (지원: {list(MODEL_KINDS)})")
+
+
+class StateSpaceModel(BaseModel):
+    """SARIMA / ETS 모델 사양(dict) 하나를 BaseModel 인터페이스로 감싼 클래스
+
+    spec 예시:
+    - {'kind': 'sarima', 'order': (1, 1, 1), 'seasonal_order': (0, 0, 1, 7)}
+    - {'kind': 'ets', 'error': 'add', 'trend': 'add', 'damped_trend': True,
+       'seasonal': 'add', 'seasonal_periods': 7}
+
+    warm_start 에 이름 붙은 파라미터(Series/dict)를 주면 SARIMA 적합 시 이름이 같은
+    파라미터(ar.L1, ma.S.L7, sigma2 등)를 초기값으로 사용한다 (이웃 차수 적합 결과 재사용).
+    X 는 사용하지 않으며 predict(X) 는 len(X) 스텝(정수면 그 값) 앞까지 예측한다.
+    """
+
+    def __init__(self, spec, warm_start=None, maxiter=50):
+        super().__init__(spec_name(spec))
+        self.spec = dict(spec)
+        self.warm_start = warm_start
+        self.maxiter = maxiter
+
+    def _build(self, y):
+        spec = self.spec
+        if spec['kind'] == 'sarima':
+            return SARIMAX(y, order=spec['order'], seasonal_order=spec.get('seasonal_order', (0, 0, 0, 0)),
+                           trend=spec.get('trend'))
+        if spec['kind'] == 'ets':
+            return ETSModel(y, error=spec.get('error', 'add'), trend=spec.get('trend'),
+                            damped_trend=spec.get('damped_trend', False), seasonal=spec.get('seasonal'),
+                            seasonal_periods=spec.get('seasonal_periods'))
+        raise ValueError(f"지원하지 않는 모델 종류입니다: {spec['kind']} (지원: {list(MODEL_KINDS)})")
+
+    def _start_params(self, model):
+        """warm_start 의 같은 이름 파라미터로 기본 초기값을 덮어씀 (SARIMA 전용)"""
+        if self.warm_start is None or self.spec['kind'] != 'sarima':
+            return None
+        start = pd.Series(model.start_params, index=model.param_names)
+        previous = pd.Series(self.warm_start)
+        shared = start.index.intersection(previous.index)
+        if len(shared) == 0:
+            return None
+        start[shared] = previous[shared]
+        return start.to_numpy()
+
+    def fit(self, X, y):
+        """모델 학습 (X 무시, y: 1차원 시계열)"""
+        y = np.asarray(y, dtype=float)
+        model = self._build(y)
+        with warnings.catch_warnings():
+            # 수렴/초기값 경고는 탐색 중 대량으로 발생하므로 converged 로만 확인
+            warnings.simplefilter('ignore')
+            self.model = model.fit(start_params=self._start_params(model), disp=False, maxiter=self.maxiter)
+        self.is_fitted = True
+        return self
+
+    def predict(self, X):
+        """예측 (X: 예측 구간 또는 스텝 수)"""
+        if not self.is_fitted:
+            raise ValueError("모델이 학습되지 않았습니다.")
+        steps = X if isinstance(X, (int, np.integer)) else len(X)
+        return np.asarray(self.model.forecast(steps), dtype=float)
+
+    @property
+    def params(self):
+        """이름 붙은 적합 파라미터"""
+        names = list(self.model.model.param_names)
+        values = np.asarray(self.model.params, dtype=float)
+        return pd.Series(values, index=names if len(names) == len(values) else None)
+
+    @property
+    def converged(self):
+        return bool(self.model.mle_retvals.get('converged', True)) if getattr(self.model, 'mle_retvals', None) else True
@@ -0,0 +1 @@
+# 파이프라인 모듈 
\ No newline at end of file
@@ -0,0 +1,300 @@
+"""
+콘텐츠 주소 기반 파이프라인 단계 캐시
+"""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+
+def hash_bytes(data):
+    """바이트열의 SHA-256"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path, chunk_size=1 << 20):
+    """파일 내용의 SHA-256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_frame(df):
+    """DataFrame 내용(컬럼명·값·인덱스)의 해시"""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).values
+    header = json.dumps([str(c) for c in df.columns] + [str(t) for t in df.dtypes]).encode('utf-8')
+    return hash_bytes(header + row_hashes.tobytes())
+
+
+def hash_code(code):
+    """코드 버전 해시 (파일 경로, 모듈, 함수/클래스 모두 허용)"""
+    if isinstance(code, (str, Path)):
+        return hash_file(code)
+    source_file = inspect.getsourcefile(code)
+    if source_file:
+        # 헬퍼 함수 변경도 반영되도록 모듈 파일 전체를 해시
+        return hash_file(source_file)
+    return hash_bytes(inspect.getsource(code).encode('utf-8'))
+
+
+class StageCache:
+    """전처리 단계의 입력·코드·파라미터 해시를 키로 출력 파일을 캐싱하는 클래스
+
+    출력 파일은 내용 해시 이름으로 objects/ 아래에 한 번만 저장되고,
+    단계별 매니페스트(stages/<단계>/<키>.json)가 출력 경로와 객체 해시를 연결한다.
+    같은 키로 다시 실행하면 단계 함수를 건너뛰고 출력 파일만 복원한다.
+    """
+
+    def __init__(self, cache_dir='results/.cache'):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / 'objects'
+        self.stages_dir = self.cache_dir / 'stages'
+        self.index_path = self.cache_dir / 'file_hash_index.json'
+        # 병렬 단계 실행 시 인덱스/매니페스트 동시 접근 보호
+        self._lock = threading.RLock()
+        self._file_index = self._load_file_index()
+
+    def _load_file_index(self):
+        """(경로, 크기, 수정시각) → 해시 인덱스 로딩 (변경되지 않은 파일 재해시 방지)"""
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_file_index(self):
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(self._file_index, f, indent=2, ensure_ascii=False)
+
+    def file_hash(self, path):
+        """파일 해시 (크기·수정시각이 같으면 인덱스 값을 재사용)"""
+        path = Path(path)
+        stat = path.stat()
+        with self._lock:
+            entry = self._file_index.get(str(path.resolve()))
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+
+        digest = hash_file(path)
+        with self._lock:
+            self._file_index[str(path.resolve())] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': digest
+            }
+        return digest
+
+    def _hash_input(self, item):
+        if isinstance(item, pd.DataFrame):
+            return hash_frame(item)
+        path = Path(item)
+        if not path.exists():
+            raise FileNotFoundError(f"단계 입력 파일을 찾을 수 없습니다: {path}")
+        return self.file_hash(path)
+
+    def stage_key(self, stage_name, inputs=(), code=(), params=None):
+        """단계 캐시 키 = hash(단계명, 입력 해시, 코드 해시, 파라미터)"""
+        payload = {
+            'stage': stage_name,
+            'inputs': [self._hash_input(item) for item in inputs],
+            'code': [hash_code(c) for c in code],
+            'params': params or {}
+        }
+        return hash_bytes(json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+
+    def _object_path(self, digest):
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _manifest_path(self, stage_name, key):
+        return self.stages_dir / stage_name / f"{key}.json"
+
+    def lookup(self, stage_name, key):
+        """캐시 매니페스트 조회 (없거나 객체가 유실되었으면 None)"""
+        manifest_path = self._manifest_path(stage_name, key)
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if not all(self._object_path(d).exists() for d in manifest['outputs'].values()):
+            return None
+        return manifest
+
+    def store(self, stage_name, key, outputs, elapsed):
+        """출력 파일을 객체 저장소에 넣고 매니페스트 기록"""
+        output_hashes = {}
+        for output in outputs:
+            output = Path(output)
+            if not output.exists():
+                raise FileNotFoundError(f"단계 출력 파일이 생성되지 않았습니다: {output}")
+            digest = self.file_hash(output)
+            obj_path = self._object_path(digest)
+            if not obj_path.exists():
+                obj_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(output, obj_path)
+            output_hashes[str(output)] = digest
+
+        manifest = {
+            'stage': stage_name,
+            'key': key,
+            'outputs': output_hashes,
+            'elapsed_seconds': elapsed,
+            'created_at': datetime.now().isoformat()
+        }
+        manifest_path = self._manifest_path(stage_name, key)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        self._save_file_index()
+        return manifest
+
+    def restore(self, manifest):
+        """매니페스트의 출력 파일을 원래 위치로 복원 (내용이 같으면 건너뜀)"""
+        for output, digest in manifest['outputs'].items():
+            output = Path(output)
+            if output.exists() and self.file_hash(output) == digest:
+                continue
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self._object_path(digest), output)
+            # 복원된 파일의 해시를 인덱스에 반영 (다음 단계 입력 해시 재계산 방지)
+            stat = output.stat()
+            with self._lock:
+                self._file_index[str(output.resolve())] = {
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'sha256': digest
+                }
+        self._save_file_index()
+
+    def run(self, stage_name, func, inputs=(), outputs=(), code=(), params=None, force=False):
+        """단계 실행 (캐시 적중 시 출력만 복원하고 건너뜀)
+
+        Parameters:
+        - stage_name: 단계 이름
+        - func: 인자 없이 호출되어 outputs 파일을 생성하는 함수 (dict를 반환하면 metrics로 전달)
+        - inputs: 입력 파일 경로 또는 DataFrame 목록
+        - outputs: 단계가 생성하는 파일 경로 목록
+        - code: 코드 버전으로 해시할 파일 경로/함수 목록
+        - params: 단계 파라미터 (JSON 직렬화 가능)
+        - force: True이면 캐시를 무시하고 재실행
+
+        Returns:
+        - dict: stage, key, cached, elapsed_seconds, metrics
+        """
+        key = self.stage_key(stage_name, inputs, code, params)
+        manifest = None if force else self.lookup(stage_name, key)
+
+        if manifest is not None:
+            self.restore(manifest)
+            print(f"⏭️ {stage_name}: 캐시 적중 ({key[:12]})")
+            return {'stage': stage_name, 'key': key, 'cached': True, 'elapsed_seconds': 0.0, 'metrics': {}}
+
+        print(f"▶️ {stage_name}: 실행 ({key[:12]})")
+        start_time = time.time()
+        output = func()
+        elapsed = time.time() - start_time
+
+        self.store(stage_name, key, outputs, elapsed)
+        print(f"✅ {stage_name}: 완료 ({elapsed:.2f}초)")
+        return {
+            'stage': stage_name,
+            'key': key,
+            'cached': False,
+            'elapsed_seconds': elapsed,
+            'metrics': output if isinstance(output, dict) else {}
+        }
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            if self.cache_dir.exists():
+                shutil.rmtree(self.cache_dir)
+            self._file_index = {}
+
+
+class ResultCache:
+    """분석 결과(DataFrame, dict 등)를 데이터·코드·파라미터 해시를 키로 디스크에 메모이즈하는 클래스
+
+    결과는 <cache_dir>/<분석명>/<키>.pkl 로 저장된다. 같은 데이터와 코드로 다시 호출하면
+    분석 함수를 실행하지 않고 저장된 결과를 돌려주므로, 대시보드/리포트가 EDA 결과를
+    재계산 없이 조회할 수 있다. 마지막 run() 호출의 적중 여부는 last_hit 에 남는다.
+    """
+
+    def __init__(self, cache_dir='results/.cache/analysis'):
+        self.cache_dir = Path(cache_dir)
+        self.last_hit = False
+
+    def key(self, name, data_hash, code=(), params=None):
+        """결과 키 = hash(분석명, 데이터 해시, 코드 해시, 파라미터)"""
+        payload = {
+            'name': name,
+            'data': data_hash,
+            'code': [hash_code(c) for c in code],
+            'params': params or {}
+        }
+        return hash_bytes(json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+
+    def _path(self, name, key):
+        return self.cache_dir / name / f"{key}.pkl"
+
+    def get(self, name, key, default=None):
+        """저장된 결과 조회 (없으면 default)"""
+        path = self._path(name, key)
+        if not path.exists():
+            return default
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def put(self, name, key, value):
+        """결과 저장 (임시 파일에 쓴 뒤 교체하여 병렬 실행 시에도 깨진 파일이 남지 않음)"""
+        path = self._path(name, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return path
+
+    def run(self, name, func, data, code=(), params=None, data_hash=None, force=False):
+        """func(data, **params) 결과를 메모이즈하여 반환
+
+        Parameters:
+        - name: 분석 이름 (캐시 하위 폴더)
+        - func: 순수 분석 함수
+        - data: 분석 대상 DataFrame
+        - code: 코드 버전으로 해시할 파일 경로/함수 목록 (기본값: func 의 모듈 파일)
+        - params: func 키워드 인자 (JSON 직렬화 가능)
+        - data_hash: 미리 계산한 data 해시 (여러 분석이 같은 데이터를 쓸 때 재해시 방지)
+        - force: True이면 캐시를 무시하고 재계산
+        """
+        params = params or {}
+        data_hash = data_hash or hash_frame(data)
+        key = self.key(name, data_hash, code or (func,), params)
+
+        if not force:
+            missing = object()
+            value = self.get(name, key, missing)
+            if value is not missing:
+                self.last_hit = True
+                return value
+
+        value = func(data, **params)
+        self.put(name, key, value)
+        self.last_hit = False
+        return value
+
+    def clear(self, name=None):
+        """캐시 삭제 (name 을 주면 해당 분석만)"""
+        target = self.cache_dir / name if name else self.cache_dir
+        if target.exists():
+            shutil.rmtree(target)
@@ -0,0 +1,208 @@
+"""
+경량 DAG 파이프라인 실행기
+"""
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+
+def _maxrss_to_mb(maxrss):
+    """ru_maxrss 단위 변환 (Linux: KB, macOS: bytes)"""
+    if sys.platform == 'darwin':
+        return maxrss / (1024 * 1024)
+    return maxrss / 1024
+
+
+def _exit_code(status):
+    """wait 상태값을 subprocess 반환 코드로 변환 (시그널 종료는 -시그널 번호)
+
+    Python 3.8 에는 os.waitstatus_to_exitcode 가 없으므로 직접 해석한다.
+    """
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    raise ValueError(f"알 수 없는 프로세스 종료 상태입니다: {status}")
+
+
+def run_script(script_path, cwd=None, args=()):
+    """Python 스크립트를 하위 프로세스로 실행하고 최대 메모리 사용량(MB)을 반환
+
+    POSIX에서는 os.wait4 로 해당 자식 프로세스만의 rusage 를 얻는다.
+    """
+    command = [sys.executable, str(script_path), *args]
+
+    if not hasattr(os, 'wait4'):
+        subprocess.run(command, cwd=cwd, check=True)
+        return {'peak_memory_mb': None}
+
+    process = subprocess.Popen(command, cwd=cwd)
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = _exit_code(status)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+    return {'peak_memory_mb': round(_maxrss_to_mb(usage.ru_maxrss), 1)}
+
+
+class PipelineStage:
+    """입력·출력 파일을 선언한 파이프라인 단계 (DAG 노드)"""
+
+    def __init__(self, name, func, inputs=(), outputs=(), code=(), params=None,
+                 depends_on=(), cacheable=True):
+        self.name = name
+        self.func = func
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.code = list(code)
+        self.params = params or {}
+        self.depends_on = list(depends_on)
+        self.cacheable = cacheable
+
+
+class PipelineDAG:
+    """단계 간 입력/출력 관계로 실행 순서를 결정하고 독립 단계를 병렬 실행하는 클래스"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def add_stage(self, name, func, **kwargs):
+        """단계 추가 (kwargs는 PipelineStage 인자)"""
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+        self.stages[name] = PipelineStage(name, func, **kwargs)
+        return self.stages[name]
+
+    def dependencies(self):
+        """단계별 선행 단계 집합 (입력 파일을 출력하는 단계 + 명시적 depends_on)"""
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                if output in producers:
+                    raise ValueError(
+                        f"출력 파일이 여러 단계에서 생성됩니다: {output} "
+                        f"({producers[output]}, {stage.name})"
+                    )
+                producers[output] = stage.name
+
+        deps = {}
+        for stage in self.stages.values():
+            stage_deps = {producers[p] for p in stage.inputs if p in producers}
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"{stage.name}: 알 수 없는 선행 단계 {dep}")
+                stage_deps.add(dep)
+            stage_deps.discard(stage.name)
+            deps[stage.name] = stage_deps
+        return deps
+
+    def execution_levels(self):
+        """위상 정렬 결과를 병렬 실행 가능한 레벨 단위로 반환 (순환 시 ValueError)"""
+        deps = {name: set(d) for name, d in self.dependencies().items()}
+        levels = []
+
+        while deps:
+            ready = sorted(name for name, d in deps.items() if not d)
+            if not ready:
+                raise ValueError(f"파이프라인에 순환 의존성이 있습니다: {sorted(deps)}")
+            levels.append(ready)
+            for name in ready:
+                del deps[name]
+            for d in deps.values():
+                d.difference_update(ready)
+
+        return levels
+
+    def _execute(self, stage, cache, force):
+        """단일 단계 실행 (캐시가 있으면 캐시를 통해 실행)"""
+        if cache is not None and stage.cacheable:
+            result = cache.run(
+                stage.name, stage.func,
+                inputs=stage.inputs, outputs=stage.outputs,
+                code=stage.code, params=stage.params, force=force
+            )
+            return result['cached'], result['metrics']
+
+        output = stage.func()
+        return False, output if isinstance(output, dict) else {}
+
+    def run(self, max_workers=4, cache=None, force=False, fail_fast=True):
+        """선행 단계가 끝난 단계부터 스레드 풀에서 병렬 실행
+
+        Parameters:
+        - max_workers: 동시에 실행할 최대 단계 수
+        - cache: StageCache (None이면 항상 실행)
+        - force: 캐시 무시 여부
+        - fail_fast: True이면 실패 시 새 단계를 시작하지 않음
+
+        Returns:
+        - list: 단계별 실행 기록 (status, start/end 시각, elapsed, peak_memory_mb, error)
+        """
+        deps = {name: set(d) for name, d in self.dependencies().items()}
+        self.execution_levels()  # 순환 의존성 사전 검사
+
+        dependents = {name: set() for name in self.stages}
+        for name, d in deps.items():
+            for dep in d:
+                dependents[dep].add(name)
+
+        records = {}
+        pipeline_start = time.time()
+        failed = False
+
+        def skip_downstream(name):
+            for child in dependents[name]:
+                if child not in records:
+                    records[child] = {'stage': child, 'status': 'skipped', 'error': f"선행 단계 실패: {name}"}
+                    skip_downstream(child)
+
+        def timed(stage):
+            start = time.time()
+            cached, metrics = self._execute(stage, cache, force)
+            end = time.time()
+            return cached, metrics, start, end
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            waiting = set(self.stages)
+
+            while waiting or running:
+                if not (failed and fail_fast):
+                    for name in sorted(waiting):
+                        if not deps[name] and name not in records:
+                            running[executor.submit(timed, self.stages[name])] = name
+                            waiting.discard(name)
+                waiting = {name for name in waiting if name not in records}
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        cached, metrics, start, end = future.result()
+                        records[name] = {
+                            'stage': name,
+                            'status': 'cached' if cached else 'success',
+                            'start_offset': round(start - pipeline_start, 3),
+                            'end_offset': round(end - pipeline_start, 3),
+                            'elapsed_seconds': round(end - start, 3),
+                            'peak_memory_mb': metrics.get('peak_memory_mb'),
+                        }
+                        for child in dependents[name]:
+                            deps[child].discard(name)
+                    except Exception as e:
+                        failed = True
+                        records[name] = {'stage': name, 'status': 'failed', 'error': str(e)}
+                        print(f"❌ {name} 실패: {e}")
+                        skip_downstream(name)
+
+            for name in waiting:
+                records.setdefault(name, {'stage': name, 'status': 'skipped', 'error': 'fail-fast로 중단'})
+
+        # 등록 순서대로 반환
+        return [records[name] for name in self.stages]
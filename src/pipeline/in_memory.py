@@ -0,0 +1,129 @@
+"""
+메모리 내 전처리 파이프라인 (단계 간 디스크 왕복 없음)
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+from ..data.feature_store import FeatureStore
+from ..features.scaling_quality import verify_scaling
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PREPROCESSING_DIR = PROJECT_ROOT / 'preprocessing'
+
+# 전처리 단계 스크립트 (폴더명이 숫자로 시작하여 일반 import 불가)
+STAGE_MODULES = {
+    'temporal': '02_feature_engineering/temporal_features.py',
+    'derived': '03_derived_variables/core_derived_features.py',
+    'normalization': '04_normalization/feature_normalization.py',
+    'splitting': '05_data_splitting/competition_data_prep.py',
+}
+
+# 단계별 저장 산출물 이름 (results/preprocessing 기준)
+STAGE_ARTIFACTS = {
+    'temporal': '02_feature_engineering/electricity_data_with_temporal_features',
+    'derived': '03_derived_variables/electricity_data_with_core_derived',
+    'normalization': '04_normalization/electricity_data_normalized',
+}
+
+
+def load_stage_module(relative_path):
+    """preprocessing/ 아래 스크립트를 모듈로 로딩 (한 번 로딩한 모듈은 재사용)"""
+    module_name = 'preprocessing_' + Path(relative_path).stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, PREPROCESSING_DIR / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class InMemoryPipeline:
+    """02 → 05 전처리 단계를 DataFrame 그대로 연결하는 파이프라인 클래스
+
+    create_temporal_features → add_holiday_features → create_core_derived_features
+    → normalize_features → CompetitionDataPreparator 순서로 실행하며,
+    save_stages 에 지정한 단계만 디스크에 기록한다.
+    """
+
+    STAGES = ('temporal', 'derived', 'normalization', 'splitting')
+
+    def __init__(self, save_stages=(), output_root='results/preprocessing',
+                 forecast_safe=True, keep_intermediate=False):
+        unknown = set(save_stages) - set(self.STAGES)
+        if unknown:
+            raise ValueError(f"알 수 없는 단계입니다: {sorted(unknown)} (지원: {list(self.STAGES)})")
+
+        self.save_stages = set(save_stages)
+        self.output_root = Path(output_root)
+        self.forecast_safe = forecast_safe
+        self.keep_intermediate = keep_intermediate
+        self.store = FeatureStore(root=self.output_root)
+
+        self.modules = {name: load_stage_module(path) for name, path in STAGE_MODULES.items()}
+
+    def _save(self, stage, df):
+        """요청된 단계만 저장 (pyarrow가 있으면 피처 저장소, 없으면 CSV)"""
+        if stage not in self.save_stages:
+            return None
+
+        path = self.store.try_save(df, STAGE_ARTIFACTS[stage])
+        if path is None:
+            path = self.output_root / f"{STAGE_ARTIFACTS[stage]}.csv"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(path, index=False, encoding='utf-8')
+        print(f"💾 {stage} 단계 저장: {path}")
+        return path
+
+    def run(self, df_imputed):
+        """보간 완료 데이터(date, 최대전력(MW))로 전체 단계 실행
+
+        Returns:
+        - dict: normalized, normalizer, scaling_info, quality, feature_types, holidays, competition
+                (keep_intermediate=True 이면 temporal, derived 도 포함)
+        """
+        temporal = self.modules['temporal']
+        derived = self.modules['derived']
+        normalization = self.modules['normalization']
+        splitting = self.modules['splitting']
+
+        results = {}
+
+        # 02. 시간 피처 + 공휴일
+        df_temporal = temporal.create_temporal_features(df_imputed)
+        df_temporal, holidays_df = temporal.add_holiday_features(df_temporal)
+        results['holidays'] = holidays_df
+        self._save('temporal', df_temporal)
+
+        # 03. 핵심 파생 변수
+        df_derived = derived.create_core_derived_features(df_temporal, forecast_safe=self.forecast_safe)
+        self._save('derived', df_derived)
+
+        # 04. 정규화
+        feature_types = normalization.analyze_feature_types(df_derived)
+        df_normalized, normalizer, scaling_info = normalization.normalize_features(df_derived, feature_types)
+        results.update({
+            'feature_types': feature_types,
+            'normalized': df_normalized,
+            'normalizer': normalizer,
+            'scaling_info': scaling_info,
+            'quality': verify_scaling(df_derived, df_normalized, normalizer),
+        })
+        self._save('normalization', df_normalized)
+
+        # 05. 대회용 데이터 분할 및 템플릿
+        preparator = splitting.CompetitionDataPreparator(
+            output_dir=self.output_root / '05_data_splitting',
+            train_data=df_normalized,
+            normalizer=normalizer
+        )
+        results['competition'] = preparator.run_complete_pipeline(save='splitting' in self.save_stages)
+
+        if self.keep_intermediate:
+            results['temporal'] = df_temporal
+            results['derived'] = df_derived
+
+        return results
@@ -0,0 +1,186 @@
+"""
+헤드리스 그림 렌더링 (Agg 백엔드, 프로세스 병렬 렌더링, 변경 없는 그림 재렌더링 생략)
+"""
+import json
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from ..pipeline.cache import hash_bytes, hash_code, hash_frame
+
+
+# DPI/형식 프리셋 (FIGURE_PRESET 환경변수로 기본값 변경)
+FIGURE_PRESETS = {
+    'preview': {'dpi': 72, 'format': 'png'},
+    'screen': {'dpi': 150, 'format': 'png'},
+    'publication': {'dpi': 300, 'format': 'png'},
+    'vector': {'dpi': 300, 'format': 'pdf'},
+}
+DEFAULT_PRESET = 'publication'
+
+# 그림별 렌더링 키 저장 폴더 (출력 폴더 아래, 분석끼리 폴더를 공유해도 충돌 없음)
+KEY_DIRNAME = '.figure_hashes'
+
+
+def use_headless_backend():
+    """Agg 백엔드 강제 (창을 띄우지 않으므로 plt.show()가 블로킹되지 않음)"""
+    if matplotlib.get_backend().lower() != 'agg':
+        plt.switch_backend('Agg')
+
+
+def is_interactive_backend():
+    """화면 표시가 가능한 백엔드인지 여부"""
+    return matplotlib.get_backend().lower() not in ('agg', 'pdf', 'ps', 'svg', 'cairo', 'template')
+
+
+def resolve_preset(preset=None):
+    """프리셋 이름 또는 {'dpi', 'format'} dict → 설정 dict"""
+    if isinstance(preset, dict):
+        return {**FIGURE_PRESETS[DEFAULT_PRESET], **preset}
+    name = preset or os.environ.get('FIGURE_PRESET', DEFAULT_PRESET)
+    if name not in FIGURE_PRESETS:
+        raise ValueError(f"지원하지 않는 그림 프리셋입니다: {name} (지원: {list(FIGURE_PRESETS)})")
+    return dict(FIGURE_PRESETS[name])
+
+
+def save_figure(fig, path, preset=None):
+    """프리셋 DPI/형식으로 그림 저장 후 닫기 (plt.show() 대신 사용)
+
+    Returns:
+    - Path: 저장 경로 (확장자는 프리셋 형식)
+    """
+    settings = resolve_preset(preset)
+    path = Path(path).with_suffix('.' + settings['format'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=settings['dpi'], format=settings['format'], bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+
+def hash_data(data):
+    """그림 입력 데이터 해시 (DataFrame/Series/ndarray/dict/list 중첩 허용)"""
+    if isinstance(data, pd.DataFrame):
+        return hash_frame(data)
+    if isinstance(data, pd.Series):
+        return hash_frame(data.to_frame())
+    if isinstance(data, pd.Index):
+        return hash_frame(data.to_frame(index=False))
+    if isinstance(data, np.ndarray):
+        return hash_bytes(str((data.dtype, data.shape)).encode('utf-8') + np.ascontiguousarray(data).tobytes())
+    if isinstance(data, dict):
+        return hash_bytes(json.dumps({str(k): hash_data(v) for k, v in data.items()}, sort_keys=True).encode('utf-8'))
+    if isinstance(data, (list, tuple)):
+        return hash_bytes(json.dumps([hash_data(v) for v in data]).encode('utf-8'))
+    return hash_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class FigureSpec:
+    """그림 하나의 렌더링 명세
+
+    Parameters:
+    - name: 출력 파일 이름 (확장자 제외)
+    - plot: plot(data, **params) → Figure 를 반환하는 모듈 최상위 함수 (워커로 전달됨)
+    - data: 그림 입력 데이터 (해시되어 재렌더링 여부 판단에 사용)
+    - params: plot 키워드 인자 (JSON 직렬화 가능)
+    """
+
+    def __init__(self, name, plot, data, params=None):
+        self.name = name
+        self.plot = plot
+        self.data = data
+        self.params = dict(params or {})
+
+    def key(self, settings):
+        """렌더링 키 = hash(그림 코드, 데이터, 파라미터, DPI/형식)"""
+        payload = {
+            'name': self.name,
+            'code': hash_code(self.plot),
+            'data': hash_data(self.data),
+            'params': self.params,
+            'settings': settings,
+        }
+        return hash_bytes(json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+
+
+def _render(plot, data, params, path, settings):
+    """워커에서 그림 하나 렌더링"""
+    use_headless_backend()
+    start_time = time.time()
+    fig = plot(data, **params)
+    save_figure(fig, path, settings)
+    return time.time() - start_time
+
+
+class FigureRenderer:
+    """FigureSpec 목록을 Agg 백엔드로 병렬 렌더링하는 클래스
+
+    출력 폴더의 .figure_hashes/<그림>.sha256 에 그림별 렌더링 키를 기록해 두고,
+    코드·데이터·파라미터·프리셋이 모두 같고 파일이 남아 있으면 다시 그리지 않는다.
+    이미 워커 프로세스 안에서 실행 중이면 중첩 프로세스를 만들지 않고 순차로 렌더링한다.
+    """
+
+    def __init__(self, output_dir, preset=None, max_workers=None):
+        self.output_dir = Path(output_dir)
+        self.settings = resolve_preset(preset)
+        self.max_workers = max_workers
+        self.key_dir = self.output_dir / KEY_DIRNAME
+        use_headless_backend()
+
+    def path(self, spec):
+        return self.output_dir / f"{spec.name}.{self.settings['format']}"
+
+    def _key_path(self, spec):
+        return self.key_dir / f"{spec.name}.sha256"
+
+    def is_current(self, spec, key):
+        """저장된 렌더링 키가 같고 그림 파일이 있는지 여부"""
+        key_path = self._key_path(spec)
+        return self.path(spec).exists() and key_path.exists() and key_path.read_text().strip() == key
+
+    def _workers(self, n_jobs):
+        if n_jobs <= 1 or multiprocessing.current_process().name != 'MainProcess':
+            return 1
+        return min(self.max_workers or os.cpu_count() or 1, n_jobs)
+
+    def render(self, specs, force=False):
+        """그림 렌더링 (변경된 그림만)
+
+        Returns:
+        - list: 그림별 {name, path, rendered, elapsed_seconds}
+        """
+        self.key_dir.mkdir(parents=True, exist_ok=True)
+
+        keys = {spec.name: spec.key(self.settings) for spec in specs}
+        stale = [spec for spec in specs if force or not self.is_current(spec, keys[spec.name])]
+
+        elapsed = {}
+        n_workers = self._workers(len(stale))
+        if n_workers == 1:
+            for spec in stale:
+                elapsed[spec.name] = _render(spec.plot, spec.data, spec.params, self.path(spec), self.settings)
+        else:
+            context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+                futures = {
+                    spec.name: executor.submit(_render, spec.plot, spec.data, spec.params, self.path(spec), self.settings)
+                    for spec in stale
+                }
+                elapsed = {name: future.result() for name, future in futures.items()}
+
+        for spec in stale:
+            self._key_path(spec).write_text(keys[spec.name])
+
+        return [{
+            'name': spec.name,
+            'path': self.path(spec),
+            'rendered': spec.name in elapsed,
+            'elapsed_seconds': elapsed.get(spec.name, 0.0),
+        } for spec in specs]
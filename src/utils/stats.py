@@ -0,0 +1,133 @@
+"""
+벡터화 통계 유틸리티
+"""
+import numpy as np
+
+
+def masked_corr(X, Y):
+    """결측값을 쌍별로 제외한 상관계수 행렬 (X의 열 × Y의 열)
+
+    모든 열 쌍을 행렬곱 몇 번으로 한 번에 계산한다.
+
+    Parameters:
+    - X: (n, p) 배열
+    - Y: (n, q) 배열
+
+    Returns:
+    - (p, q) 상관계수 배열 (유효 쌍이 2개 미만이거나 분산이 0이면 NaN)
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    if Y.ndim == 1:
+        Y = Y[:, None]
+
+    # 수치 안정성을 위해 열 평균으로 먼저 중심화
+    X = X - np.nanmean(X, axis=0)
+    Y = Y - np.nanmean(Y, axis=0)
+
+    mx = ~np.isnan(X)
+    my = ~np.isnan(Y)
+    X0 = np.where(mx, X, 0.0)
+    Y0 = np.where(my, Y, 0.0)
+    mx = mx.astype(float)
+    my = my.astype(float)
+
+    n = mx.T @ my
+    sx = X0.T @ my
+    sy = mx.T @ Y0
+    sxy = X0.T @ Y0
+    sxx = (X0 ** 2).T @ my
+    syy = mx.T @ (Y0 ** 2)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = n * sxy - sx * sy
+        var = (n * sxx - sx ** 2) * (n * syy - sy ** 2)
+        corr = cov / np.sqrt(var)
+
+    corr[(n < 2) | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def paired_corr(X, Y):
+    """같은 위치의 열끼리(X[:, j] ↔ Y[:, j]) 결측값을 쌍별로 제외한 상관계수
+
+    Parameters:
+    - X, Y: 같은 형태의 (n, p) 배열
+
+    Returns:
+    - (p,) 상관계수 배열 (유효 쌍이 2개 미만이거나 분산이 0이면 NaN)
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    if X.shape != Y.shape:
+        raise ValueError(f"X와 Y의 형태가 다릅니다: {X.shape} vs {Y.shape}")
+
+    valid = ~np.isnan(X) & ~np.isnan(Y)
+    n = valid.sum(axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        X0 = np.where(valid, X, 0.0)
+        Y0 = np.where(valid, Y, 0.0)
+        X0 = np.where(valid, X0 - X0.sum(axis=0) / n, 0.0)
+        Y0 = np.where(valid, Y0 - Y0.sum(axis=0) / n, 0.0)
+        corr = (X0 * Y0).sum(axis=0) / np.sqrt((X0 ** 2).sum(axis=0) * (Y0 ** 2).sum(axis=0))
+
+    corr[(n < 2) | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def standardize(X, dtype=np.float32):
+    """열별 표준화 (결측값은 0으로 두고 유효 마스크를 함께 반환)
+
+    Returns:
+    - Z: (n, p) 표준화 배열 (dtype, 결측 위치 0)
+    - M: (n, p) 유효 마스크 (dtype, 1/0)
+    """
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    valid = ~np.isnan(X)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nanmean(X, axis=0)
+        std = np.nanstd(X, axis=0)
+        Z = (X - mean) / np.where(std > 0, std, np.nan)
+    Z = np.where(valid & np.isfinite(Z), Z, 0.0).astype(dtype)
+    return Z, valid.astype(dtype)
+
+
+def block_corr(X, Y, block_size=512, dtype=np.float32):
+    """표준화 열의 행렬곱으로 계산하는 상관계수 행렬 (X의 열 × Y의 열)
+
+    전체 표본 기준으로 한 번 표준화한 뒤 X 열을 block_size 개씩 나눠 float32 행렬곱
+    세 번(교차곱, 쌍별 제곱합 두 개)으로 계산하므로 메모리는 (n × block_size) 로 제한된다.
+    결측값은 쌍별로 제외하지만 중심화는 전체 표본 평균 기준이라, 결측이 많은 열은
+    masked_corr 와 약간 다를 수 있다.
+
+    Returns:
+    - (p, q) 상관계수 배열 (유효 쌍이 2개 미만이거나 분산이 0이면 NaN)
+    """
+    Zy, My = standardize(Y, dtype)
+    Zx_all, Mx_all = standardize(X, dtype)
+    p = Zx_all.shape[1]
+    corr = np.empty((p, Zy.shape[1]), dtype=dtype)
+
+    Zy2 = Zy * Zy
+    for start in range(0, p, block_size):
+        Zx = Zx_all[:, start:start + block_size]
+        Mx = Mx_all[:, start:start + block_size]
+        n = Mx.T @ My
+        sxy = Zx.T @ Zy
+        sxx = (Zx * Zx).T @ My
+        syy = Mx.T @ Zy2
+        with np.errstate(invalid='ignore', divide='ignore'):
+            block = sxy / np.sqrt(sxx * syy)
+        block[(n < 2) | ~np.isfinite(block)] = np.nan
+        corr[start:start + block_size] = block
+
+    return np.clip(corr, -1.0, 1.0)
@@ -6,20 +6,65 @@ import seaborn as sns
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+from .figures import resolve_preset, is_interactive_backend
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
 
 
+def finish_figure(fig, save_path=None, show=None, preset=None):
+    """그림 저장(프리셋 DPI/형식) 및 표시 (표시하지 않으면 닫아서 메모리 해제)"""
+    if save_path:
+        settings = resolve_preset(preset)
+        fig.savefig(Path(save_path).with_suffix('.' + settings['format']),
+                    dpi=settings['dpi'], format=settings['format'], bbox_inches='tight')
+    show = is_interactive_backend() if show is None else show
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def plot_correlogram(ax, values, band, title, color='steelblue', markers=None):
+    """미리 계산한 ACF/PACF(index=lag Series)를 막대 + 신뢰구간 음영으로 표시
+
+    statsmodels plot_acf/plot_pacf 와 같은 모양이지만 계산은 하지 않는다
+    (src.features.autocorrelation.correlogram 결과를 그대로 사용).
+    """
+    lags = values.index.to_numpy()
+    ax.vlines(lags, 0, values.to_numpy(), colors=color, linewidth=1)
+    # 래그가 많으면 마커 생략 (렌더링 비용)
+    if markers is None:
+        markers = len(lags) <= 100
+    if markers:
+        ax.plot(lags, values.to_numpy(), 'o', color=color, markersize=4)
+    ax.fill_between(lags, -band.to_numpy(), band.to_numpy(), color=color, alpha=0.25, linewidth=0)
+    ax.axhline(0, color='black', linewidth=0.8)
+    ax.set_title(title)
+    ax.set_xlabel('Lag')
+    return ax
+
+
 class TimeSeriesVisualizer:
-    """시계열 데이터 시각화 클래스"""
+    """시계열 데이터 시각화 클래스
+
+    save_path 를 주면 그림 프리셋(DPI/형식)으로 저장한다. show=None 이면 화면 표시가
+    가능한 백엔드에서만 plt.show()를 호출하므로 헤드리스(Agg) 실행에서 블로킹되지 않는다.
+    """
     
-    def __init__(self, figsize=(15, 8), style='whitegrid'):
+    def __init__(self, figsize=(15, 8), style='whitegrid', show=None, preset=None):
         self.figsize = figsize
+        self.show = show
+        self.preset = preset
         sns.set_style(style)
+    
+    def _finish(self, fig, save_path=None):
+        finish_figure(fig, save_path, show=self.show, preset=self.preset)
         
     def plot_time_series(self, data, date_col=None, value_col=None, 
                         title="시계열 데이터", save_path=None):
@@ -37,44 +82,33 @@ class TimeSeriesVisualizer:
         plt.ylabel('값')
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish(plt.gcf(), save_path)
     
-    def plot_seasonal_decomposition(self, data, period=365, title="계절성 분해"):
-        """계절성 분해 시각화"""
-        from statsmodels.tsa.seasonal import seasonal_decompose
-        
-        # 계절성 분해
-        decomposition = seasonal_decompose(data, model='additive', period=period)
-        
-        fig, axes = plt.subplots(4, 1, figsize=(15, 12))
+    def plot_seasonal_decomposition(self, data, periods=(7, 365), title="계절성 분해", save_path=None):
+        """계절성 분해 시각화 (MSTL 다중 계절 분해, 성분은 get_decomposition 캐시 공유)
         
-        # 원본 데이터
-        decomposition.observed.plot(ax=axes[0], title='원본 데이터')
-        axes[0].grid(True, alpha=0.3)
+        data: 날짜 인덱스 시계열
+        """
+        from ..features.decomposition import get_decomposition, seasonal_columns
         
-        # 트렌드
-        decomposition.trend.plot(ax=axes[1], title='트렌드', color='orange')
-        axes[1].grid(True, alpha=0.3)
+        components = get_decomposition(data, periods=periods)
+        panels = [('observed', '원본 데이터', None), ('trend', '트렌드', 'orange')]
+        panels += [(col, f"계절성 ({col.split('_')[1]}일 주기)", 'green') for col in seasonal_columns(components)]
+        panels.append(('resid', '잔차', 'red'))
         
-        # 계절성
-        decomposition.seasonal.plot(ax=axes[2], title='계절성', color='green')
-        axes[2].grid(True, alpha=0.3)
+        fig, axes = plt.subplots(len(panels), 1, figsize=(15, 3 * len(panels)))
         
-        # 잔차
-        decomposition.resid.plot(ax=axes[3], title='잔차', color='red')
-        axes[3].grid(True, alpha=0.3)
+        for ax, (col, label, color) in zip(axes, panels):
+            components[col].plot(ax=ax, title=label, color=color)
+            ax.grid(True, alpha=0.3)
         
         plt.suptitle(title, fontsize=16, fontweight='bold')
         plt.tight_layout()
-        plt.show()
+        self._finish(plt.gcf(), save_path)
         
-        return decomposition
+        return components
     
-    def plot_distribution_analysis(self, data, bins=50, title="분포 분석"):
+    def plot_distribution_analysis(self, data, bins=50, title="분포 분석", save_path=None):
         """데이터 분포 분석"""
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         
@@ -106,9 +140,9 @@ class TimeSeriesVisualizer:
         
         plt.suptitle(title, fontsize=16, fontweight='bold')
         plt.tight_layout()
-        plt.show()
+        self._finish(plt.gcf(), save_path)
     
-    def plot_correlation_matrix(self, df, title="상관관계 행렬"):
+    def plot_correlation_matrix(self, df, title="상관관계 행렬", save_path=None):
         """상관관계 행렬 히트맵"""
         plt.figure(figsize=(12, 10))
         
@@ -123,12 +157,12 @@ class TimeSeriesVisualizer:
         
         plt.title(title, fontsize=16, fontweight='bold')
         plt.tight_layout()
-        plt.show()
+        self._finish(plt.gcf(), save_path)
         
         return corr_matrix
     
     def plot_feature_importance(self, feature_names, importances, 
-                              title="특성 중요도", top_n=20):
+                              title="특성 중요도", top_n=20, save_path=None):
         """특성 중요도 시각화"""
         # 중요도 순으로 정렬
         indices = np.argsort(importances)[::-1][:top_n]
@@ -141,10 +175,10 @@ class TimeSeriesVisualizer:
         plt.ylabel('중요도')
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
-        plt.show()
+        self._finish(plt.gcf(), save_path)
     
     def plot_prediction_comparison(self, y_true, y_pred, 
-                                 title="예측 결과 비교", sample_size=None):
+                                 title="예측 결과 비교", sample_size=None, save_path=None):
         """예측 결과 비교 시각화"""
         if sample_size and len(y_true) > sample_size:
             idx = np.random.choice(len(y_true), sample_size, replace=False)
@@ -178,9 +212,9 @@ class TimeSeriesVisualizer:
         
         plt.suptitle(title, fontsize=16, fontweight='bold')
         plt.tight_layout()
-        plt.show()
+        self._finish(plt.gcf(), save_path)
     
-    def plot_residuals_analysis(self, y_true, y_pred, title="잔차 분석"):
+    def plot_residuals_analysis(self, y_true, y_pred, title="잔차 분석", save_path=None):
         """잔차 분석 시각화"""
         residuals = y_true - y_pred
         
@@ -217,7 +251,7 @@ class TimeSeriesVisualizer:
         
         plt.suptitle(title, fontsize=16, fontweight='bold')
         plt.tight_layout()
-        plt.show()
+        self._finish(plt.gcf(), save_path)
 
 
 def quick_eda_plot(data, target_col, date_col=None):
@@ -243,7 +277,7 @@ def quick_eda_plot(data, target_col, date_col=None):
     print(f"  결측값: {data[target_col].isnull().sum()}개")
 
 
-def plot_model_comparison(models_results, metric='RMSE'):
+def plot_model_comparison(models_results, metric='RMSE', save_path=None):
     """여러 모델 성능 비교 시각화"""
     plt.figure(figsize=(12, 6))
     
@@ -264,4 +298,4 @@ def plot_model_comparison(models_results, metric='RMSE'):
     plt.xticks(rotation=45)
     plt.grid(True, alpha=0.3, axis='y')
     plt.tight_layout()
-    plt.show() 
\ No newline at end of file
+    finish_figure(plt.gcf(), save_path) 
\ No newline at end of file
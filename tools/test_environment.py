@@ -80,6 +80,7 @@ class EnvironmentTester:
             ('statsmodels', 'Statsmodels'),
             ('scipy', 'SciPy'),
             ('plotly', 'Plotly'),
+            ('pyarrow', 'PyArrow'),
             ('tensorboard', 'TensorBoard')
         ]
         